@@ -153,7 +153,7 @@ export class FileStorageAdapter implements GraphStorageGateway {
     const normalized = this.normalizeRelativePath(relativePath);
     const target = this.resolve(normalized);
     await this.ensureParentDirectory(target);
-    await fs.writeFile(target, content, 'utf-8');
+    await this.writeAtomically(target, content);
   }
 
   /**
@@ -163,7 +163,7 @@ export class FileStorageAdapter implements GraphStorageGateway {
     const normalized = this.normalizeRelativePath(relativePath);
     const target = this.resolve(normalized);
     await this.ensureParentDirectory(target);
-    await fs.writeFile(target, content);
+    await this.writeAtomically(target, content);
   }
 
   /**
@@ -237,6 +237,30 @@ export class FileStorageAdapter implements GraphStorageGateway {
     return resolved;
   }
 
+  /**
+   * Write to a temporary sibling file and rename it over the target.
+   *
+   * Readers never observe a partially written file, and the target gets a new inode, so a
+   * file hard-linked into another graph copy (e.g. a pristine test fixture) is never modified.
+   *
+   * @param absolutePath - Destination file.
+   * @param content - Text (written as UTF-8) or binary payload.
+   */
+  private async writeAtomically(absolutePath: string, content: string | Buffer): Promise<void> {
+    const random = Math.random().toString(36).substring(2, 9);
+    const tempPath = path.join(
+      path.dirname(absolutePath),
+      `.${path.basename(absolutePath)}.${process.pid}.${random}.tmp`
+    );
+    try {
+      await fs.writeFile(tempPath, content, typeof content === 'string' ? 'utf-8' : undefined);
+      await fs.rename(tempPath, absolutePath);
+    } catch (error) {
+      await fs.rm(tempPath, { force: true });
+      throw error;
+    }
+  }
+
   private async ensureParentDirectory(absolutePath: string): Promise<void> {
     const dir = path.dirname(absolutePath);
     await fs.mkdir(dir, { recursive: true });
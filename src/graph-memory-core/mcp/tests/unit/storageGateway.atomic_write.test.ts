@@ -0,0 +1,47 @@
+/**
+ * Tests for: FileStorageAdapter atomic writes
+ * Feature: Graph Memory Core (MCP)
+ * Spec: specs/done/graph-memory-core.md
+ *
+ * Tests written: 2026-10-18
+ */
+
+import { afterEach, beforeEach, describe, expect, it } from 'vitest'
+import { tmpdir } from 'node:os'
+import { linkSync, mkdtempSync, readFileSync, readdirSync, rmSync, statSync, writeFileSync } from 'node:fs'
+import { join } from 'node:path'
+import { FileStorageAdapter } from '../../src/storageGateway.js'
+
+describe('FileStorageAdapter writes', () => {
+  let basePath: string
+  let storage: FileStorageAdapter
+
+  beforeEach(() => {
+    basePath = mkdtempSync(join(tmpdir(), 'gmc-storage-'))
+    storage = new FileStorageAdapter(basePath)
+  })
+
+  afterEach(() => {
+    rmSync(basePath, { recursive: true, force: true })
+  })
+
+  it('replaces the file instead of rewriting a hard-linked copy', async () => {
+    const pristine = join(basePath, 'pristine.json')
+    writeFileSync(pristine, '{"nodes":[]}')
+    linkSync(pristine, join(basePath, 'registry.json'))
+
+    await storage.writeText('registry.json', '{"nodes":["mem_1"]}')
+
+    expect(readFileSync(pristine, 'utf-8')).toBe('{"nodes":[]}')
+    expect(readFileSync(join(basePath, 'registry.json'), 'utf-8')).toBe('{"nodes":["mem_1"]}')
+    expect(statSync(join(basePath, 'registry.json')).ino).not.toBe(statSync(pristine).ino)
+  })
+
+  it('leaves no temporary files behind', async () => {
+    await storage.writeBinary('_content/nodes/mem_1.bin', Buffer.from([1, 2, 3]))
+    await storage.writeText('_content/nodes/mem_1.bin', 'text')
+
+    expect(readdirSync(join(basePath, '_content/nodes'))).toEqual(['mem_1.bin'])
+    expect(await storage.readText('_content/nodes/mem_1.bin')).toBe('text')
+  })
+})
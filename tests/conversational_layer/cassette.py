@@ -0,0 +1,274 @@
+"""Record/replay cassettes for Claude CLI calls.
+
+In record mode every CLI invocation made through claude_exec is captured:
+its normalized argv and cwd (the request), plus its stdout, stderr, exit
+code and the MCP call-log lines it produced (a take). Takes are stored in
+an on-disk cassette directory, one JSON file per request hash.
+
+In replay mode the same requests are served from the cassette without
+spawning the CLI, and the recorded MCP log lines are written back to the
+current MCP call log. A whole suite run (results DB, Markdown report,
+judge parsing) can then be repeated offline at full speed, which also
+measures harness overhead separately from model latency.
+
+Requests are normalized so that per-run details (isolated installation
+and worker paths, snapshot MCP configs) don't change the key: the MCP
+config path is dropped, system prompt files are keyed by content, and
+test workspaces collapse to one placeholder.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .logging_config import get_logger
+
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+# Workspace directories created by TestInstallation (default and per worker)
+_WORKSPACE_PREFIX = "gtd-test-workspace"
+
+
+class CassetteMissError(RuntimeError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+def normalize_request(args: List[str], cwd: Optional[str]) -> Dict[str, Any]:
+    """Normalize a CLI invocation into its cassette request.
+
+    Args:
+        args: Full argv (including the claude executable)
+        cwd: Working directory (None for the current one)
+
+    Returns:
+        Dictionary with normalized "argv" and "cwd"
+    """
+    argv: List[str] = [Path(args[0]).name] if args else []
+    index = 1
+    while index < len(args):
+        arg = args[index]
+        value = args[index + 1] if index + 1 < len(args) else None
+
+        if arg == "--mcp-config" and value is not None:
+            argv += [arg, "<mcp-config>"]
+            index += 2
+        elif arg == "--system-prompt" and value is not None:
+            argv += [arg, _file_token(value)]
+            index += 2
+        else:
+            argv.append(arg)
+            index += 1
+
+    normalized_cwd = ""
+    if cwd:
+        normalized_cwd = "<workspace>" if Path(cwd).name.startswith(_WORKSPACE_PREFIX) else str(cwd)
+
+    return {"argv": argv, "cwd": normalized_cwd}
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Hash a normalized request.
+
+    Args:
+        request: Result of normalize_request()
+
+    Returns:
+        Hex digest used as the cassette file name
+    """
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def mcp_log_path_for_args(args: List[str]) -> Optional[Path]:
+    """Find the MCP call log a CLI invocation writes to.
+
+    Args:
+        args: Full argv (including the claude executable)
+
+    Returns:
+        MCP_CALL_LOG from the --mcp-config file, or None
+    """
+    if "--mcp-config" not in args:
+        return None
+    index = args.index("--mcp-config")
+    if index + 1 >= len(args):
+        return None
+
+    try:
+        with open(args[index + 1], 'r', encoding='utf-8') as f:
+            mcp_config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    for server in mcp_config.get("mcpServers", {}).values():
+        log_path = server.get("env", {}).get("MCP_CALL_LOG")
+        if log_path:
+            return Path(log_path)
+    return None
+
+
+class CassetteStore:
+    """On-disk store of recorded CLI calls.
+
+    Each request hash maps to a JSON file holding the request and a list of
+    takes. Identical requests made several times in one session (e.g. the
+    same case across runs) are recorded as successive takes and replayed in
+    the same order; replay repeats the last take once they run out.
+    """
+
+    def __init__(self, directory: Path, mode: str):
+        """Initialize store.
+
+        Args:
+            directory: Cassette directory
+            mode: "record" or "replay"
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', got {mode}")
+
+        self.directory = directory
+        self.mode = mode
+        self.logger = get_logger()
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, List[Dict[str, Any]]] = {}
+        self._replayed: Dict[str, int] = {}
+
+        if mode == "record":
+            self.directory.mkdir(parents=True, exist_ok=True)
+        elif not self.directory.is_dir():
+            raise ValueError(f"Cassette directory not found: {self.directory}")
+
+    def record(
+        self,
+        args: List[str],
+        cwd: Optional[str],
+        result: subprocess.CompletedProcess,
+        mcp_log: str,
+        duration: float
+    ) -> None:
+        """Store one take for a request.
+
+        The first take of a request in a session replaces whatever an
+        earlier session recorded for it.
+
+        Args:
+            args: Full argv (including the claude executable)
+            cwd: Working directory
+            result: Completed CLI process
+            mcp_log: MCP call-log lines produced during the call
+            duration: Wall-clock seconds the call took
+        """
+        request = normalize_request(args, cwd)
+        key = request_key(request)
+        take = {
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "mcp_log": mcp_log,
+            "duration": duration,
+        }
+
+        with self._lock:
+            takes = self._recorded.setdefault(key, [])
+            takes.append(take)
+            self._write(key, {"request": request, "takes": takes})
+
+    def replay(self, args: List[str], cwd: Optional[str]) -> subprocess.CompletedProcess:
+        """Serve a recorded take for a request.
+
+        Recorded MCP log lines are appended to the invocation's MCP call log.
+
+        Args:
+            args: Full argv (including the claude executable)
+            cwd: Working directory
+
+        Returns:
+            CompletedProcess rebuilt from the take
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        request = normalize_request(args, cwd)
+        key = request_key(request)
+        path = self.directory / f"{key}.json"
+
+        with self._lock:
+            if not path.exists():
+                raise CassetteMissError(
+                    f"No cassette for request {key[:12]} ({' '.join(request['argv'])[:120]})"
+                )
+            with open(path, 'r', encoding='utf-8') as f:
+                takes = json.load(f)["takes"]
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+
+        take = takes[min(index, len(takes) - 1)]
+        if take.get("mcp_log"):
+            log_path = mcp_log_path_for_args(args)
+            if log_path is not None:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(log_path, 'a', encoding='utf-8') as f:
+                    f.write(take["mcp_log"])
+
+        return subprocess.CompletedProcess(
+            args, take["returncode"], stdout=take["stdout"], stderr=take["stderr"]
+        )
+
+    def _write(self, key: str, data: Dict[str, Any]) -> None:
+        """Write a cassette file atomically."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.directory / f"{key}.json")
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def _file_token(path: str) -> str:
+    """Identify a prompt file by content instead of location."""
+    try:
+        return "<file:" + hashlib.sha256(Path(path).read_bytes()).hexdigest() + ">"
+    except OSError:
+        return path
+
+
+# Process-wide store used by claude_exec (None when cassettes are off)
+_store: Optional[CassetteStore] = None
+
+
+def configure_cassettes(mode: str = "off", directory: Optional[Path] = None) -> None:
+    """Enable recording or replay for all CLI calls in this process.
+
+    Args:
+        mode: "off", "record" or "replay"
+        directory: Cassette directory (required unless mode is "off")
+    """
+    global _store
+
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"Cassette mode must be one of {CASSETTE_MODES}, got {mode}")
+
+    if mode == "off":
+        _store = None
+        return
+
+    if directory is None:
+        raise ValueError(f"Cassette mode '{mode}' needs a cassette directory")
+    _store = CassetteStore(directory, mode)
+    get_logger().info(f"Cassettes: {mode} ({directory})")
+
+
+def get_cassette_store() -> Optional[CassetteStore]:
+    """Get the active cassette store, if any.
+
+    Returns:
+        CassetteStore or None when cassettes are off
+    """
+    return _store
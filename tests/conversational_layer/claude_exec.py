@@ -0,0 +1,417 @@
+"""Execution core for Claude CLI subprocesses.
+
+Every role (assistant, judge, user-proxy, interrogation, fixture setup)
+builds its own argv and hands it to one of these functions. The blocking
+variant wraps subprocess.run; the asyncio variant uses
+asyncio.create_subprocess_exec so an event loop can overlap many slow
+model calls. Both return a CompletedProcess with text stdout/stderr and
+raise subprocess.TimeoutExpired on timeout, so callers handle results the
+same way whichever path they use.
+
+Both variants hold a slot from the per-model rate limiter (keyed by the
+``--model`` argument) for the duration of the call, and report rate-limit
+failures back to it so later calls stretch back automatically.
+
+When cassettes are enabled (see cassette.py) calls are recorded, or served
+from the cassette without spawning the CLI (and without rate limiting).
+
+The streaming variants run a ``--output-format stream-json`` command and
+feed its output line by line to a StreamMonitor (see streaming.py), killing
+the child as soon as the monitor or its inactivity timeout says so.
+
+Every call is a ``subprocess`` span in the suite trace (see tracing.py);
+streamed calls add an ``mcp`` span per tool call the session made.
+"""
+
+import asyncio
+import json
+import queue
+import subprocess
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from .cassette import get_cassette_store, mcp_log_path_for_args
+from .mcp_log import McpLogCursor
+from .rate_limit import RateLimiter, get_rate_limiter
+from .retry import is_rate_limit_error
+from .streaming import StreamAborted, StreamMonitor
+from .tracing import get_tracer, record_span, span
+
+# asyncio's default 64 KiB line limit is too small for large tool results
+_STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+
+def run_claude(
+    args: List[str],
+    timeout: float,
+    cwd: Optional[str] = None
+) -> subprocess.CompletedProcess[str]:
+    """Run a Claude CLI command and wait for it.
+
+    Args:
+        args: Full argv (including the claude executable)
+        timeout: Timeout in seconds
+        cwd: Optional working directory
+
+    Returns:
+        CompletedProcess with stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds timeout
+        CassetteMissError: If replaying and the call was never recorded
+    """
+    store = get_cassette_store()
+    if store is not None and store.mode == "replay":
+        return _replay(store, args, cwd)
+
+    limiter = limiter_for_args(args)
+    with limiter.slot(), span("claude", "subprocess", model=_model_arg(args)) as call:
+        mcp_log, start = _begin_recording(args)
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+            cwd=cwd,
+        )
+        call.set(returncode=result.returncode)
+    _report_outcome(limiter, result)
+    _finish_recording(args, cwd, result, mcp_log, start)
+    return result
+
+
+async def run_claude_async(
+    args: List[str],
+    timeout: float,
+    cwd: Optional[str] = None
+) -> subprocess.CompletedProcess[str]:
+    """Run a Claude CLI command without blocking the event loop.
+
+    The child is killed if the timeout expires or the awaiting task is
+    cancelled, so abandoned calls never leak CLI processes.
+
+    Args:
+        args: Full argv (including the claude executable)
+        timeout: Timeout in seconds
+        cwd: Optional working directory
+
+    Returns:
+        CompletedProcess with stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds timeout
+        asyncio.CancelledError: If the awaiting task is cancelled
+        CassetteMissError: If replaying and the call was never recorded
+    """
+    store = get_cassette_store()
+    if store is not None and store.mode == "replay":
+        return _replay(store, args, cwd)
+
+    limiter = limiter_for_args(args)
+    async with limiter.slot_async():
+        mcp_log, start = _begin_recording(args)
+        with span("claude", "subprocess", model=_model_arg(args)) as call:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                _kill(process)
+                stdout, stderr = await process.communicate()
+                raise subprocess.TimeoutExpired(
+                    args, timeout, output=_decode(stdout), stderr=_decode(stderr)
+                )
+            except asyncio.CancelledError:
+                _kill(process)
+                await process.wait()
+                raise
+            call.set(returncode=process.returncode)
+
+    result = subprocess.CompletedProcess(
+        args, process.returncode, stdout=_decode(stdout), stderr=_decode(stderr)
+    )
+    _report_outcome(limiter, result)
+    _finish_recording(args, cwd, result, mcp_log, start)
+    return result
+
+
+def run_claude_stream(
+    args: List[str],
+    monitor: StreamMonitor,
+    timeout: float,
+    cwd: Optional[str] = None
+) -> subprocess.CompletedProcess[str]:
+    """Run a stream-json Claude CLI command under a StreamMonitor.
+
+    The returned stdout is the final result event (the same payload
+    ``--output-format json`` prints), so callers parse it as usual.
+
+    Args:
+        args: Full argv (including the claude executable)
+        monitor: Monitor fed every stdout line
+        timeout: Overall ceiling in seconds (inactivity is checked separately)
+        cwd: Optional working directory
+
+    Returns:
+        CompletedProcess with the result payload as stdout
+
+    Raises:
+        StreamAborted: If the monitor, inactivity timeout or ceiling cut the run off
+        CassetteMissError: If replaying and the call was never recorded
+    """
+    store = get_cassette_store()
+    if store is not None and store.mode == "replay":
+        return _replay(store, args, cwd)
+
+    limiter = limiter_for_args(args)
+    with limiter.slot(), span("claude", "subprocess", model=_model_arg(args), stream=True) as call:
+        # Clocks start once the slot is held: queueing is not inactivity
+        mcp_log, start = _begin_recording(args)
+        monitor.start()
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=cwd,
+        )
+        lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        stderr_chunks: List[str] = []
+        readers = [
+            threading.Thread(target=_pump_lines, args=(process.stdout, lines), daemon=True),
+            threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            while True:
+                wait = _next_wait(monitor, start, timeout)
+                try:
+                    line = lines.get(timeout=wait)
+                except queue.Empty:
+                    raise _stall_error(monitor, start, timeout, "".join(stderr_chunks))
+                if line is None:
+                    break
+                reason = monitor.feed_line(line)
+                if reason:
+                    raise StreamAborted(
+                        reason, monitor.progress(), monitor.output(), "".join(stderr_chunks)
+                    )
+            process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join(timeout=5)
+            _trace_tool_calls(monitor)
+        call.set(returncode=process.returncode, **monitor.progress())
+
+    result = _stream_result(args, process.returncode, monitor, "".join(stderr_chunks))
+    _report_outcome(limiter, result)
+    _finish_recording(args, cwd, result, mcp_log, start)
+    return result
+
+
+async def run_claude_stream_async(
+    args: List[str],
+    monitor: StreamMonitor,
+    timeout: float,
+    cwd: Optional[str] = None
+) -> subprocess.CompletedProcess[str]:
+    """Async variant of run_claude_stream.
+
+    Args:
+        args: Full argv (including the claude executable)
+        monitor: Monitor fed every stdout line
+        timeout: Overall ceiling in seconds (inactivity is checked separately)
+        cwd: Optional working directory
+
+    Returns:
+        CompletedProcess with the result payload as stdout
+
+    Raises:
+        StreamAborted: If the monitor, inactivity timeout or ceiling cut the run off
+        asyncio.CancelledError: If the awaiting task is cancelled
+        CassetteMissError: If replaying and the call was never recorded
+    """
+    store = get_cassette_store()
+    if store is not None and store.mode == "replay":
+        return _replay(store, args, cwd)
+
+    limiter = limiter_for_args(args)
+    async with limiter.slot_async():
+        mcp_log, start = _begin_recording(args)
+        monitor.start()
+        with span("claude", "subprocess", model=_model_arg(args), stream=True) as call:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                limit=_STREAM_LINE_LIMIT,
+            )
+            stderr_task = asyncio.ensure_future(process.stderr.read())
+
+            try:
+                while True:
+                    wait = _next_wait(monitor, start, timeout)
+                    try:
+                        raw = await asyncio.wait_for(process.stdout.readline(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        raise _stall_error(monitor, start, timeout, "")
+                    if not raw:
+                        break
+                    reason = monitor.feed_line(_decode(raw))
+                    if reason:
+                        raise StreamAborted(reason, monitor.progress(), monitor.output())
+                await process.wait()
+                stderr = _decode(await stderr_task)
+            except BaseException:
+                _kill(process)
+                await process.wait()
+                stderr_task.cancel()
+                raise
+            finally:
+                _trace_tool_calls(monitor)
+            call.set(returncode=process.returncode, **monitor.progress())
+
+    result = _stream_result(args, process.returncode, monitor, stderr)
+    _report_outcome(limiter, result)
+    _finish_recording(args, cwd, result, mcp_log, start)
+    return result
+
+
+def _replay(store, args: List[str], cwd: Optional[str]) -> subprocess.CompletedProcess[str]:
+    """Serve a call from the cassette (traced like a real call)."""
+    with span("claude", "subprocess", model=_model_arg(args), replay=True):
+        return store.replay(args, cwd)
+
+
+def _trace_tool_calls(monitor: StreamMonitor) -> None:
+    """Add the tool calls a streamed session made to the trace."""
+    if get_tracer() is None:
+        return
+    now = time.monotonic()
+    for call in monitor.tool_timeline:
+        finished = call["end"] is not None
+        record_span(
+            call["name"], "mcp", call["start"], call["end"] if finished else now,
+            error=call["error"], finished=finished
+        )
+
+
+def _pump_lines(stream, lines: "queue.Queue[Optional[str]]") -> None:
+    """Copy a text stream into a queue line by line (None marks EOF)."""
+    try:
+        for line in stream:
+            lines.put(line)
+    finally:
+        lines.put(None)
+
+
+def _next_wait(monitor: StreamMonitor, start: float, timeout: float) -> float:
+    """Seconds to wait for the next line before the stream counts as stalled."""
+    inactivity_left = monitor.limits.inactivity_timeout - monitor.idle_seconds()
+    overall_left = timeout - (time.monotonic() - start)
+    return max(0.0, min(inactivity_left, overall_left))
+
+
+def _stall_error(monitor: StreamMonitor, start: float, timeout: float, stderr: str) -> StreamAborted:
+    """Build the abort for a stream that hit its inactivity timeout or ceiling."""
+    if time.monotonic() - start >= timeout:
+        reason = f"timeout ({timeout:g}s overall)"
+    else:
+        reason = f"inactivity timeout (no output for {monitor.limits.inactivity_timeout:g}s)"
+    return StreamAborted(reason, monitor.progress(), monitor.output(), stderr, retryable=True)
+
+
+def _stream_result(
+    args: List[str],
+    returncode: int,
+    monitor: StreamMonitor,
+    stderr: str
+) -> subprocess.CompletedProcess[str]:
+    """Turn a finished stream into a CompletedProcess holding the result payload."""
+    if monitor.result_payload is not None:
+        stdout = json.dumps(monitor.result_payload)
+    else:
+        stdout = monitor.output()
+    return subprocess.CompletedProcess(args, returncode, stdout=stdout, stderr=stderr)
+
+
+def _begin_recording(args: List[str]) -> Tuple[Optional[McpLogCursor], float]:
+    """Mark where the MCP log ends before a call (when recording)."""
+    store = get_cassette_store()
+    if store is None or store.mode != "record":
+        return None, time.monotonic()
+    return McpLogCursor(mcp_log_path_for_args(args)), time.monotonic()
+
+
+def _finish_recording(
+    args: List[str],
+    cwd: Optional[str],
+    result: subprocess.CompletedProcess,
+    mcp_log: Optional[McpLogCursor],
+    start: float
+) -> None:
+    """Store a finished call in the cassette (when recording)."""
+    store = get_cassette_store()
+    if store is None or store.mode != "record":
+        return
+    store.record(args, cwd, result, mcp_log.read(), time.monotonic() - start)
+
+
+def limiter_for_args(args: List[str]) -> RateLimiter:
+    """Get the rate limiter for the model a CLI command will use.
+
+    Args:
+        args: Full argv (including the claude executable)
+
+    Returns:
+        Shared RateLimiter for the --model value (or the default model)
+    """
+    return get_rate_limiter(_model_arg(args))
+
+
+def _model_arg(args: List[str]) -> Optional[str]:
+    """Value of the --model argument (None for the default model)."""
+    model = None
+    for index, arg in enumerate(args):
+        if arg == "--model" and index + 1 < len(args):
+            model = args[index + 1]
+        elif arg.startswith("--model="):
+            model = arg.split("=", 1)[1]
+    return model
+
+
+def _report_outcome(limiter: RateLimiter, result: subprocess.CompletedProcess) -> None:
+    """Feed a finished call's outcome back into its rate limiter."""
+    if result.returncode != 0 and is_rate_limit_error({"reason": result.stderr or result.stdout}):
+        limiter.report_rate_limit()
+    elif result.returncode == 0:
+        limiter.report_success()
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a child process that may already have exited."""
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _decode(data: Optional[bytes]) -> str:
+    """Decode captured output the way text=True would."""
+    if not data:
+        return ""
+    return data.decode("utf-8", errors="replace")
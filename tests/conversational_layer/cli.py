@@ -7,7 +7,7 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from .config import Config
 
@@ -29,17 +29,53 @@ Examples:
   # Run all tests with Live MCP
   %(prog)s --mode real
 
-  # Run 5 times with delays between runs
-  %(prog)s --runs 5 --inter-run-delay 10
+  # Run 5 times
+  %(prog)s --runs 5
+
+  # Up to 10 runs per test, stopping early on tests with a settled pass rate
+  %(prog)s --runs 10 --adaptive-runs
+
+  # Only re-run cases affected by prompt/case/build changes since the last run
+  %(prog)s --reuse-unchanged
+
+  # Record a run, then replay it offline (no model calls)
+  %(prog)s --record-cassettes tests/cassettes
+  %(prog)s --replay-cassettes tests/cassettes
+
+  # Kill stuck runs based on each case's own duration history
+  %(prog)s --runs 5 --adaptive-timeouts
+
+  # Stream assistant output; abort sessions that stall for 90s or loop
+  %(prog)s --stream --inactivity-timeout 90
+
+  # Resume an interrupted run (skips results already saved for run 42)
+  %(prog)s --runs 5 --resume 42
 
   # Run specific category with Live MCP
   %(prog)s --category Capture --clean-graph-between-tests
 
+  # Reuse built fixture graphs across tests and runs
+  %(prog)s --clean-graph-between-tests --fixture-snapshots .fixture-snapshots
+
   # Interrogate failures and save to JSON
   %(prog)s --interrogate-failures --interrogation-log results.json
 
   # Run single test
   %(prog)s --test-name capture_simple_task
+
+  # Run 4 tests at a time, each against its own isolated graph
+  %(prog)s --runs 5 --workers 4
+
+  # Split 5 runs across two hosts, then merge the shard databases
+  %(prog)s --runs 5 --shard 1/2 --results-db shard1.db   # host A
+  %(prog)s --runs 5 --shard 2/2 --results-db shard2.db   # host B
+  %(prog)s --merge-results shard1.db shard2.db --results-db merged.db --markdown-report merged.md
+
+  # Start the slowest cases first so they don't form a long tail
+  %(prog)s --runs 5 --workers 4 --schedule longest-first
+
+  # Record a timeline of the run (open in https://ui.perfetto.dev)
+  %(prog)s --workers 4 --trace trace.json
 """
     )
 
@@ -109,15 +145,113 @@ Examples:
         "--inter-run-delay",
         dest="inter_run_delay",
         type=float,
-        default=10.0,
-        help="Delay in seconds between runs (default: 10.0)."
+        default=0.0,
+        help="Extra fixed delay in seconds between runs; model calls are already rate limited (default: 0.0)."
     )
     parser.add_argument(
         "--inter-test-delay",
         dest="inter_test_delay",
         type=float,
         default=0.0,
-        help="Delay in seconds between tests within a run (default: 0.0)."
+        help="Extra fixed delay in seconds between tests within a run (default: 0.0)."
+    )
+    parser.add_argument(
+        "--rate-limit-rpm",
+        dest="rate_limit_rpm",
+        type=float,
+        default=50.0,
+        help="Model requests per minute allowed per model; backs off automatically on rate-limit errors (default: 50, 0 = unlimited)."
+    )
+    parser.add_argument(
+        "--max-concurrent-calls",
+        dest="max_concurrent_calls",
+        type=int,
+        default=8,
+        help="Concurrent model calls allowed per model (default: 8, 0 = unlimited)."
+    )
+    parser.add_argument(
+        "--adaptive-runs",
+        dest="adaptive_runs",
+        action="store_true",
+        help="Stop repeating a test once its pass-rate interval is narrow enough; spend --runs on flaky tests."
+    )
+    parser.add_argument(
+        "--adaptive-max-width",
+        dest="adaptive_max_width",
+        type=float,
+        default=0.6,
+        help="Wilson 95%% interval width at which a test counts as settled (default: 0.6, i.e. 3/3 passes)."
+    )
+    parser.add_argument(
+        "--adaptive-min-runs",
+        dest="adaptive_min_runs",
+        type=int,
+        default=3,
+        help="Minimum runs per test before adaptive stopping applies (default: 3)."
+    )
+    parser.add_argument(
+        "--shard",
+        dest="shard",
+        default=None,
+        metavar="K/N",
+        help="Run only shard K of N duration-balanced shards of the case x run matrix "
+             "(combine the shard databases afterwards with --merge-results)."
+    )
+    parser.add_argument(
+        "--shard-history",
+        dest="shard_history",
+        default=None,
+        metavar="DB",
+        help="Results database whose durations balance the shards; every host must use the same "
+             "file (default: static estimates)."
+    )
+    parser.add_argument(
+        "--schedule",
+        dest="schedule",
+        choices=["file", "longest-first", "flaky-first"],
+        default="file",
+        help="Order cases by results-database history: longest expected duration first, "
+             "or most unstable first (default: file order)."
+    )
+    parser.add_argument(
+        "--reuse-unchanged",
+        dest="reuse_unchanged",
+        action="store_true",
+        help="Don't re-run cases whose inputs (case, prompt, overlays, models, MCP build) match a stored result; import it instead."
+    )
+    parser.add_argument(
+        "--resume",
+        dest="resume_run_id",
+        type=int,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume an interrupted run from the results database, re-running only unfinished (test, run) pairs."
+    )
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help="Run N tests concurrently, each worker with its own isolated installation (default: 1)."
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_asyncio",
+        action="store_true",
+        help="Drive tests on an asyncio event loop (non-blocking CLI subprocesses); --workers sets concurrency."
+    )
+    parser.add_argument(
+        "--pipeline",
+        dest="pipeline",
+        action="store_true",
+        help="Judge and interrogate each test while the next test's assistant runs (graph snapshot per test)."
+    )
+    parser.add_argument(
+        "--pipeline-depth",
+        dest="pipeline_depth",
+        type=int,
+        default=2,
+        help="Maximum tests queued in front of each pipeline stage (default: 2)."
     )
 
     # Phase 1 improvement: Retry configuration
@@ -132,8 +266,8 @@ Examples:
         "--initial-backoff",
         dest="initial_backoff",
         type=float,
-        default=30.0,
-        help="Initial backoff delay for retries in seconds (default: 30.0)."
+        default=5.0,
+        help="Initial backoff delay for non-rate-limit retries in seconds (default: 5.0)."
     )
 
     # Timeouts
@@ -166,6 +300,72 @@ Examples:
         help="Timeout in seconds for graph cleanup (default: 120)."
     )
 
+    parser.add_argument(
+        "--adaptive-timeouts",
+        dest="adaptive_timeouts",
+        action="store_true",
+        help="Derive per-case assistant/judge/interrogation timeouts from duration history in the "
+             "results database (p99 x --timeout-factor, at least --timeout-floor, at most the static timeout)."
+    )
+    parser.add_argument(
+        "--timeout-factor",
+        dest="timeout_factor",
+        type=float,
+        default=2.0,
+        help="Safety factor applied to the p99 duration with --adaptive-timeouts (default: 2.0)."
+    )
+    parser.add_argument(
+        "--timeout-floor",
+        dest="timeout_floor",
+        type=float,
+        default=30.0,
+        help="Lowest timeout --adaptive-timeouts will use, in seconds (default: 30)."
+    )
+    parser.add_argument(
+        "--timeout-min-samples",
+        dest="timeout_min_samples",
+        type=int,
+        default=5,
+        help="Recorded durations a case phase needs before its timeout adapts (default: 5)."
+    )
+
+    # Streaming assistant runs
+    parser.add_argument(
+        "--stream",
+        dest="stream_assistant",
+        action="store_true",
+        help="Run the assistant with stream-json output; abort stalled or looping sessions early."
+    )
+    parser.add_argument(
+        "--inactivity-timeout",
+        dest="inactivity_timeout",
+        type=float,
+        default=120.0,
+        help="With --stream: abort after this many seconds without output (default: 120). "
+             "--assistant-timeout stays as the overall ceiling."
+    )
+    parser.add_argument(
+        "--max-tool-calls",
+        dest="max_tool_calls",
+        type=int,
+        default=60,
+        help="With --stream: abort after this many tool calls (default: 60, 0 = unlimited)."
+    )
+    parser.add_argument(
+        "--max-tool-errors",
+        dest="max_tool_errors",
+        type=int,
+        default=3,
+        help="With --stream: abort after this many consecutive tool errors (default: 3, 0 = never)."
+    )
+    parser.add_argument(
+        "--max-identical-calls",
+        dest="max_identical_calls",
+        type=int,
+        default=4,
+        help="With --stream: abort when one tool call repeats with identical input this often (default: 4, 0 = never)."
+    )
+
     # Interrogation
     parser.add_argument(
         "--interrogate-failures",
@@ -199,6 +399,21 @@ Examples:
         action="store_true",
         help="Delete all graph nodes between tests in Live MCP mode (ensures test isolation)."
     )
+    parser.add_argument(
+        "--fixture-snapshots",
+        dest="fixture_snapshots",
+        metavar="DIR",
+        default=None,
+        help="Build each graph_setup fixture once into DIR and restore it per test by hardlink/reflink/copy "
+             "(requires --clean-graph-between-tests)."
+    )
+    parser.add_argument(
+        "--preflight",
+        dest="preflight",
+        action="store_true",
+        help="Before running tests, check the graph-memory server over MCP (initialize, tools/list, "
+             "get_ontology) for every installation and abort if it is not healthy."
+    )
 
     # Test environment isolation
     parser.add_argument(
@@ -213,6 +428,21 @@ Examples:
         action="store_true",
         help="Keep test installation after completion (default: cleanup after tests)."
     )
+    cassettes = parser.add_mutually_exclusive_group()
+    cassettes.add_argument(
+        "--record-cassettes",
+        dest="record_cassettes",
+        metavar="DIR",
+        default=None,
+        help="Record every Claude CLI call (argv, output, MCP log lines) into a cassette directory."
+    )
+    cassettes.add_argument(
+        "--replay-cassettes",
+        dest="replay_cassettes",
+        metavar="DIR",
+        default=None,
+        help="Serve Claude CLI calls from a recorded cassette directory instead of running the CLI (offline)."
+    )
 
     # Output
     parser.add_argument(
@@ -251,6 +481,15 @@ Examples:
         default=None,
         help="Query test results database instead of running tests."
     )
+    parser.add_argument(
+        "--merge-results",
+        dest="merge_results",
+        nargs="+",
+        default=None,
+        metavar="DB[:RUN_ID]",
+        help="Merge the --shard runs in these databases (latest run unless RUN_ID is given) "
+             "into one run in --results-db, instead of running tests."
+    )
     parser.add_argument(
         "--run-id",
         dest="run_id",
@@ -272,6 +511,13 @@ Examples:
         default=None,
         help="Generate Markdown report at specified path (default: tests/report_<run_id>_<timestamp>.md)."
     )
+    parser.add_argument(
+        "--trace",
+        dest="trace",
+        type=str,
+        default=None,
+        help="Write a Chrome/Perfetto trace-event timeline of the run (tests, phases, CLI calls, tool calls) to this path."
+    )
 
     return parser.parse_args(args)
 
@@ -329,6 +575,15 @@ def args_to_config(args: argparse.Namespace, root: Optional[Path] = None) -> Con
     interrogate_failures = args.interrogate_failures or args.interrogate_all
     interrogate_passes = args.interrogate_passes or args.interrogate_all
 
+    # Cassette record/replay (mutually exclusive flags)
+    cassette_mode, cassette_dir = "off", None
+    if args.record_cassettes:
+        cassette_mode, cassette_dir = "record", Path(args.record_cassettes)
+    elif args.replay_cassettes:
+        cassette_mode, cassette_dir = "replay", Path(args.replay_cassettes)
+
+    shard_index, shard_count = parse_shard(args.shard) if args.shard else (1, 1)
+
     # Build config
     config = Config(
         # Paths
@@ -339,6 +594,21 @@ def args_to_config(args: argparse.Namespace, root: Optional[Path] = None) -> Con
         runs=args.runs,
         inter_run_delay=args.inter_run_delay,
         inter_test_delay=args.inter_test_delay,
+        rate_limit_rpm=args.rate_limit_rpm,
+        max_concurrent_calls=args.max_concurrent_calls,
+        adaptive_runs=args.adaptive_runs,
+        adaptive_max_width=args.adaptive_max_width,
+        adaptive_min_runs=args.adaptive_min_runs,
+        shard_index=shard_index,
+        shard_count=shard_count,
+        shard_history=Path(args.shard_history) if args.shard_history else None,
+        schedule=args.schedule,
+        reuse_unchanged=args.reuse_unchanged,
+        resume_run_id=args.resume_run_id,
+        workers=args.workers,
+        use_asyncio=args.use_asyncio,
+        pipeline=args.pipeline,
+        pipeline_depth=args.pipeline_depth,
         max_retries=args.max_retries,
         initial_backoff=args.initial_backoff,
         # Timeouts
@@ -346,14 +616,27 @@ def args_to_config(args: argparse.Namespace, root: Optional[Path] = None) -> Con
         judge_timeout=float(args.judge_timeout),
         interrogation_timeout=float(args.interrogation_timeout),
         cleanup_timeout=float(args.cleanup_timeout),
+        adaptive_timeouts=args.adaptive_timeouts,
+        timeout_factor=args.timeout_factor,
+        timeout_floor=args.timeout_floor,
+        timeout_min_samples=args.timeout_min_samples,
+        stream_assistant=args.stream_assistant,
+        inactivity_timeout=args.inactivity_timeout,
+        max_tool_calls=args.max_tool_calls,
+        max_tool_errors=args.max_tool_errors,
+        max_identical_calls=args.max_identical_calls,
         # Features
         mode=mode,
         clean_between_tests=args.clean_graph_between_tests,
+        fixture_snapshot_dir=Path(args.fixture_snapshots) if args.fixture_snapshots else None,
+        preflight=args.preflight,
         interrogate_failures=interrogate_failures,
         interrogate_passes=interrogate_passes,
         use_refactored_cases=use_refactored,
         use_isolated_env=args.use_isolated_env,
         keep_test_install=args.keep_test_install,
+        cassette_mode=cassette_mode,
+        cassette_dir=cassette_dir,
         # Output
         log_file=Path(args.log_file),
         log_level=args.log_level,
@@ -361,6 +644,7 @@ def args_to_config(args: argparse.Namespace, root: Optional[Path] = None) -> Con
         interrogation_log=Path(args.interrogation_log) if args.interrogation_log else None,
         print_assistant_on_fail=args.print_assistant_on_fail or bool(os.environ.get("PRINT_ASSISTANT_ON_FAIL")),
         markdown_report=args.markdown_report,
+        trace_path=Path(args.trace) if args.trace else None,
         # CLI
         suite=args.suite,
         category=args.category,
@@ -371,6 +655,42 @@ def args_to_config(args: argparse.Namespace, root: Optional[Path] = None) -> Con
     return config
 
 
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse a shard spec like "2/4".
+
+    Args:
+        spec: "K/N" with 1 <= K <= N
+
+    Returns:
+        (K, N)
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like K/N (e.g. 2/4), got {spec!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard must be K/N with 1 <= K <= N, got {spec!r}")
+    return index, count
+
+
+def parse_merge_source(spec: str) -> Tuple[Path, Optional[int]]:
+    """Parse a --merge-results entry like "shard2.db" or "shard2.db:7".
+
+    Args:
+        spec: Database path with an optional ":RUN_ID" suffix
+
+    Returns:
+        (database path, run ID or None for the latest run)
+    """
+    path, _, run_id = spec.rpartition(":")
+    if path and run_id.isdigit():
+        return Path(path), int(run_id)
+    return Path(spec), None
+
+
 def validate_args(args: argparse.Namespace) -> None:
     """Validate argument combinations.
 
@@ -390,16 +710,51 @@ def validate_args(args: argparse.Namespace) -> None:
         print("ERROR: --query export requires --export-json", file=sys.stderr)
         sys.exit(1)
 
+    if args.shard:
+        try:
+            parse_shard(args.shard)
+        except ValueError as e:
+            print(f"ERROR: --shard: {e}", file=sys.stderr)
+            sys.exit(1)
+
     # Check runs value
     if args.runs < 1:
         print(f"ERROR: --runs must be >= 1, got {args.runs}", file=sys.stderr)
         sys.exit(1)
 
+    if args.workers < 1:
+        print(f"ERROR: --workers must be >= 1, got {args.workers}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.pipeline and args.use_asyncio:
+        print("ERROR: --pipeline cannot be combined with --async", file=sys.stderr)
+        sys.exit(1)
+
+    if args.pipeline_depth < 1:
+        print(f"ERROR: --pipeline-depth must be >= 1, got {args.pipeline_depth}", file=sys.stderr)
+        sys.exit(1)
+
     # Check delays
     if args.inter_run_delay < 0:
         print(f"ERROR: --inter-run-delay must be >= 0, got {args.inter_run_delay}", file=sys.stderr)
         sys.exit(1)
 
+    if args.rate_limit_rpm < 0:
+        print(f"ERROR: --rate-limit-rpm must be >= 0, got {args.rate_limit_rpm}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.max_concurrent_calls < 0:
+        print(f"ERROR: --max-concurrent-calls must be >= 0, got {args.max_concurrent_calls}", file=sys.stderr)
+        sys.exit(1)
+
+    if not 0 < args.adaptive_max_width <= 1:
+        print(f"ERROR: --adaptive-max-width must be in (0, 1], got {args.adaptive_max_width}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.adaptive_min_runs < 1:
+        print(f"ERROR: --adaptive-min-runs must be >= 1, got {args.adaptive_min_runs}", file=sys.stderr)
+        sys.exit(1)
+
     if args.inter_test_delay < 0:
         print(f"ERROR: --inter-test-delay must be >= 0, got {args.inter_test_delay}", file=sys.stderr)
         sys.exit(1)
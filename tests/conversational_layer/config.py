@@ -20,26 +20,55 @@ class Config:
 
         # Execution
         runs: Number of times to run each test
-        inter_run_delay: Delay in seconds between runs
-        inter_test_delay: Delay in seconds between tests
+        inter_run_delay: Extra fixed delay in seconds between runs (rate limiting is adaptive)
+        inter_test_delay: Extra fixed delay in seconds between tests
         max_retries: Maximum retry attempts for failed operations
         initial_backoff: Initial backoff delay for retries (seconds)
         backoff_multiplier: Multiplier for exponential backoff
+        workers: Number of tests to run concurrently (each on its own isolated installation)
+        use_asyncio: Drive tests on an asyncio event loop (asyncio subprocesses) instead of threads
+        pipeline: Overlap judge/interrogation of one test with the next test's assistant phase
+        pipeline_depth: Maximum tests queued in front of each pipeline stage
+        rate_limit_rpm: Requests per minute allowed per model (0 = unlimited)
+        max_concurrent_calls: Concurrent model calls allowed per model (0 = unlimited)
+
+        adaptive_runs: Stop repeating a case once its pass-rate interval is narrow enough
+        adaptive_max_width: Wilson 95% interval width at which a case counts as settled
+        adaptive_min_runs: Minimum runs per case before adaptive stopping applies
+        shard_index: Which shard of the case x run matrix to run (1-based)
+        shard_count: Number of shards the matrix is split into (1 = no sharding)
+        shard_history: Results DB whose durations balance the shards (None = static estimates)
+        schedule: Case order: 'file', 'longest-first' or 'flaky-first' (from ResultsDB history)
+        reuse_unchanged: Import stored results for cases whose input hash is unchanged
+        resume_run_id: Resume this ResultsDB run, skipping finished (test, run) pairs
 
         # Timeouts
         assistant_timeout: Timeout for assistant execution (seconds)
         judge_timeout: Timeout for judge evaluation (seconds)
         interrogation_timeout: Timeout for interrogation questions (seconds)
         cleanup_timeout: Timeout for graph cleanup (seconds)
+        adaptive_timeouts: Derive per-case phase timeouts from ResultsDB duration history
+        timeout_factor: Safety factor applied to the p99 duration
+        timeout_floor: Lowest adaptive timeout (seconds)
+        timeout_min_samples: Durations needed before a phase's timeout adapts
+        stream_assistant: Run the assistant with stream-json output and early abort
+        inactivity_timeout: Abort a streamed assistant run after this long without output (seconds)
+        max_tool_calls: Abort a streamed assistant run after this many tool calls (0 = unlimited)
+        max_tool_errors: Abort a streamed assistant run after this many consecutive tool errors (0 = never)
+        max_identical_calls: Abort a streamed assistant run repeating one tool call this often (0 = never)
 
         # Features
         mode: Test mode (always 'real' - Live MCP)
         clean_between_tests: Whether to clean graph between tests
+        fixture_snapshot_dir: Build each graph_setup fixture once here and restore per test (optional)
+        preflight: Probe the graph-memory server (each worker's, in pool mode) before running tests
         interrogate_failures: Whether to interrogate failed tests
         interrogate_passes: Whether to interrogate passed tests
         use_refactored_cases: Whether to use refactored test cases
         use_isolated_env: Use isolated test installation directory
         keep_test_install: Keep test installation after completion
+        cassette_mode: Claude CLI cassettes: 'off', 'record' or 'replay'
+        cassette_dir: Cassette directory for record/replay
 
         # Output
         log_file: Path to log file
@@ -48,6 +77,7 @@ class Config:
         interrogation_log: Path to interrogation log (optional)
         print_assistant_on_fail: Whether to print assistant output on failure
         markdown_report: Path to generated Markdown report (optional)
+        trace_path: Write a Chrome trace-event timeline of the run here (optional)
 
         # CLI
         suite: Test suite to run ('assistant' or 'judge')
@@ -63,26 +93,54 @@ class Config:
 
     # Execution
     runs: int = 1
-    inter_run_delay: float = 10.0
+    inter_run_delay: float = 0.0
     inter_test_delay: float = 0.0
     max_retries: int = 3
-    initial_backoff: float = 30.0
+    initial_backoff: float = 5.0
     backoff_multiplier: float = 2.0
+    workers: int = 1
+    use_asyncio: bool = False
+    pipeline: bool = False
+    pipeline_depth: int = 2
+    rate_limit_rpm: float = 50.0
+    max_concurrent_calls: int = 8
+    adaptive_runs: bool = False
+    adaptive_max_width: float = 0.6
+    adaptive_min_runs: int = 3
+    shard_index: int = 1
+    shard_count: int = 1
+    shard_history: Optional[Path] = None
+    schedule: str = "file"
+    reuse_unchanged: bool = False
+    resume_run_id: Optional[int] = None
 
     # Timeouts
     assistant_timeout: float = 600.0
     judge_timeout: float = 120.0  # Increased for complex evaluations
     interrogation_timeout: float = 120.0  # Increased for complex interrogations
     cleanup_timeout: float = 120.0
+    adaptive_timeouts: bool = False
+    timeout_factor: float = 2.0
+    timeout_floor: float = 30.0
+    timeout_min_samples: int = 5
+    stream_assistant: bool = False
+    inactivity_timeout: float = 120.0
+    max_tool_calls: int = 60
+    max_tool_errors: int = 3
+    max_identical_calls: int = 4
 
     # Features
     mode: str = "real"  # Always 'real' (Live MCP)
     clean_between_tests: bool = False
+    fixture_snapshot_dir: Optional[Path] = None
+    preflight: bool = False
     interrogate_failures: bool = True  # Default: interrogate failures
     interrogate_passes: bool = True  # Default: interrogate passes (--interrogate-all)
     use_refactored_cases: bool = True
     use_isolated_env: bool = False  # Use isolated test installation
     keep_test_install: bool = False  # Keep test installation after completion
+    cassette_mode: str = "off"  # Record or replay Claude CLI calls
+    cassette_dir: Optional[Path] = None
 
     # Output
     log_file: Path = Path("test_run.log")
@@ -91,6 +149,7 @@ class Config:
     interrogation_log: Optional[Path] = None
     print_assistant_on_fail: bool = False
     markdown_report: Optional[str] = None
+    trace_path: Optional[Path] = None
 
     # CLI
     suite: str = "assistant"  # 'assistant' or 'judge'
@@ -124,6 +183,45 @@ class Config:
         if self.runs < 1:
             raise ValueError(f"Runs must be >= 1, got {self.runs}")
 
+        if self.workers < 1:
+            raise ValueError(f"Workers must be >= 1, got {self.workers}")
+
+        if self.pipeline and self.use_asyncio:
+            raise ValueError("Pipeline mode and asyncio mode cannot be combined")
+
+        if self.pipeline_depth < 1:
+            raise ValueError(f"Pipeline depth must be >= 1, got {self.pipeline_depth}")
+
+        if self.rate_limit_rpm < 0:
+            raise ValueError(f"Rate limit must be >= 0, got {self.rate_limit_rpm}")
+
+        if self.max_concurrent_calls < 0:
+            raise ValueError(f"Max concurrent calls must be >= 0, got {self.max_concurrent_calls}")
+
+        if not 0 < self.adaptive_max_width <= 1:
+            raise ValueError(f"Adaptive max width must be in (0, 1], got {self.adaptive_max_width}")
+
+        if self.adaptive_min_runs < 1:
+            raise ValueError(f"Adaptive min runs must be >= 1, got {self.adaptive_min_runs}")
+
+        if self.shard_count < 1 or not 1 <= self.shard_index <= self.shard_count:
+            raise ValueError(f"Shard must be K/N with 1 <= K <= N, got {self.shard_index}/{self.shard_count}")
+
+        if self.shard_history and not self.shard_history.exists():
+            raise ValueError(f"Shard history database not found: {self.shard_history}")
+
+        if self.schedule not in ("file", "longest-first", "flaky-first"):
+            raise ValueError(f"Schedule must be file, longest-first or flaky-first, got {self.schedule}")
+
+        if self.cassette_mode not in ("off", "record", "replay"):
+            raise ValueError(f"Cassette mode must be off, record or replay, got {self.cassette_mode}")
+
+        if self.cassette_mode != "off" and self.cassette_dir is None:
+            raise ValueError(f"Cassette mode '{self.cassette_mode}' requires a cassette directory")
+
+        if self.fixture_snapshot_dir is not None and not self.clean_between_tests:
+            raise ValueError("Fixture snapshots replace the whole graph and require clean_between_tests")
+
         if self.max_retries < 0:
             raise ValueError(f"Max retries must be >= 0, got {self.max_retries}")
 
@@ -133,6 +231,22 @@ class Config:
         if self.assistant_timeout <= 0:
             raise ValueError(f"Assistant timeout must be > 0, got {self.assistant_timeout}")
 
+        if self.timeout_factor < 1:
+            raise ValueError(f"Timeout factor must be >= 1, got {self.timeout_factor}")
+
+        if self.timeout_floor <= 0:
+            raise ValueError(f"Timeout floor must be > 0, got {self.timeout_floor}")
+
+        if self.timeout_min_samples < 1:
+            raise ValueError(f"Timeout min samples must be >= 1, got {self.timeout_min_samples}")
+
+        if self.inactivity_timeout <= 0:
+            raise ValueError(f"Inactivity timeout must be > 0, got {self.inactivity_timeout}")
+
+        for name in ("max_tool_calls", "max_tool_errors", "max_identical_calls"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0, got {getattr(self, name)}")
+
         # Validate paths exist
         if not self.system_prompt_path.exists():
             raise ValueError(f"System prompt not found: {self.system_prompt_path}")
@@ -147,6 +261,10 @@ class Config:
         """Check if running in live MCP mode (always True now)."""
         return True
 
+    def uses_worker_pool(self) -> bool:
+        """Check if tests run on a pool of isolated worker installations."""
+        return self.workers > 1 or self.use_asyncio or self.pipeline
+
     def should_clean_graph(self) -> bool:
         """Check if graph cleanup is enabled."""
         return self.clean_between_tests
@@ -203,23 +321,52 @@ class Config:
             "max_retries": self.max_retries,
             "initial_backoff": self.initial_backoff,
             "backoff_multiplier": self.backoff_multiplier,
+            "workers": self.workers,
+            "use_asyncio": self.use_asyncio,
+            "pipeline": self.pipeline,
+            "pipeline_depth": self.pipeline_depth,
+            "rate_limit_rpm": self.rate_limit_rpm,
+            "max_concurrent_calls": self.max_concurrent_calls,
+            "adaptive_runs": self.adaptive_runs,
+            "adaptive_max_width": self.adaptive_max_width,
+            "adaptive_min_runs": self.adaptive_min_runs,
+            "shard_index": self.shard_index,
+            "shard_count": self.shard_count,
+            "shard_history": str(self.shard_history) if self.shard_history else None,
+            "schedule": self.schedule,
+            "reuse_unchanged": self.reuse_unchanged,
+            "resume_run_id": self.resume_run_id,
             "assistant_timeout": self.assistant_timeout,
             "judge_timeout": self.judge_timeout,
             "interrogation_timeout": self.interrogation_timeout,
             "cleanup_timeout": self.cleanup_timeout,
+            "adaptive_timeouts": self.adaptive_timeouts,
+            "timeout_factor": self.timeout_factor,
+            "timeout_floor": self.timeout_floor,
+            "timeout_min_samples": self.timeout_min_samples,
+            "stream_assistant": self.stream_assistant,
+            "inactivity_timeout": self.inactivity_timeout,
+            "max_tool_calls": self.max_tool_calls,
+            "max_tool_errors": self.max_tool_errors,
+            "max_identical_calls": self.max_identical_calls,
             "mode": self.mode,
             "clean_between_tests": self.clean_between_tests,
+            "fixture_snapshot_dir": str(self.fixture_snapshot_dir) if self.fixture_snapshot_dir else None,
+            "preflight": self.preflight,
             "interrogate_failures": self.interrogate_failures,
             "interrogate_passes": self.interrogate_passes,
             "use_refactored_cases": self.use_refactored_cases,
             "use_isolated_env": self.use_isolated_env,
             "keep_test_install": self.keep_test_install,
+            "cassette_mode": self.cassette_mode,
+            "cassette_dir": str(self.cassette_dir) if self.cassette_dir else None,
             "log_file": str(self.log_file),
             "log_level": self.log_level,
             "results_db": str(self.results_db),
             "interrogation_log": str(self.interrogation_log) if self.interrogation_log else None,
             "print_assistant_on_fail": self.print_assistant_on_fail,
             "markdown_report": self.markdown_report,
+            "trace_path": str(self.trace_path) if self.trace_path else None,
             "suite": self.suite,
             "category": self.category,
             "test_name": self.test_name,
@@ -238,7 +385,8 @@ class Config:
         """
         # Convert string paths to Path objects
         for key in ('system_prompt_path', 'test_cases_path', 'mcp_config_path',
-                    'log_file', 'results_db', 'interrogation_log'):
+                    'log_file', 'results_db', 'interrogation_log', 'cassette_dir',
+                    'shard_history', 'trace_path', 'fixture_snapshot_dir'):
             if key in data and data[key] is not None:
                 data[key] = Path(data[key])
 
@@ -252,9 +400,9 @@ DEFAULT_CONFIG = Config(
     mcp_config_path=Path("tests/mcp-config.json"),  # Live MCP mode
     mode="real",
     runs=1,
-    inter_run_delay=10.0,
+    inter_run_delay=0.0,
     max_retries=3,
-    initial_backoff=30.0,
+    initial_backoff=5.0,
     interrogate_failures=True,  # Default: interrogate all
     interrogate_passes=True,
 )
@@ -0,0 +1,103 @@
+"""Sequential early stopping for multi-run variance measurement.
+
+With --runs N every case normally runs N times, even when its first few
+runs already pin the outcome down (e.g. 3/3 passes). In adaptive mode a
+case stops being repeated once the Wilson score interval for its pass rate
+is narrower than a configured width, so the remaining runs are spent on
+cases that are actually flaky.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+
+# z for a two-sided 95% confidence interval
+DEFAULT_Z = 1.96
+
+
+def wilson_interval(passes: int, total: int, z: float = DEFAULT_Z) -> Tuple[float, float]:
+    """Wilson score interval for a pass rate.
+
+    Unlike the normal approximation, the Wilson interval stays inside
+    [0, 1] and is meaningful for small samples and 0%/100% pass rates.
+
+    Args:
+        passes: Number of passing runs
+        total: Number of runs
+        z: Standard normal quantile (1.96 for 95% confidence)
+
+    Returns:
+        (low, high) bounds of the interval; (0.0, 1.0) when total is 0
+    """
+    if total <= 0:
+        return 0.0, 1.0
+
+    p = passes / total
+    z2 = z * z
+    denominator = 1 + z2 / total
+    center = (p + z2 / (2 * total)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+class EarlyStopper:
+    """Tracks per-case pass/fail history and decides when a case is settled.
+
+    Attributes:
+        max_width: Stop repeating a case once its interval is at most this wide
+        min_runs: Never stop a case before this many runs
+        z: Standard normal quantile for the interval
+    """
+
+    def __init__(self, max_width: float, min_runs: int, z: float = DEFAULT_Z):
+        """Initialize stopper.
+
+        Args:
+            max_width: Interval width (0-1] below which a case is settled
+            min_runs: Minimum runs per case before stopping is considered
+            z: Standard normal quantile for the interval
+        """
+        if not 0 < max_width <= 1:
+            raise ValueError(f"max_width must be in (0, 1], got {max_width}")
+        if min_runs < 1:
+            raise ValueError(f"min_runs must be >= 1, got {min_runs}")
+
+        self.max_width = max_width
+        self.min_runs = min_runs
+        self.z = z
+        self._history: Dict[str, List[bool]] = {}
+
+    def record(self, case_name: str, passed: bool) -> None:
+        """Add one run outcome for a case.
+
+        Args:
+            case_name: Test case name
+            passed: Whether the run passed
+        """
+        self._history.setdefault(case_name, []).append(passed)
+
+    def interval(self, case_name: str) -> Tuple[float, float]:
+        """Current Wilson interval for a case's pass rate.
+
+        Args:
+            case_name: Test case name
+
+        Returns:
+            (low, high) interval bounds
+        """
+        history = self._history.get(case_name, [])
+        return wilson_interval(sum(history), len(history), self.z)
+
+    def is_settled(self, case_name: str) -> bool:
+        """Whether further runs of a case are unnecessary.
+
+        Args:
+            case_name: Test case name
+
+        Returns:
+            True once the case has min_runs runs and a narrow enough interval
+        """
+        if len(self._history.get(case_name, [])) < self.min_runs:
+            return False
+        low, high = self.interval(case_name)
+        return high - low <= self.max_width
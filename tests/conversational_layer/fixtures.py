@@ -4,19 +4,16 @@ Provides functions to clean graph state between tests and populate
 test fixtures.
 """
 
+import asyncio
 import json
-import subprocess
-import textwrap
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .config import Config
-from .errors import handle_subprocess_error
+from .graph_loader import FixtureError, McpSessionError, load_fixture, probe_mcp_server, read_server_config
 from .logging_config import get_logger
-
-
-# Constants from main test file
-CLAUDE_CMD = "claude"
+from .snapshots import GRAPH_DIRS, get_fixture_snapshot_store
+from .trash import TRASH_DIR_NAME, move_to_trash
 
 
 def parse_payload(raw: str) -> Optional[Dict[str, Any]]:
@@ -58,6 +55,25 @@ def extract_text(payload: Dict[str, Any]) -> str:
     return json.dumps(payload, indent=2)
 
 
+def graph_base_path(config: Config) -> Optional[Path]:
+    """Graph data directory (BASE_PATH) named in the MCP config.
+
+    Args:
+        config: Test configuration
+
+    Returns:
+        BASE_PATH of the graph-memory server, or None if not configured
+    """
+    if not config.mcp_config_path:
+        return None
+    try:
+        server = read_server_config(config.mcp_config_path)
+    except (OSError, ValueError, McpSessionError):
+        return None
+    base_path = server.get("env", {}).get("BASE_PATH")
+    return Path(base_path) if base_path else None
+
+
 def clean_graph_state(config: Config) -> bool:
     """Delete all nodes in the graph to ensure clean state between tests.
 
@@ -68,47 +84,34 @@ def clean_graph_state(config: Config) -> bool:
         True if cleanup succeeded, False otherwise
 
     Notes:
-        - Uses brute force filesystem deletion (no model involved)
-        - Deletes the entire graph database directory
-        - Much faster and more reliable than model-based cleanup
-        - Reads actual data location from MCP config's BASE_PATH
+        - Uses brute force filesystem removal (no model involved)
+        - Resets both the registry (_system) and node content (_content)
+        - Directories are renamed into BASE_PATH/.trash and deleted by a
+          background reaper, so the next test starts immediately
+        - Reads actual data location from MCP config's BASE_PATH; the MCP
+          call log next to the graph is kept
     """
     logger = get_logger()
 
-    # Read the MCP config to get the actual BASE_PATH
-    graph_data_dir = None
-
-    if config.mcp_config_path and config.mcp_config_path.exists():
-        try:
-            with open(config.mcp_config_path, 'r', encoding='utf-8') as f:
-                mcp_config = json.load(f)
-
-            # Extract BASE_PATH from gtd-graph-memory server config
-            if "mcpServers" in mcp_config and "gtd-graph-memory" in mcp_config["mcpServers"]:
-                server_config = mcp_config["mcpServers"]["gtd-graph-memory"]
-                if "env" in server_config and "BASE_PATH" in server_config["env"]:
-                    base_path = Path(server_config["env"]["BASE_PATH"])
-                    graph_data_dir = base_path / "gtd-memory" / "_system"
-                    logger.debug(f"Using BASE_PATH from MCP config: {base_path}")
-        except Exception as e:
-            logger.warning(f"Failed to read MCP config for BASE_PATH: {e}")
-
-    # Fall back to default location if not found in config
-    if graph_data_dir is None:
+    base_path = graph_base_path(config)
+    if base_path is not None:
+        logger.debug(f"Using BASE_PATH from MCP config: {base_path}")
+    else:
+        # Fall back to default location if not found in config
         project_root = config.test_cases_path.parent.parent
-        graph_data_dir = project_root / ".data" / "gtd-memory" / "_system"
-        logger.debug(f"Using default graph location: {graph_data_dir}")
+        base_path = project_root / ".data" / "gtd-memory"
+        logger.debug(f"Using default graph location: {base_path}")
 
-    if not graph_data_dir.exists():
-        logger.info(f"Graph data directory does not exist: {graph_data_dir}")
+    graph_dirs = [base_path / graph_dir for graph_dir in GRAPH_DIRS]
+    if not any(path.exists() for path in graph_dirs):
+        logger.info(f"Graph data directory does not exist: {base_path}")
         return True  # Nothing to clean
 
-    logger.info(f"Cleaning graph state: {graph_data_dir}")
+    logger.info(f"Cleaning graph state: {base_path}")
 
     try:
-        import shutil
-        shutil.rmtree(graph_data_dir)
-        logger.info("Graph cleanup completed successfully (brute force)")
+        move_to_trash(graph_dirs, base_path / TRASH_DIR_NAME)
+        logger.info("Graph cleanup completed successfully (moved to trash)")
         return True
 
     except Exception as e:
@@ -152,6 +155,13 @@ def setup_graph_from_fixture(
                 }
             ]
         }
+
+    Notes:
+        - Writes nodes and connections directly through the graph-memory
+          tools (see graph_loader.py); no model is involved
+        - depends_on entries name a task id or a context/state/task content
+        - With fixture snapshots enabled, the graph is replaced by a clone
+          of the fixture's snapshot (built on first use; see snapshots.py)
     """
     logger = get_logger()
 
@@ -163,96 +173,42 @@ def setup_graph_from_fixture(
         logger.error("MCP config path is required for fixture setup")
         return False
 
-    # Convert fixture to natural language setup instructions
-    setup_instructions = []
-
-    # Tasks
-    for task in fixture.get("tasks", []):
-        content = task.get("content", "")
-        is_complete = task.get("isComplete", False)
-        depends_on = task.get("depends_on", [])
-        task_id = task.get("id", "")
-
-        if is_complete:
-            setup_instructions.append(f"Create a completed task: '{content}'")
-        else:
-            setup_instructions.append(f"Create an incomplete task: '{content}'")
-
-        if task_id:
-            setup_instructions.append(f"  (Store this task ID as '{task_id}' for later reference)")
-
-        for dep in depends_on:
-            setup_instructions.append(f"  Make this task depend on: {dep}")
-
-    # Contexts
-    for context in fixture.get("contexts", []):
-        content = context.get("content", "")
-        is_available = context.get("isTrue", False)
-        avail_str = "available" if is_available else "unavailable"
-        setup_instructions.append(f"Create context {content} (currently {avail_str})")
-
-    # States
-    for state in fixture.get("states", []):
-        content = state.get("content", "")
-        is_true = state.get("isTrue", False)
-        state_str = "true" if is_true else "false"
-        setup_instructions.append(f"Create manual state: '{content}' (currently {state_str})")
-
-    if not setup_instructions:
-        logger.debug("No fixture instructions to execute")
-        return True  # Nothing to set up
-
-    setup_prompt = "Set up the following test data:\n\n" + "\n".join(setup_instructions)
+    snapshots = get_fixture_snapshot_store()
+    try:
+        if snapshots is not None:
+            base_path = graph_base_path(config)
+            if base_path is None:
+                logger.error("Fixture snapshots need BASE_PATH in the MCP config")
+                return False
+            snapshot = snapshots.restore(fixture, base_path, config.mcp_config_path, config.cleanup_timeout)
+            logger.info(f"Fixture restored from snapshot {snapshot.name[:12]} ({snapshots.method})")
+            return True
+        node_ids = load_fixture(fixture, config.mcp_config_path, config.cleanup_timeout)
+    except FixtureError as e:
+        logger.error(f"Invalid graph fixture: {e}")
+        return False
+    except (McpSessionError, OSError, ValueError) as e:
+        logger.warning(f"Graph setup failed: {e}")
+        return False
 
-    setup_system = textwrap.dedent("""
-        You are a test fixture setup utility for a GTD system.
-        Your job is to create nodes and connections as requested.
+    logger.info(f"Fixture setup completed successfully ({len(set(node_ids.values()))} nodes)")
+    return True
 
-        Execute all setup commands precisely, then confirm completion.
-        Be concise - just create what's needed and confirm when done.
-    """).strip()
 
-    logger.info(f"Setting up fixture with {len(setup_instructions)} instructions")
+async def setup_graph_from_fixture_async(
+    fixture: Dict[str, Any],
+    config: Config
+) -> bool:
+    """Async variant of setup_graph_from_fixture.
 
-    try:
-        args = [CLAUDE_CMD]
-        if config.mcp_config_path:
-            args += ["--mcp-config", str(config.mcp_config_path)]
-        args += [
-            "--dangerously-skip-permissions",
-            "--print",
-            "--output-format", "json",
-            "--system-prompt", setup_system,
-            setup_prompt
-        ]
-
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=config.cleanup_timeout,
-            check=False,
-        )
-
-        if result.returncode != 0:
-            logger.warning(f"Graph setup failed: {result.stderr.strip()}")
-            return False
-
-        payload = parse_payload(result.stdout)
-        if payload is None:
-            logger.warning("Graph setup returned non-JSON output")
-            return False
-
-        logger.info("Fixture setup completed successfully")
-        return True
+    Args:
+        fixture: Dictionary with 'tasks', 'contexts', 'states' arrays
+        config: Test configuration
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"Graph setup timed out after {config.cleanup_timeout}s")
-        return False
-    except Exception as e:
-        error_dict = handle_subprocess_error(e, "setup_graph_from_fixture")
-        logger.error(f"Graph setup error: {error_dict['reason']}")
-        return False
+    Returns:
+        True if setup succeeded, False otherwise
+    """
+    return await asyncio.to_thread(setup_graph_from_fixture, fixture, config)
 
 
 def verify_mcp_server(mcp_config_path: Path, timeout: float = 10.0) -> bool:
@@ -265,46 +221,17 @@ def verify_mcp_server(mcp_config_path: Path, timeout: float = 10.0) -> bool:
     Returns:
         True if server is healthy, False otherwise
 
-    Performs a simple query to verify the MCP server is running and responding.
+    Speaks MCP to the graph-memory server directly (initialize, tools/list,
+    get_ontology; see probe_mcp_server), so the check takes well under a
+    second and involves no model.
     """
     logger = get_logger()
 
     logger.debug(f"Verifying MCP server at {mcp_config_path}")
+    health = probe_mcp_server(mcp_config_path, timeout)
 
-    try:
-        # Simple ping query
-        ping_system = "You are a health check utility. Just confirm the system is working."
-        ping_prompt = "Ping - respond if you can access the graph memory."
-
-        args = [
-            CLAUDE_CMD,
-            "--mcp-config", str(mcp_config_path),
-            "--dangerously-skip-permissions",
-            "--print",
-            "--output-format", "json",
-            "--system-prompt", ping_system,
-            ping_prompt
-        ]
-
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
-
-        if result.returncode == 0:
-            logger.info("MCP server health check passed")
-            return True
-        else:
-            logger.warning(f"MCP server health check failed: {result.stderr.strip()}")
-            return False
-
-    except subprocess.TimeoutExpired:
-        logger.error(f"MCP server health check timed out after {timeout}s")
-        return False
-    except Exception as e:
-        error_dict = handle_subprocess_error(e, "verify_mcp_server")
-        logger.error(f"MCP server health check error: {error_dict['reason']}")
-        return False
+    if health.healthy:
+        logger.info(f"MCP server health check passed: {health.summary()}")
+    else:
+        logger.warning(f"MCP server health check failed: {health.error}")
+    return health.healthy
@@ -0,0 +1,361 @@
+"""Deterministic graph fixture loading.
+
+Test cases describe their starting graph as a ``graph_setup`` fixture
+(tasks, contexts, states and the DependsOn edges between them). Instead of
+asking a model to build it, the loader writes it straight through the
+graph-memory tools:
+
+    node_ids = load_fixture(case["graph_setup"], mcp_config_path)
+
+One graph-memory server is started from the MCP config (the same command,
+arguments and environment the assistant gets), and every node and
+connection is created over that single stdio session, so setting up a
+fixture costs one server start plus a few milliseconds per tool call.
+The session is an McpStdioConnection (mcp_stdio.py), the transport the API
+harness uses too, so both decode tool results the same way.
+
+Fixtures refer to each other symbolically. A ``depends_on`` entry names
+either a task's ``id`` (e.g. ``"task_1"``) or the content of a context,
+state or task (e.g. ``"atOffice"``); plan_fixture() resolves these before
+anything is written, so a typo fails the setup instead of producing a
+partial graph.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .mcp_stdio import McpStdioConnection, McpStdioError, McpToolError
+from .tracing import span
+
+
+GRAPH_SERVER_NAME = "gtd-graph-memory"
+
+# Same schema as src/gtd-ontology (buildGtdOntologyDefinition)
+GTD_ONTOLOGY: Dict[str, Any] = {
+    "node_types": ["Task", "State", "Context", "UNSPECIFIED"],
+    "connection_types": [
+        {
+            "name": "DependsOn",
+            "from_types": ["Task", "State"],
+            "to_types": ["Task", "State", "Context", "UNSPECIFIED"],
+        }
+    ],
+}
+
+
+class FixtureError(ValueError):
+    """Fixture is malformed (e.g. depends on something it never defines)."""
+
+
+# Graph-memory server failed to start, timed out, or rejected a call
+# (McpToolError, a subclass, means the tool itself reported an error)
+McpSessionError = McpStdioError
+
+
+@dataclass
+class FixtureNode:
+    """A node to create for a fixture."""
+
+    node_type: str
+    content: str
+    properties: Dict[str, Any]
+    names: List[str] = field(default_factory=list)
+
+    def create_request(self) -> Dict[str, Any]:
+        """Arguments for the create_node tool."""
+        return {
+            "type": self.node_type,
+            "content": self.content,
+            "encoding": "utf-8",
+            "format": "markdown",
+            "properties": self.properties,
+        }
+
+
+@dataclass
+class FixturePlan:
+    """Nodes to create, and DependsOn edges as (from, to) node indexes."""
+
+    nodes: List[FixtureNode]
+    edges: List[Tuple[int, int]]
+
+
+def plan_fixture(fixture: Mapping[str, Any]) -> FixturePlan:
+    """Turn a graph_setup fixture into nodes and resolved edges.
+
+    Contexts and states are planned before tasks. A reference resolves to
+    the task with that ``id`` first, then to the context, state or task
+    with that content.
+
+    Args:
+        fixture: Dictionary with 'tasks', 'contexts', 'states' arrays
+
+    Returns:
+        Plan with every depends_on reference resolved to a node index
+
+    Raises:
+        FixtureError: If a depends_on entry matches no fixture node
+    """
+    nodes: List[FixtureNode] = []
+    for context in fixture.get("contexts", []):
+        properties = {"isTrue": bool(context.get("isTrue", False))}
+        nodes.append(FixtureNode("Context", context.get("content", ""), properties))
+    for state in fixture.get("states", []):
+        properties = {"isTrue": bool(state.get("isTrue", False)), "logic": "MANUAL"}
+        nodes.append(FixtureNode("State", state.get("content", ""), properties))
+
+    tasks = fixture.get("tasks", [])
+    first_task = len(nodes)
+    for task in tasks:
+        properties = {"isComplete": bool(task.get("isComplete", False))}
+        nodes.append(FixtureNode("Task", task.get("content", ""), properties))
+
+    symbols: Dict[str, int] = {}
+    for index, task in enumerate(tasks, start=first_task):
+        task_id = task.get("id")
+        if task_id:
+            if task_id in symbols:
+                raise FixtureError(f"Duplicate fixture task id: {task_id!r}")
+            symbols[task_id] = index
+    for index, node in enumerate(nodes):
+        if node.content:
+            symbols.setdefault(node.content, index)
+    for name, index in symbols.items():
+        nodes[index].names.append(name)
+
+    edges: List[Tuple[int, int]] = []
+    for index, task in enumerate(tasks, start=first_task):
+        for reference in task.get("depends_on", []):
+            if reference not in symbols:
+                raise FixtureError(
+                    f"Task {nodes[index].content!r} depends on unknown fixture node {reference!r}"
+                )
+            edges.append((index, symbols[reference]))
+
+    return FixturePlan(nodes=nodes, edges=edges)
+
+
+def read_server_config(mcp_config_path: Path) -> Dict[str, Any]:
+    """Read the graph-memory server entry from an MCP config.
+
+    Args:
+        mcp_config_path: MCP config file (as passed to --mcp-config)
+
+    Returns:
+        Server entry with 'command', optional 'args' and 'env'
+
+    Raises:
+        McpSessionError: If the config has no graph-memory server
+    """
+    with open(mcp_config_path, 'r', encoding='utf-8') as f:
+        mcp_config = json.load(f)
+    server = mcp_config.get("mcpServers", {}).get(GRAPH_SERVER_NAME)
+    if not server or "command" not in server:
+        raise McpSessionError(f"No {GRAPH_SERVER_NAME} server in MCP config {mcp_config_path}")
+    return server
+
+
+@contextmanager
+def open_graph_session(server: Mapping[str, Any], timeout: float) -> Iterator[McpStdioConnection]:
+    """Start a server from its config entry and complete the MCP handshake.
+
+    Args:
+        server: MCP config server entry ('command', 'args', 'env')
+        timeout: Seconds allowed per request (including the handshake)
+
+    Yields:
+        Initialized McpStdioConnection; the server is stopped on exit
+
+    Raises:
+        McpSessionError: If the server cannot be started or never answers
+    """
+    env = os.environ.copy()
+    env.update({key: str(value) for key, value in server.get("env", {}).items()})
+    command = [server["command"], *server.get("args", [])]
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr:
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                env=env,
+                text=True,
+                errors="replace",
+            )
+        except OSError as e:
+            raise McpSessionError(f"Could not start graph-memory server {command[0]}: {e}") from e
+
+        client = McpStdioConnection(process, server_name=GRAPH_SERVER_NAME, timeout=timeout)
+        try:
+            try:
+                client.initialize()
+            except McpSessionError as e:
+                raise McpSessionError(f"{e}: {_tail(stderr)}") from e
+            yield client
+        finally:
+            client.close()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def call_graph_tool(client: McpStdioConnection, name: str, arguments: Mapping[str, Any], deadline: float) -> Any:
+    """Call a tool (traced) with whatever is left of a session deadline.
+
+    Args:
+        client: Session from open_graph_session()
+        name: Tool name (without the mcp__server__ prefix)
+        arguments: Tool arguments
+        deadline: time.monotonic() value the whole session must finish by
+
+    Returns:
+        Decoded result (see decode_tool_result)
+
+    Raises:
+        McpToolError: If the tool reports an error
+        McpSessionError: If the server fails or the deadline passes
+    """
+    with span(name, "mcp"):
+        return client.call_tool(name, arguments, timeout=max(0.0, deadline - time.monotonic()))
+
+
+def ensure_ontology(client: McpStdioConnection, deadline: float) -> None:
+    """Create the GTD ontology unless the graph already has one."""
+    try:
+        call_graph_tool(client, "create_ontology", GTD_ONTOLOGY, deadline)
+    except McpToolError as e:
+        if "already exists" not in str(e):
+            raise
+
+
+def load_fixture(
+    fixture: Mapping[str, Any],
+    mcp_config_path: Path,
+    timeout: float = 30.0
+) -> Dict[str, str]:
+    """Write a graph_setup fixture into the graph.
+
+    Args:
+        fixture: Dictionary with 'tasks', 'contexts', 'states' arrays
+        mcp_config_path: MCP config naming the graph-memory server
+        timeout: Seconds allowed for the whole load
+
+    Returns:
+        Fixture name (task id or content) -> created node ID
+
+    Raises:
+        FixtureError: If the fixture references undefined nodes
+        McpSessionError: If the server fails or rejects a write
+    """
+    plan = plan_fixture(fixture)
+    if not plan.nodes:
+        return {}
+
+    deadline = time.monotonic() + timeout
+    server = read_server_config(mcp_config_path)
+    with open_graph_session(server, timeout) as client:
+        ensure_ontology(client, deadline)
+
+        node_ids: List[str] = []
+        for node in plan.nodes:
+            created = call_graph_tool(client, "create_node", node.create_request(), deadline)
+            node_ids.append(_node_id(created))
+
+        for from_index, to_index in plan.edges:
+            call_graph_tool(client, "create_connection", {
+                "type": "DependsOn",
+                "from_node_id": node_ids[from_index],
+                "to_node_id": node_ids[to_index],
+            }, deadline)
+
+    return {name: node_ids[index] for index, node in enumerate(plan.nodes) for name in node.names}
+
+
+@dataclass
+class McpHealth:
+    """Result of probing the graph-memory server.
+
+    Attributes:
+        healthy: Server completed the handshake and answered every probe
+        startup_time: Seconds from spawning the server to its initialize response
+        latencies: Seconds per probe call (tools/list, get_ontology)
+        tools: Tool names the server offers
+        ontology_loaded: Whether get_ontology found an ontology (None if not asked)
+        error: Why the probe failed (None when healthy)
+    """
+
+    healthy: bool
+    startup_time: float = 0.0
+    latencies: Dict[str, float] = field(default_factory=dict)
+    tools: List[str] = field(default_factory=list)
+    ontology_loaded: Optional[bool] = None
+    error: Optional[str] = None
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        if not self.healthy:
+            return f"unhealthy: {self.error}"
+        calls = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.latencies.items())
+        ontology = "ontology loaded" if self.ontology_loaded else "no ontology"
+        return f"started in {self.startup_time * 1000:.0f}ms, {len(self.tools)} tools, {ontology} ({calls})"
+
+
+def probe_mcp_server(mcp_config_path: Path, timeout: float = 10.0) -> McpHealth:
+    """Check the graph-memory server over MCP without involving a model.
+
+    Starts the server from the MCP config, performs the initialize
+    handshake, lists tools and calls get_ontology. A get_ontology error
+    (no ontology yet) still counts as a healthy response.
+
+    Args:
+        mcp_config_path: MCP config naming the graph-memory server
+        timeout: Seconds allowed for the whole probe
+
+    Returns:
+        McpHealth with startup time and per-call latencies
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    try:
+        server = read_server_config(mcp_config_path)
+        with open_graph_session(server, timeout) as client:
+            health = McpHealth(healthy=True, startup_time=time.monotonic() - started)
+
+            call_start = time.monotonic()
+            health.tools = [tool.get("name", "") for tool in client.list_tools()]
+            health.latencies["tools/list"] = time.monotonic() - call_start
+
+            call_start = time.monotonic()
+            try:
+                call_graph_tool(client, "get_ontology", {}, deadline)
+                health.ontology_loaded = True
+            except McpToolError:
+                health.ontology_loaded = False
+            health.latencies["get_ontology"] = time.monotonic() - call_start
+    except (McpSessionError, OSError, ValueError) as e:
+        return McpHealth(healthy=False, startup_time=time.monotonic() - started, error=str(e))
+    return health
+
+
+def _tail(stderr, limit: int = 2000) -> str:
+    """Last part of a server's captured stderr."""
+    stderr.flush()
+    stderr.seek(0)
+    return stderr.read().strip()[-limit:] or "no stderr output"
+
+
+def _node_id(created: Any) -> str:
+    """Extract node_id from a create_node result."""
+    if isinstance(created, dict) and created.get("node_id"):
+        return created["node_id"]
+    raise McpSessionError(f"create_node returned no node_id: {created!r}")
@@ -0,0 +1,134 @@
+"""Content-addressed input hashes for test cases.
+
+A case's input hash covers everything that can change its outcome: the
+case JSON, the bundled system prompt, the test overlays, the models,
+judge rubric, the user-proxy prompt and default model, the stream guard
+limits, and the graph-memory MCP server build. Two results with the
+same hash were produced from identical inputs, so with --reuse-unchanged
+a stored result can be imported instead of calling the model again.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import Config
+from .install import bundle_system_prompt
+from .judge import JUDGE_MODEL, JUDGE_SYSTEM_PROMPT, JUDGE_TEMPLATE
+from .logging_config import get_logger
+from .user_proxy import ConversationalConfig, user_proxy_prompt_template
+
+
+# Bump when the hash recipe changes so old results stop matching
+HASH_VERSION = "3"
+
+
+def compute_suite_fingerprint(config: Config, assistant_model: str) -> str:
+    """Hash the inputs shared by every case in a suite run.
+
+    Args:
+        config: Test configuration (original, un-isolated paths)
+        assistant_model: Model the assistant runs on
+
+    Returns:
+        Hex digest of prompt, overlays, models, judge rubric, user-proxy
+        prompt and defaults, stream guards and MCP build
+    """
+    digest = hashlib.sha256()
+    _update(digest, "version", HASH_VERSION)
+    _update(digest, "system_prompt", bundle_system_prompt(config))
+
+    for overlay_path in config.get_test_overlays():
+        _update(digest, "overlay", overlay_path.name)
+        _update(digest, "overlay_content", overlay_path.read_text(encoding='utf-8'))
+
+    _update(digest, "assistant_model", assistant_model)
+    _update(digest, "judge_model", JUDGE_MODEL)
+    _update(digest, "judge_rubric", JUDGE_SYSTEM_PROMPT + JUDGE_TEMPLATE)
+    _update(digest, "user_proxy_prompt", user_proxy_prompt_template())
+
+    # Cases only carry user-proxy settings they override; the case JSON
+    # covers those, the defaults they fall back to are hashed here
+    proxy_defaults = ConversationalConfig()
+    _update(digest, "user_proxy_model", proxy_defaults.user_proxy_model)
+    _update(digest, "user_proxy_temperature", str(proxy_defaults.llm_user_temperature))
+
+    # Stream guards can abort or fail a run; they only apply when streaming
+    _update(digest, "stream_assistant", str(config.stream_assistant))
+    if config.stream_assistant:
+        _update(digest, "stream_guards", json.dumps({
+            "inactivity_timeout": config.inactivity_timeout,
+            "max_tool_calls": config.max_tool_calls,
+            "max_tool_errors": config.max_tool_errors,
+            "max_identical_calls": config.max_identical_calls,
+        }, sort_keys=True))
+    _update(digest, "graph_memory_build", graph_memory_build_fingerprint(config.mcp_config_path))
+    return digest.hexdigest()
+
+
+def compute_case_hash(case: Dict[str, Any], suite_fingerprint: str) -> str:
+    """Hash one case together with the suite-wide inputs.
+
+    Args:
+        case: Test case dictionary
+        suite_fingerprint: Result of compute_suite_fingerprint()
+
+    Returns:
+        Hex digest identifying this case's inputs
+    """
+    digest = hashlib.sha256()
+    _update(digest, "suite", suite_fingerprint)
+    _update(digest, "case", json.dumps(case, sort_keys=True, ensure_ascii=False))
+    return digest.hexdigest()
+
+
+def graph_memory_build_fingerprint(mcp_config_path: Optional[Path]) -> str:
+    """Hash the graph-memory MCP server build (its dist directory).
+
+    The dist directory is located from the server entry point named in the
+    MCP config (e.g. .../mcp/dist/index.js).
+
+    Args:
+        mcp_config_path: Path to MCP config
+
+    Returns:
+        Hex digest of every file under dist, or "missing" if it can't be found
+    """
+    dist_dir = _find_dist_dir(mcp_config_path)
+    if dist_dir is None:
+        get_logger().debug("Graph-memory dist build not found; hashing as 'missing'")
+        return "missing"
+
+    digest = hashlib.sha256()
+    for path in sorted(p for p in dist_dir.rglob("*") if p.is_file()):
+        _update(digest, "file", path.relative_to(dist_dir).as_posix())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _find_dist_dir(mcp_config_path: Optional[Path]) -> Optional[Path]:
+    """Find the directory holding the MCP server entry point."""
+    if not mcp_config_path or not mcp_config_path.exists():
+        return None
+
+    try:
+        with open(mcp_config_path, 'r', encoding='utf-8') as f:
+            mcp_config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    server = mcp_config.get("mcpServers", {}).get("gtd-graph-memory", {})
+    for arg in server.get("args", []):
+        if str(arg).endswith(".js"):
+            entry = Path(arg)
+            if entry.exists():
+                return entry.parent
+    return None
+
+
+def _update(digest: "hashlib._Hash", label: str, value: str) -> None:
+    """Add a labelled, length-prefixed field so fields can't run together."""
+    data = value.encode('utf-8')
+    digest.update(f"{label}:{len(data)}:".encode('utf-8'))
+    digest.update(data)
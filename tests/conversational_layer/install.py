@@ -6,8 +6,10 @@ removing development environment artifacts while keeping production tools availa
 
 import json
 import shutil
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .config import Config
 from .logging_config import get_logger
@@ -24,14 +26,26 @@ class TestInstallation:
               └── data/  (isolated graph storage)
 
     Working directory during tests: /tmp/gtd-test-workspace
+
+    Parallel workers each get their own named installation (and workspace),
+    so graph data and MCP logs never cross between concurrently running tests.
     """
 
-    def __init__(self, config: Config, install_root: Optional[Path] = None):
+    def __init__(
+        self,
+        config: Config,
+        install_root: Optional[Path] = None,
+        name: str = "gtd-assistant",
+        workspace_dir: Optional[Path] = None
+    ):
         """Initialize test installation manager.
 
         Args:
             config: Test configuration
             install_root: Root directory for test installations (default: .test-install/)
+            name: Installation directory name under install_root
+            workspace_dir: Working directory for test execution
+                (default: /tmp/gtd-test-workspace)
         """
         self.config = config
         self.logger = get_logger()
@@ -40,10 +54,13 @@ class TestInstallation:
         if install_root is None:
             install_root = Path.cwd() / ".test-install"
         self.install_root = install_root
-        self.install_dir = install_root / "gtd-assistant"
+        self.name = name
+        self.install_dir = install_root / name
 
         # Working directory for test execution
-        self.workspace_dir = Path("/tmp/gtd-test-workspace")
+        if workspace_dir is None:
+            workspace_dir = Path("/tmp/gtd-test-workspace")
+        self.workspace_dir = workspace_dir
 
         # Paths within installation
         self.system_prompt_path = self.install_dir / "system-prompt.md"
@@ -91,30 +108,24 @@ class TestInstallation:
     def _bundle_system_prompt(self) -> None:
         """Bundle system prompt with test overlays into single file."""
         self.logger.debug("Bundling system prompt with overlays...")
-
-        # Read base system prompt
-        base_prompt = self.config.system_prompt_path.read_text(encoding='utf-8')
-
-        # Read and append overlays
-        overlays = self.config.get_test_overlays()
-        overlay_content = []
-
-        for overlay_path in overlays:
-            if overlay_path.exists():
-                self.logger.debug(f"Adding overlay: {overlay_path}")
-                content = overlay_path.read_text(encoding='utf-8')
-                overlay_content.append(f"\n\n<!-- Overlay: {overlay_path.name} -->\n\n{content}")
-
-        # Combine into single file
-        bundled_prompt = base_prompt + "".join(overlay_content)
-        self.system_prompt_path.write_text(bundled_prompt, encoding='utf-8')
+        self.system_prompt_path.write_text(bundle_system_prompt(self.config), encoding='utf-8')
 
         self.logger.debug(f"System prompt bundled: {self.system_prompt_path}")
 
     def _create_mcp_config(self) -> None:
         """Create isolated MCP config with isolated data path."""
         self.logger.debug("Creating isolated MCP config...")
+        self._write_mcp_config(self.mcp_config_path, self.data_dir)
+        self.logger.debug(f"MCP config created: {self.mcp_config_path}")
+        self.logger.debug(f"Data directory: {self.data_dir}")
 
+    def _write_mcp_config(self, config_path: Path, data_dir: Path) -> None:
+        """Write a copy of the original MCP config pointing at data_dir.
+
+        Args:
+            config_path: Where to write the MCP config
+            data_dir: Graph data directory (BASE_PATH, and home of MCP_CALL_LOG)
+        """
         # Read original MCP config
         if not self.config.mcp_config_path:
             raise RuntimeError("MCP config path not set in config")
@@ -129,18 +140,52 @@ class TestInstallation:
             # Update BASE_PATH to isolated data directory
             if "env" not in server_config:
                 server_config["env"] = {}
-            server_config["env"]["BASE_PATH"] = str(self.data_dir.resolve())
+            server_config["env"]["BASE_PATH"] = str(data_dir.resolve())
 
             # Update MCP_CALL_LOG to isolated log file
-            mcp_log_path = self.data_dir / "mcp-calls.log"
+            mcp_log_path = data_dir / "mcp-calls.log"
             server_config["env"]["MCP_CALL_LOG"] = str(mcp_log_path.resolve())
 
         # Write isolated config
-        with open(self.mcp_config_path, 'w', encoding='utf-8') as f:
+        with open(config_path, 'w', encoding='utf-8') as f:
             json.dump(mcp_config, f, indent=2)
 
-        self.logger.debug(f"MCP config created: {self.mcp_config_path}")
-        self.logger.debug(f"Data directory: {self.data_dir}")
+    def create_review_snapshot(self, label: str) -> Path:
+        """Copy the current graph into a read-only review area.
+
+        The judge and interrogation inspect graph state through MCP. In the
+        pipelined runner they run after the next test's assistant has
+        started mutating this installation's graph, so they get a frozen
+        copy (with its own MCP call log) instead.
+
+        Args:
+            label: Unique snapshot name (e.g. job sequence)
+
+        Returns:
+            Path to an MCP config pointing at the snapshot
+        """
+        review_dir = self.install_dir / "review" / label
+        if review_dir.exists():
+            shutil.rmtree(review_dir)
+        snapshot_data = review_dir / "data"
+        snapshot_data.mkdir(parents=True)
+
+        for graph_dir in ("_system", "_content"):
+            source = self.data_dir / graph_dir
+            if source.exists():
+                shutil.copytree(source, snapshot_data / graph_dir)
+
+        config_path = review_dir / "mcp-config.json"
+        self._write_mcp_config(config_path, snapshot_data)
+        return config_path
+
+    def remove_review_snapshot(self, config_path: Path) -> None:
+        """Delete a snapshot created by create_review_snapshot().
+
+        Args:
+            config_path: MCP config path returned by create_review_snapshot()
+        """
+        shutil.rmtree(config_path.parent, ignore_errors=True)
 
     def cleanup(self) -> None:
         """Remove test installation and workspace directories."""
@@ -189,6 +234,32 @@ class TestInstallation:
         return self.data_dir / "mcp-calls.log"
 
 
+def bundle_system_prompt(config: Config) -> str:
+    """Build the system prompt with test overlays appended.
+
+    Args:
+        config: Test configuration (original system prompt path)
+
+    Returns:
+        Bundled system prompt text
+    """
+    logger = get_logger()
+
+    # Read base system prompt
+    base_prompt = config.system_prompt_path.read_text(encoding='utf-8')
+
+    # Read and append overlays
+    overlay_content = []
+    for overlay_path in config.get_test_overlays():
+        if overlay_path.exists():
+            logger.debug(f"Adding overlay: {overlay_path}")
+            content = overlay_path.read_text(encoding='utf-8')
+            overlay_content.append(f"\n\n<!-- Overlay: {overlay_path.name} -->\n\n{content}")
+
+    # Combine into single file
+    return base_prompt + "".join(overlay_content)
+
+
 def create_test_installation(config: Config, force: bool = False) -> TestInstallation:
     """Create and build a test installation.
 
@@ -205,3 +276,58 @@ def create_test_installation(config: Config, force: bool = False) -> TestInstall
     installation = TestInstallation(config)
     installation.build(force=force)
     return installation
+
+
+def create_worker_installation(
+    config: Config,
+    worker_id: int,
+    force: bool = False
+) -> TestInstallation:
+    """Create and build an isolated installation for one parallel worker.
+
+    Args:
+        config: Test configuration (original, un-isolated paths)
+        worker_id: Worker number (1-based)
+        force: If True, remove existing installation first
+
+    Returns:
+        TestInstallation instance with its own data dir, MCP log and workspace
+    """
+    installation = TestInstallation(
+        config,
+        name=f"gtd-assistant-worker-{worker_id}",
+        workspace_dir=Path(f"/tmp/gtd-test-workspace-worker-{worker_id}"),
+    )
+    installation.build(force=force)
+    return installation
+
+
+# Installation used by the current thread/task. Parallel workers bind their
+# own installation here so helpers such as the MCP log path and the CLI
+# working directory resolve per worker instead of through a module global.
+_active_installation: ContextVar[Optional[TestInstallation]] = ContextVar(
+    "active_installation", default=None
+)
+
+
+def get_active_installation() -> Optional[TestInstallation]:
+    """Get the installation bound to the current worker, if any.
+
+    Returns:
+        Active TestInstallation or None
+    """
+    return _active_installation.get()
+
+
+@contextmanager
+def use_installation(installation: Optional[TestInstallation]) -> Iterator[None]:
+    """Bind an installation to the current worker for the duration of a block.
+
+    Args:
+        installation: Installation to activate (None leaves the default)
+    """
+    token = _active_installation.set(installation)
+    try:
+        yield
+    finally:
+        _active_installation.reset(token)
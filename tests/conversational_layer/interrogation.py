@@ -10,10 +10,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .claude_exec import run_claude, run_claude_async
 from .config import Config
 from .errors import handle_subprocess_error
 from .fixtures import parse_payload, extract_text
 from .logging_config import get_logger
+from .tracing import span
 
 
 CLAUDE_CMD = "claude"
@@ -92,106 +94,154 @@ def get_interrogation_questions(passed: bool) -> List[str]:
         return INTERROGATION_FAILURE_QUESTIONS
 
 
-def resume_session_with_question(
+def build_interrogation_args(
     session_id: str,
     question: str,
-    config: Config
-) -> Dict[str, Any]:
-    """Resume Claude session and ask a single question.
+    mcp_config_path: Optional[Path]
+) -> List[str]:
+    """Build Claude CLI argv to resume a session with a question.
 
     Args:
         session_id: Session ID from original test run
         question: Question to ask
-        config: Test configuration
+        mcp_config_path: Optional MCP config
 
     Returns:
-        Dictionary with answer or error info
+        Argument list for the claude executable
+    """
+    args = [CLAUDE_CMD]
+    if mcp_config_path:
+        args += ["--mcp-config", str(mcp_config_path)]
+    args += [
+        "--model", "sonnet",
+        "--resume", session_id,
+        "--dangerously-skip-permissions",
+        "--print",
+        "--output-format", "json",
+        question
+    ]
+    return args
+
+
+def _answer_from_process(result: subprocess.CompletedProcess[str]) -> Dict[str, Any]:
+    """Convert interrogation CLI output into an answer dictionary.
+
+    Args:
+        result: Completed interrogation CLI process
+
+    Returns:
+        Dictionary with success/answer/error
     """
     logger = get_logger()
 
-    try:
-        args = [CLAUDE_CMD]
-        if config.mcp_config_path:
-            args += ["--mcp-config", str(config.mcp_config_path)]
-        args += [
-            "--model", "sonnet",
-            "--resume", session_id,
-            "--dangerously-skip-permissions",
-            "--print",
-            "--output-format", "json",
-            question
-        ]
-
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=config.interrogation_timeout,
-            check=False,
-        )
+    if result.returncode != 0:
+        error_msg = result.stderr.strip() or "CLI error"
+        logger.warning(f"Interrogation CLI error: {error_msg}")
+        return {
+            "success": False,
+            "answer": f"[ERROR: {error_msg}]",
+            "error": error_msg
+        }
 
-        if result.returncode != 0:
-            error_msg = result.stderr.strip() or "CLI error"
-            logger.warning(f"Interrogation CLI error: {error_msg}")
-            return {
-                "success": False,
-                "answer": f"[ERROR: {error_msg}]",
-                "error": error_msg
-            }
-
-        payload = parse_payload(result.stdout)
-        if payload is None:
-            logger.warning("Interrogation returned non-JSON output")
-            return {
-                "success": False,
-                "answer": "[ERROR: Non-JSON output]",
-                "error": "Non-JSON output"
-            }
-
-        answer = extract_text(payload).strip()
+    payload = parse_payload(result.stdout)
+    if payload is None:
+        logger.warning("Interrogation returned non-JSON output")
         return {
-            "success": True,
-            "answer": answer,
-            "error": None
+            "success": False,
+            "answer": "[ERROR: Non-JSON output]",
+            "error": "Non-JSON output"
         }
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"Interrogation timeout after {config.interrogation_timeout}s")
+    answer = extract_text(payload).strip()
+    return {
+        "success": True,
+        "answer": answer,
+        "error": None
+    }
+
+
+def _answer_from_error(error: Exception, config: Config) -> Dict[str, Any]:
+    """Convert an interrogation exception into an answer dictionary.
+
+    Args:
+        error: Exception raised while asking the question
+        config: Test configuration
+
+    Returns:
+        Dictionary with success/answer/error
+    """
+    if isinstance(error, subprocess.TimeoutExpired):
+        get_logger().error(f"Interrogation timeout after {config.interrogation_timeout}s")
         return {
             "success": False,
             "answer": f"[ERROR: Timeout after {config.interrogation_timeout}s]",
             "error": "Timeout"
         }
+
+    error_dict = handle_subprocess_error(error, "resume_session_with_question")
+    return {
+        "success": False,
+        "answer": f"[ERROR: {error_dict['reason'][:200]}]",
+        "error": error_dict["reason"]
+    }
+
+
+def resume_session_with_question(
+    session_id: str,
+    question: str,
+    config: Config
+) -> Dict[str, Any]:
+    """Resume Claude session and ask a single question.
+
+    Args:
+        session_id: Session ID from original test run
+        question: Question to ask
+        config: Test configuration
+
+    Returns:
+        Dictionary with answer or error info
+    """
+    try:
+        args = build_interrogation_args(session_id, question, config.mcp_config_path)
+        result = run_claude(args, config.interrogation_timeout)
+        return _answer_from_process(result)
     except Exception as e:
-        error_dict = handle_subprocess_error(e, "resume_session_with_question")
-        return {
-            "success": False,
-            "answer": f"[ERROR: {error_dict['reason'][:200]}]",
-            "error": error_dict["reason"]
-        }
+        return _answer_from_error(e, config)
 
 
-def interrogate_session(
+async def resume_session_with_question_async(
     session_id: str,
-    passed: bool,
-    config: Config,
-    case_name: str = "",
-    verdict: Optional[Dict[str, Any]] = None
-) -> List[QAPair]:
-    """Resume test session and ask follow-up questions.
+    question: str,
+    config: Config
+) -> Dict[str, Any]:
+    """Async variant of resume_session_with_question.
 
     Args:
-        session_id: Session ID from the initial test run
-        passed: Whether test passed
+        session_id: Session ID from original test run
+        question: Question to ask
         config: Test configuration
-        case_name: Name of test case (for logging)
-        verdict: Optional judge verdict dictionary to include in Q2
 
     Returns:
-        List of Q&A pairs
+        Dictionary with answer or error info
     """
-    logger = get_logger()
+    try:
+        args = build_interrogation_args(session_id, question, config.mcp_config_path)
+        result = await run_claude_async(args, config.interrogation_timeout)
+        return _answer_from_process(result)
+    except Exception as e:
+        return _answer_from_error(e, config)
+
 
+def _build_questions(passed: bool, verdict: Optional[Dict[str, Any]]) -> List[str]:
+    """Get interrogation questions, injecting judge feedback for failures.
+
+    Args:
+        passed: Whether test passed
+        verdict: Optional judge verdict dictionary to include in Q2
+
+    Returns:
+        List of questions to ask in order
+    """
     questions = get_interrogation_questions(passed)
 
     # For Q2 on failed tests, inject judge feedback
@@ -209,6 +259,54 @@ Looking back, what were you trying to accomplish and why did you think that appr
 """
         questions[1] = judge_feedback.strip()
 
+    return questions
+
+
+def _record_answer(
+    qa_pairs: List[QAPair],
+    index: int,
+    question: str,
+    result: Dict[str, Any],
+    case_name: str
+) -> None:
+    """Append a Q&A pair and log failed questions."""
+    qa_pairs.append(QAPair(
+        question=question,
+        answer=result["answer"],
+        error=result.get("error")
+    ))
+
+    # Log if there was an error
+    if not result["success"]:
+        get_logger().warning(
+            f"Interrogation question {index} failed: {result['error']}",
+            extra={"test_name": case_name}
+        )
+
+
+def interrogate_session(
+    session_id: str,
+    passed: bool,
+    config: Config,
+    case_name: str = "",
+    verdict: Optional[Dict[str, Any]] = None
+) -> List[QAPair]:
+    """Resume test session and ask follow-up questions.
+
+    Args:
+        session_id: Session ID from the initial test run
+        passed: Whether test passed
+        config: Test configuration
+        case_name: Name of test case (for logging)
+        verdict: Optional judge verdict dictionary to include in Q2
+
+    Returns:
+        List of Q&A pairs
+    """
+    logger = get_logger()
+
+    questions = _build_questions(passed, verdict)
+
     logger.info(
         f"Interrogating session for {case_name} ({len(questions)} questions)",
         extra={"test_name": case_name}
@@ -219,21 +317,59 @@ Looking back, what were you trying to accomplish and why did you think that appr
     for i, question in enumerate(questions, start=1):
         logger.debug(f"Interrogation question {i}/{len(questions)}")
 
-        result = resume_session_with_question(session_id, question, config)
+        with span(f"question {i}", "interrogation", session_id=session_id) as traced:
+            result = resume_session_with_question(session_id, question, config)
+            traced.set(success=bool(result["success"]))
+        _record_answer(qa_pairs, i, question, result, case_name)
 
-        qa_pair = QAPair(
-            question=question,
-            answer=result["answer"],
-            error=result.get("error")
-        )
-        qa_pairs.append(qa_pair)
-
-        # Log if there was an error
-        if not result["success"]:
-            logger.warning(
-                f"Interrogation question {i} failed: {result['error']}",
-                extra={"test_name": case_name}
-            )
+    logger.info(
+        f"Interrogation complete: {len(qa_pairs)} Q&A pairs",
+        extra={"test_name": case_name}
+    )
+
+    return qa_pairs
+
+
+async def interrogate_session_async(
+    session_id: str,
+    passed: bool,
+    config: Config,
+    case_name: str = "",
+    verdict: Optional[Dict[str, Any]] = None
+) -> List[QAPair]:
+    """Async variant of interrogate_session.
+
+    Questions are still asked one after another: each resumes the same
+    session, so they cannot overlap with each other (only with other cases).
+
+    Args:
+        session_id: Session ID from the initial test run
+        passed: Whether test passed
+        config: Test configuration
+        case_name: Name of test case (for logging)
+        verdict: Optional judge verdict dictionary to include in Q2
+
+    Returns:
+        List of Q&A pairs
+    """
+    logger = get_logger()
+
+    questions = _build_questions(passed, verdict)
+
+    logger.info(
+        f"Interrogating session for {case_name} ({len(questions)} questions)",
+        extra={"test_name": case_name}
+    )
+
+    qa_pairs = []
+
+    for i, question in enumerate(questions, start=1):
+        logger.debug(f"Interrogation question {i}/{len(questions)}")
+
+        with span(f"question {i}", "interrogation", session_id=session_id) as traced:
+            result = await resume_session_with_question_async(session_id, question, config)
+            traced.set(success=bool(result["success"]))
+        _record_answer(qa_pairs, i, question, result, case_name)
 
     logger.info(
         f"Interrogation complete: {len(qa_pairs)} Q&A pairs",
@@ -15,14 +15,17 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from judge_utils import parse_judge_verdict
 
+from .claude_exec import run_claude, run_claude_async
 from .config import Config
 from .errors import handle_subprocess_error
 from .fixtures import parse_payload, extract_text
 from .logging_config import get_logger
-from .retry import retry_with_backoff
+from .retry import retry_with_backoff, retry_with_backoff_async
+from .timing import mark_phase_failed, timed_phase
 
 
 CLAUDE_CMD = "claude"
+JUDGE_MODEL = "sonnet"
 
 
 # Phase 3 improvement: Enhanced judge system prompt with clear criteria
@@ -388,61 +391,81 @@ def format_validation_requirements(conversational_config: Optional[Dict[str, Any
     return f"Validation Requirements:\n{req_list}"
 
 
-def run_claude_judge(
-    judge_prompt: str,
-    mcp_config_path: Optional[Path],
-    timeout: float
-) -> subprocess.CompletedProcess[str]:
-    """Execute Claude CLI for judge evaluation.
+def build_judge_args(judge_prompt: str, mcp_config_path: Optional[Path]) -> List[str]:
+    """Build Claude CLI argv for judge evaluation.
 
     Args:
         judge_prompt: Formatted judge prompt
-        mcp_config_path: Optional MCP config (usually None for judge)
-        timeout: Timeout in seconds
+        mcp_config_path: Optional MCP config
 
     Returns:
-        CompletedProcess with stdout/stderr
+        Argument list for the claude executable
     """
     args = [CLAUDE_CMD]
     if mcp_config_path:
         args += ["--mcp-config", str(mcp_config_path)]
     args += [
-        "--model", "sonnet",
+        "--model", JUDGE_MODEL,
         "--dangerously-skip-permissions",
         "--print",
         "--output-format", "json",
         "--append-system-prompt", JUDGE_SYSTEM_PROMPT,
         judge_prompt
     ]
+    return args
 
-    return subprocess.run(
-        args,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        check=False,
-    )
 
+def run_claude_judge(
+    judge_prompt: str,
+    mcp_config_path: Optional[Path],
+    timeout: float
+) -> subprocess.CompletedProcess[str]:
+    """Execute Claude CLI for judge evaluation.
 
-def run_judge_single_attempt(
+    Args:
+        judge_prompt: Formatted judge prompt
+        mcp_config_path: Optional MCP config (usually None for judge)
+        timeout: Timeout in seconds
+
+    Returns:
+        CompletedProcess with stdout/stderr
+    """
+    return run_claude(build_judge_args(judge_prompt, mcp_config_path), timeout)
+
+
+async def run_claude_judge_async(
+    judge_prompt: str,
+    mcp_config_path: Optional[Path],
+    timeout: float
+) -> subprocess.CompletedProcess[str]:
+    """Async variant of run_claude_judge.
+
+    Args:
+        judge_prompt: Formatted judge prompt
+        mcp_config_path: Optional MCP config
+        timeout: Timeout in seconds
+
+    Returns:
+        CompletedProcess with stdout/stderr
+    """
+    return await run_claude_async(build_judge_args(judge_prompt, mcp_config_path), timeout)
+
+
+def build_judge_prompt(
     case: Dict[str, Any],
     assistant_text: str,
-    full_output: str,
-    config: Config
-) -> Dict[str, Any]:
-    """Run judge evaluation (single attempt, no retry).
+    full_output: str
+) -> str:
+    """Build the judge prompt for a test case.
 
     Args:
         case: Test case dictionary
         assistant_text: Extracted assistant response text
         full_output: Full JSON output including MCP calls
-        config: Test configuration
 
     Returns:
-        Dictionary with pass/reason or error info
+        Formatted judge prompt
     """
-    logger = get_logger()
-
     env_mode = "Live MCP"
 
     # Build scenario description
@@ -465,7 +488,7 @@ def run_judge_single_attempt(
         validation_requirements_section += "\n\n"
 
     # Use full output (including MCP tool calls) for judge evaluation
-    judge_prompt = JUDGE_TEMPLATE.format(
+    return JUDGE_TEMPLATE.format(
         prompt=case["prompt"],
         response=full_output if full_output else assistant_text,
         category=case.get("category", "Unknown"),
@@ -477,48 +500,125 @@ def run_judge_single_attempt(
         validation_requirements_section=validation_requirements_section
     )
 
+
+def _judge_result_from_process(result: subprocess.CompletedProcess[str]) -> Dict[str, Any]:
+    """Convert judge CLI output into a judge result dictionary.
+
+    Args:
+        result: Completed judge CLI process
+
+    Returns:
+        Dictionary with pass/reason/verdict or error info
+    """
+    logger = get_logger()
+
+    if result.returncode != 0:
+        reason = result.stderr.strip() or "Judge CLI error"
+        logger.warning(f"Judge CLI error: {reason}")
+        return {"pass": False, "reason": reason, "retry": True}
+
+    payload = parse_payload(result.stdout)
+    if payload is None:
+        logger.warning("Judge returned non-JSON output")
+        return {"pass": False, "reason": "Judge returned non-JSON output", "retry": True}
+
+    verdict_dict = parse_judge_verdict(extract_text(payload))
+    if verdict_dict is None:
+        logger.warning("Judge verdict not valid JSON")
+        return {"pass": False, "reason": "Judge verdict not valid JSON", "retry": True}
+
+    # Convert to Verdict object
+    verdict = Verdict.from_dict(verdict_dict)
+
+    reasoning = verdict.reasoning.strip() if verdict.reasoning else json.dumps(verdict_dict)
+
+    return {
+        "pass": verdict.passed,
+        "reason": reasoning,
+        "verdict": verdict,
+        "retry": False
+    }
+
+
+def _judge_timeout_result(config: Config) -> Dict[str, Any]:
+    """Build the judge result for a timed-out attempt."""
+    get_logger().error(f"Judge timed out after {config.judge_timeout}s")
+    return {
+        "pass": False,
+        "reason": f"Judge timeout ({config.judge_timeout}s)",
+        "retry": True
+    }
+
+
+def run_judge_single_attempt(
+    case: Dict[str, Any],
+    assistant_text: str,
+    full_output: str,
+    config: Config
+) -> Dict[str, Any]:
+    """Run judge evaluation (single attempt, no retry).
+
+    Args:
+        case: Test case dictionary
+        assistant_text: Extracted assistant response text
+        full_output: Full JSON output including MCP calls
+        config: Test configuration
+
+    Returns:
+        Dictionary with pass/reason or error info
+    """
+    judge_prompt = build_judge_prompt(case, assistant_text, full_output)
+
     try:
         result = run_claude_judge(judge_prompt, config.mcp_config_path, config.judge_timeout)
+        return _judge_result_from_process(result)
 
-        if result.returncode != 0:
-            reason = result.stderr.strip() or "Judge CLI error"
-            logger.warning(f"Judge CLI error: {reason}")
-            return {"pass": False, "reason": reason, "retry": True}
+    except subprocess.TimeoutExpired:
+        return _judge_timeout_result(config)
+    except Exception as e:
+        error_dict = handle_subprocess_error(e, "run_judge")
+        return error_dict
 
-        payload = parse_payload(result.stdout)
-        if payload is None:
-            logger.warning("Judge returned non-JSON output")
-            return {"pass": False, "reason": "Judge returned non-JSON output", "retry": True}
 
-        verdict_dict = parse_judge_verdict(extract_text(payload))
-        if verdict_dict is None:
-            logger.warning("Judge verdict not valid JSON")
-            return {"pass": False, "reason": "Judge verdict not valid JSON", "retry": True}
+async def run_judge_single_attempt_async(
+    case: Dict[str, Any],
+    assistant_text: str,
+    full_output: str,
+    config: Config
+) -> Dict[str, Any]:
+    """Async variant of run_judge_single_attempt.
 
-        # Convert to Verdict object
-        verdict = Verdict.from_dict(verdict_dict)
+    Args:
+        case: Test case dictionary
+        assistant_text: Extracted assistant response text
+        full_output: Full JSON output including MCP calls
+        config: Test configuration
 
-        reasoning = verdict.reasoning.strip() if verdict.reasoning else json.dumps(verdict_dict)
+    Returns:
+        Dictionary with pass/reason or error info
+    """
+    judge_prompt = build_judge_prompt(case, assistant_text, full_output)
 
-        return {
-            "pass": verdict.passed,
-            "reason": reasoning,
-            "verdict": verdict,
-            "retry": False
-        }
+    try:
+        result = await run_claude_judge_async(judge_prompt, config.mcp_config_path, config.judge_timeout)
+        return _judge_result_from_process(result)
 
     except subprocess.TimeoutExpired:
-        logger.error(f"Judge timed out after {config.judge_timeout}s")
-        return {
-            "pass": False,
-            "reason": f"Judge timeout ({config.judge_timeout}s)",
-            "retry": True
-        }
+        return _judge_timeout_result(config)
     except Exception as e:
         error_dict = handle_subprocess_error(e, "run_judge")
         return error_dict
 
 
+def _log_judge_outcome(case: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Log the final judge outcome for a case."""
+    logger = get_logger()
+    if result.get("pass"):
+        logger.debug(f"Judge PASS: {case['name']}")
+    else:
+        logger.warning(f"Judge FAIL: {case['name']} - {result.get('reason', '')}")
+
+
 def run_judge(
     case: Dict[str, Any],
     assistant_text: str,
@@ -541,21 +641,60 @@ def run_judge(
     logger.debug(f"Running judge for test: {case['name']}")
 
     # Phase 3 improvement: Increase retry attempts from 2 to 3
-    result = retry_with_backoff(
-        run_judge_single_attempt,
-        max_retries=3,  # Was 2 in original
-        initial_backoff=20.0,  # Shorter than assistant retries
-        case=case,
-        assistant_text=assistant_text,
-        full_output=full_output,
-        config=config
-    )
+    with timed_phase("judge") as traced:
+        result = retry_with_backoff(
+            run_judge_single_attempt,
+            max_retries=3,  # Was 2 in original
+            initial_backoff=5.0,
+            case=case,
+            assistant_text=assistant_text,
+            full_output=full_output,
+            config=config
+        )
+        traced.set(passed=bool(result.get("pass")), verdict=result.get("verdict") is not None)
+    if result.get("verdict") is None:
+        mark_phase_failed("judge")
+
+    _log_judge_outcome(case, result)
+    return result
 
-    if result.get("pass"):
-        logger.debug(f"Judge PASS: {case['name']}")
-    else:
-        logger.warning(f"Judge FAIL: {case['name']} - {result.get('reason', '')}")
 
+async def run_judge_async(
+    case: Dict[str, Any],
+    assistant_text: str,
+    full_output: str,
+    config: Config
+) -> Dict[str, Any]:
+    """Async variant of run_judge (same retry policy).
+
+    Args:
+        case: Test case dictionary
+        assistant_text: Extracted assistant response text
+        full_output: Full JSON output including MCP calls
+        config: Test configuration
+
+    Returns:
+        Dictionary with pass/reason/verdict
+    """
+    logger = get_logger()
+
+    logger.debug(f"Running judge for test: {case['name']}")
+
+    with timed_phase("judge") as traced:
+        result = await retry_with_backoff_async(
+            run_judge_single_attempt_async,
+            max_retries=3,
+            initial_backoff=5.0,
+            case=case,
+            assistant_text=assistant_text,
+            full_output=full_output,
+            config=config
+        )
+        traced.set(passed=bool(result.get("pass")), verdict=result.get("verdict") is not None)
+    if result.get("verdict") is None:
+        mark_phase_failed("judge")
+
+    _log_judge_outcome(case, result)
     return result
 
 
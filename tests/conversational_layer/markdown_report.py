@@ -13,6 +13,7 @@ from collections import defaultdict
 
 from .results_db import ResultsDB
 from .logging_config import get_logger
+from .timing import format_breakdown_table, phase_breakdown
 
 
 def generate_markdown_report(
@@ -64,6 +65,9 @@ def generate_markdown_report(
     sections = []
     sections.append(_format_header(run_summary))
     sections.append(_format_overall_stats(run_summary, test_results, flaky_tests))
+    latency = _format_latency_breakdown(db.get_phase_breakdown(run_id))
+    if latency:
+        sections.append(latency)
     sections.append(_format_categories(test_results, category_stats, test_cases, db))
 
     # Write report
@@ -140,6 +144,21 @@ def _format_overall_stats(
     return "\n".join(lines)
 
 
+def _format_latency_breakdown(phase_rows: List[tuple]) -> str:
+    """Format per-category latency table (empty if no timings were recorded)."""
+    table = format_breakdown_table(phase_breakdown(phase_rows))
+    if not table:
+        return ""
+
+    lines = ["## Latency Breakdown", ""]
+    lines.append("Mean / p95 seconds per test spent in each phase. Nested phases are")
+    lines.append("counted once (user-proxy turns are not part of assistant time; backoff")
+    lines.append("sleeps are not part of the phase that retried).")
+    lines.append("")
+    lines.extend(table)
+    return "\n".join(lines)
+
+
 def _format_categories(
     test_results: List[Dict],
     category_stats: List[Dict],
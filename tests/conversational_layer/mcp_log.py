@@ -0,0 +1,87 @@
+"""Cursors into the MCP call log.
+
+The graph-memory server appends one line per tool call to its call log
+(``mcp-calls.log``). Rather than deleting the log before every test and
+reading the whole file back afterwards, callers take a cursor at the
+current end of the log and later read just the bytes appended since:
+
+    cursor = McpLogCursor(log_path)
+    ...run the assistant...
+    calls = cursor.read()
+
+The log keeps growing across the suite, so it stays available for later
+analysis, and every test attempt and conversation turn gets its own slice
+at a cost proportional to that slice rather than to the whole log.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class McpLogCursor:
+    """Position in an MCP call log.
+
+    If the log is replaced or truncated after the cursor was taken (for
+    example by a graph cleanup that removes the data directory), reads
+    start from the beginning of the new file.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        """Mark the current end of the log.
+
+        Args:
+            path: MCP call log path (None reads as an empty log)
+        """
+        self.path = path
+        self.offset, self._identity = _end_of(path)
+
+    def read(self) -> str:
+        """Text appended to the log since the cursor was taken.
+
+        Returns:
+            New log text ("" if nothing was logged)
+        """
+        text, _, _ = self._read_from_offset()
+        return text
+
+    def advance(self) -> str:
+        """Read the new text and move the cursor past it.
+
+        Returns:
+            Text appended since the previous read/advance
+        """
+        text, self.offset, self._identity = self._read_from_offset()
+        return text
+
+    def _read_from_offset(self) -> Tuple[str, int, Optional[Tuple[int, int]]]:
+        """Read from the cursor to the end of the log.
+
+        Returns:
+            (text, end offset, file identity)
+        """
+        if self.path is None:
+            return "", 0, None
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                identity = (stat.st_dev, stat.st_ino)
+                offset = self.offset
+                if identity != self._identity or stat.st_size < offset:
+                    offset = 0
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return "", 0, None
+        return data.decode('utf-8', errors='replace'), offset + len(data), identity
+
+
+def _end_of(path: Optional[Path]) -> Tuple[int, Optional[Tuple[int, int]]]:
+    """Size and (device, inode) identity of a log (0, None if missing)."""
+    if path is None:
+        return 0, None
+    try:
+        stat = path.stat()
+    except OSError:
+        return 0, None
+    return stat.st_size, (stat.st_dev, stat.st_ino)
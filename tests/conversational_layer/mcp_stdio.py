@@ -0,0 +1,241 @@
+"""MCP stdio transport shared by the fixture loader and the API harness.
+
+The graph-memory server speaks newline-delimited JSON-RPC on stdin/stdout
+(MCP stdio transport). A connection is attached to one server process for
+as long as it runs, so a tool call costs a single request/response round
+trip instead of spawning ``node`` per call:
+
+    connection = McpStdioConnection(process)
+    connection.initialize()
+    connection.call_tool("create_node", {...})
+
+Requests are multiplexed by JSON-RPC id: each one gets a Future that the
+reader thread resolves, so any number of threads can have calls in flight
+on the same pipe. A call that times out or is cancelled is forgotten (its
+late response is dropped) and the server is sent
+``notifications/cancelled``. If the server exits, every pending call fails
+immediately instead of waiting out its timeout.
+
+graph_loader.py (fixtures, --preflight) uses it directly; the API harness
+adds batching on top (harness_api/mcp/stdio_client.py). Both therefore
+speak the same protocol and decode tool results the same way.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+
+MCP_PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "harness-api", "version": "0.1.0"}
+
+
+class McpStdioError(RuntimeError):
+    """Raised when the server fails, times out, or returns a JSON-RPC error."""
+
+
+class McpToolError(McpStdioError):
+    """Raised when a tool call completes with ``isError`` set."""
+
+
+def bare_tool_name(tool_name: str) -> str:
+    """Strip the ``mcp__<server>__`` prefix from a canonical tool name."""
+    return tool_name.split("__", 2)[2] if tool_name.startswith("mcp__") else tool_name
+
+
+def decode_tool_result(tool: str, result: Mapping[str, Any]) -> Any:
+    """Turn a ``tools/call`` result into the value the tool handler returned.
+
+    Raises:
+        McpToolError: If the server flagged the result with ``isError``
+    """
+    text = "".join(item.get("text", "") for item in result.get("content", []) if item.get("type") == "text")
+    if result.get("isError"):
+        raise McpToolError(f"{tool} failed: {text}")
+    if "structuredContent" in result:
+        return result["structuredContent"]
+    if text == f"{tool} completed successfully":
+        return None
+    return text
+
+
+class McpStdioConnection:
+    """JSON-RPC connection over a server process's stdin/stdout (text mode)."""
+
+    def __init__(
+        self,
+        process,
+        server_name: str = "gtd-graph-memory",
+        timeout: float = 30.0,
+        stray_output: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.process = process
+        self.server_name = server_name
+        self.timeout = timeout
+        self.stray_output = stray_output
+        self.server_info: dict[str, Any] = {}
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._counter = 0
+        self._pending: dict[int, tuple[str, Future]] = {}
+        self._closed = False
+        self._reader_thread = threading.Thread(target=self._reader, name=f"mcp-stdio-{server_name}", daemon=True)
+        self._reader_thread.start()
+
+    def initialize(self) -> dict[str, Any]:
+        """Perform the MCP handshake; must be called once before any tool call."""
+        self.server_info = self.request(
+            "initialize",
+            {"protocolVersion": MCP_PROTOCOL_VERSION, "capabilities": {}, "clientInfo": CLIENT_INFO},
+        )
+        self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return self.server_info
+
+    def list_tools(self) -> list[dict[str, Any]]:
+        return list(self.request("tools/list", {}).get("tools", []))
+
+    def call_tool(self, tool_name: str, arguments: Mapping[str, Any], timeout: Optional[float] = None) -> Any:
+        """Invoke a tool and return its decoded result.
+
+        Canonical names (``mcp__<server>__<tool>``) are accepted and reduced to
+        the bare tool name. Results are decoded the way the CLI tool runner
+        returns them: structured content when present, otherwise the text
+        payload, and ``None`` for tools that return nothing.
+        """
+        tool = bare_tool_name(tool_name)
+        result = self.request("tools/call", {"name": tool, "arguments": dict(arguments)}, timeout=timeout)
+        return decode_tool_result(tool, result)
+
+    def request(self, method: str, params: Mapping[str, Any], timeout: Optional[float] = None) -> Any:
+        """Send a JSON-RPC request and block until its response arrives.
+
+        Raises:
+            McpStdioError: On a JSON-RPC error, timeout, or server exit
+        """
+        future = self.send_request(method, params)
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise McpStdioError(f"{self.server_name} timed out on {method}") from None
+
+    def send_request(self, method: str, params: Mapping[str, Any]) -> Future:
+        """Send a JSON-RPC request without waiting for it.
+
+        Returns:
+            A Future resolved with the response ``result`` (or failed with
+            McpStdioError). Cancelling it abandons the request.
+        """
+        return self.send_requests([(method, params)])[0]
+
+    def send_requests(self, requests: Sequence[tuple[str, Mapping[str, Any]]]) -> list[Future]:
+        """Send several JSON-RPC requests in a single write (see send_request)."""
+        entries = []
+        with self._pending_lock:
+            if self._closed:
+                raise McpStdioError(f"{self.server_name} closed stdout (exit code {self.process.poll()})")
+            for method, params in requests:
+                self._counter += 1
+                future: Future = Future()
+                self._pending[self._counter] = (method, future)
+                entries.append((self._counter, method, params, future))
+        for req_id, _, _, future in entries:
+            future.add_done_callback(lambda done, req_id=req_id: self._forget(req_id, done))
+        try:
+            self._write(
+                "".join(
+                    json.dumps({"jsonrpc": "2.0", "id": req_id, "method": method, "params": dict(params)}) + "\n"
+                    for req_id, method, params, _ in entries
+                )
+            )
+        except McpStdioError:
+            for *_, future in entries:
+                future.cancel()
+            raise
+        return [future for *_, future in entries]
+
+    def pending_count(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Close the server's stdin; the process exits at end of input."""
+        try:
+            self.process.stdin.close()
+        except (OSError, ValueError):
+            pass
+
+    def _send(self, message: Mapping[str, Any]) -> None:
+        self._write(json.dumps(message) + "\n")
+
+    def _write(self, text: str) -> None:
+        with self._write_lock:
+            try:
+                self.process.stdin.write(text)
+                self.process.stdin.flush()
+            except (BrokenPipeError, ValueError) as exc:
+                raise McpStdioError(f"{self.server_name} is not accepting input") from exc
+
+    def _forget(self, req_id: int, future: Future) -> None:
+        with self._pending_lock:
+            abandoned = self._pending.pop(req_id, None) is not None
+        if abandoned and future.cancelled():
+            try:
+                self._send({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": req_id}})
+            except McpStdioError:
+                pass
+
+    def _reader(self) -> None:
+        for line in self.process.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                message = None
+            if not isinstance(message, dict):
+                if self.stray_output and line.strip():
+                    self.stray_output(line)
+                continue
+            # Notifications and server-initiated requests carry no matching id
+            resp_id = message.get("id")
+            if resp_id is None or "method" in message:
+                continue
+            with self._pending_lock:
+                entry = self._pending.pop(resp_id, None)
+            if entry is None:
+                continue  # caller timed out or cancelled
+            method, future = entry
+            try:
+                if "error" in message:
+                    error = message["error"]
+                    future.set_exception(McpStdioError(f"{method} failed: {error.get('message', error)}"))
+                else:
+                    future.set_result(message.get("result") or {})
+            except InvalidStateError:
+                pass  # cancelled while the response was in flight
+
+        with self._pending_lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for method, future in pending:
+            if not future.done():
+                try:
+                    future.set_exception(
+                        McpStdioError(f"{self.server_name} closed stdout during {method} (exit code {self.process.poll()})")
+                    )
+                except InvalidStateError:
+                    pass
+
+
+__all__ = [
+    "CLIENT_INFO",
+    "MCP_PROTOCOL_VERSION",
+    "McpStdioConnection",
+    "McpStdioError",
+    "McpToolError",
+    "bare_tool_name",
+    "decode_tool_result",
+]
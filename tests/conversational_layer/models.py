@@ -8,6 +8,7 @@ from typing import List, Optional
 
 from .interrogation import QAPair
 from .judge import Verdict
+from .timing import PhaseTiming
 
 
 @dataclass
@@ -29,6 +30,9 @@ class TestResult:
         duration: Test duration in seconds
         retry_count: Number of retries needed
         session_id: Session ID for resumption
+        input_hash: Content hash of everything the result depends on
+        source_result_id: ResultsDB result this was reused from (None if executed)
+        phase_timings: Time spent in each phase (fixture/assistant/user_proxy/judge/interrogation/backoff/rate_limit)
     """
     test_name: str
     category: str
@@ -44,6 +48,9 @@ class TestResult:
     duration: float = 0.0
     retry_count: int = 0
     session_id: str = ""
+    input_hash: str = ""
+    source_result_id: Optional[int] = None
+    phase_timings: List[PhaseTiming] = field(default_factory=list)
 
 
 @dataclass
@@ -57,6 +64,7 @@ class TestSuiteResults:
         results: List of individual test results
         interrogations: Number of interrogations performed
         duration: Total suite duration in seconds
+        run_id: ResultsDB run ID the results were saved under (if any)
     """
     total: int = 0
     passed: int = 0
@@ -64,3 +72,4 @@ class TestSuiteResults:
     results: List[TestResult] = field(default_factory=list)
     interrogations: int = 0
     duration: float = 0.0
+    run_id: Optional[int] = None
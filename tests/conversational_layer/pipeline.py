@@ -0,0 +1,202 @@
+"""Bounded multi-stage pipeline for overlapping test phases.
+
+Items flow through an ordered list of stages (e.g. assistant -> judge ->
+interrogate). Each stage has its own worker threads and a bounded input
+queue, so a slow stage applies backpressure instead of letting work pile
+up, and throughput is set by the slowest stage rather than the sum of all
+of them. Outputs are yielded in input order.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .logging_config import get_logger
+
+
+# Marker telling a stage worker that no more items will arrive
+_DONE = object()
+
+# How often blocked queue operations re-check for shutdown (seconds)
+_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class Stage:
+    """One pipeline stage.
+
+    Attributes:
+        name: Stage name (used for thread names and logging)
+        func: Called with the item from the previous stage; its return value
+            is passed to the next stage
+        workers: Number of threads running this stage concurrently
+    """
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class _Failure:
+    """Exception raised by a stage, carried to the consumer in order."""
+    stage: str
+    error: BaseException
+
+
+class Pipeline:
+    """Runs items through stages with bounded queues between them."""
+
+    def __init__(self, stages: List[Stage], queue_size: int = 2):
+        """Initialize pipeline.
+
+        Args:
+            stages: Stages in execution order
+            queue_size: Maximum items waiting in front of each stage
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        if queue_size < 1:
+            raise ValueError(f"Queue size must be >= 1, got {queue_size}")
+
+        self.stages = stages
+        self.queue_size = queue_size
+        self.logger = get_logger()
+        self._stop = threading.Event()
+
+    def run(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Run items through all stages.
+
+        Args:
+            items: Input items (consumed lazily, as the first stage has room)
+
+        Yields:
+            Final-stage outputs in input order
+
+        Raises:
+            Exception: The first stage failure, when its item is reached
+        """
+        self._stop.clear()
+
+        inputs: List["queue.Queue[Any]"] = [
+            queue.Queue(maxsize=self.queue_size) for _ in self.stages
+        ]
+        outputs: "queue.Queue[Any]" = queue.Queue()
+        threads = [threading.Thread(
+            target=self._feed, args=(items, inputs[0]), name="pipeline-feed", daemon=True
+        )]
+
+        for index, stage in enumerate(self.stages):
+            if index + 1 < len(self.stages):
+                downstream, markers = inputs[index + 1], self.stages[index + 1].workers
+            else:
+                downstream, markers = outputs, 1
+            remaining = {"workers": stage.workers}
+            lock = threading.Lock()
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, inputs[index], downstream, markers, remaining, lock),
+                    name=f"pipeline-{stage.name}-{worker + 1}",
+                    daemon=True,
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            yield from self._reorder(outputs)
+        finally:
+            # Workers stuck in a long stage call are daemons; don't wait on them
+            self._stop.set()
+        for thread in threads:
+            thread.join()
+
+    def _feed(self, items: Iterable[Any], first: "queue.Queue[Any]") -> None:
+        """Push numbered items into the first stage, then end-of-input markers."""
+        try:
+            for sequence, item in enumerate(items):
+                if not self._put(first, (sequence, item)):
+                    return
+        except BaseException as e:
+            # A failing input iterator ends the run like a stage failure
+            self._put(first, (-1, _Failure("input", e)))
+        for _ in range(self.stages[0].workers):
+            if not self._put(first, _DONE):
+                return
+
+    def _work(
+        self,
+        stage: Stage,
+        inbox: "queue.Queue[Any]",
+        downstream: "queue.Queue[Any]",
+        markers: int,
+        remaining: Dict[str, int],
+        lock: threading.Lock
+    ) -> None:
+        """Stage worker loop: process items until end of input."""
+        while not self._stop.is_set():
+            entry = self._get(inbox)
+            if entry is None:
+                continue
+            if entry is _DONE:
+                break
+
+            sequence, payload = entry
+            if not isinstance(payload, _Failure):
+                try:
+                    payload = stage.func(payload)
+                except BaseException as e:
+                    self.logger.error(f"Pipeline stage '{stage.name}' failed: {e}", exc_info=True)
+                    payload = _Failure(stage.name, e)
+
+            if not self._put(downstream, (sequence, payload)):
+                return
+
+        # Last worker out tells the next stage (or the consumer) we're done
+        with lock:
+            remaining["workers"] -= 1
+            finished = remaining["workers"] == 0
+        if finished:
+            for _ in range(markers):
+                if not self._put(downstream, _DONE):
+                    return
+
+    def _reorder(self, outputs: "queue.Queue[Any]") -> Iterator[Any]:
+        """Yield final outputs in input order as they become available."""
+        pending: Dict[int, Any] = {}
+        next_sequence = 0
+
+        while True:
+            entry = outputs.get()
+            if entry is _DONE:
+                break
+
+            sequence, payload = entry
+            if sequence < 0:
+                raise payload.error
+            pending[sequence] = payload
+
+            while next_sequence in pending:
+                payload = pending.pop(next_sequence)
+                next_sequence += 1
+                if isinstance(payload, _Failure):
+                    raise payload.error
+                yield payload
+
+    def _put(self, target: "queue.Queue[Any]", entry: Any) -> bool:
+        """Put with backpressure; returns False if the pipeline was stopped."""
+        while not self._stop.is_set():
+            try:
+                target.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: "queue.Queue[Any]") -> Optional[Any]:
+        """Get with periodic shutdown checks; returns None on poll timeout."""
+        try:
+            return source.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            return None
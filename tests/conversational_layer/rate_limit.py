@@ -0,0 +1,253 @@
+"""Process-wide, per-model rate limiting for model calls.
+
+Every Claude CLI invocation (and every API call made by the API harness)
+acquires a slot from the limiter for its model before it starts. A limiter
+combines a token bucket (requests per minute) with a cap on concurrent
+calls. While we are under quota, acquiring is free: nothing sleeps. When a
+call reports a rate-limit error the limiter stretches back — it halves its
+request rate and imposes a cooldown — then recovers gradually as calls
+succeed again. This replaces fixed inter-test/inter-run sleeps.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from .logging_config import get_logger
+from .timing import timed_phase
+
+
+# Defaults used until configure_rate_limits() is called
+DEFAULT_REQUESTS_PER_MINUTE = 50.0
+DEFAULT_MAX_CONCURRENT = 8
+
+# Key used for calls that don't name a model
+DEFAULT_MODEL_KEY = "default"
+
+# Cooldown after a rate-limit error (doubles on repeated errors, up to max)
+INITIAL_COOLDOWN = 5.0
+MAX_COOLDOWN = 120.0
+
+# Never slow below this fraction of the configured rate
+MIN_RATE_FRACTION = 0.05
+
+# Fraction of the configured rate regained per successful call
+RECOVERY_FRACTION = 0.1
+
+# How often a call blocked on the concurrency cap re-checks (seconds)
+_CONCURRENCY_POLL = 0.05
+
+
+class RateLimiter:
+    """Token bucket plus concurrency cap for one model.
+
+    Attributes:
+        name: Model key this limiter guards
+        requests_per_minute: Configured request rate (0 disables rate limiting)
+        max_concurrent: Maximum calls in flight (0 disables the cap)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        clock=time.monotonic
+    ):
+        """Initialize limiter.
+
+        Args:
+            name: Model key this limiter guards
+            requests_per_minute: Sustained request rate (0 = unlimited)
+            max_concurrent: Maximum calls in flight (0 = unlimited)
+            clock: Monotonic time source (injectable for tests)
+        """
+        if requests_per_minute < 0:
+            raise ValueError(f"requests_per_minute must be >= 0, got {requests_per_minute}")
+        if max_concurrent < 0:
+            raise ValueError(f"max_concurrent must be >= 0, got {max_concurrent}")
+
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrent = max_concurrent
+        self.logger = get_logger()
+        self._clock = clock
+
+        # Bucket holds up to one burst of max_concurrent calls (at least one)
+        self._capacity = float(max(1, max_concurrent))
+        self._tokens = self._capacity
+        self._rate = requests_per_minute / 60.0
+        self._updated = clock()
+        self._in_flight = 0
+        self._cooldown_until = 0.0
+        self._cooldown = INITIAL_COOLDOWN
+        self._condition = threading.Condition()
+
+    @property
+    def current_rate(self) -> float:
+        """Current (possibly stretched-back) rate in requests per minute."""
+        with self._condition:
+            return self._rate * 60.0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        with self._condition:
+            return self._in_flight
+
+    def try_acquire(self) -> float:
+        """Take a slot if one is available right now.
+
+        Returns:
+            0.0 if a slot was taken, else seconds to wait before trying again
+        """
+        with self._condition:
+            return self._try_acquire_locked()
+
+    def acquire(self) -> None:
+        """Block until a slot is available, then take it.
+
+        Time spent waiting is timed as the ``rate_limit`` phase, so it is
+        not counted in the phase of the call that queued.
+        """
+        wait = self.try_acquire()
+        if wait <= 0:
+            return
+        with timed_phase("rate_limit"), self._condition:
+            while wait > 0:
+                self._condition.wait(timeout=wait)
+                wait = self._try_acquire_locked()
+
+    async def acquire_async(self) -> None:
+        """Wait for a slot without blocking the event loop, then take it."""
+        wait = self.try_acquire()
+        if wait <= 0:
+            return
+        with timed_phase("rate_limit"):
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.try_acquire()
+
+    def release(self) -> None:
+        """Return a slot taken by acquire()/acquire_async()/try_acquire()."""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of a block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of an async block."""
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def report_rate_limit(self) -> None:
+        """Stretch back after a rate-limit error.
+
+        Halves the request rate (down to a floor), empties the bucket and
+        pauses new calls for a cooldown that doubles on repeated errors.
+        """
+        with self._condition:
+            now = self._clock()
+            if self.requests_per_minute > 0:
+                floor = self.requests_per_minute / 60.0 * MIN_RATE_FRACTION
+                self._rate = max(floor, self._rate / 2)
+            self._tokens = 0.0
+            self._updated = now
+            self._cooldown_until = max(self._cooldown_until, now + self._cooldown)
+            cooldown = self._cooldown
+            self._cooldown = min(MAX_COOLDOWN, self._cooldown * 2)
+            rate = self._rate * 60.0
+
+        self.logger.warning(
+            f"Rate limit hit for {self.name}: pausing {cooldown:.0f}s, "
+            f"rate now {rate:.1f}/min"
+        )
+
+    def report_success(self) -> None:
+        """Recover gradually toward the configured rate after a good call."""
+        with self._condition:
+            self._cooldown = INITIAL_COOLDOWN
+            if self.requests_per_minute > 0:
+                configured = self.requests_per_minute / 60.0
+                self._rate = min(configured, self._rate + configured * RECOVERY_FRACTION)
+
+    def _try_acquire_locked(self) -> float:
+        """try_acquire() body; caller holds the condition lock."""
+        now = self._clock()
+
+        if now < self._cooldown_until:
+            return self._cooldown_until - now
+
+        if self.max_concurrent and self._in_flight >= self.max_concurrent:
+            return _CONCURRENCY_POLL
+
+        if self.requests_per_minute > 0:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self._rate
+            self._tokens -= 1.0
+
+        self._in_flight += 1
+        return 0.0
+
+
+# Process-wide registry: one limiter per model
+_limiters: Dict[str, RateLimiter] = {}
+_settings = {
+    "requests_per_minute": DEFAULT_REQUESTS_PER_MINUTE,
+    "max_concurrent": DEFAULT_MAX_CONCURRENT,
+}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limits(
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT
+) -> None:
+    """Set limits for all models and discard existing limiters.
+
+    Args:
+        requests_per_minute: Sustained request rate per model (0 = unlimited)
+        max_concurrent: Maximum calls in flight per model (0 = unlimited)
+    """
+    with _registry_lock:
+        _settings["requests_per_minute"] = requests_per_minute
+        _settings["max_concurrent"] = max_concurrent
+        _limiters.clear()
+
+
+def get_rate_limiter(model: Optional[str] = None) -> RateLimiter:
+    """Get the shared limiter for a model.
+
+    Args:
+        model: Model name or alias (None uses the default key)
+
+    Returns:
+        RateLimiter shared by every caller using this model
+    """
+    key = model or DEFAULT_MODEL_KEY
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                key,
+                requests_per_minute=_settings["requests_per_minute"],
+                max_concurrent=int(_settings["max_concurrent"]),
+            )
+            _limiters[key] = limiter
+        return limiter
@@ -13,10 +13,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from .config import Config
+from .early_stopping import wilson_interval
 from .interrogation import QAPair
 from .judge import Verdict
 from .logging_config import get_logger
 from .models import TestResult, TestSuiteResults
+from .timing import PhaseTiming
 
 
 class ResultsDB:
@@ -27,6 +29,7 @@ class ResultsDB:
     - test_results: Individual test results
     - interrogations: Q&A pairs from interrogation
     - verdicts: Judge verdicts
+    - phase_timings: Time each result spent per phase (clean = no retry or failure)
     """
 
     def __init__(self, db_path: Path):
@@ -112,6 +115,23 @@ class ResultsDB:
             )
         """)
 
+        # Phase timings table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS phase_timings (
+                timing_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                result_id INTEGER NOT NULL,
+                phase TEXT NOT NULL,
+                duration REAL NOT NULL,
+                clean INTEGER NOT NULL DEFAULT 1,
+                FOREIGN KEY (result_id) REFERENCES test_results (result_id)
+            )
+        """)
+
+        # Columns added after the original schema
+        self._ensure_column("test_results", "input_hash", "TEXT")
+        self._ensure_column("test_results", "source_result_id", "INTEGER")
+        self._ensure_column("phase_timings", "clean", "INTEGER NOT NULL DEFAULT 1")
+
         # Indexes for common queries
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_test_results_run_id
@@ -128,18 +148,43 @@ class ResultsDB:
             ON test_results (category)
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_test_results_input_hash
+            ON test_results (input_hash)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_phase_timings_result_id
+            ON phase_timings (result_id)
+        """)
+
         self.conn.commit()
 
+    def _ensure_column(self, table: str, column: str, declaration: str):
+        """Add a column to an existing table if it is missing.
+
+        Args:
+            table: Table name
+            column: Column name
+            declaration: Column type/constraints for ALTER TABLE
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row["name"] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
     def create_run(
         self,
         config: Config,
-        suite_results: TestSuiteResults
+        suite_results: TestSuiteResults,
+        extra: Optional[Dict[str, Any]] = None
     ) -> int:
         """Create a new test run record.
 
         Args:
             config: Test configuration
             suite_results: Suite results to save
+            extra: Additional run metadata stored with the config (e.g. shard plan)
 
         Returns:
             run_id for the new run
@@ -152,13 +197,27 @@ class ResultsDB:
             "runs": config.runs,
             "inter_run_delay": config.inter_run_delay,
             "inter_test_delay": config.inter_test_delay,
+            "workers": config.workers,
+            "use_asyncio": config.use_asyncio,
+            "pipeline": config.pipeline,
+            "rate_limit_rpm": config.rate_limit_rpm,
+            "max_concurrent_calls": config.max_concurrent_calls,
+            "adaptive_runs": config.adaptive_runs,
+            "reuse_unchanged": config.reuse_unchanged,
+            "cassette_mode": config.cassette_mode,
             "max_retries": config.max_retries,
             "assistant_timeout": config.assistant_timeout,
+            "adaptive_timeouts": config.adaptive_timeouts,
+            "schedule": config.schedule,
+            "stream_assistant": config.stream_assistant,
+            "inactivity_timeout": config.inactivity_timeout,
             "judge_timeout": config.judge_timeout,
             "clean_between_tests": config.clean_between_tests,
             "interrogate_failures": config.interrogate_failures,
             "interrogate_passes": config.interrogate_passes,
         }
+        if extra:
+            config_dict.update(extra)
 
         cursor.execute("""
             INSERT INTO runs (
@@ -202,8 +261,9 @@ class ResultsDB:
             INSERT INTO test_results (
                 run_id, test_name, category, run_number, passed,
                 expected_pass, actual_pass, reason, assistant_response,
-                full_transcript, duration, retry_count, session_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                full_transcript, duration, retry_count, session_id,
+                input_hash, source_result_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             run_id,
             result.test_name,
@@ -217,7 +277,9 @@ class ResultsDB:
             result.full_transcript,
             result.duration,
             result.retry_count,
-            result.session_id
+            result.session_id,
+            result.input_hash or None,
+            result.source_result_id
         ))
 
         self.conn.commit()
@@ -231,6 +293,10 @@ class ResultsDB:
         if result.interrogation:
             self._save_interrogation(result_id, result.interrogation)
 
+        # Reused results didn't run, so they add nothing to the timing history
+        if result.phase_timings and result.source_result_id is None:
+            self._save_phase_timings(result_id, result.phase_timings)
+
         return result_id
 
     def _save_verdict(self, result_id: int, verdict: Verdict):
@@ -281,6 +347,99 @@ class ResultsDB:
 
         self.conn.commit()
 
+    def _save_phase_timings(self, result_id: int, phase_timings: List[PhaseTiming]):
+        """Save phase timings.
+
+        Args:
+            result_id: Result ID
+            phase_timings: Time spent per phase
+        """
+        cursor = self.conn.cursor()
+
+        cursor.executemany("""
+            INSERT INTO phase_timings (result_id, phase, duration, clean) VALUES (?, ?, ?, ?)
+        """, [(result_id, t.phase, t.duration, int(t.clean)) for t in phase_timings])
+
+        self.conn.commit()
+
+    def get_phase_durations(self, limit_per_phase: int = 50) -> Dict[Tuple[str, str], List[float]]:
+        """Recent clean phase durations for every test.
+
+        Phases that failed or needed a retry are left out so they don't
+        inflate the history adaptive timeouts are learned from.
+
+        Args:
+            limit_per_phase: Keep at most this many of the newest durations
+                per (test, phase)
+
+        Returns:
+            (test_name, phase) -> durations in seconds, newest first
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            SELECT tr.test_name, pt.phase, pt.duration
+            FROM phase_timings pt
+            JOIN test_results tr ON tr.result_id = pt.result_id
+            WHERE pt.clean = 1
+            ORDER BY pt.timing_id DESC
+        """)
+
+        history: Dict[Tuple[str, str], List[float]] = {}
+        for row in cursor.fetchall():
+            durations = history.setdefault((row["test_name"], row["phase"]), [])
+            if len(durations) < limit_per_phase:
+                durations.append(row["duration"])
+        return history
+
+    def get_phase_breakdown(self, run_id: int) -> List[Tuple[str, str, float]]:
+        """Phase timings of a run, for per-category latency breakdowns.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            (category, phase, duration) rows, one per result and phase
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            SELECT tr.category, pt.phase, pt.duration
+            FROM phase_timings pt
+            JOIN test_results tr ON tr.result_id = pt.result_id
+            WHERE tr.run_id = ?
+            ORDER BY pt.timing_id
+        """, (run_id,))
+
+        return [(row["category"], row["phase"], row["duration"]) for row in cursor.fetchall()]
+
+    def get_case_history(self, limit_per_test: int = 20) -> Dict[str, List[Tuple[float, bool]]]:
+        """Recent durations and outcomes of every test.
+
+        Reused results are skipped (they repeat their source's duration).
+
+        Args:
+            limit_per_test: Keep at most this many of the newest results per test
+
+        Returns:
+            test_name -> (duration, passed) pairs, newest first
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            SELECT test_name, duration, passed
+            FROM test_results
+            WHERE source_result_id IS NULL
+            ORDER BY result_id DESC
+        """)
+
+        history: Dict[str, List[Tuple[float, bool]]] = {}
+        for row in cursor.fetchall():
+            results = history.setdefault(row["test_name"], [])
+            if len(results) < limit_per_test:
+                results.append((row["duration"], bool(row["passed"])))
+        return history
+
     def save_suite_results(
         self,
         config: Config,
@@ -345,6 +504,163 @@ class ResultsDB:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_completed_results(self, run_id: int, judged_only: bool = False) -> List[TestResult]:
+        """Load the finished test results of a run (for resuming it).
+
+        If a (test_name, run_number) pair was saved more than once, the most
+        recent result wins.
+
+        Args:
+            run_id: Run ID
+            judged_only: Leave out pairs whose latest result never reached the
+                judge (assistant/CLI failures, as in find_reusable_result), so
+                a resumed run executes them again
+
+        Returns:
+            TestResult objects (with verdicts and interrogations) in save order
+        """
+        latest: Dict[Tuple[str, int], TestResult] = {}
+
+        for row in self.get_test_results(run_id):
+            key = (row["test_name"], row["run_number"])
+            latest.pop(key, None)
+            latest[key] = self._row_to_test_result(row)
+
+        return [
+            result for result in latest.values()
+            if not judged_only or result.verdict is not None
+        ]
+
+    def find_reusable_result(
+        self,
+        input_hash: str,
+        run_number: int,
+        exclude_run_id: Optional[int] = None
+    ) -> Optional[Tuple[int, TestResult]]:
+        """Find the latest judged result produced from identical inputs.
+
+        Only results that reached the judge are reused; assistant/CLI
+        failures are infrastructure problems, not outcomes of the inputs.
+
+        Args:
+            input_hash: Case input hash
+            run_number: Run number to match (keeps N-run variance intact)
+            exclude_run_id: Run to ignore (usually the current one)
+
+        Returns:
+            (result_id, TestResult) or None if nothing matches
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            SELECT * FROM test_results tr
+            WHERE tr.input_hash = ?
+                AND tr.run_number = ?
+                AND tr.run_id != ?
+                AND EXISTS (SELECT 1 FROM verdicts v WHERE v.result_id = tr.result_id)
+            ORDER BY tr.result_id DESC
+            LIMIT 1
+        """, (input_hash, run_number, exclude_run_id if exclude_run_id is not None else -1))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return row["result_id"], self._row_to_test_result(dict(row))
+
+    def _row_to_test_result(self, row: Dict[str, Any]) -> TestResult:
+        """Rebuild a TestResult (with verdict and interrogation) from a row.
+
+        Args:
+            row: test_results row as a dictionary
+
+        Returns:
+            TestResult object
+        """
+        cursor = self.conn.cursor()
+        result_id = row["result_id"]
+
+        cursor.execute("""
+            SELECT * FROM verdicts WHERE result_id = ?
+        """, (result_id,))
+        verdict_row = cursor.fetchone()
+        verdict = None
+        if verdict_row:
+            verdict = Verdict(
+                effective=bool(verdict_row["effective"]),
+                safe=bool(verdict_row["safe"]),
+                clear=bool(verdict_row["clear"]),
+                reasoning=verdict_row["reasoning"],
+                passed=bool(verdict_row["passed"]),
+                confidence=verdict_row["confidence"],
+            )
+
+        cursor.execute("""
+            SELECT * FROM interrogations WHERE result_id = ? ORDER BY interrogation_id
+        """, (result_id,))
+        interrogation = [
+            QAPair(question=qa["question"], answer=qa["answer"], error=qa["error"])
+            for qa in cursor.fetchall()
+        ] or None
+
+        return TestResult(
+            test_name=row["test_name"],
+            category=row["category"],
+            run_number=row["run_number"],
+            passed=bool(row["passed"]),
+            expected_pass=bool(row["expected_pass"]),
+            actual_pass=bool(row["actual_pass"]),
+            reason=row["reason"] or "",
+            verdict=verdict,
+            assistant_response=row["assistant_response"] or "",
+            full_transcript=row["full_transcript"] or "",
+            interrogation=interrogation,
+            duration=row["duration"],
+            retry_count=row["retry_count"],
+            session_id=row["session_id"] or "",
+            input_hash=row["input_hash"] or "",
+            source_result_id=row["source_result_id"],
+        )
+
+    def update_run_totals(self, run_id: int, duration: float) -> None:
+        """Recompute a run's test/pass/fail counts from its saved test results.
+
+        Like get_completed_results(), only the latest result of each
+        (test_name, run_number) pair counts, so a pair saved twice (e.g.
+        re-run after a resume) is counted once. test_count is replaced too:
+        create_run() records the planned total, which overstates the run
+        when --adaptive-runs stops some tests early.
+
+        Args:
+            run_id: Run ID
+            duration: Total run duration in seconds (all sessions)
+        """
+        cursor = self.conn.cursor()
+
+        latest = """
+            SELECT passed FROM test_results
+            WHERE result_id IN (
+                SELECT MAX(result_id) FROM test_results
+                WHERE run_id = ?
+                GROUP BY test_name, run_number
+            )
+        """
+        cursor.execute(f"""
+            UPDATE runs
+            SET test_count = (
+                    SELECT COUNT(*) FROM ({latest})
+                ),
+                passed_count = (
+                    SELECT COALESCE(SUM(passed), 0) FROM ({latest})
+                ),
+                failed_count = (
+                    SELECT COUNT(*) - COALESCE(SUM(passed), 0) FROM ({latest})
+                ),
+                duration = ?
+            WHERE run_id = ?
+        """, (run_id, run_id, run_id, duration, run_id))
+
+        self.conn.commit()
+
     def get_flaky_tests(
         self,
         min_runs: int = 5,
@@ -357,7 +673,8 @@ class ResultsDB:
             instability_threshold: Max acceptable failure rate (0.0-1.0)
 
         Returns:
-            List of flaky test summaries with statistics
+            List of flaky test summaries with statistics, including the
+            Wilson 95% interval of the pass rate (wilson_low/wilson_high)
         """
         cursor = self.conn.cursor()
 
@@ -378,7 +695,12 @@ class ResultsDB:
             ORDER BY pass_rate ASC
         """, (min_runs, instability_threshold))
 
-        return [dict(row) for row in cursor.fetchall()]
+        flaky = []
+        for row in cursor.fetchall():
+            test = dict(row)
+            test["wilson_low"], test["wilson_high"] = wilson_interval(test["pass_count"], test["total_runs"])
+            flaky.append(test)
+        return flaky
 
     def get_category_stats(self, run_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get statistics by category.
@@ -440,6 +762,137 @@ class ResultsDB:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def merge_shard_runs(self, sources: List[Tuple["ResultsDB", int]]) -> int:
+        """Combine the runs of all shards of a suite into one run in this database.
+
+        Every shard run must come from the same --shard plan (same shard
+        count and plan hash) and together they must cover all shards.
+        Results, verdicts, interrogations and phase timings are copied with
+        new IDs; the merged run's duration is the slowest shard's.
+
+        Args:
+            sources: (database, run_id) of every shard run (may include this database)
+
+        Returns:
+            run_id of the merged run
+
+        Raises:
+            ValueError: If a run is missing or the shards don't form one complete plan
+        """
+        shard_runs = []
+        for source, run_id in sources:
+            summary = source.get_run_summary(run_id)
+            if summary is None:
+                raise ValueError(f"Run {run_id} not found in {source.db_path}")
+            run_config = json.loads(summary["config_json"])
+            if "shard" not in run_config:
+                raise ValueError(f"Run {run_id} in {source.db_path} was not run with --shard")
+            shard_runs.append((source, run_id, summary, run_config))
+
+        plans = {(cfg["shard"].split("/")[1], cfg.get("shard_plan")) for _, _, _, cfg in shard_runs}
+        if len(plans) != 1:
+            raise ValueError(f"Shard runs come from different shard plans: {sorted(plans)}")
+        count = int(next(iter(plans))[0])
+        shards = sorted(int(cfg["shard"].split("/")[0]) for _, _, _, cfg in shard_runs)
+        if shards != list(range(1, count + 1)):
+            raise ValueError(f"Expected shards 1-{count} exactly once, got {shards}")
+
+        # Read everything first: a source may be this very database
+        copied = []
+        for source, run_id, summary, run_config in shard_runs:
+            rows = []
+            for row in source.get_test_results(run_id):
+                result_id = row["result_id"]
+                rows.append((row, source._rows("verdicts", result_id),
+                             source._rows("interrogations", result_id),
+                             source._rows("phase_timings", result_id)))
+            copied.append((source, run_id, summary, run_config, rows))
+
+        merged_config = {
+            key: value for key, value in copied[0][3].items()
+            if key not in ("shard", "shard_jobs", "planned_results")
+        }
+        if all("planned_results" in run_config for _, _, _, run_config, _ in copied):
+            merged_config["planned_results"] = sum(
+                run_config["planned_results"] for _, _, _, run_config, _ in copied
+            )
+        merged_config["merged_shards"] = [
+            {"source": str(source.db_path), "run_id": run_id, "shard": run_config["shard"]}
+            for source, run_id, _, run_config, _ in copied
+        ]
+        first = copied[0][2]
+
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO runs (
+                timestamp, mode, runs_count, test_count, passed_count,
+                failed_count, duration, config_json
+            ) VALUES (?, ?, ?, ?, 0, 0, ?, ?)
+        """, (
+            min(summary["timestamp"] for _, _, summary, _, _ in copied),
+            first["mode"],
+            first["runs_count"],
+            sum(summary["test_count"] for _, _, summary, _, _ in copied),
+            max(summary["duration"] for _, _, summary, _, _ in copied),
+            json.dumps(merged_config)
+        ))
+        merged_run_id = cursor.lastrowid
+
+        result_columns = [
+            "test_name", "category", "run_number", "passed", "expected_pass", "actual_pass",
+            "reason", "assistant_response", "full_transcript", "duration", "retry_count",
+            "session_id", "input_hash", "source_result_id",
+        ]
+        for _, _, _, _, rows in copied:
+            id_map: Dict[int, int] = {}
+            reused: List[Tuple[int, int]] = []
+            for row, verdicts, interrogations, timings in rows:
+                values = [row.get(column) for column in result_columns]
+                cursor.execute(f"""
+                    INSERT INTO test_results (run_id, {", ".join(result_columns)})
+                    VALUES (?, {", ".join("?" for _ in result_columns)})
+                """, [merged_run_id] + values)
+                new_id = cursor.lastrowid
+                id_map[row["result_id"]] = new_id
+                if row.get("source_result_id") is not None:
+                    reused.append((new_id, row["source_result_id"]))
+                self._copy_rows(cursor, "verdicts", "verdict_id", new_id, verdicts)
+                self._copy_rows(cursor, "interrogations", "interrogation_id", new_id, interrogations)
+                self._copy_rows(cursor, "phase_timings", "timing_id", new_id, timings)
+
+            # Reuse provenance only survives when the source result was copied too
+            for new_id, old_source_id in reused:
+                cursor.execute("""
+                    UPDATE test_results SET source_result_id = ? WHERE result_id = ?
+                """, (id_map.get(old_source_id), new_id))
+
+        self.conn.commit()
+        self.update_run_totals(merged_run_id, max(summary["duration"] for _, _, summary, _, _ in copied))
+        self.logger.info(f"Merged {len(copied)} shard runs into run_id={merged_run_id}")
+        return merged_run_id
+
+    def _rows(self, table: str, result_id: int) -> List[Dict[str, Any]]:
+        """All rows of a per-result table for one result."""
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT * FROM {table} WHERE result_id = ?", (result_id,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _copy_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        table: str,
+        primary_key: str,
+        result_id: int,
+        rows: List[Dict[str, Any]]
+    ):
+        """Insert per-result rows under a new result ID (with new primary keys)."""
+        for row in rows:
+            columns = [column for column in row if column not in (primary_key, "result_id")]
+            cursor.execute(f"""
+                INSERT INTO {table} (result_id, {", ".join(columns)})
+                VALUES (?, {", ".join("?" for _ in columns)})
+            """, [result_id] + [row[column] for column in columns])
+
     def export_run_to_json(self, run_id: int, output_path: Path) -> bool:
         """Export run results to JSON file.
 
@@ -527,6 +980,7 @@ def print_flaky_tests_report(db: ResultsDB, min_runs: int = 5):
     for test in flaky:
         print(f"  {test['test_name']} ({test['category']})")
         print(f"    Pass rate: {100*test['pass_rate']:.1f}% ({test['pass_count']}/{test['total_runs']})")
+        print(f"    95% interval: {100*test['wilson_low']:.1f}%-{100*test['wilson_high']:.1f}%")
         print(f"    Avg duration: {test['avg_duration']:.1f}s")
         print()
 
@@ -4,11 +4,14 @@ Provides retry decorators and functions for handling rate limits and
 temporary errors in Claude API calls.
 """
 
+import asyncio
 import time
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, TypeVar, cast
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar, cast
 
 from .logging_config import get_logger, log_retry
+from .timing import timed_phase
+from .tracing import span
 
 T = TypeVar('T')
 
@@ -62,10 +65,16 @@ def is_retryable_error(result: Dict[str, Any]) -> bool:
         - Connection errors
         - Broken pipe
         - Explicit retry flag in result
+
+    Results flagged "fatal" (e.g. an aborted tool-call loop) are never
+    retried, whatever their reason text mentions.
     """
     if not isinstance(result, dict):
         return False
 
+    if result.get("fatal") is True:
+        return False
+
     # Explicit retry flag
     if result.get("retry") is True:
         return True
@@ -119,46 +128,125 @@ def retry_with_backoff(
         ...     initial_backoff=30.0
         ... )
     """
-    logger = get_logger()
-
     for attempt in range(max_retries):
         # Execute function
-        result = func(*args, **kwargs)
-
-        # Success (pass is not False, handles None/missing pass field)
-        if result.get("pass") is not False:
-            if attempt > 0:
-                logger.info(
-                    f"Retry successful on attempt {attempt + 1}",
-                    extra={"attempt": attempt + 1}
-                )
-            return result
+        with span(f"attempt {attempt + 1}", "retry", function=getattr(func, "__name__", "call")) as traced:
+            result = func(*args, **kwargs)
+            traced.set(passed=bool(result.get("pass")), retry=bool(result.get("retry")))
 
-        # Check if error is retryable
-        if not is_retryable_error(result):
-            logger.debug(
-                f"Non-retryable error, failing immediately: {result.get('reason', 'unknown')[:100]}",
-                extra={"attempt": attempt + 1}
-            )
+        backoff = _next_backoff(result, attempt, max_retries, initial_backoff, backoff_multiplier)
+        if backoff is None:
             return result
 
-        # Last attempt - don't retry
-        if attempt >= max_retries - 1:
-            logger.warning(
-                f"Max retries ({max_retries}) exceeded",
-                extra={"attempt": attempt + 1, "reason": result.get("reason", "")[:100]}
-            )
+        with timed_phase("backoff"):
+            time.sleep(backoff)
+
+    # Should never reach here, but safety fallback
+    return {"pass": False, "reason": "Max retries exceeded (fallback)"}
+
+
+async def retry_with_backoff_async(
+    func: Callable[..., Awaitable[Dict[str, Any]]],
+    max_retries: int = 3,
+    initial_backoff: float = 30.0,
+    backoff_multiplier: float = 2.0,
+    *args,
+    **kwargs
+) -> Dict[str, Any]:
+    """Async variant of retry_with_backoff for coroutine functions.
+
+    Backoff waits use asyncio.sleep, so other cases keep running on the
+    event loop while this one waits.
+
+    Args:
+        func: Coroutine function to execute (must return Dict with "pass" field)
+        max_retries: Maximum number of retry attempts (default: 3)
+        initial_backoff: Initial backoff delay in seconds (default: 30.0)
+        backoff_multiplier: Multiplier for backoff delay (default: 2.0)
+        *args: Positional arguments to pass to func
+        **kwargs: Keyword arguments to pass to func
+
+    Returns:
+        Result dictionary from successful execution or final attempt
+    """
+    for attempt in range(max_retries):
+        with span(f"attempt {attempt + 1}", "retry", function=getattr(func, "__name__", "call")) as traced:
+            result = await func(*args, **kwargs)
+            traced.set(passed=bool(result.get("pass")), retry=bool(result.get("retry")))
+
+        backoff = _next_backoff(result, attempt, max_retries, initial_backoff, backoff_multiplier)
+        if backoff is None:
             return result
 
-        # Calculate backoff and wait
-        backoff = initial_backoff * (backoff_multiplier ** attempt)
-        log_retry(logger, attempt + 1, max_retries, backoff)
-        time.sleep(backoff)
+        with timed_phase("backoff"):
+            await asyncio.sleep(backoff)
 
     # Should never reach here, but safety fallback
     return {"pass": False, "reason": "Max retries exceeded (fallback)"}
 
 
+def _next_backoff(
+    result: Dict[str, Any],
+    attempt: int,
+    max_retries: int,
+    initial_backoff: float,
+    backoff_multiplier: float
+) -> Optional[float]:
+    """Decide whether an attempt should be retried.
+
+    Args:
+        result: Result dictionary from the attempt
+        attempt: Attempt index (0-based)
+        max_retries: Maximum number of attempts
+        initial_backoff: Initial backoff delay in seconds
+        backoff_multiplier: Multiplier for backoff delay
+
+    Returns:
+        Seconds to wait before the next attempt, or None to return result
+    """
+    logger = get_logger()
+
+    # Success (pass is not False, handles None/missing pass field)
+    if result.get("pass") is not False:
+        if attempt > 0:
+            logger.info(
+                f"Retry successful on attempt {attempt + 1}",
+                extra={"attempt": attempt + 1}
+            )
+        return None
+
+    # Check if error is retryable
+    if not is_retryable_error(result):
+        logger.debug(
+            f"Non-retryable error, failing immediately: {result.get('reason', 'unknown')[:100]}",
+            extra={"attempt": attempt + 1}
+        )
+        return None
+
+    # Last attempt - don't retry
+    if attempt >= max_retries - 1:
+        logger.warning(
+            f"Max retries ({max_retries}) exceeded",
+            extra={"attempt": attempt + 1, "reason": result.get("reason", "")[:100]}
+        )
+        return None
+
+    # Rate limits are paced by the shared rate limiter, which has already
+    # stretched back for this model; retrying goes through it, so don't add
+    # a blind sleep on top
+    if is_rate_limit_error(result):
+        logger.info(
+            f"Rate limited, retrying via rate limiter (attempt {attempt + 2}/{max_retries})",
+            extra={"attempt": attempt + 1}
+        )
+        return 0.0
+
+    # Calculate backoff
+    backoff = initial_backoff * (backoff_multiplier ** attempt)
+    log_retry(logger, attempt + 1, max_retries, backoff)
+    return backoff
+
+
 def retry_decorator(
     max_retries: int = 3,
     initial_backoff: float = 30.0,
@@ -3,28 +3,50 @@
 Orchestrates test execution, judge evaluation, interrogation, and results collection.
 """
 
+import asyncio
 import json
 import os
 import subprocess
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
+from .cassette import configure_cassettes
+from .claude_exec import run_claude, run_claude_async, run_claude_stream, run_claude_stream_async
 from .config import Config
+from .early_stopping import EarlyStopper
 from .errors import flush_output, handle_subprocess_error
 from .fixtures import (
     clean_graph_state,
     extract_text,
     parse_payload,
     setup_graph_from_fixture,
+    setup_graph_from_fixture_async,
+    verify_mcp_server,
 )
-from .install import TestInstallation, create_test_installation
-from .interrogation import interrogate_session, QAPair, format_interrogation_for_json
-from .judge import run_judge, Verdict
+from .input_hash import compute_case_hash, compute_suite_fingerprint, graph_memory_build_fingerprint
+from .install import TestInstallation, create_test_installation, get_active_installation
+from .interrogation import (
+    interrogate_session,
+    interrogate_session_async,
+    QAPair,
+    format_interrogation_for_json,
+)
+from .judge import run_judge, run_judge_async, Verdict
 from .logging_config import get_logger, log_test_start, log_test_result
+from .mcp_log import McpLogCursor
 from .models import TestResult, TestSuiteResults
-from .retry import retry_with_backoff
+from .rate_limit import configure_rate_limits
+from .scheduling import assign_shards, build_case_stats, order_items, shard_plan_hash
+from .snapshots import configure_fixture_snapshots
+from .streaming import StreamAborted, StreamLimits, StreamMonitor
+from .timeouts import AdaptiveTimeouts, TimeoutPolicy
+from .timing import PHASES, PhaseTimer, activate_timer, mark_phase_failed, phase_breakdown, timed_phase
+from .tracing import configure_tracing, span, write_trace
+from .trash import wait_for_trash
+from .retry import retry_with_backoff, retry_with_backoff_async
 from .user_proxy import (
     UserProxy,
     LLMUserProxy,
@@ -32,14 +54,48 @@ from .user_proxy import (
     extract_conversational_config,
 )
 from .results_db import ResultsDB
+from .pipeline import Pipeline, Stage
+from .workers import WorkerPool
 
 
 CLAUDE_CMD = "claude"
+ASSISTANT_MODEL = "sonnet"
 MCP_LOG_PATH = Path("/Users/scottmcguire/Share1/Projects/personal-assistant-gtd-style/.data/gtd-memory/mcp-calls.log")
 
 # Global test installation instance (set during suite setup if using isolated mode)
 _test_installation: Optional[TestInstallation] = None
 
+# Global worker pool (set during suite setup if running with --workers > 1)
+_worker_pool: Optional[WorkerPool] = None
+
+# Per-case timeouts learned from ResultsDB (set during suite setup with --adaptive-timeouts)
+_adaptive_timeouts: Optional[AdaptiveTimeouts] = None
+
+
+@dataclass
+class TestJob:
+    """One (test case, run number) unit of work in a suite.
+
+    Attributes:
+        sequence: Position in deterministic suite order (0-based)
+        run_number: Which run this is (1-based)
+        index: Position of the case within the run (1-based)
+        case: Test case dictionary
+    """
+    sequence: int
+    run_number: int
+    index: int
+    case: Dict[str, Any]
+
+
+def _current_installation() -> Optional[TestInstallation]:
+    """Get the installation for the calling worker (or the suite-wide one).
+
+    Returns:
+        Active TestInstallation, or None when not isolated
+    """
+    return get_active_installation() or _test_installation
+
 
 def setup_test_installation(config: Config) -> None:
     """Setup isolated test installation if enabled.
@@ -52,7 +108,8 @@ def setup_test_installation(config: Config) -> None:
     """
     global _test_installation
 
-    if not config.use_isolated_env:
+    # Parallel workers build their own installations (see WorkerPool)
+    if not config.use_isolated_env or config.uses_worker_pool():
         return
 
     logger = get_logger()
@@ -80,7 +137,15 @@ def teardown_test_installation(config: Config) -> None:
     Args:
         config: Test configuration
     """
-    global _test_installation
+    global _test_installation, _worker_pool
+
+    # Let the reaper finish deleting cleaned graphs before removing their installations
+    if not wait_for_trash(config.cleanup_timeout):
+        get_logger().warning("Graph trash still being deleted; continuing teardown")
+
+    if _worker_pool is not None:
+        _worker_pool.close(keep=config.keep_test_install)
+        _worker_pool = None
 
     if not config.use_isolated_env or _test_installation is None:
         return
@@ -106,62 +171,52 @@ def get_mcp_log_path() -> Path:
     Returns:
         Path to MCP log file
     """
-    if _test_installation is not None:
-        return _test_installation.get_mcp_log_path()
+    installation = _current_installation()
+    if installation is not None:
+        return installation.get_mcp_log_path()
     return MCP_LOG_PATH
 
 
-def clear_mcp_log() -> None:
-    """Clear MCP call log file before test execution."""
-    try:
-        log_path = get_mcp_log_path()
-        if log_path.exists():
-            log_path.unlink()
-    except Exception as e:
-        logger = get_logger()
-        logger.warning(f"Failed to clear MCP log: {e}")
-
+def mark_mcp_log() -> McpLogCursor:
+    """Mark the end of the MCP call log before an assistant run.
 
-def read_mcp_log() -> str:
-    """Read MCP call log file after test execution.
+    The log is never cleared; the cursor reads back only the calls
+    logged after this point.
 
     Returns:
-        String content of MCP log file, or empty string if not found
+        Cursor at the current end of the log
     """
-    try:
-        log_path = get_mcp_log_path()
-        if log_path.exists():
-            return log_path.read_text(encoding='utf-8')
-    except Exception as e:
-        logger = get_logger()
-        logger.warning(f"Failed to read MCP log: {e}")
-
-    return ""
+    return McpLogCursor(get_mcp_log_path())
 
 
-def run_claude_assistant(
+def build_assistant_args(
     system_prompt_path: Optional[Path],
     append_prompts: List[str],
     user_prompt: str,
     mcp_config_path: Optional[Path],
-    timeout: float
-) -> subprocess.CompletedProcess[str]:
-    """Execute Claude CLI for assistant.
+    streaming: bool = False
+) -> List[str]:
+    """Build Claude CLI argv for the assistant.
 
     Args:
         system_prompt_path: Path to system prompt file
         append_prompts: List of prompts to append
         user_prompt: User's prompt
         mcp_config_path: Optional MCP config
-        timeout: Timeout in seconds
+        streaming: Emit stream-json events instead of one JSON payload
 
     Returns:
-        CompletedProcess with stdout/stderr
+        Argument list for the claude executable
     """
     args = [CLAUDE_CMD]
     if mcp_config_path:
         args += ["--mcp-config", str(mcp_config_path)]
-    args += ["--model", "sonnet", "--dangerously-skip-permissions", "--print", "--output-format", "json"]
+    args += ["--model", ASSISTANT_MODEL, "--dangerously-skip-permissions", "--print"]
+    if streaming:
+        # --print only emits stream-json together with --verbose
+        args += ["--output-format", "stream-json", "--verbose"]
+    else:
+        args += ["--output-format", "json"]
 
     if system_prompt_path and system_prompt_path.exists():
         args += ["--system-prompt", str(system_prompt_path)]
@@ -171,98 +226,174 @@ def run_claude_assistant(
             args += ["--append-system-prompt", append_content]
 
     args.append(user_prompt)
+    return args
+
+
+def _assistant_cwd() -> Optional[str]:
+    """Get the working directory for assistant runs (isolated workspace if any)."""
+    installation = _current_installation()
+    if installation is not None:
+        return str(installation.get_workspace_dir())
+    return None
+
+
+def run_claude_assistant(
+    system_prompt_path: Optional[Path],
+    append_prompts: List[str],
+    user_prompt: str,
+    mcp_config_path: Optional[Path],
+    timeout: float,
+    stream_monitor: Optional[StreamMonitor] = None
+) -> subprocess.CompletedProcess[str]:
+    """Execute Claude CLI for assistant.
+
+    Args:
+        system_prompt_path: Path to system prompt file
+        append_prompts: List of prompts to append
+        user_prompt: User's prompt
+        mcp_config_path: Optional MCP config
+        timeout: Timeout in seconds
+        stream_monitor: Run in stream-json mode under this monitor (optional)
+
+    Returns:
+        CompletedProcess with stdout/stderr
+
+    Raises:
+        StreamAborted: If streaming and the monitor cut the run off
+    """
+    args = build_assistant_args(
+        system_prompt_path, append_prompts, user_prompt, mcp_config_path,
+        streaming=stream_monitor is not None
+    )
 
     # Use isolated working directory if available
-    cwd = None
-    if _test_installation is not None:
-        cwd = str(_test_installation.get_workspace_dir())
-
-    return subprocess.run(
-        args,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        check=False,
-        cwd=cwd,
+    if stream_monitor is not None:
+        return run_claude_stream(args, stream_monitor, timeout, cwd=_assistant_cwd())
+    return run_claude(args, timeout, cwd=_assistant_cwd())
+
+
+async def run_claude_assistant_async(
+    system_prompt_path: Optional[Path],
+    append_prompts: List[str],
+    user_prompt: str,
+    mcp_config_path: Optional[Path],
+    timeout: float,
+    stream_monitor: Optional[StreamMonitor] = None
+) -> subprocess.CompletedProcess[str]:
+    """Async variant of run_claude_assistant.
+
+    Args:
+        system_prompt_path: Path to system prompt file
+        append_prompts: List of prompts to append
+        user_prompt: User's prompt
+        mcp_config_path: Optional MCP config
+        timeout: Timeout in seconds
+        stream_monitor: Run in stream-json mode under this monitor (optional)
+
+    Returns:
+        CompletedProcess with stdout/stderr
+
+    Raises:
+        StreamAborted: If streaming and the monitor cut the run off
+    """
+    args = build_assistant_args(
+        system_prompt_path, append_prompts, user_prompt, mcp_config_path,
+        streaming=stream_monitor is not None
     )
+    if stream_monitor is not None:
+        return await run_claude_stream_async(args, stream_monitor, timeout, cwd=_assistant_cwd())
+    return await run_claude_async(args, timeout, cwd=_assistant_cwd())
 
 
-def run_assistant_single_attempt(
-    case: Dict[str, Any],
-    config: Config,
-    append_prompts: List[str]
+def _assistant_result_from_process(
+    result: subprocess.CompletedProcess[str],
+    mcp_logs: str
 ) -> Dict[str, Any]:
-    """Run assistant for single attempt (no retry).
+    """Convert assistant CLI output into an assistant result dictionary.
 
     Args:
-        case: Test case dictionary
-        config: Test configuration
-        append_prompts: System prompt additions
+        result: Completed assistant CLI process
+        mcp_logs: MCP calls logged during the run
 
     Returns:
         Result dictionary with pass/assistant/full_output/mcp_logs/session_id
     """
     logger = get_logger()
 
-    # Clear MCP log before execution
-    clear_mcp_log()
+    if result.returncode != 0:
+        reason = result.stderr.strip() or "Assistant CLI error"
+        logger.warning(f"Assistant CLI error: {reason}")
+        return {
+            "pass": False,
+            "assistant": "",
+            "full_output": "",
+            "mcp_logs": mcp_logs,
+            "reason": reason,
+            "retry": True
+        }
 
-    try:
-        result = run_claude_assistant(
-            config.system_prompt_path,
-            append_prompts,
-            case["prompt"],
-            config.mcp_config_path,
-            config.assistant_timeout
-        )
+    payload = parse_payload(result.stdout)
+    if payload is None:
+        logger.warning("Assistant returned non-JSON output")
+        return {
+            "pass": False,
+            "assistant": result.stdout.strip(),
+            "full_output": result.stdout.strip(),
+            "mcp_logs": mcp_logs,
+            "reason": "Assistant returned non-JSON output",
+            "retry": True
+        }
+
+    session_id = payload.get("session_id", "")
+    assistant_text = extract_text(payload).strip()
+
+    # Combine stdout and MCP logs in full_output
+    full_output = result.stdout.strip()
+    if mcp_logs:
+        full_output += "\n\n=== MCP Tool Calls ===\n" + mcp_logs
 
-        # Read MCP logs after execution
-        mcp_logs = read_mcp_log()
-
-        if result.returncode != 0:
-            reason = result.stderr.strip() or "Assistant CLI error"
-            logger.warning(f"Assistant CLI error: {reason}")
-            return {
-                "pass": False,
-                "assistant": "",
-                "full_output": "",
-                "mcp_logs": mcp_logs,
-                "reason": reason,
-                "retry": True
-            }
-
-        payload = parse_payload(result.stdout)
-        if payload is None:
-            logger.warning("Assistant returned non-JSON output")
-            return {
-                "pass": False,
-                "assistant": result.stdout.strip(),
-                "full_output": result.stdout.strip(),
-                "mcp_logs": mcp_logs,
-                "reason": "Assistant returned non-JSON output",
-                "retry": True
-            }
-
-        session_id = payload.get("session_id", "")
-        assistant_text = extract_text(payload).strip()
-
-        # Combine stdout and MCP logs in full_output
-        full_output = result.stdout.strip()
+    return {
+        "pass": True,
+        "assistant": assistant_text,
+        "full_output": full_output,
+        "mcp_logs": mcp_logs,
+        "session_id": session_id,
+        "retry": False
+    }
+
+
+def _assistant_error_result(error: Exception, config: Config, mcp_logs: str) -> Dict[str, Any]:
+    """Convert an assistant exception into an assistant result dictionary.
+
+    Args:
+        error: Exception raised while running the assistant
+        config: Test configuration
+        mcp_logs: MCP calls logged before the failure
+
+    Returns:
+        Result dictionary with failure reason and MCP logs so far
+    """
+    if isinstance(error, StreamAborted):
+        get_logger().error(f"Assistant aborted: {error.describe()}")
+        full_output = error.output
+        full_output += "\n\n=== Stream Aborted ===\n" + json.dumps(
+            {"reason": error.reason, **error.progress}, indent=2
+        )
         if mcp_logs:
             full_output += "\n\n=== MCP Tool Calls ===\n" + mcp_logs
-
         return {
-            "pass": True,
-            "assistant": assistant_text,
+            "pass": False,
+            "assistant": "",
             "full_output": full_output,
             "mcp_logs": mcp_logs,
-            "session_id": session_id,
-            "retry": False
+            "session_id": error.progress.get("session_id", ""),
+            "reason": f"Assistant aborted: {error.describe()}",
+            "retry": error.retryable,
+            "fatal": not error.retryable
         }
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"Assistant timeout after {config.assistant_timeout}s")
-        mcp_logs = read_mcp_log()
+    if isinstance(error, subprocess.TimeoutExpired):
+        get_logger().error(f"Assistant timeout after {config.assistant_timeout}s")
         return {
             "pass": False,
             "assistant": "",
@@ -271,11 +402,89 @@ def run_assistant_single_attempt(
             "reason": f"Assistant timeout ({config.assistant_timeout}s)",
             "retry": True
         }
+
+    error_dict = handle_subprocess_error(error, "run_assistant")
+    error_dict["mcp_logs"] = mcp_logs
+    return error_dict
+
+
+def _new_stream_monitor(config: Config) -> Optional[StreamMonitor]:
+    """Create a fresh stream monitor for one assistant attempt (None unless streaming)."""
+    if not config.stream_assistant:
+        return None
+    return StreamMonitor(StreamLimits(
+        inactivity_timeout=config.inactivity_timeout,
+        max_tool_calls=config.max_tool_calls,
+        max_tool_errors=config.max_tool_errors,
+        max_identical_calls=config.max_identical_calls,
+    ))
+
+
+def run_assistant_single_attempt(
+    case: Dict[str, Any],
+    config: Config,
+    append_prompts: List[str]
+) -> Dict[str, Any]:
+    """Run assistant for single attempt (no retry).
+
+    Args:
+        case: Test case dictionary
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Returns:
+        Result dictionary with pass/assistant/full_output/mcp_logs/session_id
+    """
+    # Only calls logged from here on belong to this attempt
+    mcp_log = mark_mcp_log()
+
+    try:
+        result = run_claude_assistant(
+            config.system_prompt_path,
+            append_prompts,
+            case["prompt"],
+            config.mcp_config_path,
+            config.assistant_timeout,
+            stream_monitor=_new_stream_monitor(config)
+        )
+
+        # Read the MCP calls this attempt logged
+        return _assistant_result_from_process(result, mcp_log.read())
+
+    except Exception as e:
+        return _assistant_error_result(e, config, mcp_log.read())
+
+
+async def run_assistant_single_attempt_async(
+    case: Dict[str, Any],
+    config: Config,
+    append_prompts: List[str]
+) -> Dict[str, Any]:
+    """Async variant of run_assistant_single_attempt.
+
+    Args:
+        case: Test case dictionary
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Returns:
+        Result dictionary with pass/assistant/full_output/mcp_logs/session_id
+    """
+    mcp_log = mark_mcp_log()
+
+    try:
+        result = await run_claude_assistant_async(
+            config.system_prompt_path,
+            append_prompts,
+            case["prompt"],
+            config.mcp_config_path,
+            config.assistant_timeout,
+            stream_monitor=_new_stream_monitor(config)
+        )
+        return _assistant_result_from_process(result, mcp_log.read())
+
     except Exception as e:
-        mcp_logs = read_mcp_log()
-        error_dict = handle_subprocess_error(e, "run_assistant")
-        error_dict["mcp_logs"] = mcp_logs
-        return error_dict
+        return _assistant_error_result(e, config, mcp_log.read())
 
 
 def run_assistant(
@@ -303,182 +512,456 @@ def run_assistant(
     )
 
 
-def run_single_test(
+async def run_assistant_async(
     case: Dict[str, Any],
     config: Config,
-    append_prompts: List[str],
-    run_number: int
-) -> TestResult:
-    """Run a single test case.
+    append_prompts: List[str]
+) -> Dict[str, Any]:
+    """Async variant of run_assistant.
 
     Args:
         case: Test case dictionary
         config: Test configuration
         append_prompts: System prompt additions
-        run_number: Which run this is (1-based)
 
     Returns:
-        TestResult object
+        Result dictionary
     """
-    logger = get_logger()
-    start_time = time.time()
+    return await retry_with_backoff_async(
+        run_assistant_single_attempt_async,
+        max_retries=config.max_retries,
+        initial_backoff=config.initial_backoff,
+        case=case,
+        config=config,
+        append_prompts=append_prompts
+    )
 
-    expected_pass = bool(case.get("expected_pass", True))
-    session_id = None
 
-    # Set up graph fixture if specified
-    if case.get("graph_setup") and config.is_live_mcp_mode() and "assistant_override" not in case:
-        logger.info(f"Setting up graph fixture for {case['name']}")
-        if not setup_graph_from_fixture(case["graph_setup"], config):
-            logger.warning(f"Graph setup failed for {case['name']}")
+def _needs_fixture(case: Dict[str, Any], config: Config) -> bool:
+    """Check whether a case's graph fixture must be loaded before it runs."""
+    return bool(case.get("graph_setup")) and config.is_live_mcp_mode() and "assistant_override" not in case
 
-    # Run assistant (or use override for negative controls)
-    if "assistant_override" in case:
-        assistant_result = {
-            "pass": True,
-            "assistant": case["assistant_override"],
-            "full_output": case["assistant_override"],
-            "session_id": ""
-        }
-    elif is_conversational_test(case):
-        # Multi-turn conversation with LLM user-proxy
-        logger.info(f"Running conversational test: {case['name']}")
-
-        # Clear MCP log before conversation
-        clear_mcp_log()
-
-        conv_config = extract_conversational_config(case)
-        user_proxy = LLMUserProxy(config)
-
-        conv_result = user_proxy.run_conversation(
-            initial_prompt=case["prompt"],
-            conv_config=conv_config,
-            append_prompts=append_prompts,
-            case_name=case["name"],
-            case=case
-        )
 
-        # Read MCP logs after conversation completes
-        mcp_logs = read_mcp_log()
-
-        # Convert ConversationResult to assistant_result format
-        if conv_result.success:
-            # Combine transcript and MCP logs
-            full_output = conv_result.full_transcript
-            if mcp_logs:
-                full_output += "\n\n=== MCP Tool Calls ===\n" + mcp_logs
-
-            assistant_result = {
-                "pass": True,
-                "assistant": conv_result.final_response,
-                "full_output": full_output,
-                "mcp_logs": mcp_logs,
-                "session_id": conv_result.session_id
-            }
-        else:
-            assistant_result = {
-                "pass": False,
-                "assistant": "",
-                "full_output": "",
-                "mcp_logs": mcp_logs,
-                "reason": conv_result.reason,
-                "session_id": conv_result.session_id
-            }
-
-        session_id = conv_result.session_id
-    else:
-        # Single-turn test
-        assistant_result = run_assistant(case, config, append_prompts)
-        session_id = assistant_result.get("session_id")
+def _override_result(case: Dict[str, Any]) -> Dict[str, Any]:
+    """Assistant result for negative controls with a canned response."""
+    return {
+        "pass": True,
+        "assistant": case["assistant_override"],
+        "full_output": case["assistant_override"],
+        "session_id": ""
+    }
 
-    # Check if assistant failed
-    if not assistant_result["pass"]:
-        duration = time.time() - start_time
-        return TestResult(
-            test_name=case["name"],
-            category=case["category"],
-            run_number=run_number,
-            passed=False,
-            expected_pass=expected_pass,
-            actual_pass=False,
-            reason=assistant_result.get("reason", "Unknown error"),
-            duration=duration,
-            session_id=session_id or ""
-        )
 
-    # Extract responses
-    assistant_text = assistant_result["assistant"]
-    full_output = assistant_result.get("full_output", assistant_text)
+def _conversation_assistant_result(conv_result: Any, mcp_logs: str) -> Dict[str, Any]:
+    """Convert a ConversationResult to assistant_result format.
 
-    # Run judge
-    judge_result = run_judge(case, assistant_text, full_output, config)
-    actual_pass = bool(judge_result.get("pass"))
-    verdict = judge_result.get("verdict")
+    Args:
+        conv_result: ConversationResult from the user proxy
+        mcp_logs: MCP calls logged during the conversation
+
+    Returns:
+        Result dictionary with pass/assistant/full_output/mcp_logs/session_id
+    """
+    if conv_result.success:
+        # Combine transcript and MCP logs (unless each turn already carries its own calls)
+        full_output = conv_result.full_transcript
+        if mcp_logs and not any(turn.mcp_calls for turn in conv_result.turns):
+            full_output += "\n\n=== MCP Tool Calls ===\n" + mcp_logs
+
+        return {
+            "pass": True,
+            "assistant": conv_result.final_response,
+            "full_output": full_output,
+            "mcp_logs": mcp_logs,
+            "session_id": conv_result.session_id
+        }
 
-    # Determine if test passed overall
-    test_passed = (actual_pass == expected_pass)
+    return {
+        "pass": False,
+        "assistant": "",
+        "full_output": "",
+        "mcp_logs": mcp_logs,
+        "reason": conv_result.reason,
+        "session_id": conv_result.session_id
+    }
+
+
+def _assistant_failed_test_result(
+    case: Dict[str, Any],
+    run_number: int,
+    assistant_result: Dict[str, Any],
+    start_time: float
+) -> TestResult:
+    """Build the TestResult for a case whose assistant phase failed."""
+    return TestResult(
+        test_name=case["name"],
+        category=case["category"],
+        run_number=run_number,
+        passed=False,
+        expected_pass=bool(case.get("expected_pass", True)),
+        actual_pass=False,
+        reason=assistant_result.get("reason", "Unknown error"),
+        full_transcript=assistant_result.get("full_output", ""),
+        duration=time.time() - start_time,
+        session_id=assistant_result.get("session_id") or ""
+    )
 
-    # Interrogation if configured
-    interrogation_qa = None
-    if session_id and config.should_interrogate(actual_pass):
-        logger.info(f"Interrogating {case['name']}")
-        # Pass verdict dict to interrogation so it can include judge feedback in Q2
-        verdict_dict = verdict.to_dict() if verdict else None
-        interrogation_qa = interrogate_session(session_id, actual_pass, config, case["name"], verdict=verdict_dict)
 
-    duration = time.time() - start_time
+def _judged_test_result(
+    case: Dict[str, Any],
+    run_number: int,
+    assistant_result: Dict[str, Any],
+    judge_result: Dict[str, Any],
+    interrogation_qa: Optional[List[QAPair]],
+    start_time: float
+) -> TestResult:
+    """Build the TestResult for a case that reached the judge."""
+    expected_pass = bool(case.get("expected_pass", True))
+    actual_pass = bool(judge_result.get("pass"))
+    assistant_text = assistant_result["assistant"]
 
     return TestResult(
         test_name=case["name"],
         category=case["category"],
         run_number=run_number,
-        passed=test_passed,
+        # Determine if test passed overall
+        passed=(actual_pass == expected_pass),
         expected_pass=expected_pass,
         actual_pass=actual_pass,
         reason=judge_result.get("reason", ""),
-        verdict=verdict,
+        verdict=judge_result.get("verdict"),
         assistant_response=assistant_text,
-        full_transcript=full_output,
+        full_transcript=assistant_result.get("full_output", assistant_text),
         interrogation=interrogation_qa,
-        duration=duration,
-        session_id=session_id or ""
+        duration=time.time() - start_time,
+        session_id=assistant_result.get("session_id") or ""
     )
 
 
-def load_test_cases(config: Config) -> List[Dict[str, Any]]:
-    """Load test cases from JSON file.
+@dataclass
+class _PipelineItem:
+    """A test moving through the pipelined runner's stages."""
+    job: TestJob
+    start_time: float
+    assistant_result: Dict[str, Any]
+    review_config: Optional[Config] = None
+    review_installation: Optional[TestInstallation] = None
+    judge_result: Optional[Dict[str, Any]] = None
+    result: Optional[TestResult] = None
+    timer: PhaseTimer = field(default_factory=PhaseTimer)
+    trace_span: Any = None
 
-    Args:
-        config: Test configuration
 
-    Returns:
-        List of test case dictionaries
-    """
-    with open(config.test_cases_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+def _case_config(config: Config, case: Dict[str, Any]) -> Config:
+    """Config with the case's adaptive timeouts applied (config itself if disabled)."""
+    if _adaptive_timeouts is None:
+        return config
+    get_logger().debug(f"Timeouts for {case['name']}: {_adaptive_timeouts.describe(case['name'], config)}")
+    return _adaptive_timeouts.apply(config, case["name"])
 
-    if not isinstance(data, list):
-        raise ValueError(f"Test cases file must contain a list")
 
-    return data
+def _test_span(case: Dict[str, Any], run_number: int):
+    """Root trace span of a test, on its own track."""
+    label = f"{case['name']} run {run_number}"
+    return span(label, "test", track=label, test_category=case.get("category", ""), run=run_number)
 
 
-def filter_test_cases(
-    cases: List[Dict[str, Any]],
-    config: Config
-) -> List[Dict[str, Any]]:
-    """Filter test cases based on configuration.
+def _interrogation_completed(interrogation_qa: Optional[List[QAPair]]) -> bool:
+    """Whether an interrogation ran and every question was answered."""
+    return bool(interrogation_qa) and not any(qa.error for qa in interrogation_qa)
 
-    Args:
-        cases: All test cases
-        config: Test configuration
 
-    Returns:
-        Filtered list of test cases
-    """
-    filtered = cases
+def _verdict_dict(judge_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Verdict as a dict for interrogation (so Q2 can include judge feedback)."""
+    verdict = judge_result.get("verdict")
+    return verdict.to_dict() if verdict else None
 
-    # Filter by category
+
+def run_assistant_phase(
+    case: Dict[str, Any],
+    config: Config,
+    append_prompts: List[str]
+) -> Dict[str, Any]:
+    """Run the graph-mutating phase of a test: fixture setup and assistant.
+
+    Args:
+        case: Test case dictionary
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Returns:
+        Assistant result dictionary (pass/assistant/full_output/session_id)
+    """
+    logger = get_logger()
+
+    # Set up graph fixture if specified
+    if _needs_fixture(case, config):
+        logger.info(f"Setting up graph fixture for {case['name']}")
+        with timed_phase("fixture"):
+            if not setup_graph_from_fixture(case["graph_setup"], config):
+                logger.warning(f"Graph setup failed for {case['name']}")
+                mark_phase_failed("fixture")
+
+    # Run assistant (or use override for negative controls)
+    if "assistant_override" in case:
+        return _override_result(case)
+
+    with timed_phase("assistant"):
+        if is_conversational_test(case):
+            # Multi-turn conversation with LLM user-proxy
+            logger.info(f"Running conversational test: {case['name']}")
+
+            # Only calls logged from here on belong to this conversation
+            mcp_log = mark_mcp_log()
+
+            user_proxy = LLMUserProxy(config, mcp_log_path=mcp_log.path)
+            conv_result = user_proxy.run_conversation(
+                initial_prompt=case["prompt"],
+                conv_config=extract_conversational_config(case),
+                append_prompts=append_prompts,
+                case_name=case["name"],
+                case=case
+            )
+
+            # Read the MCP calls the conversation logged
+            assistant_result = _conversation_assistant_result(conv_result, mcp_log.read())
+        else:
+            # Single-turn test
+            assistant_result = run_assistant(case, config, append_prompts)
+
+    if not assistant_result["pass"]:
+        mark_phase_failed("assistant")
+    return assistant_result
+
+
+def run_judge_phase(
+    case: Dict[str, Any],
+    assistant_result: Dict[str, Any],
+    config: Config
+) -> Dict[str, Any]:
+    """Judge a successful assistant result.
+
+    Args:
+        case: Test case dictionary
+        assistant_result: Result from run_assistant_phase()
+        config: Test configuration (its MCP config decides which graph the
+            judge inspects)
+
+    Returns:
+        Judge result dictionary with pass/reason/verdict
+    """
+    return run_judge(case, assistant_result["assistant"], assistant_result.get("full_output", ""), config)
+
+
+def run_interrogation_phase(
+    case: Dict[str, Any],
+    assistant_result: Dict[str, Any],
+    judge_result: Dict[str, Any],
+    config: Config
+) -> Optional[List[QAPair]]:
+    """Interrogate the assistant session if configured.
+
+    Args:
+        case: Test case dictionary
+        assistant_result: Result from run_assistant_phase()
+        judge_result: Result from run_judge_phase()
+        config: Test configuration
+
+    Returns:
+        Q&A pairs, or None if not interrogated
+    """
+    actual_pass = bool(judge_result.get("pass"))
+    session_id = assistant_result.get("session_id")
+    if not session_id or not config.should_interrogate(actual_pass):
+        return None
+
+    get_logger().info(f"Interrogating {case['name']}")
+    with timed_phase("interrogation"):
+        interrogation_qa = interrogate_session(
+            session_id, actual_pass, config, case["name"], verdict=_verdict_dict(judge_result)
+        )
+    if not _interrogation_completed(interrogation_qa):
+        mark_phase_failed("interrogation")
+    return interrogation_qa
+
+
+def run_single_test(
+    case: Dict[str, Any],
+    config: Config,
+    append_prompts: List[str],
+    run_number: int
+) -> TestResult:
+    """Run a single test case.
+
+    Args:
+        case: Test case dictionary
+        config: Test configuration
+        append_prompts: System prompt additions
+        run_number: Which run this is (1-based)
+
+    Returns:
+        TestResult object
+    """
+    start_time = time.time()
+    config = _case_config(config, case)
+    timer = PhaseTimer()
+
+    with activate_timer(timer), _test_span(case, run_number) as traced:
+        assistant_result = run_assistant_phase(case, config, append_prompts)
+
+        # Check if assistant failed
+        if not assistant_result["pass"]:
+            result = _assistant_failed_test_result(case, run_number, assistant_result, start_time)
+        else:
+            judge_result = run_judge_phase(case, assistant_result, config)
+            interrogation_qa = run_interrogation_phase(case, assistant_result, judge_result, config)
+            result = _judged_test_result(
+                case, run_number, assistant_result, judge_result, interrogation_qa, start_time
+            )
+        traced.set(passed=result.passed)
+
+    result.phase_timings = timer.timings()
+    return result
+
+
+async def run_single_test_async(
+    case: Dict[str, Any],
+    config: Config,
+    append_prompts: List[str],
+    run_number: int
+) -> TestResult:
+    """Async variant of run_single_test.
+
+    Args:
+        case: Test case dictionary
+        config: Test configuration
+        append_prompts: System prompt additions
+        run_number: Which run this is (1-based)
+
+    Returns:
+        TestResult object
+    """
+    start_time = time.time()
+    config = _case_config(config, case)
+    timer = PhaseTimer()
+
+    with activate_timer(timer), _test_span(case, run_number) as traced:
+        assistant_result = await _run_assistant_phase_async(case, config, append_prompts)
+
+        if not assistant_result["pass"]:
+            result = _assistant_failed_test_result(case, run_number, assistant_result, start_time)
+        else:
+            judge_result = await run_judge_async(
+                case, assistant_result["assistant"], assistant_result.get("full_output", ""), config
+            )
+            interrogation_qa = await _run_interrogation_phase_async(case, assistant_result, judge_result, config)
+            result = _judged_test_result(
+                case, run_number, assistant_result, judge_result, interrogation_qa, start_time
+            )
+        traced.set(passed=result.passed)
+
+    result.phase_timings = timer.timings()
+    return result
+
+
+async def _run_assistant_phase_async(
+    case: Dict[str, Any],
+    config: Config,
+    append_prompts: List[str]
+) -> Dict[str, Any]:
+    """Async variant of run_assistant_phase."""
+    logger = get_logger()
+
+    if _needs_fixture(case, config):
+        logger.info(f"Setting up graph fixture for {case['name']}")
+        with timed_phase("fixture"):
+            if not await setup_graph_from_fixture_async(case["graph_setup"], config):
+                logger.warning(f"Graph setup failed for {case['name']}")
+                mark_phase_failed("fixture")
+
+    if "assistant_override" in case:
+        return _override_result(case)
+
+    with timed_phase("assistant"):
+        if is_conversational_test(case):
+            logger.info(f"Running conversational test: {case['name']}")
+
+            mcp_log = mark_mcp_log()
+
+            user_proxy = LLMUserProxy(config, mcp_log_path=mcp_log.path)
+            conv_result = await user_proxy.run_conversation_async(
+                initial_prompt=case["prompt"],
+                conv_config=extract_conversational_config(case),
+                append_prompts=append_prompts,
+                case_name=case["name"],
+                case=case
+            )
+
+            assistant_result = _conversation_assistant_result(conv_result, mcp_log.read())
+        else:
+            assistant_result = await run_assistant_async(case, config, append_prompts)
+
+    if not assistant_result["pass"]:
+        mark_phase_failed("assistant")
+    return assistant_result
+
+
+async def _run_interrogation_phase_async(
+    case: Dict[str, Any],
+    assistant_result: Dict[str, Any],
+    judge_result: Dict[str, Any],
+    config: Config
+) -> Optional[List[QAPair]]:
+    """Async variant of run_interrogation_phase."""
+    actual_pass = bool(judge_result.get("pass"))
+    session_id = assistant_result.get("session_id")
+    if not session_id or not config.should_interrogate(actual_pass):
+        return None
+
+    get_logger().info(f"Interrogating {case['name']}")
+    with timed_phase("interrogation"):
+        interrogation_qa = await interrogate_session_async(
+            session_id, actual_pass, config, case["name"], verdict=_verdict_dict(judge_result)
+        )
+    if not _interrogation_completed(interrogation_qa):
+        mark_phase_failed("interrogation")
+    return interrogation_qa
+
+
+def load_test_cases(config: Config) -> List[Dict[str, Any]]:
+    """Load test cases from JSON file.
+
+    Args:
+        config: Test configuration
+
+    Returns:
+        List of test case dictionaries
+    """
+    with open(config.test_cases_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if not isinstance(data, list):
+        raise ValueError(f"Test cases file must contain a list")
+
+    return data
+
+
+def filter_test_cases(
+    cases: List[Dict[str, Any]],
+    config: Config
+) -> List[Dict[str, Any]]:
+    """Filter test cases based on configuration.
+
+    Args:
+        cases: All test cases
+        config: Test configuration
+
+    Returns:
+        Filtered list of test cases
+    """
+    filtered = cases
+
+    # Filter by category
     if config.category:
         filtered = [c for c in filtered if c.get("category") == config.category]
 
@@ -518,6 +1001,293 @@ def build_append_prompts(config: Config) -> List[str]:
     return append_prompts
 
 
+def build_test_jobs(cases: List[Dict[str, Any]], runs: int) -> List[TestJob]:
+    """Expand selected cases into the suite's ordered (case, run) jobs.
+
+    Args:
+        cases: Selected test cases
+        runs: Number of runs per case
+
+    Returns:
+        Jobs in run-major order (all cases of run 1, then run 2, ...)
+    """
+    jobs = []
+    for run_num in range(1, runs + 1):
+        for index, case in enumerate(cases, start=1):
+            jobs.append(TestJob(sequence=len(jobs), run_number=run_num, index=index, case=case))
+    return jobs
+
+
+def _run_jobs_sequential(
+    jobs: List[TestJob],
+    config: Config,
+    append_prompts: List[str]
+) -> Iterator[Tuple[TestJob, TestResult]]:
+    """Run jobs one at a time against the shared graph.
+
+    Cleanup and delays are placed by position in ``jobs``, not by the
+    case's file index, so they still fall between tests after jobs were
+    reordered or filtered (schedule, shard, resume, reuse).
+
+    Args:
+        jobs: Jobs in execution order
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Yields:
+        (job, result) pairs in execution order
+    """
+    logger = get_logger()
+
+    # Initial graph cleanup if requested
+    if config.should_clean_graph():
+        logger.info("Performing initial graph cleanup")
+        if not clean_graph_state(config):
+            logger.warning("Initial graph cleanup failed, continuing anyway")
+
+    for position, job in enumerate(jobs):
+        new_run = position == 0 or jobs[position - 1].run_number != job.run_number
+        if new_run and config.runs > 1:
+            logger.info(f"=== Run {job.run_number}/{config.runs} ===")
+
+        log_test_start(logger, job.case["name"], job.run_number, config.runs)
+
+        # Run test
+        yield job, run_single_test(job.case, config, append_prompts, job.run_number)
+
+        # Nothing to separate after the last job
+        if position == len(jobs) - 1:
+            break
+
+        if jobs[position + 1].run_number == job.run_number:
+            # Inter-test delay
+            if config.inter_test_delay > 0:
+                time.sleep(config.inter_test_delay)
+
+        # Inter-run delay
+        elif config.inter_run_delay > 0:
+            logger.info(f"Run {job.run_number} complete, waiting {config.inter_run_delay}s...")
+            time.sleep(config.inter_run_delay)
+
+        # Clean graph before the next test if requested
+        if config.should_clean_graph():
+            logger.debug("Cleaning graph before next test")
+            if not clean_graph_state(config):
+                logger.warning("Graph cleanup failed between tests")
+
+
+def _get_worker_pool(config: Config) -> WorkerPool:
+    """Get the suite's worker pool, building it on first use.
+
+    Args:
+        config: Test configuration
+
+    Returns:
+        Started WorkerPool (reused across batches of the same suite)
+    """
+    global _worker_pool
+
+    if _worker_pool is None:
+        _worker_pool = WorkerPool(config, config.workers)
+        _worker_pool.start()
+    return _worker_pool
+
+
+def _run_jobs_parallel(
+    jobs: List[TestJob],
+    config: Config,
+    append_prompts: List[str]
+) -> Iterator[Tuple[TestJob, TestResult]]:
+    """Run jobs concurrently, one isolated installation per worker.
+
+    Jobs are dispatched in suite order to whichever worker is free. Results
+    are yielded strictly in suite order, so the caller streams them into the
+    results DB deterministically while later jobs are still running.
+
+    Args:
+        jobs: Jobs in suite order
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Yields:
+        (job, result) pairs in suite order
+    """
+    logger = get_logger()
+    pool = _get_worker_pool(config)
+
+    if config.inter_test_delay > 0 or config.inter_run_delay > 0:
+        logger.debug("Inter-test and inter-run delays are not applied with parallel workers")
+
+    def execute(job: TestJob) -> TestResult:
+        with pool.lease() as slot:
+            log_test_start(logger, job.case["name"], job.run_number, config.runs)
+            logger.debug(f"{job.case['name']} (run {job.run_number}) on worker {slot.worker_id}")
+            return run_single_test(job.case, slot.config, append_prompts, job.run_number)
+
+    logger.info(f"Running {len(jobs)} tests on {config.workers} workers")
+    executor = ThreadPoolExecutor(max_workers=config.workers, thread_name_prefix="test-worker")
+    try:
+        futures = [executor.submit(execute, job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            yield job, future.result()
+    except BaseException:
+        # Interrupted or failed: drop queued tests instead of running them all
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+
+def _run_jobs_pipelined(
+    jobs: List[TestJob],
+    config: Config,
+    append_prompts: List[str]
+) -> Iterator[Tuple[TestJob, TestResult]]:
+    """Run jobs through assistant -> judge -> interrogate stages.
+
+    The assistant stage mutates the graph, so it runs at most once per
+    isolated worker installation at a time. As soon as a test's assistant
+    phase ends, its graph is copied to a review snapshot and the worker is
+    released for the next test; the judge and interrogation then work
+    against that snapshot while the next assistant runs.
+
+    Args:
+        jobs: Jobs in suite order
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Yields:
+        (job, result) pairs in suite order
+    """
+    logger = get_logger()
+    pool = _get_worker_pool(config)
+
+    def assistant_stage(job: TestJob) -> _PipelineItem:
+        with pool.lease() as slot:
+            log_test_start(logger, job.case["name"], job.run_number, config.runs)
+            case_config = _case_config(slot.config, job.case)
+            timer = PhaseTimer()
+            start_time = time.time()
+            with activate_timer(timer), _test_span(job.case, job.run_number) as traced:
+                assistant_result = run_assistant_phase(job.case, case_config, append_prompts)
+            item = _PipelineItem(job, start_time, assistant_result, timer=timer, trace_span=traced)
+            if item.assistant_result["pass"]:
+                review_mcp_config = slot.installation.create_review_snapshot(f"job-{job.sequence}")
+                item.review_config = replace(case_config, mcp_config_path=review_mcp_config)
+                item.review_installation = slot.installation
+            return item
+
+    def judge_stage(item: _PipelineItem) -> _PipelineItem:
+        if item.review_config is None:
+            item.result = _assistant_failed_test_result(
+                item.job.case, item.job.run_number, item.assistant_result, item.start_time
+            )
+            item.result.phase_timings = item.timer.timings()
+            return item
+        try:
+            with activate_timer(item.timer), span("judge stage", "test", parent=item.trace_span):
+                item.judge_result = run_judge_phase(item.job.case, item.assistant_result, item.review_config)
+        except Exception as e:
+            # Fail this test only: interrogation is skipped, so drop the snapshot here
+            logger.error(f"Judge failed for {item.job.case['name']}: {e}")
+            item.review_installation.remove_review_snapshot(item.review_config.mcp_config_path)
+            item.timer.mark_failed("judge")
+            item.result = _judged_test_result(
+                item.job.case, item.job.run_number, item.assistant_result,
+                {"pass": False, "reason": f"Judge error: {e}"}, None, item.start_time
+            )
+            # An error is never a pass, even for cases expected to fail
+            item.result.passed = False
+            item.result.phase_timings = item.timer.timings()
+        return item
+
+    def interrogate_stage(item: _PipelineItem) -> _PipelineItem:
+        if item.result is not None:
+            return item
+        try:
+            with activate_timer(item.timer), span("interrogate stage", "test", parent=item.trace_span):
+                interrogation_qa = run_interrogation_phase(
+                    item.job.case, item.assistant_result, item.judge_result, item.review_config
+                )
+            item.result = _judged_test_result(
+                item.job.case, item.job.run_number, item.assistant_result,
+                item.judge_result, interrogation_qa, item.start_time
+            )
+            item.result.phase_timings = item.timer.timings()
+        finally:
+            item.review_installation.remove_review_snapshot(item.review_config.mcp_config_path)
+        return item
+
+    pipeline = Pipeline(
+        [
+            Stage("assistant", assistant_stage, workers=config.workers),
+            Stage("judge", judge_stage, workers=config.workers),
+            Stage("interrogate", interrogate_stage, workers=config.workers),
+        ],
+        queue_size=config.pipeline_depth,
+    )
+
+    logger.info(f"Pipelining {len(jobs)} tests across {config.workers} workers")
+    for item in pipeline.run(jobs):
+        yield item.job, item.result
+
+
+async def _run_jobs_async(
+    jobs: List[TestJob],
+    config: Config,
+    append_prompts: List[str]
+) -> AsyncIterator[Tuple[TestJob, TestResult]]:
+    """Run jobs as asyncio tasks, one isolated installation per worker.
+
+    Every CLI call goes through asyncio subprocesses, so up to
+    config.workers cases overlap on a single event loop. Results are
+    yielded in suite order.
+
+    Args:
+        jobs: Jobs in suite order
+        config: Test configuration
+        append_prompts: System prompt additions
+
+    Yields:
+        (job, result) pairs in suite order
+    """
+    logger = get_logger()
+    pool = _get_worker_pool(config)
+
+    async def execute(job: TestJob) -> TestResult:
+        async with pool.lease_async() as slot:
+            log_test_start(logger, job.case["name"], job.run_number, config.runs)
+            logger.debug(f"{job.case['name']} (run {job.run_number}) on worker {slot.worker_id}")
+            return await run_single_test_async(job.case, slot.config, append_prompts, job.run_number)
+
+    logger.info(f"Running {len(jobs)} tests on the event loop with {config.workers} workers")
+    tasks = [asyncio.create_task(execute(job)) for job in jobs]
+    try:
+        for job, task in zip(jobs, tasks):
+            yield job, await task
+    finally:
+        # Cancelling a task kills its in-flight CLI subprocess
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _drain_async(
+    completed: AsyncIterator[Tuple[TestJob, TestResult]],
+    record: Any
+) -> None:
+    """Feed async job results to a synchronous record callback.
+
+    Args:
+        completed: Async iterator of (job, result) pairs
+        record: Callable taking (job, result)
+    """
+    try:
+        async for job, result in completed:
+            record(job, result)
+    finally:
+        await completed.aclose()
+
+
 def run_test_suite(config: Config) -> TestSuiteResults:
     """Run complete test suite with N runs.
 
@@ -532,9 +1302,32 @@ def run_test_suite(config: Config) -> TestSuiteResults:
 
     logger.info(f"Starting test suite in {config.mode} mode")
     logger.info(f"Runs: {config.runs}, Inter-run delay: {config.inter_run_delay}s")
+    logger.info(
+        f"Rate limit: {config.rate_limit_rpm:g} requests/min, "
+        f"{config.max_concurrent_calls} concurrent calls per model"
+    )
+    configure_rate_limits(config.rate_limit_rpm, config.max_concurrent_calls)
+    configure_cassettes(config.cassette_mode, config.cassette_dir)
+    configure_tracing(config.trace_path is not None)
+    configure_fixture_snapshots(
+        config.fixture_snapshot_dir,
+        graph_memory_build_fingerprint(config.mcp_config_path) if config.fixture_snapshot_dir else ""
+    )
+    if config.uses_worker_pool():
+        executor_kind = "asyncio" if config.use_asyncio else "pipeline" if config.pipeline else "threads"
+        logger.info(f"Workers: {config.workers} ({executor_kind}, isolated installation per worker)")
+
+    # Fingerprint shared inputs before setup repoints config at the bundled prompt
+    suite_fingerprint = compute_suite_fingerprint(config, ASSISTANT_MODEL)
 
     # Setup isolated test installation if enabled
-    setup_test_installation(config)
+    with span("setup installation", "fixture"):
+        setup_test_installation(config)
+
+    # Worker pools probe each worker's server as they build installations
+    if config.preflight and not config.uses_worker_pool():
+        if not verify_mcp_server(config.mcp_config_path):
+            raise RuntimeError("Graph-memory server pre-flight check failed")
 
     # Load and filter test cases
     all_cases = load_test_cases(config)
@@ -549,85 +1342,106 @@ def run_test_suite(config: Config) -> TestSuiteResults:
     # Build append prompts (test overlays)
     append_prompts = build_append_prompts(config)
 
+    # Every (case, run) pair this process is responsible for
+    planned_jobs = build_test_jobs(selected_cases, config.runs)
+    shard_info: Optional[Dict[str, Any]] = None
+    if config.shard_count > 1:
+        planned_jobs, shard_info = _select_shard(planned_jobs, selected_cases, config)
+
     # Initialize results database
     db: Optional[ResultsDB] = None
     run_id: Optional[int] = None
-    try:
-        db = ResultsDB(config.results_db)
-        logger.info(f"Initialized results database: {config.results_db}")
-
-        # Create run record (we'll populate counts later)
-        # Create a preliminary suite_results for run creation
-        preliminary_results = TestSuiteResults(
-            total=len(selected_cases) * config.runs,
-            passed=0,
-            failed=0,
-            results=[],
-            interrogations=0,
-            duration=0.0
-        )
-        run_id = db.create_run(config, preliminary_results)
-        logger.info(f"Created run record: run_id={run_id}")
-    except Exception as e:
-        logger.warning(f"Failed to initialize database: {e}")
-        db = None
+    all_results: List[TestResult] = []
+    prior_duration = 0.0
 
-    # Initial graph cleanup if requested
-    if config.should_clean_graph():
-        logger.info("Performing initial graph cleanup")
-        if not clean_graph_state(config):
-            logger.warning("Initial graph cleanup failed, continuing anyway")
-
-    # Run tests N times
-    all_results = []
-
-    for run_num in range(1, config.runs + 1):
-        if config.runs > 1:
-            logger.info(f"=== Run {run_num}/{config.runs} ===")
-
-        for index, case in enumerate(selected_cases, start=1):
-            log_test_start(logger, case["name"], run_num, config.runs)
-
-            # Run test
-            result = run_single_test(case, config, append_prompts, run_num)
-            all_results.append(result)
-
-            # Save to database incrementally (if run_id created)
-            if db and run_id:
-                try:
-                    db.save_test_result(run_id, result)
-                except Exception as e:
-                    logger.warning(f"Failed to save test result to DB: {e}")
-
-            # Log result
-            log_test_result(
-                logger,
-                case["name"],
-                result.passed,
-                result.reason if not result.passed else None,
-                result.duration
+    if config.resume_run_id is not None:
+        # Resuming requires the database; fail loudly rather than re-run everything
+        db = ResultsDB(config.results_db)
+        run_id, all_results, prior_duration = _load_resume_state(db, config.resume_run_id)
+        if shard_info is not None:
+            planned_jobs = _resume_shard_jobs(db, run_id, planned_jobs, selected_cases, config)
+    else:
+        try:
+            db = ResultsDB(config.results_db)
+            logger.info(f"Initialized results database: {config.results_db}")
+
+            # Create run record (we'll populate counts later)
+            # Create a preliminary suite_results for run creation
+            preliminary_results = TestSuiteResults(
+                total=len(planned_jobs),
+                passed=0,
+                failed=0,
+                results=[],
+                interrogations=0,
+                duration=0.0
             )
+            # test_count tracks saved results; keep the planned total for progress checks
+            run_extra = dict(shard_info or {}, planned_results=len(planned_jobs))
+            run_id = db.create_run(config, preliminary_results, extra=run_extra)
+            logger.info(f"Created run record: run_id={run_id}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize database: {e}")
+            db = None
+
+    _configure_adaptive_timeouts(config, db)
+
+    # Run tests N times, skipping (test, run) pairs a resumed run already finished
+    completed_pairs = {(r.test_name, r.run_number) for r in all_results}
+    jobs = [
+        job for job in planned_jobs
+        if (job.case["name"], job.run_number) not in completed_pairs
+    ]
+    if completed_pairs:
+        logger.info(f"Skipping {len(completed_pairs)} finished results, {len(jobs)} remaining")
+
+    input_hashes = {
+        case["name"]: compute_case_hash(case, suite_fingerprint) for case in selected_cases
+    }
+
+    def record(job: TestJob, result: TestResult) -> None:
+        result.input_hash = input_hashes[job.case["name"]]
+        all_results.append(result)
+
+        # Save to database incrementally (if run_id created), keeping the run
+        # totals current so an interrupted run can be resumed from here
+        if db and run_id:
+            try:
+                db.save_test_result(run_id, result)
+                db.update_run_totals(run_id, prior_duration + time.time() - suite_start)
+            except Exception as e:
+                logger.warning(f"Failed to save test result to DB: {e}")
+
+        # Log result
+        log_test_result(
+            logger,
+            job.case["name"],
+            result.passed,
+            result.reason if not result.passed else None,
+            result.duration
+        )
 
-            # Flush output
-            flush_output()
-
-            # Inter-test delay (except after last test)
-            if config.inter_test_delay > 0 and index < len(selected_cases):
-                time.sleep(config.inter_test_delay)
+        # Flush output
+        flush_output()
 
-            # Clean graph between tests if requested
-            if config.should_clean_graph() and index < len(selected_cases):
-                logger.debug("Cleaning graph before next test")
-                if not clean_graph_state(config):
-                    logger.warning("Graph cleanup failed between tests")
+    # Import stored results for cases whose inputs haven't changed
+    if config.reuse_unchanged and db:
+        jobs = _reuse_unchanged_results(jobs, db, run_id, input_hashes, record)
 
-        # Inter-run delay (except after last run)
-        if run_num < config.runs:
-            logger.info(f"Run {run_num} complete, waiting {config.inter_run_delay}s...")
-            time.sleep(config.inter_run_delay)
+    jobs = _schedule_jobs(jobs, selected_cases, config, db)
 
-    # Aggregate results
-    suite_duration = time.time() - suite_start
+    if config.adaptive_runs:
+        _run_adaptive_rounds(jobs, config, append_prompts, all_results, record)
+    else:
+        _run_jobs(jobs, config, append_prompts, record)
+
+    # Aggregate results (including those from earlier sessions of a resumed run)
+    suite_duration = prior_duration + time.time() - suite_start
+    if completed_pairs or config.reuse_unchanged or config.schedule != "file":
+        suite_order = {
+            (job.case["name"], job.run_number): job.sequence
+            for job in build_test_jobs(selected_cases, config.runs)
+        }
+        all_results.sort(key=lambda r: suite_order.get((r.test_name, r.run_number), len(suite_order)))
     passed_count = sum(1 for r in all_results if r.passed)
     interrogations_count = sum(1 for r in all_results if r.interrogation)
 
@@ -637,7 +1451,8 @@ def run_test_suite(config: Config) -> TestSuiteResults:
         failed=len(all_results) - passed_count,
         results=all_results,
         interrogations=interrogations_count,
-        duration=suite_duration
+        duration=suite_duration,
+        run_id=run_id
     )
 
     logger.info(f"Test suite complete: {passed_count}/{len(all_results)} passed")
@@ -646,13 +1461,7 @@ def run_test_suite(config: Config) -> TestSuiteResults:
     # Update run record with final counts
     if db and run_id:
         try:
-            cursor = db.conn.cursor()
-            cursor.execute("""
-                UPDATE runs
-                SET passed_count = ?, failed_count = ?, duration = ?
-                WHERE run_id = ?
-            """, (suite_results.passed, suite_results.failed, suite_results.duration, run_id))
-            db.conn.commit()
+            db.update_run_totals(run_id, suite_results.duration)
             logger.info(f"Updated run record with final counts")
         except Exception as e:
             logger.warning(f"Failed to update run record: {e}")
@@ -665,12 +1474,342 @@ def run_test_suite(config: Config) -> TestSuiteResults:
         except Exception as e:
             logger.warning(f"Failed to close database: {e}")
 
+    if config.trace_path is not None:
+        trace = write_trace(config.trace_path, {"run_id": run_id, "tests": len(all_results)})
+        logger.info(f"Trace written to {trace} (open in chrome://tracing or https://ui.perfetto.dev)")
+
     # NOTE: test installation cleanup moved to main script
     # (must happen AFTER markdown report generation)
 
     return suite_results
 
 
+def _select_shard(
+    jobs: List[TestJob],
+    cases: List[Dict[str, Any]],
+    config: Config
+) -> Tuple[List[TestJob], Dict[str, Any]]:
+    """Pick this process's shard of the case x run matrix.
+
+    Shards are balanced on expected durations from config.shard_history,
+    or on static estimates without it, so every host given the same
+    cases, runs and history computes the same split.
+
+    Args:
+        jobs: All jobs in suite order
+        cases: Selected test cases
+        config: Test configuration (shard_index/shard_count)
+
+    Returns:
+        (jobs of this shard, shard metadata stored with the run)
+    """
+    logger = get_logger()
+
+    history: Dict[str, List[Tuple[float, bool]]] = {}
+    if config.shard_history:
+        history_db = ResultsDB(config.shard_history)
+        try:
+            history = history_db.get_case_history()
+        finally:
+            history_db.close()
+    stats = build_case_stats(cases, history)
+
+    shards = assign_shards(
+        jobs, lambda job: (job.case["name"], job.run_number), stats, config.shard_count
+    )
+    pairs = [[(job.case["name"], job.run_number) for job in shard] for shard in shards]
+    selected = shards[config.shard_index - 1]
+    plan = shard_plan_hash(pairs)
+
+    expected = sum(stats[job.case["name"]].expected_duration for job in selected)
+    total = sum(stats[job.case["name"]].expected_duration for job in jobs)
+    logger.info(
+        f"Shard {config.shard_index}/{config.shard_count} (plan {plan}): {len(selected)}/{len(jobs)} tests, "
+        f"{100 * expected / total if total else 0:.0f}% of expected work"
+    )
+    return selected, {
+        "shard": f"{config.shard_index}/{config.shard_count}",
+        "shard_plan": plan,
+        "shard_jobs": pairs[config.shard_index - 1],
+    }
+
+
+def _resume_shard_jobs(
+    db: ResultsDB,
+    run_id: int,
+    jobs: List[TestJob],
+    cases: List[Dict[str, Any]],
+    config: Config
+) -> List[TestJob]:
+    """Jobs of the shard a resumed run was started with.
+
+    The stored assignment wins over a recomputed one, since the shard
+    history may have changed since the run started.
+
+    Args:
+        db: Results database
+        run_id: Run being resumed
+        jobs: Freshly computed shard jobs (fallback)
+        cases: Selected test cases
+        config: Test configuration
+
+    Returns:
+        Jobs in suite order
+    """
+    summary = db.get_run_summary(run_id)
+    stored = json.loads(summary["config_json"]).get("shard_jobs") if summary else None
+    if not stored:
+        return jobs
+    pairs = {(name, run_number) for name, run_number in stored}
+    return [
+        job for job in build_test_jobs(cases, config.runs)
+        if (job.case["name"], job.run_number) in pairs
+    ]
+
+
+def _schedule_jobs(
+    jobs: List[TestJob],
+    cases: List[Dict[str, Any]],
+    config: Config,
+    db: Optional[ResultsDB]
+) -> List[TestJob]:
+    """Order jobs by the configured schedule.
+
+    On a worker pool the whole case x run matrix is ordered, so e.g. every
+    run of the slowest case is dispatched first. One test at a time, jobs
+    are only reordered within each run, so runs still follow each other.
+
+    Args:
+        jobs: Jobs in suite order
+        cases: Selected test cases
+        config: Test configuration
+        db: Results database for duration/pass history (None = no history)
+
+    Returns:
+        Jobs in execution order
+    """
+    if config.schedule == "file" or not jobs:
+        return jobs
+
+    logger = get_logger()
+    history = db.get_case_history() if db else {}
+    stats = build_case_stats(cases, history)
+
+    if config.uses_worker_pool():
+        ordered = order_items(jobs, lambda job: job.case, stats, config.schedule)
+    else:
+        ordered = []
+        for run_number in sorted({job.run_number for job in jobs}):
+            run_jobs = order_items(
+                [job for job in jobs if job.run_number == run_number],
+                lambda job: job.case, stats, config.schedule
+            )
+            ordered += run_jobs
+
+    with_history = sum(1 for case in cases if stats[case["name"]].samples)
+    logger.info(f"Schedule {config.schedule}: {with_history}/{len(cases)} cases have history")
+    head = []
+    for job in ordered:
+        name = job.case["name"]
+        if name not in head:
+            head.append(name)
+        if len(head) == 5:
+            break
+    logger.info("First up: " + ", ".join(
+        f"{name} (~{stats[name].expected_duration:.0f}s)" for name in head
+    ))
+    return ordered
+
+
+def _configure_adaptive_timeouts(config: Config, db: Optional[ResultsDB]) -> None:
+    """Load per-case timeouts from the results database if enabled.
+
+    Args:
+        config: Test configuration
+        db: Results database (None if it couldn't be opened)
+    """
+    global _adaptive_timeouts
+
+    _adaptive_timeouts = None
+    if not config.adaptive_timeouts:
+        return
+
+    logger = get_logger()
+    if db is None:
+        logger.warning("Adaptive timeouts need the results database; using static timeouts")
+        return
+
+    policy = TimeoutPolicy(
+        factor=config.timeout_factor,
+        floor=config.timeout_floor,
+        min_samples=config.timeout_min_samples,
+    )
+    history = db.get_phase_durations()
+    _adaptive_timeouts = AdaptiveTimeouts(history, policy)
+
+    learned = sum(1 for durations in history.values() if len(durations) >= policy.min_samples)
+    logger.info(
+        f"Adaptive timeouts: {learned} case phases have enough history "
+        f"(p{policy.percentile * 100:g} x {policy.factor:g}, floor {policy.floor:g}s)"
+    )
+
+
+def _run_jobs(
+    jobs: List[TestJob],
+    config: Config,
+    append_prompts: List[str],
+    record: Callable[[TestJob, TestResult], None]
+) -> None:
+    """Run a batch of jobs with the configured executor.
+
+    Results arrive in suite order regardless of which worker finished first.
+
+    Args:
+        jobs: Jobs in suite order
+        config: Test configuration
+        append_prompts: System prompt additions
+        record: Callable taking (job, result) for each finished job
+    """
+    if not jobs:
+        return
+
+    if config.use_asyncio:
+        asyncio.run(_drain_async(_run_jobs_async(jobs, config, append_prompts), record))
+        return
+
+    if config.pipeline:
+        completed = _run_jobs_pipelined(jobs, config, append_prompts)
+    elif config.workers > 1:
+        completed = _run_jobs_parallel(jobs, config, append_prompts)
+    else:
+        completed = _run_jobs_sequential(jobs, config, append_prompts)
+    for job, result in completed:
+        record(job, result)
+
+
+def _run_adaptive_rounds(
+    jobs: List[TestJob],
+    config: Config,
+    append_prompts: List[str],
+    prior_results: List[TestResult],
+    record: Callable[[TestJob, TestResult], None]
+) -> None:
+    """Run jobs one run number at a time, dropping cases that have settled.
+
+    After each round, a case whose Wilson pass-rate interval is narrower
+    than config.adaptive_max_width (after at least config.adaptive_min_runs
+    runs) is not repeated again.
+
+    Args:
+        jobs: Jobs in suite order
+        config: Test configuration
+        append_prompts: System prompt additions
+        prior_results: Results already finished (e.g. from a resumed run)
+        record: Callable taking (job, result) for each finished job
+    """
+    logger = get_logger()
+    stopper = EarlyStopper(config.adaptive_max_width, config.adaptive_min_runs)
+    for result in prior_results:
+        stopper.record(result.test_name, result.passed)
+
+    def record_and_track(job: TestJob, result: TestResult) -> None:
+        stopper.record(result.test_name, result.passed)
+        record(job, result)
+
+    skipped = 0
+    for run_number in range(1, config.runs + 1):
+        round_jobs = []
+        for job in jobs:
+            if job.run_number != run_number:
+                continue
+            if stopper.is_settled(job.case["name"]):
+                skipped += 1
+                continue
+            round_jobs.append(job)
+
+        if not round_jobs:
+            continue
+        if run_number > 1:
+            logger.info(f"Adaptive runs: round {run_number} runs {len(round_jobs)} unsettled tests")
+        _run_jobs(round_jobs, config, append_prompts, record_and_track)
+
+    logger.info(f"Adaptive runs: skipped {skipped} of {len(jobs)} test runs as settled")
+
+
+def _reuse_unchanged_results(
+    jobs: List[TestJob],
+    db: ResultsDB,
+    run_id: Optional[int],
+    input_hashes: Dict[str, str],
+    record: Callable[[TestJob, TestResult], None]
+) -> List[TestJob]:
+    """Record stored results for jobs whose input hash already has one.
+
+    Reused results are saved into the current run with source_result_id
+    pointing at the result that was actually executed.
+
+    Args:
+        jobs: Jobs in suite order
+        db: Results database
+        run_id: Current run ID
+        input_hashes: Input hash per case name
+        record: Callable taking (job, result) for each reused job
+
+    Returns:
+        Jobs that still need to be executed
+    """
+    logger = get_logger()
+    remaining = []
+
+    for job in jobs:
+        match = db.find_reusable_result(input_hashes[job.case["name"]], job.run_number, exclude_run_id=run_id)
+        if match is None:
+            remaining.append(job)
+            continue
+
+        source_id, result = match
+        # Chains of reuse all point at the originally executed result
+        result.source_result_id = result.source_result_id or source_id
+        logger.info(
+            f"Reusing result {result.source_result_id} for {job.case['name']} "
+            f"(run {job.run_number}): inputs unchanged"
+        )
+        record(job, result)
+
+    logger.info(f"Reused {len(jobs) - len(remaining)} unchanged results, {len(remaining)} to run")
+    return remaining
+
+
+def _load_resume_state(
+    db: ResultsDB,
+    run_id: int
+) -> Tuple[int, List[TestResult], float]:
+    """Load what an interrupted run already finished.
+
+    Results that never reached the judge (assistant/CLI failures) are not
+    finished: they are left out so the resumed run executes them again.
+
+    Args:
+        db: Results database
+        run_id: Run to resume
+
+    Returns:
+        (run_id, finished results, duration recorded so far)
+
+    Raises:
+        ValueError: If the run does not exist
+    """
+    logger = get_logger()
+
+    summary = db.get_run_summary(run_id)
+    if summary is None:
+        raise ValueError(f"Cannot resume run {run_id}: not found in {db.db_path}")
+
+    finished = db.get_completed_results(run_id, judged_only=True)
+    logger.info(f"Resuming run_id={run_id}: {len(finished)} judged results already saved")
+    return run_id, finished, float(summary["duration"] or 0.0)
+
+
 def print_suite_summary(results: TestSuiteResults, config: Config):
     """Print test suite summary to console.
 
@@ -703,6 +1842,21 @@ def print_suite_summary(results: TestSuiteResults, config: Config):
         cat_total = len(cat_results)
         print(f"  {category}: {cat_passed}/{cat_total} ({100*cat_passed/cat_total:.1f}%)")
 
+    # Latency per category (reused results didn't run, so they are left out)
+    breakdown = phase_breakdown(
+        (r.category, t.phase, t.duration)
+        for r in results.results if r.source_result_id is None
+        for t in r.phase_timings
+    )
+    if breakdown:
+        print(f"\nLatency by Category (mean / p95 seconds per test):")
+        for category, by_phase in sorted(breakdown.items()):
+            phases = ", ".join(
+                f"{phase} {by_phase[phase]['mean']:.1f}/{by_phase[phase]['p95']:.1f}"
+                for phase in PHASES if phase in by_phase
+            )
+            print(f"  {category}: {phases}")
+
     # Show failures
     failures = [r for r in results.results if not r.passed]
     if failures:
@@ -0,0 +1,170 @@
+"""Case ordering for makespan-aware scheduling.
+
+When tests run on a worker pool, the order they enter the queue decides
+the wall-clock time of the suite: if the slow conversational cases are
+dispatched last, every other worker sits idle while they finish. The
+scheduler ranks cases from their ResultsDB history:
+
+- ``longest-first``: longest expected duration first (the LPT rule, which
+  keeps the long tail short),
+- ``flaky-first``: most unstable pass rate first, longest first among
+  equally stable cases, so the cases that need repeated runs start early,
+- ``file``: the order of the test cases file (no reordering).
+
+Cases without history are estimated from the rest of the suite, with
+conversational cases assumed to take longer than single-turn ones.
+
+The same estimates split the case x run matrix into duration-balanced
+shards for running a suite across several hosts (--shard K/N).
+"""
+
+import hashlib
+import json
+import statistics
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from .user_proxy import is_conversational_test
+
+
+SCHEDULES = ("file", "longest-first", "flaky-first")
+
+# Multi-turn conversations take several assistant + user-proxy calls
+CONVERSATIONAL_DURATION_FACTOR = 3.0
+
+T = TypeVar('T')
+
+
+@dataclass
+class CaseStats:
+    """Expected cost and instability of a case.
+
+    Attributes:
+        expected_duration: Median duration in seconds (estimated without history)
+        instability: Pass-rate variance p * (1 - p), 0 for stable cases, 0.25 at most
+        samples: Number of historical results the stats are based on
+    """
+    expected_duration: float
+    instability: float
+    samples: int
+
+
+def build_case_stats(
+    cases: Sequence[Dict[str, Any]],
+    history: Dict[str, List[Tuple[float, bool]]]
+) -> Dict[str, CaseStats]:
+    """Estimate duration and instability for every case.
+
+    Args:
+        cases: Selected test cases
+        history: test_name -> (duration, passed) results (see ResultsDB.get_case_history)
+
+    Returns:
+        test_name -> CaseStats
+    """
+    stats: Dict[str, CaseStats] = {}
+    for case in cases:
+        results = history.get(case["name"], [])
+        if not results:
+            continue
+        pass_rate = sum(1 for _, passed in results if passed) / len(results)
+        stats[case["name"]] = CaseStats(
+            expected_duration=statistics.median(duration for duration, _ in results),
+            instability=pass_rate * (1 - pass_rate),
+            samples=len(results),
+        )
+
+    known = [s.expected_duration for s in stats.values()]
+    default_duration = statistics.median(known) if known else 1.0
+    for case in cases:
+        if case["name"] not in stats:
+            factor = CONVERSATIONAL_DURATION_FACTOR if is_conversational_test(case) else 1.0
+            stats[case["name"]] = CaseStats(default_duration * factor, 0.0, 0)
+    return stats
+
+
+def order_items(
+    items: Sequence[T],
+    case_of: Callable[[T], Dict[str, Any]],
+    stats: Dict[str, CaseStats],
+    mode: str
+) -> List[T]:
+    """Order items (cases or jobs) by a schedule.
+
+    The sort is stable, so items that rank equally (e.g. several runs of
+    one case) keep their relative order.
+
+    Args:
+        items: Items in file order
+        case_of: Returns the test case of an item
+        stats: Result of build_case_stats()
+        mode: One of SCHEDULES
+
+    Returns:
+        Items in scheduled order
+    """
+    if mode not in SCHEDULES:
+        raise ValueError(f"Schedule must be one of {SCHEDULES}, got {mode}")
+    if mode == "file":
+        return list(items)
+
+    def rank(item: T) -> Tuple[float, ...]:
+        case_stats = stats[case_of(item)["name"]]
+        if mode == "flaky-first":
+            return (-case_stats.instability, -case_stats.expected_duration)
+        return (-case_stats.expected_duration,)
+
+    return sorted(items, key=rank)
+
+
+def assign_shards(
+    items: Sequence[T],
+    key_of: Callable[[T], Tuple[str, int]],
+    stats: Dict[str, CaseStats],
+    count: int
+) -> List[List[T]]:
+    """Split items into duration-balanced shards.
+
+    Items are placed longest first, each on the shard with the least
+    expected work so far (greedy LPT). Ties are broken by case name, run
+    number and shard index, so the same inputs always give the same split.
+
+    Args:
+        items: Items (jobs) in suite order
+        key_of: Returns (test_name, run_number) of an item
+        stats: Result of build_case_stats()
+        count: Number of shards
+
+    Returns:
+        One list per shard, each in suite order
+    """
+    if count < 1:
+        raise ValueError(f"Shard count must be >= 1, got {count}")
+
+    positions = {id(item): position for position, item in enumerate(items)}
+    loads = [0.0] * count
+    shards: List[List[T]] = [[] for _ in range(count)]
+
+    def placement_order(item: T) -> Tuple[float, str, int]:
+        name, run_number = key_of(item)
+        return (-stats[name].expected_duration, name, run_number)
+
+    for item in sorted(items, key=placement_order):
+        target = min(range(count), key=lambda index: (loads[index], index))
+        shards[target].append(item)
+        loads[target] += stats[key_of(item)[0]].expected_duration
+
+    return [sorted(shard, key=lambda item: positions[id(item)]) for shard in shards]
+
+
+def shard_plan_hash(shards: Sequence[Sequence[Tuple[str, int]]]) -> str:
+    """Fingerprint a shard split so shards from different hosts can be checked.
+
+    Args:
+        shards: (test_name, run_number) pairs of every shard
+
+    Returns:
+        Short hex digest
+    """
+    digest = hashlib.sha256(json.dumps([list(map(list, shard)) for shard in shards]).encode('utf-8'))
+    return digest.hexdigest()[:16]
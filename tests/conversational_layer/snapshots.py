@@ -0,0 +1,279 @@
+"""Fixture snapshot store.
+
+Many cases share the same ``graph_setup``, and with graph cleaning between
+tests every test rebuilds its graph from scratch. With snapshots, each
+distinct fixture is built once (by graph_loader, into a scratch graph) and
+kept as a pristine ``_system/`` + ``_content/`` tree:
+
+    <snapshot dir>/<fixture hash>/_system/...
+                                 /_content/...
+
+Before a test's assistant starts its MCP server, the test's graph is
+replaced by a clone of the snapshot. Files are cloned with hardlinks where
+possible, then reflinks (copy-on-write clones, Linux FICLONE), then plain
+copies, so restoring costs a directory walk rather than a server start and
+a tool call per node.
+
+Hardlinks are safe because the graph-memory server never rewrites a file
+in place: it writes a temporary file and renames it over the old one,
+which gives the test's copy a new inode and leaves the snapshot untouched.
+Snapshot files are also made read-only, so an in-place write would fail
+loudly instead of corrupting the snapshot.
+
+The hash covers the fixture and the graph-memory server build, so a
+rebuilt server gets fresh snapshots.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .graph_loader import GRAPH_SERVER_NAME, load_fixture, read_server_config
+from .logging_config import get_logger
+from .trash import TRASH_DIR_NAME, move_to_trash
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+# Bump when the snapshot layout or loader output changes
+SNAPSHOT_VERSION = "1"
+
+# Graph directories written by the graph-memory server under BASE_PATH
+GRAPH_DIRS = ("_system", "_content")
+
+# Clone methods, cheapest first
+CLONE_METHODS = ("hardlink", "reflink", "copy")
+
+# ioctl request number for FICLONE (linux/fs.h)
+_FICLONE = 0x40049409
+
+
+class FixtureSnapshotStore:
+    """Builds fixture snapshots once and clones them into test graphs (thread-safe)."""
+
+    def __init__(self, directory: Path, build_fingerprint: str = ""):
+        """Initialize store.
+
+        Args:
+            directory: Snapshot directory (created if missing)
+            build_fingerprint: Graph-memory server build hash (part of every key)
+        """
+        self.directory = Path(directory)
+        self.build_fingerprint = build_fingerprint
+        self.method = CLONE_METHODS[0]
+        self.logger = get_logger()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, fixture: Mapping[str, Any]) -> str:
+        """Hash identifying a fixture's snapshot.
+
+        Args:
+            fixture: graph_setup dictionary
+
+        Returns:
+            Hex digest of the fixture, server build and snapshot version
+        """
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "build": self.build_fingerprint,
+            "fixture": fixture,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def restore(
+        self,
+        fixture: Mapping[str, Any],
+        base_path: Path,
+        mcp_config_path: Path,
+        timeout: float
+    ) -> Path:
+        """Replace a graph with a fixture's snapshot, building it on first use.
+
+        Args:
+            fixture: graph_setup dictionary
+            base_path: Graph BASE_PATH to overwrite
+            mcp_config_path: MCP config used to build a missing snapshot
+            timeout: Seconds allowed for building a missing snapshot
+
+        Returns:
+            Snapshot directory that was restored
+
+        Raises:
+            FixtureError: If the fixture is malformed
+            McpSessionError: If building the snapshot fails
+            OSError: If the graph cannot be replaced
+        """
+        snapshot = self.ensure(fixture, mcp_config_path, timeout)
+        self.restore_snapshot(snapshot, base_path)
+        return snapshot
+
+    def restore_snapshot(self, snapshot: Path, base_path: Path) -> None:
+        """Replace a graph with a clone of an existing snapshot directory.
+
+        Args:
+            snapshot: Directory holding pristine _system/ and _content/ trees
+            base_path: Graph BASE_PATH to overwrite
+
+        Raises:
+            OSError: If the graph cannot be replaced
+        """
+        move_to_trash([base_path / graph_dir for graph_dir in GRAPH_DIRS], base_path / TRASH_DIR_NAME)
+        for graph_dir in GRAPH_DIRS:
+            source = snapshot / graph_dir
+            if source.exists():
+                self._clone_tree(source, base_path / graph_dir)
+
+    def ensure(self, fixture: Mapping[str, Any], mcp_config_path: Path, timeout: float) -> Path:
+        """Get a fixture's snapshot, building it if it doesn't exist yet.
+
+        Concurrent callers with the same fixture wait for one build.
+
+        Args:
+            fixture: graph_setup dictionary
+            mcp_config_path: MCP config naming the graph-memory server
+            timeout: Seconds allowed for the build
+
+        Returns:
+            Snapshot directory
+        """
+        key = self.key(fixture)
+        snapshot = self.directory / key
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if not snapshot.exists():
+                self._build(fixture, snapshot, mcp_config_path, timeout)
+        return snapshot
+
+    def _build(self, fixture: Mapping[str, Any], snapshot: Path, mcp_config_path: Path, timeout: float) -> None:
+        """Load a fixture into a scratch graph and publish it as a snapshot."""
+        scratch = Path(tempfile.mkdtemp(prefix=".build-", dir=self.directory))
+        try:
+            data_dir = scratch / "data"
+            data_dir.mkdir()
+            server = dict(read_server_config(mcp_config_path))
+            server["env"] = dict(server.get("env", {}))
+            server["env"]["BASE_PATH"] = str(data_dir.resolve())
+            server["env"]["MCP_CALL_LOG"] = str((scratch / "mcp-calls.log").resolve())
+            scratch_config = scratch / "mcp-config.json"
+            scratch_config.write_text(json.dumps({"mcpServers": {GRAPH_SERVER_NAME: server}}), encoding='utf-8')
+
+            load_fixture(fixture, scratch_config, timeout)
+
+            for graph_dir in GRAPH_DIRS:
+                if (data_dir / graph_dir).exists():
+                    shutil.move(str(data_dir / graph_dir), str(scratch / graph_dir))
+            shutil.rmtree(data_dir)
+            scratch_config.unlink()
+            (scratch / "mcp-calls.log").unlink(missing_ok=True)
+            _make_read_only(scratch)
+
+            try:
+                os.rename(scratch, snapshot)
+            except OSError:
+                if not snapshot.exists():
+                    raise
+                # Another process published the same snapshot first
+                shutil.rmtree(scratch, ignore_errors=True)
+            self.logger.info(f"Built fixture snapshot {snapshot.name[:12]}")
+        except BaseException:
+            shutil.rmtree(scratch, ignore_errors=True)
+            raise
+
+    def _clone_tree(self, source: Path, target: Path) -> None:
+        """Recreate a directory tree, cloning its files."""
+        for directory, _, files in os.walk(source):
+            relative = Path(directory).relative_to(source)
+            (target / relative).mkdir(parents=True, exist_ok=True)
+            for name in files:
+                self._clone_file(Path(directory) / name, target / relative / name)
+
+    def _clone_file(self, source: Path, target: Path) -> None:
+        """Clone one file with the cheapest method this filesystem supports.
+
+        A method that fails (e.g. a hardlink across devices) is not tried
+        again for later files.
+        """
+        for method in CLONE_METHODS[CLONE_METHODS.index(self.method):]:
+            try:
+                _CLONERS[method](source, target)
+            except OSError as e:
+                if method == CLONE_METHODS[-1]:
+                    raise
+                target.unlink(missing_ok=True)
+                self.logger.debug(f"Snapshot {method} failed ({e}); falling back")
+                continue
+            if method != self.method:
+                self.logger.info(f"Restoring fixture snapshots by {method}")
+                self.method = method
+            return
+
+
+def _hardlink(source: Path, target: Path) -> None:
+    os.link(source, target)
+
+
+def _reflink(source: Path, target: Path) -> None:
+    if fcntl is None:
+        raise OSError("reflinks need fcntl")
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+
+def _copy(source: Path, target: Path) -> None:
+    shutil.copy2(source, target)
+
+
+_CLONERS = {"hardlink": _hardlink, "reflink": _reflink, "copy": _copy}
+
+
+def _make_read_only(root: Path) -> None:
+    """Drop write permission from every file under root."""
+    read_only = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    for directory, _, files in os.walk(root):
+        for name in files:
+            path = Path(directory) / name
+            path.chmod(path.stat().st_mode & read_only)
+
+
+# Process-wide store used by setup_graph_from_fixture (None = snapshots off)
+_store: Optional[FixtureSnapshotStore] = None
+
+
+def configure_fixture_snapshots(
+    directory: Optional[Path],
+    build_fingerprint: str = ""
+) -> Optional[FixtureSnapshotStore]:
+    """Enable fixture snapshots for this process, or turn them off.
+
+    Args:
+        directory: Snapshot directory (None disables snapshots)
+        build_fingerprint: Graph-memory server build hash (see input_hash)
+
+    Returns:
+        The new store, or None when disabled
+    """
+    global _store
+    if directory is None:
+        _store = None
+        return None
+    _store = FixtureSnapshotStore(directory, build_fingerprint)
+    get_logger().info(f"Fixture snapshots: {directory}")
+    return _store
+
+
+def get_fixture_snapshot_store() -> Optional[FixtureSnapshotStore]:
+    """Get the active snapshot store, if any."""
+    return _store
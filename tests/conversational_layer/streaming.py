@@ -0,0 +1,261 @@
+"""Stream-json monitoring for assistant runs.
+
+With ``--output-format stream-json`` the Claude CLI prints one JSON event
+per line as the session progresses (init, assistant messages with tool
+calls, tool results, and a final result event). StreamMonitor consumes
+those events and decides when a run should be cut short:
+
+- the session stops producing output for longer than an inactivity timeout
+  (instead of waiting out one long fixed timeout),
+- several tool calls in a row come back as errors,
+- the same tool call (name and input) keeps being repeated,
+- the session exceeds its tool-call budget.
+
+The monitor also keeps a progress summary (turns, tool calls, last tool,
+idle time) so an aborted run records how far the session got, and the
+start/end time of every tool call for tracing.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class StreamLimits:
+    """Abort thresholds for a streamed session.
+
+    Attributes:
+        inactivity_timeout: Abort after this many seconds without a stream event
+        max_tool_calls: Abort when the session makes more tool calls (0 = unlimited)
+        max_tool_errors: Abort after this many consecutive tool errors (0 = never)
+        max_identical_calls: Abort when one identical tool call is made this often (0 = never)
+    """
+    inactivity_timeout: float = 120.0
+    max_tool_calls: int = 60
+    max_tool_errors: int = 3
+    max_identical_calls: int = 4
+
+
+class StreamAborted(Exception):
+    """Raised when a streamed session is cut off before it finished.
+
+    Attributes:
+        reason: Why the session was aborted
+        progress: StreamMonitor.progress() at the moment of the abort
+        output: Stream lines received before the abort
+        stderr: Stderr captured before the abort
+        retryable: Whether retrying could help (timeouts yes, loops no)
+    """
+
+    def __init__(
+        self,
+        reason: str,
+        progress: Dict[str, Any],
+        output: str = "",
+        stderr: str = "",
+        retryable: bool = False
+    ):
+        super().__init__(reason)
+        self.reason = reason
+        self.progress = progress
+        self.output = output
+        self.stderr = stderr
+        self.retryable = retryable
+
+    def describe(self) -> str:
+        """One-line summary of the abort and how far the session got."""
+        return f"{self.reason} ({format_progress(self.progress)})"
+
+
+class StreamMonitor:
+    """Tracks a stream-json session and detects fatal conditions.
+
+    Feed every stdout line to feed_line(); it returns an abort reason as
+    soon as one of the limits is hit. Inactivity is checked separately by
+    the caller with idle_seconds(), since it fires when no line arrives.
+    """
+
+    def __init__(self, limits: StreamLimits, clock: Callable[[], float] = time.monotonic):
+        """Initialize monitor.
+
+        Args:
+            limits: Abort thresholds
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.limits = limits
+        self._clock = clock
+        self._started = clock()
+        self._last_event = self._started
+
+        self.lines: List[str] = []
+        self.events = 0
+        self.assistant_turns = 0
+        self.tool_calls = 0
+        self.tool_errors = 0
+        self.consecutive_errors = 0
+        self.last_tool = ""
+        self.last_event_type = ""
+        self.session_id = ""
+        self.result_payload: Optional[Dict[str, Any]] = None
+        # One entry per tool call: name, start, end (None while running), error
+        self.tool_timeline: List[Dict[str, Any]] = []
+        self._tool_names: Dict[str, str] = {}
+        self._open_tools: Dict[str, Dict[str, Any]] = {}
+        self._call_counts: Dict[str, int] = {}
+
+    def feed_line(self, line: str) -> Optional[str]:
+        """Consume one stdout line.
+
+        Args:
+            line: Raw line from the CLI (may be blank or non-JSON)
+
+        Returns:
+            Abort reason if a limit was hit, otherwise None
+        """
+        self._last_event = self._clock()
+        line = line.strip()
+        if not line:
+            return None
+        self.lines.append(line)
+
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(event, dict):
+            return None
+
+        self.events += 1
+        self.last_event_type = str(event.get("type", ""))
+        if event.get("session_id"):
+            self.session_id = str(event["session_id"])
+
+        if self.last_event_type == "assistant":
+            self.assistant_turns += 1
+            for block in _content_blocks(event):
+                if block.get("type") == "tool_use":
+                    reason = self._on_tool_use(block)
+                    if reason:
+                        return reason
+        elif self.last_event_type == "user":
+            for block in _content_blocks(event):
+                if block.get("type") == "tool_result":
+                    reason = self._on_tool_result(block)
+                    if reason:
+                        return reason
+        elif self.last_event_type == "result":
+            self.result_payload = event
+
+        return None
+
+    def start(self) -> None:
+        """Restart the elapsed and idle clocks.
+
+        Called once the child is actually launched, so time spent waiting
+        for a rate-limiter slot is not counted as inactivity.
+        """
+        self._started = self._clock()
+        self._last_event = self._started
+
+    def idle_seconds(self) -> float:
+        """Seconds since the last line arrived."""
+        return self._clock() - self._last_event
+
+    def progress(self) -> Dict[str, Any]:
+        """Summary of how far the session has got.
+
+        Returns:
+            Dictionary with counts, last tool/event, session ID and timings
+        """
+        now = self._clock()
+        return {
+            "session_id": self.session_id,
+            "events": self.events,
+            "assistant_turns": self.assistant_turns,
+            "tool_calls": self.tool_calls,
+            "tool_errors": self.tool_errors,
+            "last_tool": self.last_tool,
+            "last_event_type": self.last_event_type,
+            "elapsed_seconds": round(now - self._started, 1),
+            "idle_seconds": round(now - self._last_event, 1),
+            "finished": self.result_payload is not None,
+        }
+
+    def output(self) -> str:
+        """All stream lines received so far."""
+        return "\n".join(self.lines)
+
+    def _on_tool_use(self, block: Dict[str, Any]) -> Optional[str]:
+        """Count a tool call and check the budget and loop limits."""
+        name = str(block.get("name", ""))
+        self.tool_calls += 1
+        self.last_tool = name
+        entry = {"name": name, "start": self._last_event, "end": None, "error": False}
+        self.tool_timeline.append(entry)
+        if block.get("id"):
+            self._tool_names[str(block["id"])] = name
+            self._open_tools[str(block["id"])] = entry
+
+        limits = self.limits
+        if limits.max_tool_calls and self.tool_calls > limits.max_tool_calls:
+            return f"tool-call budget exceeded ({limits.max_tool_calls} calls)"
+
+        signature = name + json.dumps(block.get("input"), sort_keys=True, default=str)
+        count = self._call_counts.get(signature, 0) + 1
+        self._call_counts[signature] = count
+        if limits.max_identical_calls and count >= limits.max_identical_calls:
+            return f"tool call loop ({name} made {count} times with identical input)"
+
+        return None
+
+    def _on_tool_result(self, block: Dict[str, Any]) -> Optional[str]:
+        """Track consecutive tool errors."""
+        entry = self._open_tools.pop(str(block.get("tool_use_id", "")), None)
+        if entry is not None:
+            entry["end"] = self._last_event
+            entry["error"] = bool(block.get("is_error"))
+
+        if not block.get("is_error"):
+            self.consecutive_errors = 0
+            return None
+
+        self.tool_errors += 1
+        self.consecutive_errors += 1
+        limit = self.limits.max_tool_errors
+        if limit and self.consecutive_errors >= limit:
+            name = self._tool_names.get(str(block.get("tool_use_id", "")), self.last_tool)
+            return f"{self.consecutive_errors} consecutive tool errors (last from {name})"
+        return None
+
+
+def format_progress(progress: Dict[str, Any]) -> str:
+    """Render a progress summary for log lines and failure reasons.
+
+    Args:
+        progress: Result of StreamMonitor.progress()
+
+    Returns:
+        Short human-readable summary
+    """
+    text = (
+        f"{progress.get('assistant_turns', 0)} turns, "
+        f"{progress.get('tool_calls', 0)} tool calls, "
+        f"{progress.get('tool_errors', 0)} tool errors"
+    )
+    if progress.get("last_tool"):
+        text += f", last tool {progress['last_tool']}"
+    text += f", {progress.get('elapsed_seconds', 0)}s elapsed"
+    return text
+
+
+def _content_blocks(event: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Content blocks of an assistant/user message event."""
+    message = event.get("message")
+    if not isinstance(message, dict):
+        return []
+    content = message.get("content")
+    if not isinstance(content, list):
+        return []
+    return [block for block in content if isinstance(block, dict)]
@@ -0,0 +1,132 @@
+"""Per-case, per-phase timeouts learned from duration history.
+
+The static timeouts (assistant 600s, judge and interrogation 120s) have to
+cover the slowest case, so a stuck run of a 20-second Capture case waits
+out the full ten minutes before it is killed and retried. With adaptive
+timeouts each phase of each case gets
+
+    clamp(percentile(history) * factor, floor, static timeout)
+
+from the durations recorded for that case and phase in ResultsDB. Cases
+with too little history keep the static value, and the static value is
+also the ceiling, so adaptive timeouts only ever tighten.
+
+Phases that make several CLI calls under one per-call timeout (multi-turn
+conversations, interrogation questions) are bounded by the whole phase's
+history, which is conservative.
+"""
+
+import math
+from dataclasses import dataclass, replace
+from typing import Dict, List, Sequence, Tuple
+
+from .config import Config
+
+
+# Phase name -> Config field holding its static timeout
+PHASE_TIMEOUT_FIELDS = {
+    "assistant": "assistant_timeout",
+    "judge": "judge_timeout",
+    "interrogation": "interrogation_timeout",
+}
+
+
+@dataclass
+class TimeoutPolicy:
+    """How history is turned into a timeout.
+
+    Attributes:
+        percentile: Duration percentile to start from (0-1)
+        factor: Safety factor applied to the percentile
+        floor: Never go below this many seconds
+        min_samples: Keep the static timeout until a phase has this many durations
+    """
+    percentile: float = 0.99
+    factor: float = 2.0
+    floor: float = 30.0
+    min_samples: int = 5
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linearly interpolated percentile.
+
+    Args:
+        values: Non-empty sample
+        q: Percentile as a fraction (0.99 for p99)
+
+    Returns:
+        Interpolated value
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class AdaptiveTimeouts:
+    """Timeouts for each (case, phase) derived from recorded durations."""
+
+    def __init__(self, history: Dict[Tuple[str, str], List[float]], policy: TimeoutPolicy):
+        """Initialize from duration history.
+
+        Args:
+            history: (test_name, phase) -> durations in seconds
+            policy: Percentile, factor, floor and minimum sample size
+        """
+        self.history = history
+        self.policy = policy
+
+    def timeout_for(self, test_name: str, phase: str, static: float) -> float:
+        """Timeout for one phase of one case.
+
+        Args:
+            test_name: Test case name
+            phase: Phase name (see PHASE_TIMEOUT_FIELDS)
+            static: Configured timeout, used as ceiling and fallback
+
+        Returns:
+            Timeout in seconds
+        """
+        durations = self.history.get((test_name, phase), [])
+        if len(durations) < self.policy.min_samples:
+            return static
+
+        learned = percentile(durations, self.policy.percentile) * self.policy.factor
+        return min(static, max(self.policy.floor, learned))
+
+    def apply(self, config: Config, test_name: str) -> Config:
+        """Copy of config with every phase timeout adapted to a case.
+
+        Args:
+            config: Test configuration (holding the static timeouts)
+            test_name: Test case name
+
+        Returns:
+            Config with adapted assistant/judge/interrogation timeouts
+        """
+        changes = {
+            field_name: self.timeout_for(test_name, phase, getattr(config, field_name))
+            for phase, field_name in PHASE_TIMEOUT_FIELDS.items()
+        }
+        return replace(config, **changes)
+
+    def describe(self, test_name: str, config: Config) -> str:
+        """Summary of a case's adapted timeouts for log lines.
+
+        Args:
+            test_name: Test case name
+            config: Test configuration (holding the static timeouts)
+
+        Returns:
+            e.g. "assistant 45s, judge 120s (static), interrogation 38s"
+        """
+        parts = []
+        for phase, field_name in PHASE_TIMEOUT_FIELDS.items():
+            static = getattr(config, field_name)
+            timeout = self.timeout_for(test_name, phase, static)
+            suffix = " (static)" if len(self.history.get((test_name, phase), [])) < self.policy.min_samples else ""
+            parts.append(f"{phase} {timeout:.0f}s{suffix}")
+        return ", ".join(parts)
@@ -0,0 +1,203 @@
+"""Per-phase timing of test execution.
+
+A PhaseTimer is activated for the duration of one test (in a context
+variable, so it follows the test through threads' and asyncio tasks' own
+contexts). Code anywhere below it marks phases with ``timed_phase(name)``:
+fixture setup, assistant turns, user-proxy generation, judging,
+interrogation, retry backoff sleeps and waits for a rate-limiter slot. Without an active timer
+``timed_phase`` only opens a trace span (see tracing.py).
+
+Phases nest: time spent in an inner phase (e.g. a backoff sleep inside
+the judge's retry loop, or queueing for a rate-limiter slot) is counted
+for the inner phase only, so the durations of a test add up to at most
+its wall-clock time and a model phase measures execution, not queueing. A phase that
+contained a backoff, or that the caller marks failed, is not "clean";
+only clean durations feed adaptive timeouts.
+"""
+
+import statistics
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from .tracing import span
+
+
+# Phases in reporting order
+PHASES = ("fixture", "assistant", "user_proxy", "judge", "interrogation", "backoff", "rate_limit")
+
+
+@dataclass
+class PhaseTiming:
+    """Time spent in one phase of a test.
+
+    Attributes:
+        phase: Phase name (see PHASES)
+        duration: Seconds spent in the phase itself (nested phases excluded)
+        clean: Whether the phase completed on its first attempt
+    """
+    phase: str
+    duration: float
+    clean: bool = True
+
+
+class PhaseTimer:
+    """Accumulates phase durations for one test."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize timer.
+
+        Args:
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._clock = clock
+        self._durations: Dict[str, float] = {}
+        self._unclean: Set[str] = set()
+        # [phase, start, seconds spent in nested phases]
+        self._stack: List[list] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as phase name (accumulates across repeated blocks).
+
+        Args:
+            name: Phase name
+        """
+        frame = [name, self._clock(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = self._clock() - frame[1]
+            self._durations[name] = self._durations.get(name, 0.0) + elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+                if name == "backoff":
+                    # The enclosing phase needed a retry
+                    self._unclean.add(self._stack[-1][0])
+
+    def mark_failed(self, name: str) -> None:
+        """Exclude a phase from the clean history (it failed or timed out).
+
+        Args:
+            name: Phase name
+        """
+        self._unclean.add(name)
+
+    def timings(self) -> List[PhaseTiming]:
+        """Phase timings recorded so far, in PHASES order.
+
+        Returns:
+            List of PhaseTiming
+        """
+        order = {phase: index for index, phase in enumerate(PHASES)}
+        return [
+            PhaseTiming(phase, duration, phase not in self._unclean)
+            for phase, duration in sorted(self._durations.items(), key=lambda item: order.get(item[0], len(order)))
+        ]
+
+
+_current_timer: ContextVar[Optional[PhaseTimer]] = ContextVar("phase_timer", default=None)
+
+
+@contextmanager
+def activate_timer(timer: PhaseTimer) -> Iterator[PhaseTimer]:
+    """Make timer the target of timed_phase() in the current context.
+
+    Args:
+        timer: Timer for the test being run
+
+    Yields:
+        The timer
+    """
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[Any]:
+    """Time a block as a phase of the current test (and trace it as a span).
+
+    Args:
+        name: Phase name (see PHASES)
+
+    Yields:
+        The phase's trace span (call .set() to attach attributes)
+    """
+    timer = _current_timer.get()
+    with span(name, "phase") as traced:
+        if timer is None:
+            yield traced
+            return
+        with timer.phase(name):
+            yield traced
+
+
+def mark_phase_failed(name: str) -> None:
+    """Mark a phase of the current test as failed (no-op without a timer).
+
+    Args:
+        name: Phase name
+    """
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.mark_failed(name)
+
+
+def phase_breakdown(rows: Iterable[tuple]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Summarize phase durations per category.
+
+    Args:
+        rows: (category, phase, duration) tuples, one per test and phase
+
+    Returns:
+        category -> phase -> {"count", "mean", "p95", "total"}
+    """
+    grouped: Dict[str, Dict[str, List[float]]] = {}
+    for category, phase, duration in rows:
+        grouped.setdefault(category, {}).setdefault(phase, []).append(duration)
+
+    breakdown: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for category, phases in grouped.items():
+        breakdown[category] = {}
+        for phase, durations in phases.items():
+            ordered = sorted(durations)
+            breakdown[category][phase] = {
+                "count": len(ordered),
+                "mean": statistics.fmean(ordered),
+                "p95": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+                "total": sum(ordered),
+            }
+    return breakdown
+
+
+def format_breakdown_table(breakdown: Dict[str, Dict[str, Dict[str, float]]]) -> List[str]:
+    """Render a breakdown as Markdown table lines (mean / p95 seconds per test).
+
+    Args:
+        breakdown: Result of phase_breakdown()
+
+    Returns:
+        Table lines (empty if there are no timings)
+    """
+    if not breakdown:
+        return []
+
+    phases = [p for p in PHASES if any(p in by_phase for by_phase in breakdown.values())]
+    lines = [
+        "| Category | " + " | ".join(phases) + " |",
+        "|---|" + "---|" * len(phases),
+    ]
+    for category in sorted(breakdown):
+        cells = []
+        for phase in phases:
+            stats = breakdown[category].get(phase)
+            cells.append(f"{stats['mean']:.1f} / {stats['p95']:.1f}" if stats else "-")
+        lines.append(f"| {category} | " + " | ".join(cells) + " |")
+    return lines
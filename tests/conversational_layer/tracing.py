@@ -0,0 +1,324 @@
+"""Suite timeline tracing in Chrome trace-event format.
+
+Aggregate phase timings (timing.py) say where time goes on average; a
+trace shows what actually happened: which tests overlapped, where workers
+sat idle, and which call made up the long tail. When tracing is enabled,
+code marks spans with ``span(name, category)``:
+
+- one track per test, with the test's phases below it,
+- every Claude CLI subprocess, conversation turn, interrogation question,
+  retry attempt and backoff sleep,
+- MCP tool calls (seen in stream-json output, or made directly by the
+  harness API assistant engine).
+
+Spans nest through a context variable, so children follow their parent
+into threads' and asyncio tasks' own contexts. A span can also name its
+parent explicitly (a pipeline stage continuing a test on another worker
+thread stays on the test's track); a child that starts a track of its own
+is linked to its parent by a flow arrow.
+
+The trace is written as ``trace.json`` for chrome://tracing or
+https://ui.perfetto.dev. With tracing disabled ``span()`` returns a shared
+no-op object, so instrumented code pays one function call per span.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Tracer:
+    """Collects trace events for one suite run (thread-safe)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize tracer.
+
+        Args:
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self.clock = clock
+        self._origin = clock()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._span_ids = itertools.count(1)
+        self._track_ids = itertools.count(1)
+        self._thread_tracks: Dict[int, int] = {}
+
+    def next_span_id(self) -> int:
+        """Allocate a span ID."""
+        return next(self._span_ids)
+
+    def new_track(self, label: str) -> int:
+        """Allocate a named track (a row in the trace viewer).
+
+        Args:
+            label: Track name shown in the viewer
+
+        Returns:
+            Track ID (used as the event tid)
+        """
+        track = next(self._track_ids)
+        self._emit({"ph": "M", "name": "thread_name", "tid": track, "args": {"name": label}})
+        self._emit({"ph": "M", "name": "thread_sort_index", "tid": track, "args": {"sort_index": track}})
+        return track
+
+    def thread_track(self) -> int:
+        """Track for spans that run outside any test (one per thread)."""
+        ident = threading.get_ident()
+        with self._lock:
+            track = self._thread_tracks.get(ident)
+        if track is None:
+            track = self.new_track(threading.current_thread().name)
+            with self._lock:
+                self._thread_tracks[ident] = track
+        return track
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        track: int,
+        args: Dict[str, Any]
+    ) -> None:
+        """Add a finished span.
+
+        Args:
+            name: Span name
+            category: Span category (test, phase, subprocess, mcp, ...)
+            start: Start time on the tracer clock
+            end: End time on the tracer clock
+            track: Track ID
+            args: Span attributes shown in the viewer
+        """
+        self._emit({
+            "ph": "X",
+            "name": name,
+            "cat": category,
+            "ts": self._micros(start),
+            "dur": max(0.0, (end - start) * 1e6),
+            "tid": track,
+            "args": args,
+        })
+
+    def flow(self, flow_id: int, source_track: int, source_time: float, target_track: int, target_time: float) -> None:
+        """Draw an arrow from a point on one track to a point on another.
+
+        Args:
+            flow_id: Unique flow ID (the child span ID)
+            source_track: Track of the parent span
+            source_time: Time within the parent span
+            target_track: Track of the child span
+            target_time: Start of the child span
+        """
+        common = {"name": "link", "cat": "link", "id": flow_id}
+        self._emit(dict(common, ph="s", tid=source_track, ts=self._micros(source_time)))
+        self._emit(dict(common, ph="f", bp="e", tid=target_track, ts=self._micros(target_time)))
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Snapshot of the events recorded so far."""
+        with self._lock:
+            return list(self._events)
+
+    def write(self, path: Path, metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """Write the trace as Chrome trace-event JSON.
+
+        Args:
+            path: Output file
+            metadata: Extra key/values stored alongside the events
+
+        Returns:
+            The path written
+        """
+        events = sorted(self.events(), key=lambda event: (event["ph"] != "M", event.get("ts", 0.0)))
+        payload = {"traceEvents": events, "displayTimeUnit": "ms", "metadata": metadata or {}}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload))
+        return path
+
+    def _micros(self, timestamp: float) -> float:
+        """Tracer clock time -> microseconds since the trace started."""
+        return (timestamp - self._origin) * 1e6
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        event["pid"] = self._pid
+        with self._lock:
+            self._events.append(event)
+
+
+class Span:
+    """An open span; use as a context manager (see span())."""
+
+    __slots__ = ("tracer", "name", "category", "args", "span_id", "parent", "track", "start", "_label", "_token")
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        category: str,
+        args: Dict[str, Any],
+        track_label: Optional[str],
+        parent: Optional["Span"]
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.span_id = tracer.next_span_id()
+        self.parent = parent
+        self.track = 0
+        self.start = 0.0
+        self._label = track_label
+        self._token = None
+
+    def set(self, **args: Any) -> None:
+        """Attach attributes to the span (e.g. an exit code or outcome)."""
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        if self.parent is None:
+            self.parent = _current_span.get()
+        if self._label is not None:
+            self.track = self.tracer.new_track(self._label)
+        elif self.parent is not None:
+            self.track = self.parent.track
+        else:
+            self.track = self.tracer.thread_track()
+        self.start = self.tracer.clock()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current_span.reset(self._token)
+        end = self.tracer.clock()
+        self.args["span_id"] = self.span_id
+        if self.parent is not None:
+            self.args["parent_id"] = self.parent.span_id
+            if self.parent.track != self.track:
+                self.tracer.flow(self.span_id, self.parent.track, self.parent.start, self.track, self.start)
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.complete(self.name, self.category, self.start, end, self.track, self.args)
+        return False
+
+
+class _NullSpan:
+    """Stand-in returned by span() when tracing is off."""
+
+    __slots__ = ()
+    span_id = 0
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+# Active tracer for this process (None = tracing disabled)
+_tracer: Optional[Tracer] = None
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+def configure_tracing(enabled: bool) -> Optional[Tracer]:
+    """Start a fresh trace, or turn tracing off.
+
+    Args:
+        enabled: Whether to record spans
+
+    Returns:
+        The new tracer, or None when disabled
+    """
+    global _tracer
+    _tracer = Tracer() if enabled else None
+    return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the active tracer, if any."""
+    return _tracer
+
+
+def span(
+    name: str,
+    category: str,
+    track: Optional[str] = None,
+    parent: Optional[Span] = None,
+    **args: Any
+):
+    """Open a span (a no-op object when tracing is off).
+
+    Args:
+        name: Span name
+        category: Span category (test, phase, subprocess, mcp, turn, retry, ...)
+        track: Start a new track with this label (e.g. one per test)
+        parent: Explicit parent (defaults to the innermost open span)
+        **args: Span attributes
+
+    Returns:
+        Context manager yielding the span (call .set() to add attributes)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args, track, parent)
+
+
+def current_span() -> Optional[Span]:
+    """Innermost open span in this context (None when tracing is off)."""
+    if _tracer is None:
+        return None
+    return _current_span.get()
+
+
+def record_span(name: str, category: str, start: float, end: float, **args: Any) -> None:
+    """Add an already finished span under the current span.
+
+    Used for intervals observed after the fact, such as tool calls read
+    from a CLI's stream output.
+
+    Args:
+        name: Span name
+        category: Span category
+        start: Start time on the tracer clock (time.monotonic)
+        end: End time on the tracer clock
+        **args: Span attributes
+    """
+    tracer = _tracer
+    if tracer is None:
+        return
+    parent = _current_span.get()
+    track = parent.track if parent is not None else tracer.thread_track()
+    args["span_id"] = tracer.next_span_id()
+    if parent is not None:
+        args["parent_id"] = parent.span_id
+    tracer.complete(name, category, start, end, track, args)
+
+
+def write_trace(path: Path, metadata: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+    """Write the active trace to a file.
+
+    Args:
+        path: Output file
+        metadata: Extra key/values stored with the trace (e.g. run ID)
+
+    Returns:
+        The path written, or None when tracing is off
+    """
+    if _tracer is None:
+        return None
+    return _tracer.write(path, metadata)
@@ -0,0 +1,127 @@
+"""Non-blocking directory removal.
+
+Deleting a graph between tests used to run ``shutil.rmtree`` inline, so
+the next test waited for the filesystem. Instead, directories are renamed
+into a trash bin next to them (one atomic rename each, on the same
+filesystem) and a background reaper thread deletes the bin later:
+
+    move_to_trash([base / "_system", base / "_content"], base / TRASH_DIR_NAME)
+
+The next test sees an empty graph immediately. Bins left behind by an
+interrupted run are swept the first time a trash root is used, and the
+suite waits for the reaper (wait_for_trash) before it exits.
+"""
+
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+from .logging_config import get_logger
+
+
+# Trash bins live in this hidden directory (ignored by the graph server)
+TRASH_DIR_NAME = ".trash"
+
+
+class TrashReaper:
+    """Moves directories to trash and deletes them on a background thread."""
+
+    def __init__(self):
+        self.logger = get_logger()
+        self._queue: "queue.Queue[Path]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._swept: Set[Path] = set()
+
+    def move_to_trash(self, paths: Iterable[Path], trash_root: Path) -> Optional[Path]:
+        """Rename directories into a fresh trash bin and schedule its deletion.
+
+        Args:
+            paths: Directories (or files) to discard; missing ones are skipped
+            trash_root: Directory holding trash bins (same filesystem as paths)
+
+        Returns:
+            The trash bin, or None if there was nothing to move
+
+        Raises:
+            OSError: If a rename fails
+        """
+        existing = [Path(path) for path in paths if Path(path).exists()]
+        self._sweep(trash_root)
+        if not existing:
+            return None
+
+        trash_bin = trash_root / uuid.uuid4().hex
+        trash_bin.mkdir(parents=True)
+        try:
+            for path in existing:
+                os.rename(path, trash_bin / path.name)
+        finally:
+            self._submit(trash_bin)
+        return trash_bin
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every scheduled bin has been deleted.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if the reaper caught up, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _sweep(self, trash_root: Path) -> None:
+        """Schedule bins left in a trash root by an earlier (interrupted) run."""
+        with self._lock:
+            if trash_root in self._swept:
+                return
+            self._swept.add(trash_root)
+        if trash_root.is_dir():
+            for leftover in trash_root.iterdir():
+                self._submit(leftover)
+
+    def _submit(self, path: Path) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trash-reaper", daemon=True)
+                self._thread.start()
+        self._queue.put(path)
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                shutil.rmtree(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Failed to delete trash {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+# Process-wide reaper shared by graph cleanup and snapshot restore
+_reaper = TrashReaper()
+
+
+def move_to_trash(paths: Iterable[Path], trash_root: Path) -> Optional[Path]:
+    """Discard directories without waiting for their deletion (see TrashReaper)."""
+    return _reaper.move_to_trash(paths, trash_root)
+
+
+def wait_for_trash(timeout: Optional[float] = None) -> bool:
+    """Wait for the background reaper to finish deleting trash."""
+    return _reaper.wait(timeout)
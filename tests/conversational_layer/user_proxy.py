@@ -11,14 +11,27 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .claude_exec import run_claude, run_claude_async
 from .config import Config
 from .errors import handle_subprocess_error
 from .fixtures import parse_payload, extract_text
 from .logging_config import get_logger
+from .mcp_log import McpLogCursor
+from .timing import timed_phase
+from .tracing import span
 
 
 CLAUDE_CMD = "claude"
 
+# Timeout for LLM user-proxy responses (seconds)
+USER_PROXY_TIMEOUT = 120.0
+
+# Phrases in a user-proxy reply that end the conversation
+SATISFACTION_PHRASES = [
+    "thanks", "perfect", "looks good", "that works",
+    "appreciate it", "all set", "that's it"
+]
+
 
 @dataclass
 class ConversationalConfig:
@@ -89,6 +102,7 @@ class ConversationTurn:
         full_output: Full JSON output with MCP calls
         session_id: Session ID for resumption
         mcp_calls_made: Whether assistant made MCP calls
+        mcp_calls: MCP call-log lines written during this turn
         duration: Turn duration in seconds
     """
     turn_number: int
@@ -97,6 +111,7 @@ class ConversationTurn:
     full_output: str = ""
     session_id: str = ""
     mcp_calls_made: bool = False
+    mcp_calls: str = ""
     duration: float = 0.0
 
 
@@ -132,13 +147,15 @@ class UserProxy:
     - Building conversation transcripts
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, mcp_log_path: Optional[Path] = None):
         """Initialize user proxy.
 
         Args:
             config: Test configuration
+            mcp_log_path: MCP call log to slice per turn (None = no per-turn calls)
         """
         self.config = config
+        self.mcp_log_path = mcp_log_path
         self.logger = get_logger()
 
     def _has_mcp_calls(self, payload: Dict[str, Any]) -> bool:
@@ -214,13 +231,13 @@ class UserProxy:
 
         return False
 
-    def _run_claude_turn(
+    def _build_turn_args(
         self,
         user_message: str,
         session_id: Optional[str],
         append_prompts: List[str]
-    ) -> subprocess.CompletedProcess[str]:
-        """Execute Claude CLI for a single conversation turn.
+    ) -> List[str]:
+        """Build Claude CLI argv for a single conversation turn.
 
         Args:
             user_message: User's message
@@ -228,7 +245,7 @@ class UserProxy:
             append_prompts: System prompt additions
 
         Returns:
-            CompletedProcess with stdout/stderr
+            Argument list for the claude executable
         """
         args = [CLAUDE_CMD]
         if self.config.mcp_config_path:
@@ -253,15 +270,122 @@ class UserProxy:
             args += ["--resume", session_id]
 
         args.append(user_message)
+        return args
+
+    def _run_claude_turn(
+        self,
+        user_message: str,
+        session_id: Optional[str],
+        append_prompts: List[str]
+    ) -> subprocess.CompletedProcess[str]:
+        """Execute Claude CLI for a single conversation turn.
+
+        Args:
+            user_message: User's message
+            session_id: Optional session ID to resume
+            append_prompts: System prompt additions
+
+        Returns:
+            CompletedProcess with stdout/stderr
+        """
+        args = self._build_turn_args(user_message, session_id, append_prompts)
+        return run_claude(args, self.config.assistant_timeout)
+
+    async def _run_claude_turn_async(
+        self,
+        user_message: str,
+        session_id: Optional[str],
+        append_prompts: List[str]
+    ) -> subprocess.CompletedProcess[str]:
+        """Async variant of _run_claude_turn.
+
+        Args:
+            user_message: User's message
+            session_id: Optional session ID to resume
+            append_prompts: System prompt additions
+
+        Returns:
+            CompletedProcess with stdout/stderr
+        """
+        args = self._build_turn_args(user_message, session_id, append_prompts)
+        return await run_claude_async(args, self.config.assistant_timeout)
+
+    def _turn_from_process(
+        self,
+        turn_number: int,
+        user_message: str,
+        session_id: Optional[str],
+        result: subprocess.CompletedProcess[str],
+        start_time: float
+    ) -> ConversationTurn:
+        """Convert turn CLI output into a ConversationTurn.
+
+        Args:
+            turn_number: Turn number (1-based)
+            user_message: User's message
+            session_id: Session ID the turn resumed (if any)
+            result: Completed turn CLI process
+            start_time: Turn start time (time.time())
+
+        Returns:
+            ConversationTurn with results
+
+        Raises:
+            Exception: If the CLI failed or returned non-JSON output
+        """
+        if result.returncode != 0:
+            reason = result.stderr.strip() or "CLI error"
+            raise Exception(f"Turn {turn_number} CLI error: {reason}")
+
+        payload = parse_payload(result.stdout)
+        if payload is None:
+            raise Exception(f"Turn {turn_number} returned non-JSON output")
+
+        new_session_id = payload.get("session_id", session_id or "")
+        assistant_text = extract_text(payload).strip()
+        mcp_calls_made = self._has_mcp_calls(payload)
+
+        # Log MCP call status for all turns (for debugging)
+        # Note: We no longer fail tests here - the judge evaluates effectiveness
+        # with the full transcript (including MCP calls) and makes the determination
+        if not mcp_calls_made:
+            self.logger.debug(
+                f"Turn {turn_number}: No MCP calls detected in this turn"
+            )
+        else:
+            self.logger.debug(
+                f"Turn {turn_number}: MCP calls detected"
+            )
 
-        return subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=self.config.assistant_timeout,
-            check=False,
+        duration = time.time() - start_time
+
+        return ConversationTurn(
+            turn_number=turn_number,
+            user_message=user_message,
+            assistant_response=assistant_text,
+            full_output=result.stdout.strip(),
+            session_id=new_session_id,
+            mcp_calls_made=mcp_calls_made,
+            duration=duration
         )
 
+    def _turn_error(self, turn_number: int, error: Exception) -> Exception:
+        """Translate a turn failure into the exception raised to the caller.
+
+        Args:
+            turn_number: Turn number (1-based)
+            error: Exception raised while running the turn
+
+        Returns:
+            Exception to raise
+        """
+        if isinstance(error, subprocess.TimeoutExpired):
+            return Exception(f"Turn {turn_number} timeout after {self.config.assistant_timeout}s")
+        if "CLI error" in str(error) or "non-JSON" in str(error) or "timeout" in str(error):
+            return error
+        error_dict = handle_subprocess_error(error, f"turn_{turn_number}")
+        return Exception(error_dict.get("reason", str(error)))
+
     def _execute_turn(
         self,
         turn_number: int,
@@ -288,51 +412,167 @@ class UserProxy:
         start_time = time.time()
 
         try:
-            result = self._run_claude_turn(user_message, session_id, append_prompts)
+            with span(f"turn {turn_number}", "turn", resumes=session_id or "") as traced:
+                mcp_log = McpLogCursor(self.mcp_log_path)
+                result = self._run_claude_turn(user_message, session_id, append_prompts)
+                turn = self._turn_from_process(turn_number, user_message, session_id, result, start_time)
+                turn.mcp_calls = mcp_log.read()
+                traced.set(session_id=turn.session_id or "")
+            return turn
+        except Exception as e:
+            error = self._turn_error(turn_number, e)
+            if error is e:
+                raise
+            raise error
 
-            if result.returncode != 0:
-                reason = result.stderr.strip() or "CLI error"
-                raise Exception(f"Turn {turn_number} CLI error: {reason}")
+    async def _execute_turn_async(
+        self,
+        turn_number: int,
+        user_message: str,
+        session_id: Optional[str],
+        append_prompts: List[str],
+        conv_config: ConversationalConfig
+    ) -> ConversationTurn:
+        """Async variant of _execute_turn.
 
-            payload = parse_payload(result.stdout)
-            if payload is None:
-                raise Exception(f"Turn {turn_number} returned non-JSON output")
-
-            new_session_id = payload.get("session_id", session_id or "")
-            assistant_text = extract_text(payload).strip()
-            mcp_calls_made = self._has_mcp_calls(payload)
-
-            # Log MCP call status for all turns (for debugging)
-            # Note: We no longer fail tests here - the judge evaluates effectiveness
-            # with the full transcript (including MCP calls) and makes the determination
-            if not mcp_calls_made:
-                self.logger.debug(
-                    f"Turn {turn_number}: No MCP calls detected in this turn"
-                )
-            else:
-                self.logger.debug(
-                    f"Turn {turn_number}: MCP calls detected"
-                )
+        Args:
+            turn_number: Turn number (1-based)
+            user_message: User's message
+            session_id: Optional session ID to resume
+            append_prompts: System prompt additions
+            conv_config: Conversational configuration
 
-            duration = time.time() - start_time
+        Returns:
+            ConversationTurn with results
 
-            return ConversationTurn(
-                turn_number=turn_number,
-                user_message=user_message,
-                assistant_response=assistant_text,
-                full_output=result.stdout.strip(),
-                session_id=new_session_id,
-                mcp_calls_made=mcp_calls_made,
-                duration=duration
-            )
+        Raises:
+            Exception: If turn fails
+        """
+        start_time = time.time()
 
-        except subprocess.TimeoutExpired:
-            raise Exception(f"Turn {turn_number} timeout after {self.config.assistant_timeout}s")
+        try:
+            with span(f"turn {turn_number}", "turn", resumes=session_id or "") as traced:
+                mcp_log = McpLogCursor(self.mcp_log_path)
+                result = await self._run_claude_turn_async(user_message, session_id, append_prompts)
+                turn = self._turn_from_process(turn_number, user_message, session_id, result, start_time)
+                turn.mcp_calls = mcp_log.read()
+                traced.set(session_id=turn.session_id or "")
+            return turn
         except Exception as e:
-            if "CLI error" in str(e) or "non-JSON" in str(e) or "timeout" in str(e):
+            error = self._turn_error(turn_number, e)
+            if error is e:
                 raise
-            error_dict = handle_subprocess_error(e, f"turn_{turn_number}")
-            raise Exception(error_dict.get("reason", str(e)))
+            raise error
+
+    def _completed_conversation(
+        self,
+        turns: List[ConversationTurn],
+        session_id: Optional[str],
+        start_time: float,
+        summary: str
+    ) -> ConversationResult:
+        """Build a successful ConversationResult with full transcript.
+
+        Args:
+            turns: Completed conversation turns
+            session_id: Final session ID
+            start_time: Conversation start time (time.time())
+            summary: Log message prefix (e.g. "Conversation complete for x")
+
+        Returns:
+            ConversationResult with full transcript
+        """
+        # Build full transcript
+        transcript_parts = []
+        for turn in turns:
+            transcript_parts.append(f"[Turn {turn.turn_number} - User]")
+            transcript_parts.append(turn.user_message)
+            transcript_parts.append(f"\n[Turn {turn.turn_number} - Assistant]")
+            # Use full_output to include MCP tool calls, not just extracted text
+            transcript_parts.append(turn.full_output)
+            if turn.mcp_calls:
+                transcript_parts.append(f"\n[Turn {turn.turn_number} - MCP Tool Calls]")
+                transcript_parts.append(turn.mcp_calls.rstrip("\n"))
+            transcript_parts.append("")
+
+        full_transcript = "\n".join(transcript_parts)
+
+        # Final response is last turn's assistant response
+        final_response = turns[-1].assistant_response if turns else ""
+
+        total_duration = time.time() - start_time
+
+        self.logger.info(f"{summary}: {len(turns)} turns, {total_duration:.1f}s")
+
+        return ConversationResult(
+            success=True,
+            turns=turns,
+            final_response=final_response,
+            full_transcript=full_transcript,
+            session_id=session_id or "",
+            total_duration=total_duration,
+            reason=""
+        )
+
+    def _failed_conversation(
+        self,
+        turns: List[ConversationTurn],
+        session_id: Optional[str],
+        start_time: float,
+        summary: str,
+        error: Exception
+    ) -> ConversationResult:
+        """Build a failed ConversationResult.
+
+        Args:
+            turns: Turns completed before the failure
+            session_id: Last known session ID
+            start_time: Conversation start time (time.time())
+            summary: Log message prefix (e.g. "Conversation failed for x")
+            error: Exception that ended the conversation
+
+        Returns:
+            ConversationResult with failure reason
+        """
+        total_duration = time.time() - start_time
+        reason = str(error)
+
+        self.logger.error(f"{summary}: {reason}", exc_info=True)
+
+        return ConversationResult(
+            success=False,
+            turns=turns,
+            final_response="",
+            full_transcript="",
+            session_id=session_id or "",
+            total_duration=total_duration,
+            reason=reason
+        )
+
+    def _log_turn_complete(self, turn: ConversationTurn) -> None:
+        """Log a completed turn."""
+        self.logger.debug(
+            f"Turn {turn.turn_number} complete: {len(turn.assistant_response)} chars, "
+            f"MCP calls: {turn.mcp_calls_made}"
+        )
+
+    def _scripted_responses(self, conv_config: ConversationalConfig) -> List[str]:
+        """Get the scripted responses that fit within max_turns.
+
+        Args:
+            conv_config: Conversational configuration
+
+        Returns:
+            Responses for turns 2..max_turns
+        """
+        responses = conv_config.user_responses[:max(conv_config.max_turns - 1, 0)]
+        unused = len(conv_config.user_responses) - len(responses)
+        if unused > 0:
+            self.logger.warning(
+                f"Reached max turns ({conv_config.max_turns}), "
+                f"stopping with {unused} responses unused"
+            )
+        return responses
 
     def run_conversation(
         self,
@@ -363,95 +603,78 @@ class UserProxy:
         session_id = None
 
         try:
-            # Turn 1: Initial prompt
-            turn1 = self._execute_turn(
-                turn_number=1,
-                user_message=initial_prompt,
-                session_id=None,
-                append_prompts=append_prompts,
-                conv_config=conv_config
-            )
-            turns.append(turn1)
-            session_id = turn1.session_id
-
-            self.logger.debug(
-                f"Turn 1 complete: {len(turn1.assistant_response)} chars, "
-                f"MCP calls: {turn1.mcp_calls_made}"
-            )
-
-            # Additional turns with user responses
-            for i, user_response in enumerate(conv_config.user_responses, start=2):
-                if i > conv_config.max_turns:
-                    self.logger.warning(
-                        f"Reached max turns ({conv_config.max_turns}), "
-                        f"stopping with {len(conv_config.user_responses) - i + 2} responses unused"
-                    )
-                    break
-
+            # Turn 1: Initial prompt, then additional turns with user responses
+            messages = [initial_prompt] + self._scripted_responses(conv_config)
+            for turn_number, message in enumerate(messages, start=1):
                 turn = self._execute_turn(
-                    turn_number=i,
-                    user_message=user_response,
+                    turn_number=turn_number,
+                    user_message=message,
                     session_id=session_id,
-                    append_prompts=[],  # Only on first turn
+                    append_prompts=append_prompts if turn_number == 1 else [],  # Only on first turn
                     conv_config=conv_config
                 )
                 turns.append(turn)
                 session_id = turn.session_id
+                self._log_turn_complete(turn)
 
-                self.logger.debug(
-                    f"Turn {i} complete: {len(turn.assistant_response)} chars, "
-                    f"MCP calls: {turn.mcp_calls_made}"
-                )
-
-            # Build full transcript
-            transcript_parts = []
-            for turn in turns:
-                transcript_parts.append(f"[Turn {turn.turn_number} - User]")
-                transcript_parts.append(turn.user_message)
-                transcript_parts.append(f"\n[Turn {turn.turn_number} - Assistant]")
-                # Use full_output to include MCP tool calls, not just extracted text
-                transcript_parts.append(turn.full_output)
-                transcript_parts.append("")
+            return self._completed_conversation(
+                turns, session_id, start_time, f"Conversation complete for {case_name}"
+            )
 
-            full_transcript = "\n".join(transcript_parts)
+        except Exception as e:
+            return self._failed_conversation(
+                turns, session_id, start_time, f"Conversation failed for {case_name}", e
+            )
 
-            # Final response is last turn's assistant response
-            final_response = turns[-1].assistant_response if turns else ""
+    async def run_conversation_async(
+        self,
+        initial_prompt: str,
+        conv_config: ConversationalConfig,
+        append_prompts: List[str],
+        case_name: str = ""
+    ) -> ConversationResult:
+        """Async variant of run_conversation (scripted user responses).
 
-            total_duration = time.time() - start_time
+        Args:
+            initial_prompt: Initial user prompt
+            conv_config: Conversational configuration
+            append_prompts: System prompt additions
+            case_name: Test case name (for logging)
 
-            self.logger.info(
-                f"Conversation complete for {case_name}: "
-                f"{len(turns)} turns, {total_duration:.1f}s"
-            )
+        Returns:
+            ConversationResult with full transcript
+        """
+        self.logger.info(
+            f"Starting conversation for {case_name} "
+            f"(max {conv_config.max_turns} turns, "
+            f"{len(conv_config.user_responses)} scripted responses)"
+        )
 
-            return ConversationResult(
-                success=True,
-                turns=turns,
-                final_response=final_response,
-                full_transcript=full_transcript,
-                session_id=session_id or "",
-                total_duration=total_duration,
-                reason=""
-            )
+        start_time = time.time()
+        turns = []
+        session_id = None
 
-        except Exception as e:
-            total_duration = time.time() - start_time
-            reason = str(e)
+        try:
+            messages = [initial_prompt] + self._scripted_responses(conv_config)
+            for turn_number, message in enumerate(messages, start=1):
+                turn = await self._execute_turn_async(
+                    turn_number=turn_number,
+                    user_message=message,
+                    session_id=session_id,
+                    append_prompts=append_prompts if turn_number == 1 else [],
+                    conv_config=conv_config
+                )
+                turns.append(turn)
+                session_id = turn.session_id
+                self._log_turn_complete(turn)
 
-            self.logger.error(
-                f"Conversation failed for {case_name}: {reason}",
-                exc_info=True
+            return self._completed_conversation(
+                turns, session_id, start_time, f"Conversation complete for {case_name}"
             )
 
-            return ConversationResult(
-                success=False,
-                turns=turns,
-                final_response="",
-                full_transcript="",
-                session_id=session_id or "",
-                total_duration=total_duration,
-                reason=reason
+        except Exception as e:
+            return self._failed_conversation(
+                turns, session_id, start_time, f"Conversation failed for {case_name}", e
             )
 
 
@@ -463,8 +686,8 @@ class LLMUserProxy(UserProxy):
     the assistant asks, rather than using scripted responses.
     """
 
+    @staticmethod
     def _build_user_proxy_system_prompt(
-        self,
         case: Dict[str, Any],
         conv_config: ConversationalConfig,
         conversation_history: List[ConversationTurn]
@@ -587,29 +810,22 @@ Now respond naturally to whatever the assistant just said or asked."""
 
         return prompt
 
-    def _call_user_proxy_llm(
+    def _build_user_proxy_args(
         self,
         assistant_message: str,
-        case: Dict[str, Any],
-        conv_config: ConversationalConfig,
-        conversation_history: List[ConversationTurn]
-    ) -> str:
-        """Call LLM user-proxy to generate natural response.
+        system_prompt: str,
+        conv_config: ConversationalConfig
+    ) -> List[str]:
+        """Build Claude CLI argv for the user-proxy LLM.
 
         Args:
             assistant_message: What the assistant just said/asked
-            case: Test case dictionary
+            system_prompt: User-proxy system prompt
             conv_config: Conversational configuration
-            conversation_history: Previous conversation turns
 
         Returns:
-            Natural user response from LLM
+            Argument list for the claude executable
         """
-        # Build system prompt
-        system_prompt = self._build_user_proxy_system_prompt(
-            case, conv_config, conversation_history
-        )
-
         # Call Claude with user-proxy system prompt
         args = [
             CLAUDE_CMD,
@@ -625,16 +841,17 @@ Now respond naturally to whatever the assistant just said or asked."""
         user_message = f"The assistant just said:\n\n{assistant_message}\n\nHow do you respond?"
 
         args.append(user_message)
+        return args
 
-        # Build subprocess call with system prompt
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=120.0,  # Increased timeout for LLM user proxy responses
-            check=False
-        )
+    def _user_response_from_process(self, result: subprocess.CompletedProcess[str]) -> str:
+        """Extract the user-proxy reply, falling back to a simple confirmation.
 
+        Args:
+            result: Completed user-proxy CLI process
+
+        Returns:
+            Natural user response
+        """
         if result.returncode != 0:
             self.logger.error(f"User-proxy LLM failed: {result.stderr}")
             # Fallback: simple confirmation
@@ -653,6 +870,76 @@ Now respond naturally to whatever the assistant just said or asked."""
         # Fallback
         return "Yes, please proceed with that."
 
+    def _call_user_proxy_llm(
+        self,
+        assistant_message: str,
+        case: Dict[str, Any],
+        conv_config: ConversationalConfig,
+        conversation_history: List[ConversationTurn]
+    ) -> str:
+        """Call LLM user-proxy to generate natural response.
+
+        Args:
+            assistant_message: What the assistant just said/asked
+            case: Test case dictionary
+            conv_config: Conversational configuration
+            conversation_history: Previous conversation turns
+
+        Returns:
+            Natural user response from LLM
+        """
+        # Build system prompt
+        system_prompt = self._build_user_proxy_system_prompt(
+            case, conv_config, conversation_history
+        )
+        args = self._build_user_proxy_args(assistant_message, system_prompt, conv_config)
+
+        with timed_phase("user_proxy"):
+            result = run_claude(args, USER_PROXY_TIMEOUT)
+        return self._user_response_from_process(result)
+
+    async def _call_user_proxy_llm_async(
+        self,
+        assistant_message: str,
+        case: Dict[str, Any],
+        conv_config: ConversationalConfig,
+        conversation_history: List[ConversationTurn]
+    ) -> str:
+        """Async variant of _call_user_proxy_llm.
+
+        Args:
+            assistant_message: What the assistant just said/asked
+            case: Test case dictionary
+            conv_config: Conversational configuration
+            conversation_history: Previous conversation turns
+
+        Returns:
+            Natural user response from LLM
+        """
+        system_prompt = self._build_user_proxy_system_prompt(
+            case, conv_config, conversation_history
+        )
+        args = self._build_user_proxy_args(assistant_message, system_prompt, conv_config)
+
+        with timed_phase("user_proxy"):
+            result = await run_claude_async(args, USER_PROXY_TIMEOUT)
+        return self._user_response_from_process(result)
+
+    def _use_scripted_mode(self, conv_config: ConversationalConfig, case_name: str) -> bool:
+        """Check whether to fall back to scripted responses."""
+        if not conv_config.use_llm_user and conv_config.user_responses:
+            self.logger.info(f"Using scripted responses for {case_name} (LLM mode disabled)")
+            return True
+        return False
+
+    def _missing_case_result(self) -> ConversationResult:
+        """Result returned when no case dictionary was provided."""
+        self.logger.error("LLMUserProxy requires case dictionary for context")
+        return ConversationResult(
+            success=False,
+            reason="No case dictionary provided to LLMUserProxy"
+        )
+
     def run_conversation(
         self,
         initial_prompt: str,
@@ -674,15 +961,10 @@ Now respond naturally to whatever the assistant just said or asked."""
             ConversationResult with full transcript
         """
         if case is None:
-            self.logger.error("LLMUserProxy requires case dictionary for context")
-            return ConversationResult(
-                success=False,
-                reason="No case dictionary provided to LLMUserProxy"
-            )
+            return self._missing_case_result()
 
         # Fall back to scripted mode if disabled
-        if not conv_config.use_llm_user and conv_config.user_responses:
-            self.logger.info(f"Using scripted responses for {case_name} (LLM mode disabled)")
+        if self._use_scripted_mode(conv_config, case_name):
             return super().run_conversation(initial_prompt, conv_config, append_prompts, case_name)
 
         self.logger.info(
@@ -705,11 +987,7 @@ Now respond naturally to whatever the assistant just said or asked."""
             )
             turns.append(turn1)
             session_id = turn1.session_id
-
-            self.logger.debug(
-                f"Turn 1 complete: {len(turn1.assistant_response)} chars, "
-                f"MCP calls: {turn1.mcp_calls_made}"
-            )
+            self._log_turn_complete(turn1)
 
             # Additional turns with LLM-generated responses
             for turn_num in range(2, conv_config.max_turns + 1):
@@ -733,72 +1011,142 @@ Now respond naturally to whatever the assistant just said or asked."""
                 )
                 turns.append(turn)
                 session_id = turn.session_id
-
-                self.logger.debug(
-                    f"Turn {turn_num} complete: {len(turn.assistant_response)} chars, "
-                    f"MCP calls: {turn.mcp_calls_made}"
-                )
+                self._log_turn_complete(turn)
 
                 # Check if conversation is complete (user satisfied)
-                if any(phrase in user_response.lower() for phrase in [
-                    "thanks", "perfect", "looks good", "that works",
-                    "appreciate it", "all set", "that's it"
-                ]):
+                if is_user_satisfied(user_response):
                     self.logger.info(f"User appears satisfied, ending conversation at turn {turn_num}")
                     break
 
-            # Build full transcript
-            transcript_parts = []
-            for turn in turns:
-                transcript_parts.append(f"[Turn {turn.turn_number} - User]")
-                transcript_parts.append(turn.user_message)
-                transcript_parts.append(f"\n[Turn {turn.turn_number} - Assistant]")
-                # Use full_output to include MCP tool calls, not just extracted text
-                transcript_parts.append(turn.full_output)
-                transcript_parts.append("")
+            return self._completed_conversation(
+                turns, session_id, start_time, f"LLM conversation complete for {case_name}"
+            )
 
-            full_transcript = "\n".join(transcript_parts)
+        except Exception as e:
+            return self._failed_conversation(
+                turns, session_id, start_time, f"LLM conversation failed for {case_name}", e
+            )
+
+    async def run_conversation_async(
+        self,
+        initial_prompt: str,
+        conv_config: ConversationalConfig,
+        append_prompts: List[str],
+        case_name: str = "",
+        case: Optional[Dict[str, Any]] = None
+    ) -> ConversationResult:
+        """Async variant of run_conversation.
 
-            # Final response is last turn's assistant response
-            final_response = turns[-1].assistant_response if turns else ""
+        Args:
+            initial_prompt: Initial user prompt
+            conv_config: Conversational configuration
+            append_prompts: System prompt additions
+            case_name: Test case name (for logging)
+            case: Full test case dictionary (needed for context)
 
-            total_duration = time.time() - start_time
+        Returns:
+            ConversationResult with full transcript
+        """
+        if case is None:
+            return self._missing_case_result()
 
-            self.logger.info(
-                f"LLM conversation complete for {case_name}: "
-                f"{len(turns)} turns, {total_duration:.1f}s"
+        if self._use_scripted_mode(conv_config, case_name):
+            return await super().run_conversation_async(
+                initial_prompt, conv_config, append_prompts, case_name
             )
 
-            return ConversationResult(
-                success=True,
-                turns=turns,
-                final_response=final_response,
-                full_transcript=full_transcript,
-                session_id=session_id or "",
-                total_duration=total_duration,
-                reason=""
+        self.logger.info(
+            f"Starting LLM-powered conversation for {case_name} "
+            f"(max {conv_config.max_turns} turns, model: {conv_config.user_proxy_model})"
+        )
+
+        start_time = time.time()
+        turns = []
+        session_id = None
+
+        try:
+            turn1 = await self._execute_turn_async(
+                turn_number=1,
+                user_message=initial_prompt,
+                session_id=None,
+                append_prompts=append_prompts,
+                conv_config=conv_config
             )
+            turns.append(turn1)
+            session_id = turn1.session_id
+            self._log_turn_complete(turn1)
 
-        except Exception as e:
-            total_duration = time.time() - start_time
-            reason = str(e)
+            for turn_num in range(2, conv_config.max_turns + 1):
+                user_response = await self._call_user_proxy_llm_async(
+                    assistant_message=turns[-1].assistant_response,
+                    case=case,
+                    conv_config=conv_config,
+                    conversation_history=turns
+                )
+
+                self.logger.debug(f"User-proxy LLM generated response: {user_response[:100]}...")
 
-            self.logger.error(
-                f"LLM conversation failed for {case_name}: {reason}",
-                exc_info=True
+                turn = await self._execute_turn_async(
+                    turn_number=turn_num,
+                    user_message=user_response,
+                    session_id=session_id,
+                    append_prompts=[],
+                    conv_config=conv_config
+                )
+                turns.append(turn)
+                session_id = turn.session_id
+                self._log_turn_complete(turn)
+
+                if is_user_satisfied(user_response):
+                    self.logger.info(f"User appears satisfied, ending conversation at turn {turn_num}")
+                    break
+
+            return self._completed_conversation(
+                turns, session_id, start_time, f"LLM conversation complete for {case_name}"
             )
 
-            return ConversationResult(
-                success=False,
-                turns=turns,
-                final_response="",
-                full_transcript="",
-                session_id=session_id or "",
-                total_duration=total_duration,
-                reason=reason
+        except Exception as e:
+            return self._failed_conversation(
+                turns, session_id, start_time, f"LLM conversation failed for {case_name}", e
             )
 
 
+def is_user_satisfied(user_response: str) -> bool:
+    """Check whether a user-proxy reply signals the goal was met.
+
+    Args:
+        user_response: User-proxy reply text
+
+    Returns:
+        True if the reply contains a satisfaction phrase
+    """
+    lowered = user_response.lower()
+    return any(phrase in lowered for phrase in SATISFACTION_PHRASES)
+
+
+def user_proxy_prompt_template() -> str:
+    """User-proxy system prompt with placeholders for the case-specific parts.
+
+    The case fields the prompt is filled from are covered by each case's
+    input hash; this captures the wording around them (see input_hash.py).
+
+    Returns:
+        Prompt rendered for a first turn and for a follow-up turn
+    """
+    case = {
+        "category": "{category}",
+        "expected_behavior": "{expected_behavior}",
+        "judge_scenario": "{judge_scenario}",
+        "prompt": "{prompt}",
+    }
+    conv_config = ConversationalConfig(goal_summary="{goal}", success_criteria=["{criterion}"])
+    history = [ConversationTurn(turn_number=1, user_message="{user}", assistant_response="{assistant}")]
+    return "\n".join(
+        LLMUserProxy._build_user_proxy_system_prompt(case, conv_config, turns)
+        for turns in ([], history)
+    )
+
+
 def is_conversational_test(case: Dict[str, Any]) -> bool:
     """Check if test case is conversational.
 
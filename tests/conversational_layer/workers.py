@@ -0,0 +1,141 @@
+"""Worker pool for parallel test execution.
+
+Each worker owns an isolated test installation (own BASE_PATH, MCP_CALL_LOG
+and workspace dir) plus a Config copy pointing at it. Tests lease a worker
+for their whole duration so graph state never crosses between tests.
+"""
+
+import asyncio
+import queue
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Iterator, List, Optional
+
+from .config import Config
+from .fixtures import clean_graph_state, verify_mcp_server
+from .install import TestInstallation, create_worker_installation, use_installation
+from .logging_config import get_logger
+
+
+@dataclass
+class WorkerSlot:
+    """One isolated execution slot.
+
+    Attributes:
+        worker_id: Worker number (1-based)
+        config: Config copy using this worker's installation paths
+        installation: The worker's isolated installation
+        tests_run: Number of tests executed on this slot so far
+    """
+    worker_id: int
+    config: Config
+    installation: TestInstallation
+    tests_run: int = 0
+
+
+class WorkerPool:
+    """Pool of isolated worker slots leased one test at a time."""
+
+    def __init__(self, config: Config, size: int):
+        """Initialize worker pool.
+
+        Args:
+            config: Base test configuration (un-isolated paths)
+            size: Number of workers
+        """
+        self.config = config
+        self.size = size
+        self.logger = get_logger()
+        self.slots: List[WorkerSlot] = []
+        self._available: "queue.Queue[WorkerSlot]" = queue.Queue()
+        self._available_async: Optional["asyncio.Queue[WorkerSlot]"] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Build one isolated installation per worker.
+
+        Raises:
+            RuntimeError: If an installation cannot be built, or (with
+                preflight) a worker's graph-memory server is not healthy
+        """
+        self.logger.info(f"Building {self.size} worker installations...")
+
+        for worker_id in range(1, self.size + 1):
+            installation = create_worker_installation(self.config, worker_id, force=True)
+            worker_config = replace(
+                self.config,
+                system_prompt_path=installation.get_system_prompt_path(),
+                mcp_config_path=installation.get_mcp_config_path(),
+            )
+            if self.config.preflight and not verify_mcp_server(worker_config.mcp_config_path):
+                raise RuntimeError(f"Graph-memory server pre-flight check failed on worker {worker_id}")
+            slot = WorkerSlot(worker_id=worker_id, config=worker_config, installation=installation)
+            self.slots.append(slot)
+            self._available.put(slot)
+            self.logger.debug(f"Worker {worker_id} ready: {installation.install_dir}")
+
+    @contextmanager
+    def lease(self) -> Iterator[WorkerSlot]:
+        """Lease a free worker for the duration of one test.
+
+        The worker's installation is bound as the active installation, and its
+        graph is cleaned first when clean-between-tests is enabled.
+
+        Yields:
+            Leased WorkerSlot
+        """
+        slot = self._available.get()
+        try:
+            with use_installation(slot.installation):
+                self._prepare(slot)
+                yield slot
+        finally:
+            self._available.put(slot)
+
+    @asynccontextmanager
+    async def lease_async(self) -> AsyncIterator[WorkerSlot]:
+        """Lease a free worker from an asyncio task (see lease()).
+
+        Yields:
+            Leased WorkerSlot
+        """
+        # asyncio queues belong to one event loop; rebuild for a new loop
+        # (all slots are free between event loops)
+        loop = asyncio.get_running_loop()
+        if self._available_async is None or self._async_loop is not loop:
+            self._async_loop = loop
+            self._available_async = asyncio.Queue()
+            for slot in self.slots:
+                self._available_async.put_nowait(slot)
+
+        slot = await self._available_async.get()
+        try:
+            with use_installation(slot.installation):
+                self._prepare(slot)
+                yield slot
+        finally:
+            self._available_async.put_nowait(slot)
+
+    def _prepare(self, slot: WorkerSlot) -> None:
+        """Reset a worker's graph before its next test, if requested."""
+        if slot.tests_run > 0 and slot.config.should_clean_graph():
+            if not clean_graph_state(slot.config):
+                self.logger.warning(f"Graph cleanup failed on worker {slot.worker_id}")
+        slot.tests_run += 1
+
+    def close(self, keep: bool = False) -> None:
+        """Remove worker installations.
+
+        Args:
+            keep: If True, leave installations on disk for inspection
+        """
+        for slot in self.slots:
+            if keep:
+                self.logger.info(f"Keeping worker installation: {slot.installation.install_dir}")
+                continue
+            try:
+                slot.installation.cleanup()
+            except Exception as e:
+                self.logger.warning(f"Failed to cleanup worker {slot.worker_id}: {e}")
+        if not keep:
+            self.slots = []
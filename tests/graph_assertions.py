@@ -42,24 +42,14 @@ class GraphStateAssertions:
             AssertionError: If no matching task found
         """
         tasks = self.client.query_nodes(type="Task")
+        contents = self._node_contents(tasks.get("node_ids", []))
 
-        for task_id in tasks.get("node_ids", []):
-            try:
-                content = self.client.get_node_content(node_id=task_id)
-                if re.search(content_pattern, content, re.IGNORECASE):
-                    return task_id
-            except Exception:
-                # Skip tasks we can't read
-                continue
+        for task_id, content in contents.items():
+            if re.search(content_pattern, content, re.IGNORECASE):
+                return task_id
 
-        # Gather details for helpful error message
-        task_contents = []
-        for task_id in tasks.get("node_ids", [])[:5]:  # Show first 5
-            try:
-                content = self.client.get_node_content(node_id=task_id)
-                task_contents.append(f"  - {content[:100]}")
-            except Exception:
-                pass
+        # Gather details for helpful error message (first 5 readable tasks)
+        task_contents = [f"  - {content[:100]}" for content in list(contents.values())[:5]]
 
         tasks_summary = "\n".join(task_contents) if task_contents else "  (none)"
 
@@ -132,17 +122,12 @@ class GraphStateAssertions:
             List of matching task IDs
         """
         tasks = self.client.query_nodes(type="Task")
-        matches = []
+        contents = self._node_contents(tasks.get("node_ids", []))
 
-        for task_id in tasks.get("node_ids", []):
-            try:
-                content = self.client.get_node_content(node_id=task_id)
-                if re.search(content_pattern, content, re.IGNORECASE):
-                    matches.append(task_id)
-            except Exception:
-                continue
-
-        return matches
+        return [
+            task_id for task_id, content in contents.items()
+            if re.search(content_pattern, content, re.IGNORECASE)
+        ]
 
     # === Connection Assertions ===
 
@@ -254,13 +239,9 @@ class GraphStateAssertions:
         """
         contexts = self.client.query_nodes(type="Context")
 
-        for ctx_id in contexts.get("node_ids", []):
-            try:
-                content = self.client.get_node_content(node_id=ctx_id)
-                if re.search(context_pattern, content, re.IGNORECASE):
-                    return ctx_id
-            except Exception:
-                continue
+        for ctx_id, content in self._node_contents(contexts.get("node_ids", [])).items():
+            if re.search(context_pattern, content, re.IGNORECASE):
+                return ctx_id
 
         raise AssertionError(
             f"No context found matching pattern: '{context_pattern}'"
@@ -307,13 +288,9 @@ class GraphStateAssertions:
         """
         states = self.client.query_nodes(type="State")
 
-        for state_id in states.get("node_ids", []):
-            try:
-                content = self.client.get_node_content(node_id=state_id)
-                if re.search(state_pattern, content, re.IGNORECASE):
-                    return state_id
-            except Exception:
-                continue
+        for state_id, content in self._node_contents(states.get("node_ids", [])).items():
+            if re.search(state_pattern, content, re.IGNORECASE):
+                return state_id
 
         raise AssertionError(
             f"No state found matching pattern: '{state_pattern}'"
@@ -514,6 +491,41 @@ class GraphStateAssertions:
 
         return result
 
+    def _node_contents(self, node_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch content for several nodes, skipping nodes that can't be read.
+
+        Uses one batched request when the client supports call_tools_batch
+        (GraphMemoryBridge, harness MCP clients) instead of a round trip per
+        node.
+
+        Args:
+            node_ids: Node IDs to read
+
+        Returns:
+            Mapping of node ID to content, in node_ids order
+        """
+        if not hasattr(self.client, "call_tools_batch"):
+            contents = {}
+            for node_id in node_ids:
+                try:
+                    contents[node_id] = self.client.get_node_content(node_id=node_id)
+                except Exception:
+                    continue
+            return contents
+
+        results = self.client.call_tools_batch(
+            [("get_node_content", {"node_id": node_id}) for node_id in node_ids]
+        )
+        contents = {}
+        for node_id, result in zip(node_ids, results):
+            if result.error is not None:
+                continue
+            output = result.output
+            # The server returns {"node_id", "content"} as structured content
+            contents[node_id] = output["content"] if isinstance(output, dict) else output
+        return contents
+
     def debug_graph_state(self) -> str:
         """
         Generate debug summary of current graph state.
@@ -57,6 +57,7 @@ class HarnessConfig:
     enable_prompt_cache: bool = False
     stub_tool_responses: Dict[str, object] = field(default_factory=dict)
     gateway_base_url: Optional[str] = None
+    mcp_transport: str = "stdio"
 
     @classmethod
     def default(cls) -> "HarnessConfig":
@@ -110,6 +111,7 @@ class HarnessConfig:
             enable_prompt_cache=bool(data.get("enable_prompt_cache", False)),
             stub_tool_responses=data.get("stub_tool_responses", {}),
             gateway_base_url=gateway_cfg.get("base_url") or data.get("gateway_base_url"),
+            mcp_transport=str(data.get("mcp_transport", "stdio")),
         )
 
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List
 
+from ...conversational_layer.tracing import span
 from ..adapters.base import ChatMessage, ChatResponse, ProviderAdapter
 from ..config import HarnessConfig
 from ..mcp.tool_router import ToolRouter
@@ -31,47 +33,87 @@ class AssistantEngine(RoleEngine):
         messages.append(ChatMessage(role="user", content=user_text))
         tools = filter_tools_for_role("assistant", self.tool_router.list_tools())
 
-        response = self.adapter.send_chat(
-            role_config=self.role_config,
-            messages=messages,
-            tools=tools,
-            tool_choice="auto",
-        )
+        with span("assistant turn", "turn", model=self.role_config.model) as turn:
+            response = self._traced_chat(messages, tools, steps=0)
+            steps = 0
+            while response.tool_calls and steps < max_steps:
+                self._resolve_tool_calls(messages, response)
+                steps += 1
+                response = self._traced_chat(messages, tools, steps)
+            turn.set(steps=steps)
 
-        steps = 0
-        while response.tool_calls and steps < max_steps:
-            # Append the assistant turn with tool_calls so providers accept tool messages next
-            tool_calls_payload = []
-            for idx, call in enumerate(response.tool_calls):
-                tool_calls_payload.append({
-                    "type": "function",
-                    "id": call.call_id or f"call_{idx}",
-                    "function": {
-                        "name": call.name,
-                        "arguments": json.dumps(call.arguments),
-                    },
-                })
-            messages.append(ChatMessage(role="assistant", content={"tool_calls": tool_calls_payload}))
-            for call in response.tool_calls:
-                result = self.tool_router.execute(call.name, call.arguments)
-                tool_msg = ChatMessage(
-                    role="tool",
-                    content={
-                        "tool_call_id": call.call_id or call.name,
-                        "content": json.dumps(result.output),
-                    },
-                )
-                messages.append(tool_msg)
-
-            response = self.adapter.send_chat(
-                role_config=self.role_config,
+        return response
+
+    async def run_turn_async(self, history: List[ChatMessage], user_text: str, max_steps: int = 6) -> ChatResponse:
+        """Async run_turn: tool calls go through ToolRouter.execute_async.
+
+        Provider adapters are blocking, so each LLM call runs in a worker
+        thread; many turns can then share one event loop (and one MCP server).
+        """
+
+        messages = list(self.system_prompts)
+        messages.extend(history)
+        messages.append(ChatMessage(role="user", content=user_text))
+        tools = filter_tools_for_role("assistant", self.tool_router.list_tools())
+
+        with span("assistant turn", "turn", model=self.role_config.model) as turn:
+            response = await asyncio.to_thread(self._traced_chat, messages, tools, 0)
+            steps = 0
+            while response.tool_calls and steps < max_steps:
+                messages.append(self._tool_request_message(response))
+                # Calls within one response run in order: later ones may depend on earlier writes
+                for call in response.tool_calls:
+                    with span(call.name, "mcp"):
+                        result = await self.tool_router.execute_async(call.name, call.arguments)
+                    messages.append(self._tool_result_message(call, result.output))
+                steps += 1
+                response = await asyncio.to_thread(self._traced_chat, messages, tools, steps)
+            turn.set(steps=steps)
+
+        return response
+
+    def _traced_chat(self, messages: List[ChatMessage], tools, steps: int) -> ChatResponse:
+        with span("llm call", "llm", step=steps) as call:
+            response = self.send_chat(
                 messages=messages,
                 tools=tools,
                 tool_choice="auto",
             )
-            steps += 1
-
+            call.set(tool_calls=len(response.tool_calls or ()))
         return response
 
+    def _resolve_tool_calls(self, messages: List[ChatMessage], response: ChatResponse) -> None:
+        """Run the response's tool calls and append their results to messages."""
+
+        messages.append(self._tool_request_message(response))
+        for call in response.tool_calls:
+            with span(call.name, "mcp"):
+                result = self.tool_router.execute(call.name, call.arguments)
+            messages.append(self._tool_result_message(call, result.output))
+
+    def _tool_request_message(self, response: ChatResponse) -> ChatMessage:
+        """Assistant message echoing tool_calls so providers accept tool messages next."""
+
+        tool_calls_payload = []
+        for idx, call in enumerate(response.tool_calls):
+            tool_calls_payload.append({
+                "type": "function",
+                "id": call.call_id or f"call_{idx}",
+                "function": {
+                    "name": call.name,
+                    "arguments": json.dumps(call.arguments),
+                },
+            })
+        return ChatMessage(role="assistant", content={"tool_calls": tool_calls_payload})
+
+    def _tool_result_message(self, call, output) -> ChatMessage:
+        return ChatMessage(
+            role="tool",
+            content={
+                "tool_call_id": call.call_id or call.name,
+                "content": json.dumps(output),
+            },
+        )
+
 
 __all__ = ["AssistantEngine"]
@@ -6,7 +6,9 @@ from abc import ABC
 from dataclasses import dataclass, field
 from typing import Any, List
 
-from ..adapters.base import ChatMessage, ProviderAdapter
+from ...conversational_layer.rate_limit import get_rate_limiter
+from ...conversational_layer.retry import is_rate_limit_error
+from ..adapters.base import ChatMessage, ChatResponse, ProviderAdapter
 from ..config import HarnessConfig, RoleModelConfig
 
 
@@ -45,10 +47,35 @@ class RoleEngine(ABC):
     def build_system_prompts(self, prompt_texts: List[str]) -> List[ChatMessage]:
         return [ChatMessage(role="system", content=text) for text in prompt_texts]
 
+    def send_chat(self, **kwargs: Any) -> ChatResponse:
+        """Send a chat request through the shared per-model rate limiter."""
+
+        return rate_limited_call(self.role_config.model, self.adapter.send_chat, role_config=self.role_config, **kwargs)
+
+
+def rate_limited_call(model: str, func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a provider call holding a rate-limiter slot for ``model``.
+
+    Rate-limit failures (HTTP 429, overloaded, ...) stretch the limiter back
+    before the exception propagates.
+    """
+
+    limiter = get_rate_limiter(model)
+    with limiter.slot():
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            if is_rate_limit_error({"reason": str(exc)}):
+                limiter.report_rate_limit()
+            raise
+    limiter.report_success()
+    return result
+
 
 __all__ = [
     "ConversationTranscript",
     "ConversationTurn",
     "RoleEngine",
+    "rate_limited_call",
     "ToolInvocationRecord",
 ]
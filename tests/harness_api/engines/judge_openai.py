@@ -5,7 +5,7 @@ import os
 from typing import Dict, Any
 import urllib.request
 
-from .base import ConversationTranscript
+from .base import ConversationTranscript, rate_limited_call
 
 
 def load_dotenv(path: str) -> None:
@@ -45,12 +45,16 @@ def openai_chat(model: str, system_prompt: str, user_prompt: str, timeout: float
     }
     data = json.dumps(body).encode('utf-8')
     req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {api_key}'})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        payload = json.loads(resp.read().decode('utf-8'))
+    payload = rate_limited_call(model, _post_json, req, timeout)
     content = payload['choices'][0]['message']['content']
     return content
 
 
+def _post_json(req: urllib.request.Request, timeout: float) -> Dict[str, Any]:
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read().decode('utf-8'))
+
+
 JUDGE_SYSTEM_PROMPT = (
     "You are an independent judge evaluating a GTD assistant. "
     "Return strict JSON with keys: effective (bool), safe (bool), clear (bool), reasoning (string)."
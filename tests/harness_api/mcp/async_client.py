@@ -0,0 +1,244 @@
+"""asyncio MCP stdio client for driving many conversations from one event loop.
+
+Counterpart of McpStdioClient without threads: the server is an asyncio
+subprocess, one reader task resolves per-request futures by JSON-RPC id,
+and any number of coroutines can have ``call_tool`` requests in flight:
+
+    client = await AsyncMcpClient.spawn(default_graph_memory_spec(data_dir))
+    nodes = await asyncio.gather(*(client.call_tool("create_node", req) for req in requests))
+    await client.close()
+
+Backpressure: at most ``max_in_flight`` requests are outstanding at once
+(further callers wait for a slot), and every write awaits ``drain()`` so a
+slow server throttles its callers instead of growing the pipe buffer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any, Mapping, Optional
+
+from .manager import McpServerSpec, ServerOutputLog
+from .stdio_client import (
+    CLIENT_INFO,
+    MCP_PROTOCOL_VERSION,
+    McpStdioError,
+    bare_tool_name,
+    decode_tool_result,
+)
+
+
+# Graph query results can be large; asyncio's default line limit is 64 KiB
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class AsyncMcpClient:
+    """JSON-RPC client over an MCP server's stdio streams (asyncio)."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        server_name: str = "gtd-graph-memory",
+        timeout: float = 30.0,
+        max_in_flight: int = 64,
+        process: Optional[asyncio.subprocess.Process] = None,
+    ) -> None:
+        """Attach to a server's streams. Must be created inside a running loop."""
+        self.reader = reader
+        self.writer = writer
+        self.server_name = server_name
+        self.timeout = timeout
+        self.process = process
+        self.server_info: dict[str, Any] = {}
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._write_lock = asyncio.Lock()
+        self._counter = 0
+        self._pending: dict[int, tuple[str, asyncio.Future]] = {}
+        self._notifications: set[asyncio.Task] = set()
+        self._closed_reason: Optional[str] = None
+        self.output_log: Optional[ServerOutputLog] = None
+        self._output_task: Optional[asyncio.Task] = None
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_responses())
+
+    @classmethod
+    async def spawn(cls, spec: McpServerSpec, timeout: float = 30.0, max_in_flight: int = 64) -> "AsyncMcpClient":
+        """Start the server described by ``spec`` and complete the MCP handshake."""
+        env = os.environ.copy()
+        env.update(spec.env)
+        if spec.log_path:
+            spec.log_path.parent.mkdir(parents=True, exist_ok=True)
+            env["MCP_CALL_LOG"] = str(spec.log_path)
+        output_log_path = spec.resolved_output_log_path()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *spec.command,
+                cwd=str(spec.cwd) if spec.cwd else None,
+                env=env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE if output_log_path else None,
+                limit=STREAM_LIMIT,
+            )
+        except OSError as exc:
+            raise McpStdioError(f"Could not start {spec.name}: {exc}") from exc
+        client = cls(
+            process.stdout,
+            process.stdin,
+            server_name=spec.name,
+            timeout=timeout,
+            max_in_flight=max_in_flight,
+            process=process,
+        )
+        if output_log_path:
+            client.output_log = ServerOutputLog(output_log_path)
+            client._output_task = asyncio.get_running_loop().create_task(client._pump_stderr(process.stderr))
+        try:
+            await client.initialize()
+        except BaseException:
+            await client.close()
+            raise
+        return client
+
+    async def initialize(self) -> dict[str, Any]:
+        """Perform the MCP handshake; must be awaited once before any tool call."""
+        self.server_info = await self.request(
+            "initialize",
+            {"protocolVersion": MCP_PROTOCOL_VERSION, "capabilities": {}, "clientInfo": CLIENT_INFO},
+        )
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return self.server_info
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return list((await self.request("tools/list", {})).get("tools", []))
+
+    async def call_tool(self, tool_name: str, arguments: Mapping[str, Any], timeout: Optional[float] = None) -> Any:
+        """Invoke a tool and return its decoded result (see decode_tool_result)."""
+        tool = bare_tool_name(tool_name)
+        result = await self.request("tools/call", {"name": tool, "arguments": dict(arguments)}, timeout=timeout)
+        return decode_tool_result(tool, result)
+
+    async def request(self, method: str, params: Mapping[str, Any], timeout: Optional[float] = None) -> Any:
+        """Send a JSON-RPC request and await its response.
+
+        Cancelling the awaiting task (or timing out) abandons the request and
+        sends ``notifications/cancelled``; a late response is dropped.
+
+        Raises:
+            McpStdioError: On a JSON-RPC error, timeout, or server exit
+        """
+        async with self._slots:
+            if self._closed_reason:
+                raise McpStdioError(self._closed_reason)
+            self._counter += 1
+            req_id = self._counter
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._pending[req_id] = (method, future)
+            future.add_done_callback(lambda done: self._forget(req_id, done))
+            try:
+                await self._send({"jsonrpc": "2.0", "id": req_id, "method": method, "params": dict(params)})
+                return await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+            except asyncio.TimeoutError:
+                raise McpStdioError(f"{self.server_name} timed out on {method}") from None
+            finally:
+                future.cancel()
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def close(self) -> None:
+        """Close stdin, wait for the server to exit, and stop the reader."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        if self.process is not None:
+            try:
+                await asyncio.wait_for(self.process.wait(), self.timeout)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        self._reader_task.cancel()
+        await asyncio.gather(self._reader_task, *self._notifications, return_exceptions=True)
+        if self._output_task is not None:
+            # The server has exited, so stderr reaches EOF shortly
+            try:
+                await asyncio.wait_for(self._output_task, 5.0)
+            except asyncio.TimeoutError:
+                pass
+        if self.output_log is not None:
+            self.output_log.close()
+
+    async def _send(self, message: Mapping[str, Any]) -> None:
+        async with self._write_lock:
+            try:
+                self.writer.write((json.dumps(message) + "\n").encode())
+                await self.writer.drain()
+            except (BrokenPipeError, ConnectionResetError, RuntimeError) as exc:
+                raise McpStdioError(f"{self.server_name} is not accepting input") from exc
+
+    def _forget(self, req_id: int, future: asyncio.Future) -> None:
+        if self._pending.pop(req_id, None) is None or not future.cancelled() or self._closed_reason:
+            return
+        task = asyncio.get_running_loop().create_task(self._notify_cancelled(req_id))
+        self._notifications.add(task)
+        task.add_done_callback(self._notifications.discard)
+
+    async def _notify_cancelled(self, req_id: int) -> None:
+        try:
+            await self._send({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": req_id}})
+        except McpStdioError:
+            pass
+
+    async def _pump_stderr(self, stream: asyncio.StreamReader) -> None:
+        try:
+            while line := await stream.readline():
+                self.output_log.write("stderr", line.decode(errors="replace"))
+        except ValueError:  # line longer than STREAM_LIMIT
+            pass
+
+    async def _read_responses(self) -> None:
+        reason = f"{self.server_name} closed stdout"
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    message = None
+                if not isinstance(message, dict):
+                    if self.output_log is not None and line.strip():
+                        self.output_log.write("stdout", line.decode(errors="replace"))
+                    continue
+                # Notifications and server-initiated requests carry no matching id
+                resp_id = message.get("id")
+                if resp_id is None or "method" in message:
+                    continue
+                entry = self._pending.pop(resp_id, None)
+                if entry is None or entry[1].done():
+                    continue  # caller timed out or cancelled
+                method, future = entry
+                if "error" in message:
+                    error = message["error"]
+                    future.set_exception(McpStdioError(f"{method} failed: {error.get('message', error)}"))
+                else:
+                    future.set_result(message.get("result") or {})
+        except ValueError as exc:  # line longer than STREAM_LIMIT
+            reason = f"{self.server_name} sent an unreadable response: {exc}"
+        finally:
+            if self.process is not None and self.process.returncode is not None:
+                reason += f" (exit code {self.process.returncode})"
+            self._closed_reason = reason
+            pending = list(self._pending.values())
+            self._pending.clear()
+            for method, future in pending:
+                if not future.done():
+                    future.set_exception(McpStdioError(f"{reason} during {method}"))
+
+
+__all__ = ["AsyncMcpClient", "STREAM_LIMIT"]
@@ -8,9 +8,10 @@ import time
 from pathlib import Path
 from typing import Callable, Dict, Mapping, Any, Optional, TYPE_CHECKING
 
-from .client import GraphMemoryClient
+from .client import GraphMemoryClient, ToolCallBatch, ToolExecutionResult, run_captured
 from .manager import McpLifecycleManager, McpServerSpec, default_graph_memory_spec
 from .cli_bridge import McpCliBridge
+from .stdio_client import McpStdioClient
 from .mcp_client_stub import McpClientStub
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
@@ -19,7 +20,12 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
 
 @dataclass(slots=True)
 class GraphMemoryBridge:
-    """Placeholder bridge that will eventually invoke MCP commands."""
+    """Routes graph-memory tool calls to a live MCP server, the gateway, or stubs.
+
+    By default (`transport="stdio"`) one server process is started per bridge
+    and every tool call is a JSON-RPC request over its stdin/stdout.
+    `transport="cli"` falls back to spawning the tool runner for each call.
+    """
 
     data_dir: Path
     log_dir: Path
@@ -31,6 +37,9 @@ class GraphMemoryBridge:
     cli_bridge: Optional[McpCliBridge] = None
     gateway_base_url: Optional[str] = None
     gateway_client: Optional["GatewayClient"] = None
+    transport: str = "stdio"
+    stdio_client: Optional[McpStdioClient] = None
+    call_timeout: float = 30.0
 
     def start(self) -> None:
         data_dir = self.data_dir
@@ -42,14 +51,6 @@ class GraphMemoryBridge:
             spec: McpServerSpec = default_graph_memory_spec(data_dir=data_dir, log_path=log_path)
             self.lifecycle_manager = McpLifecycleManager([spec])
             self.lifecycle_manager.start_all()
-        # TODO (Transport Milestone):
-        #   1. Ensure `src/graph-memory-core/mcp` is built (`npm install && npm run build`).
-        #   2. Launch `node dist/index.js` via McpLifecycleManager (one per run/test).
-        #   3. Stream stdout/stderr to log files for debugging/failures.
-        #   4. Initialize `McpCliBridge` (or JSON-RPC client) pointing at a helper script
-        #      that can execute tools against the running server.
-        #   5. Surface MCP logs through a read-only tool (judge/interrogator use).
-        # For now we stay in stub mode so other harness pieces can be developed in parallel.
         self.client = GraphMemoryClient()
         tool_runner = Path(__file__).resolve().parent / "tool_runner.mjs"
         if self.executor is None and not self.stub_responses:
@@ -57,22 +58,34 @@ class GraphMemoryBridge:
                 # Prefer the shared Python client from mcp-tool-gateway when a base URL is configured.
                 self._init_gateway_client()
                 self.executor = self._gateway_client_executor
-            else:
+            elif self.transport == "stdio":
+                # start_all already completed the handshake on this client
+                self.stdio_client = self.lifecycle_manager.processes[spec.name].client
+                self.stdio_client.timeout = self.call_timeout
+                self.executor = self.stdio_client.call_tool
+            elif self.transport == "cli":
                 self.cli_bridge = McpCliBridge(
                     cli_path=tool_runner,
                     env={
                         "BASE_PATH": str(data_dir),
                         "MCP_CALL_LOG": str(log_path),
                     },
+                    timeout=self.call_timeout,
                 )
-                # TODO: replace CLI bridge with stdio client once MCP transport is wired.
                 self.executor = self.cli_bridge.run_tool
+            else:
+                raise ValueError(f"Unknown MCP transport: {self.transport!r} (expected 'stdio' or 'cli')")
         if self.executor is None:
             self.executor = self._stub_executor
         self.client.executor = self._execute
+        self.client.batch_executor = self.call_tools_batch
         self.last_calls = []
 
     def stop(self) -> None:
+        if self.stdio_client:
+            if self.executor == self.stdio_client.call_tool:
+                self.executor = None
+            self.stdio_client = None
         if self.lifecycle_manager:
             self.lifecycle_manager.stop_all()
             self.lifecycle_manager = None
@@ -83,6 +96,26 @@ class GraphMemoryBridge:
             raise RuntimeError("GraphMemoryBridge not started")
         return self._execute(tool_name, arguments)
 
+    def call_tools_batch(self, calls: ToolCallBatch) -> list[ToolExecutionResult]:
+        """Run several tool calls in order with as few round trips as the transport allows.
+
+        stdio sends runs of read-only calls in one write; the CLI transport
+        runs the whole batch in one tool-runner process. The gateway and stub
+        executors have no batch form and run the calls one by one. Results
+        come back in call order, each with either output or ``error``.
+        """
+        if not self.client:
+            raise RuntimeError("GraphMemoryBridge not started")
+        if self.stdio_client and self.executor == self.stdio_client.call_tool:
+            results = self.stdio_client.call_tools_batch(calls, timeout=self.call_timeout)
+        elif self.cli_bridge and self.executor == self.cli_bridge.run_tool:
+            results = self.cli_bridge.run_batch(calls)
+        else:
+            return [run_captured(self._execute, name, arguments) for name, arguments in calls]
+        for (name, arguments), result in zip(calls, results):
+            self._record(name, arguments, result.output, result.error)
+        return results
+
     def set_stub_response(self, tool_name: str, response: Any) -> None:
         if self.stub_responses is None:
             self.stub_responses = {}
@@ -91,20 +124,23 @@ class GraphMemoryBridge:
     def _execute(self, tool_name: str, arguments: Mapping[str, Any]) -> Any:
         if not self.executor:
             raise RuntimeError("GraphMemoryBridge executor missing")
-        # TODO: When real transport is wired, this will call out to the MCP server via
-        # JSON-RPC or a local CLI bridge, capture tool results/errors, and stream logs.
         result = self.executor(tool_name, arguments)
-        if self.last_calls is not None:
-            self.last_calls.append(
-                {
-                    "timestamp": time.time(),
-                    "tool": tool_name,
-                    "arguments": json.loads(json.dumps(arguments)),
-                    "result": result,
-                }
-            )
+        self._record(tool_name, arguments, result)
         return result
 
+    def _record(self, tool_name: str, arguments: Mapping[str, Any], result: Any, error: Optional[str] = None) -> None:
+        if self.last_calls is None:
+            return
+        entry = {
+            "timestamp": time.time(),
+            "tool": tool_name,
+            "arguments": json.loads(json.dumps(arguments)),
+            "result": result,
+        }
+        if error is not None:
+            entry["error"] = error
+        self.last_calls.append(entry)
+
     def use_gateway(self, base_url: str) -> None:
         self.gateway_base_url = base_url
 
@@ -167,7 +203,7 @@ class GraphMemoryBridge:
         return self.gateway_client.call_tool(server, tool, dict(arguments))
 
     def _stub_executor(self, tool_name: str, arguments: Mapping[str, Any]) -> Any:
-        """Return canned responses. Temporary until real transport is wired."""
+        """Return canned responses configured via set_stub_response."""
 
         if self.stub_responses and tool_name in self.stub_responses:
             return self.stub_responses[tool_name]
@@ -1,4 +1,4 @@
-"""Placeholder CLI bridge for invoking MCP server tools via subprocess."""
+"""CLI bridge for invoking MCP server tools via a one-shot subprocess."""
 
 from __future__ import annotations
 
@@ -8,14 +8,18 @@ import subprocess
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from .client import ToolCallBatch, ToolExecutionResult
+from .stdio_client import bare_tool_name
+
 
 class McpCliBridge:
     """Runs MCP tool commands by shelling out to a CLI helper.
 
-    The real implementation will likely:
-      1. Launch the MCP server (via GraphMemoryBridge lifecycle manager).
-      2. Call a CLI helper (e.g., `node cli.js call --tool create_node --input '{...}'`).
-      3. Capture stdout/stderr, parse JSON result, propagate errors, and emit logs.
+    Each call spawns `node tool_runner.mjs --tool <name> --input '{...}'`, which
+    loads the graph from BASE_PATH, runs one handler, and exits. That costs a
+    Node startup per call, so GraphMemoryBridge only uses it when the stdio
+    transport is disabled (`transport="cli"`); run_batch spreads one startup
+    over many calls via `--batch -`.
     """
 
     def __init__(self, cli_path: Path, env: Mapping[str, str] | None = None, timeout: float = 60.0) -> None:
@@ -26,44 +30,75 @@ class McpCliBridge:
             raise FileNotFoundError(f"MCP tool runner not found: {self.cli_path}")
 
     def run_tool(self, tool_name: str, arguments: Mapping[str, Any]) -> Any:
-        command = self._build_command(tool_name, arguments)
+        parsed = self._invoke(self._build_command(tool_name, arguments), tool_name)
+        if not parsed.get("ok"):
+            raise RuntimeError(f"CLI reported error for {tool_name}: {parsed.get('error')}")
+        return parsed.get("result")
+
+    def run_batch(self, calls: ToolCallBatch) -> list[ToolExecutionResult]:
+        """Run several tools in one tool-runner process (`--batch -`).
+
+        The graph is loaded once and the calls run in order; a failed call
+        is reported in its result and does not stop the rest.
+        """
+        if not calls:
+            return []
+        payload = [{"tool": bare_tool_name(name), "input": dict(arguments)} for name, arguments in calls]
+        label = f"batch of {len(calls)} calls"
+        try:
+            parsed = self._invoke(["node", str(self.cli_path), "--batch", "-"], label, stdin=json.dumps(payload))
+        except RuntimeError as exc:
+            return [ToolExecutionResult(name=name, output=None, error=str(exc)) for name, _ in calls]
+        outcomes = parsed.get("results") or []
+        if not parsed.get("ok") or len(outcomes) != len(calls):
+            error = f"CLI reported error for {label}: {parsed.get('error', 'result count mismatch')}"
+            return [ToolExecutionResult(name=name, output=None, error=error) for name, _ in calls]
+        return [
+            ToolExecutionResult(
+                name=name,
+                output=outcome.get("result"),
+                error=None if outcome.get("ok") else f"CLI reported error for {name}: {outcome.get('error')}",
+            )
+            for (name, _), outcome in zip(calls, outcomes)
+        ]
+
+    def _invoke(self, command: Sequence[str], label: str, stdin: str | None = None) -> dict[str, Any]:
         env = os.environ.copy()
         env.update(self.env)
         try:
             result = subprocess.run(
                 command,
+                input=stdin,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
                 env=env,
             )
         except subprocess.TimeoutExpired as exc:  # pragma: no cover - integration path
-            raise RuntimeError(f"MCP CLI bridge timed out calling {tool_name}") from exc
+            raise RuntimeError(f"MCP CLI bridge timed out calling {label}") from exc
 
         stdout = result.stdout.strip()
         stderr = result.stderr.strip()
         if result.returncode != 0:
             raise RuntimeError(
-                f"MCP CLI bridge failed for {tool_name}: code={result.returncode} stderr={stderr}"
+                f"MCP CLI bridge failed for {label}: code={result.returncode} stderr={stderr}"
             )
         if not stdout:
-            raise RuntimeError(f"MCP CLI bridge produced no output for {tool_name}")
+            raise RuntimeError(f"MCP CLI bridge produced no output for {label}")
         try:
-            parsed = json.loads(stdout)
+            return json.loads(stdout)
         except json.JSONDecodeError as exc:
             raise RuntimeError(
-                f"Failed to parse CLI output for {tool_name}: {stdout}"
+                f"Failed to parse CLI output for {label}: {stdout}"
             ) from exc
-        if not parsed.get("ok"):
-            raise RuntimeError(f"CLI reported error for {tool_name}: {parsed.get('error')}")
-        return parsed.get("result")
 
     def _build_command(self, tool_name: str, arguments: Mapping[str, Any]) -> Sequence[str]:
         return [
             "node",
             str(self.cli_path),
-            "call",
-            tool_name,
+            "--tool",
+            bare_tool_name(tool_name),
+            "--input",
             json.dumps(arguments),
         ]
 
@@ -3,7 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Mapping, Callable
+from dataclasses import dataclass
+from typing import Any, Mapping, Callable, Optional, Sequence
+
+
+@dataclass(slots=True)
+class ToolExecutionResult:
+    name: str
+    output: Any
+    error: Optional[str] = None
+
+
+ToolCallBatch = Sequence[tuple[str, Mapping[str, Any]]]
 
 
 class McpToolClient(ABC):
@@ -15,17 +26,43 @@ class McpToolClient(ABC):
     def call_tool(self, tool_name: str, arguments: Mapping[str, Any]) -> Any:
         """Invoke a tool and return the raw JSON result."""
 
+    def call_tools_batch(self, calls: ToolCallBatch) -> list[ToolExecutionResult]:
+        """Invoke several tools in order, keeping each call's error.
+
+        Transports that can send a batch in fewer round trips override this;
+        the default issues the calls one by one.
+        """
+        return [run_captured(self.call_tool, name, arguments) for name, arguments in calls]
+
 
 class GraphMemoryClient(McpToolClient):
     server_name = "gtd-graph-memory"
 
     def __init__(self) -> None:
         self.executor: Callable[[str, Mapping[str, Any]], Any] | None = None
+        self.batch_executor: Callable[[ToolCallBatch], list[ToolExecutionResult]] | None = None
 
     def call_tool(self, tool_name: str, arguments: Mapping[str, Any]) -> Any:
         if not self.executor:
             raise RuntimeError("GraphMemoryClient executor not configured")
         return self.executor(tool_name, arguments)
 
+    def call_tools_batch(self, calls: ToolCallBatch) -> list[ToolExecutionResult]:
+        if self.batch_executor:
+            return self.batch_executor(calls)
+        return super().call_tools_batch(calls)
+
+
+def run_captured(
+    call: Callable[[str, Mapping[str, Any]], Any],
+    tool_name: str,
+    arguments: Mapping[str, Any],
+) -> ToolExecutionResult:
+    """Run one tool call, turning an exception into a result with ``error`` set."""
+    try:
+        return ToolExecutionResult(name=tool_name, output=call(tool_name, arguments))
+    except Exception as exc:
+        return ToolExecutionResult(name=tool_name, output=None, error=str(exc))
+
 
-__all__ = ["McpToolClient", "GraphMemoryClient"]
+__all__ = ["McpToolClient", "GraphMemoryClient", "ToolExecutionResult", "ToolCallBatch", "run_captured"]
@@ -41,9 +41,7 @@ def clean_graph(bridge: GraphMemoryBridge) -> None:
     node_ids = []
     if isinstance(res, dict):
         node_ids = list(res.get("node_ids") or res.get("result", {}).get("node_ids", []) or [])
-    for node_id in node_ids:
-        try:
-            bridge.call_tool("mcp__gtd-graph-memory__delete_node", {"node_id": node_id})
-        except Exception:
-            # Best-effort cleanup
-            pass
+    # Best-effort cleanup: failed deletes are reported per call and ignored
+    bridge.call_tools_batch(
+        [("mcp__gtd-graph-memory__delete_node", {"node_id": node_id}) for node_id in node_ids]
+    )
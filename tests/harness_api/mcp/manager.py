@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
+import threading
 import time
 from dataclasses import dataclass, field
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, IO, Iterable, Optional
+
+from .stdio_client import McpStdioClient, McpStdioError
 
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 
+# Server output logs rotate at this size, keeping this many old files
+OUTPUT_LOG_MAX_BYTES = 5 * 1024 * 1024
+OUTPUT_LOG_BACKUPS = 3
+
 
 @dataclass(slots=True)
 class McpServerSpec:
@@ -22,31 +32,109 @@ class McpServerSpec:
     cwd: Optional[Path] = None
     env: Dict[str, str] = field(default_factory=dict)
     log_path: Optional[Path] = None
+    output_log_path: Optional[Path] = None
+
+    def resolved_output_log_path(self) -> Optional[Path]:
+        """Where stderr goes: output_log_path, else next to the call log."""
+        if self.output_log_path:
+            return self.output_log_path
+        if self.log_path:
+            return self.log_path.with_name(f"{self.log_path.stem}.server.log")
+        return None
+
+
+class ServerOutputLog:
+    """Timestamped, size-capped rotating log of one server's output.
+
+    A pump thread drains the server's stderr into it, so a chatty server can
+    never block on a full pipe. Each line carries wall-clock time and the
+    ``time.monotonic()`` reading used by tracing spans, so log lines can be
+    lined up with tool-call spans.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = OUTPUT_LOG_MAX_BYTES,
+        backup_count: int = OUTPUT_LOG_BACKUPS,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._pumps: list[threading.Thread] = []
+
+    def write(self, stream_name: str, line: str) -> None:
+        stamp = datetime.now().isoformat(timespec="milliseconds")
+        message = f"{stamp} mono={time.monotonic():.6f} [{stream_name}] {line.rstrip()}"
+        # handle() takes the handler lock: the stderr pump and the stdio
+        # reader (stray stdout lines) write concurrently, and rollover must
+        # not interleave with a write
+        self._handler.handle(logging.makeLogRecord({"msg": message, "levelno": logging.INFO}))
+
+    def pump(self, stream: IO[str], stream_name: str) -> None:
+        """Drain ``stream`` into the log on a daemon thread until EOF."""
+
+        def _drain() -> None:
+            try:
+                for line in stream:
+                    self.write(stream_name, line)
+            except (OSError, ValueError):
+                pass  # stream closed under us during shutdown
+
+        thread = threading.Thread(target=_drain, name=f"mcp-output-{self.path.stem}", daemon=True)
+        thread.start()
+        self._pumps.append(thread)
+
+    def close(self, timeout_s: float = 5.0) -> None:
+        """Wait for the pumps to reach EOF, then close the file."""
+        for thread in self._pumps:
+            thread.join(timeout_s)
+        self._handler.close()
 
 
 @dataclass(slots=True)
 class McpServerProcess:
     spec: McpServerSpec
     process: subprocess.Popen[str]
+    client: Optional[McpStdioClient] = None
+    output_log: Optional[ServerOutputLog] = None
 
     def stop(self, timeout_s: float = 10.0) -> None:
-        if self.process.poll() is not None:
-            return
-        self.process.terminate()
-        try:
-            self.process.wait(timeout=timeout_s)
-        except subprocess.TimeoutExpired:
-            self.process.kill()
+        if self.client:
+            self.client.close()
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=timeout_s)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.output_log:
+            self.output_log.close()
 
 
 class McpLifecycleManager:
-    """Starts and stops MCP server processes for the harness."""
+    """Starts and stops MCP server processes for the harness.
+
+    A server counts as started once it has answered the MCP ``initialize``
+    handshake; its connected McpStdioClient is kept on McpServerProcess.
+    """
 
-    def __init__(self, specs: Iterable[McpServerSpec]) -> None:
+    def __init__(self, specs: Iterable[McpServerSpec], ready_timeout: float = 30.0) -> None:
         self.specs = list(specs)
+        self.ready_timeout = ready_timeout
         self.processes: Dict[str, McpServerProcess] = {}
 
     def start_all(self) -> None:
+        """Launch every server, then wait until each completes the handshake.
+
+        All processes are spawned before any handshake, so servers boot in
+        parallel and startup costs the slowest server rather than the sum.
+
+        Raises:
+            RuntimeError: If a server cannot be launched or does not become ready
+        """
         if self.processes:
             return
         for spec in self.specs:
@@ -56,17 +144,44 @@ class McpLifecycleManager:
                 spec.log_path.parent.mkdir(parents=True, exist_ok=True)
                 env["MCP_CALL_LOG"] = str(spec.log_path)
             cwd = str(spec.cwd) if spec.cwd else None
-            proc = subprocess.Popen(
-                spec.command,
-                cwd=cwd,
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            output_log_path = spec.resolved_output_log_path()
+            try:
+                proc = subprocess.Popen(
+                    spec.command,
+                    cwd=cwd,
+                    env=env,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    # Without a log file stderr is inherited; an unread PIPE would eventually block the server
+                    stderr=subprocess.PIPE if output_log_path else None,
+                    text=True,
+                    errors="replace",
+                )
+            except OSError as exc:
+                self.stop_all()
+                raise RuntimeError(f"Could not start MCP server {spec.name}: {exc}") from exc
+            server = McpServerProcess(spec=spec, process=proc)
+            if output_log_path:
+                server.output_log = ServerOutputLog(output_log_path)
+                server.output_log.pump(proc.stderr, "stderr")
+            self.processes[spec.name] = server
+        for server in self.processes.values():
+            # stdout carries JSON-RPC; anything else printed there is logged too
+            stray_output = (
+                (lambda line, log=server.output_log: log.write("stdout", line)) if server.output_log else None
+            )
+            server.client = McpStdioClient(
+                server.process,
+                server_name=server.spec.name,
+                timeout=self.ready_timeout,
+                stray_output=stray_output,
             )
-            self.processes[spec.name] = McpServerProcess(spec=spec, process=proc)
-        # TODO: replace sleep with health probe once MCP exposes readiness signal.
-        time.sleep(2.0)
+        for name, server in self.processes.items():
+            try:
+                server.client.initialize()
+            except McpStdioError as exc:
+                self.stop_all()
+                raise RuntimeError(f"MCP server {name} did not become ready: {exc}") from exc
 
     def stop_all(self) -> None:
         for process in self.processes.values():
@@ -106,5 +221,6 @@ __all__ = [
     "McpLifecycleManager",
     "McpServerProcess",
     "McpServerSpec",
+    "ServerOutputLog",
     "default_graph_memory_spec",
 ]
@@ -0,0 +1,199 @@
+"""Pre-warmed pool of graph-memory MCP servers.
+
+Starting a server (Node boot, graph load, MCP handshake) is the slow part
+of a harness run. The pool starts ``size`` servers in parallel, each with
+its own data dir under ``data_root``, and hands them out as leases:
+
+    pool = McpServerPool(4, Path(".tmp/harness/pool"), snapshot=fixture_snapshot)
+    pool.start()
+    with pool.leased() as server:
+        server.client.call_tool("query_nodes", {})
+    pool.close()
+
+The server keeps its graph in memory, so a released server is recycled on
+a background thread: it is stopped, its data dir is reset to the snapshot
+(hardlink clone, see FixtureSnapshotStore) or emptied, and it is started
+again. The next lease therefore gets a ready server with a pristine graph
+without waiting for the restart.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from ...conversational_layer.logging_config import get_logger
+from ...conversational_layer.snapshots import GRAPH_DIRS, FixtureSnapshotStore
+from ...conversational_layer.trash import TRASH_DIR_NAME, move_to_trash
+from .manager import McpLifecycleManager, McpServerSpec, default_graph_memory_spec
+from .stdio_client import McpStdioClient
+
+
+@dataclass(slots=True)
+class PooledServer:
+    """One pool member: a running server and the data dir it owns."""
+
+    index: int
+    data_dir: Path
+    manager: McpLifecycleManager
+
+    @property
+    def client(self) -> McpStdioClient:
+        return next(iter(self.manager.processes.values())).client
+
+    @property
+    def log_path(self) -> Path:
+        return self.data_dir / "mcp-calls.log"
+
+
+class McpServerPool:
+    """Starts MCP servers in parallel and leases them to workers (thread-safe)."""
+
+    def __init__(
+        self,
+        size: int,
+        data_root: Path,
+        spec_factory: Callable[..., McpServerSpec] = default_graph_memory_spec,
+        snapshot: Optional[Path] = None,
+        ready_timeout: float = 30.0,
+    ) -> None:
+        """Configure the pool; nothing is started until start().
+
+        Args:
+            size: Number of servers
+            data_root: Parent of the per-server data dirs (server-0, server-1, ...)
+            spec_factory: Called as spec_factory(data_dir=..., log_path=...)
+            snapshot: Pristine graph (_system/ + _content/) each lease starts from;
+                None starts every lease from an empty graph
+            ready_timeout: Seconds a server may take to answer the handshake
+        """
+        if size < 1:
+            raise ValueError("MCP server pool needs at least one server")
+        self.size = size
+        self.data_root = Path(data_root)
+        self.spec_factory = spec_factory
+        self.snapshot = Path(snapshot) if snapshot else None
+        self.ready_timeout = ready_timeout
+        self.logger = get_logger()
+        self._snapshots = FixtureSnapshotStore(self.snapshot.parent) if self.snapshot else None
+        self._servers: list[PooledServer] = []
+        # Holds ready servers; None is a sentinel meaning every server has failed
+        self._idle: "queue.Queue[Optional[PooledServer]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._live = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        """Start every server in parallel and wait until all are ready.
+
+        Raises:
+            RuntimeError: If any server fails to start (the others are stopped)
+        """
+        if self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="mcp-pool")
+        launches = [self._executor.submit(self._launch, index) for index in range(self.size)]
+        errors = []
+        for launch in launches:
+            try:
+                self._servers.append(launch.result())
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            self.close()
+            raise RuntimeError(f"MCP server pool failed to start: {errors[0]}") from errors[0]
+        self._live = len(self._servers)
+        for server in self._servers:
+            self._idle.put(server)
+
+    def lease(self, timeout: Optional[float] = None) -> PooledServer:
+        """Take a ready server, waiting for one to be released or recycled.
+
+        Raises:
+            RuntimeError: If the pool is not started, every server has failed,
+                or no server became free within ``timeout`` seconds
+        """
+        if self._executor is None:
+            raise RuntimeError("MCP server pool not started")
+        try:
+            server = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No MCP server became free within {timeout}s") from None
+        if server is None:
+            self._idle.put(None)  # wake the next waiter too
+            raise RuntimeError("MCP server pool has no working servers left")
+        return server
+
+    def release(self, server: PooledServer, reset: bool = True) -> None:
+        """Return a leased server; with ``reset`` it is recycled in the background."""
+        if not reset:
+            self._idle.put(server)
+            return
+        if self._executor is None:
+            server.manager.stop_all()
+            return
+        self._executor.submit(self._recycle, server)
+
+    @contextmanager
+    def leased(self, timeout: Optional[float] = None) -> Iterator[PooledServer]:
+        server = self.lease(timeout)
+        try:
+            yield server
+        finally:
+            self.release(server)
+
+    def close(self) -> None:
+        """Wait for pending recycles, then stop every server."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for server in self._servers:
+            server.manager.stop_all()
+        self._servers.clear()
+        self._idle = queue.Queue()
+        self._live = 0
+
+    def __enter__(self) -> "McpServerPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    def _launch(self, index: int) -> PooledServer:
+        data_dir = self.data_root / f"server-{index}"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        self._reset_graph(data_dir)
+        spec = self.spec_factory(data_dir=data_dir, log_path=data_dir / "mcp-calls.log")
+        manager = McpLifecycleManager([spec], ready_timeout=self.ready_timeout)
+        manager.start_all()
+        return PooledServer(index=index, data_dir=data_dir, manager=manager)
+
+    def _recycle(self, server: PooledServer) -> None:
+        try:
+            server.manager.stop_all()
+            self._reset_graph(server.data_dir)
+            server.manager.start_all()
+        except Exception as exc:
+            server.manager.stop_all()
+            self.logger.warning(f"Dropping MCP pool server {server.index}: {exc}")
+            with self._lock:
+                self._live -= 1
+                if self._live == 0:
+                    self._idle.put(None)
+            return
+        self._idle.put(server)
+
+    def _reset_graph(self, data_dir: Path) -> None:
+        if self._snapshots is not None:
+            self._snapshots.restore_snapshot(self.snapshot, data_dir)
+        else:
+            move_to_trash([data_dir / graph_dir for graph_dir in GRAPH_DIRS], data_dir / TRASH_DIR_NAME)
+
+
+__all__ = ["McpServerPool", "PooledServer"]
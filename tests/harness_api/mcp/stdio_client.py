@@ -1,52 +1,90 @@
-"""Minimal MCP stdio client to communicate with running Node server."""
+"""MCP stdio client that drives a long-lived server process.
+
+The JSON-RPC transport (handshake, per-request futures, cancellation,
+result decoding) lives in conversational_layer/mcp_stdio.py and is shared
+with the fixture loader and the --preflight probe. This client plugs it
+into the harness as an McpToolClient and adds batching:
+
+    client = McpStdioClient(process)
+    client.initialize()
+    client.call_tool("create_node", {...})
+    client.call_tools_batch([("query_nodes", {...}), ("get_node", {...})])
+
+call_tools_batch sends runs of read-only calls in a single write.
+"""
 
 from __future__ import annotations
 
-import json
-import threading
-from typing import Any, Mapping, Optional
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional
 
+from ...conversational_layer.mcp_stdio import (
+    CLIENT_INFO,
+    MCP_PROTOCOL_VERSION,
+    McpStdioConnection,
+    McpStdioError,
+    McpToolError,
+    bare_tool_name,
+    decode_tool_result,
+)
+from .client import McpToolClient, ToolCallBatch, ToolExecutionResult
+from .policies import READ_ONLY
 
-class McpStdioClient:
-    def __init__(self, process) -> None:
-        self.process = process
-        self._lock = threading.Lock()
-        self._counter = 0
-        self._responses: dict[int, Any] = {}
-        self._reader_thread = threading.Thread(target=self._reader, daemon=True)
-        self._reader_thread.start()
 
-    def _reader(self) -> None:
-        while True:
-            line = self.process.stdout.readline()
-            if not line:
-                break
+class McpStdioClient(McpStdioConnection, McpToolClient):
+    """JSON-RPC client over a server process's stdin/stdout (text mode)."""
+
+    def call_tools_batch(self, calls: ToolCallBatch, timeout: Optional[float] = None) -> list[ToolExecutionResult]:
+        """Invoke several tools in order with one timeout for the whole batch.
+
+        The server runs concurrent requests concurrently, and overlapping
+        writes race on its registry file. So only runs of consecutive
+        read-only calls go out together (one write, responses awaited
+        together). Each mutating call is sent alone once everything before
+        it has answered.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        results: list[ToolExecutionResult] = []
+        index = 0
+        while index < len(calls):
+            end = index + 1
+            if self._is_read_only(calls[index][0]):
+                while end < len(calls) and self._is_read_only(calls[end][0]):
+                    end += 1
+            run = [(bare_tool_name(name), arguments) for name, arguments in calls[index:end]]
             try:
-                message = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            resp_id = message.get("id")
-            if resp_id is not None:
-                self._responses[resp_id] = message
-
-    def call_tool(self, tool_name: str, arguments: Mapping[str, Any]) -> Any:
-        import time
-        import json
-        with self._lock:
-            self._counter += 1
-            req_id = self._counter
-            request = {
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "method": "call_tool",
-                "params": {"name": tool_name, "arguments": arguments},
-            }
-            self.process.stdin.write(json.dumps(request) + "\n")
-            self.process.stdin.flush()
-        while True:
-            if req_id in self._responses:
-                response = self._responses.pop(req_id)
-                if "error" in response:
-                    raise RuntimeError(response["error"])
-                return response.get("result")
-            time.sleep(0.01)
+                futures = self.send_requests(
+                    [("tools/call", {"name": tool, "arguments": dict(arguments)}) for tool, arguments in run]
+                )
+            except McpStdioError as exc:
+                results.extend(ToolExecutionResult(name=name, output=None, error=str(exc)) for name, _ in calls[index:])
+                break
+            for (name, _), (tool, _), future in zip(calls[index:end], run, futures):
+                results.append(self._collect(name, tool, future, deadline))
+            index = end
+        return results
+
+    def _is_read_only(self, tool_name: str) -> bool:
+        return f"mcp__{self.server_name}__{bare_tool_name(tool_name)}" in READ_ONLY
+
+    def _collect(self, name: str, tool: str, future: Future, deadline: float) -> ToolExecutionResult:
+        try:
+            output = decode_tool_result(tool, future.result(max(0.0, deadline - time.monotonic())))
+        except FutureTimeoutError:
+            future.cancel()
+            return ToolExecutionResult(name=name, output=None, error=f"{self.server_name} timed out on {tool}")
+        except McpStdioError as exc:
+            return ToolExecutionResult(name=name, output=None, error=str(exc))
+        return ToolExecutionResult(name=name, output=output)
+
+
+__all__ = [
+    "CLIENT_INFO",
+    "MCP_PROTOCOL_VERSION",
+    "McpStdioClient",
+    "McpStdioError",
+    "McpToolError",
+    "bare_tool_name",
+    "decode_tool_result",
+]
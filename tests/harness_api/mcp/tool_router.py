@@ -2,18 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Mapping, Callable
+import asyncio
+from typing import Any, Awaitable, Dict, Iterable, Mapping, Callable, TYPE_CHECKING
 
 from ..adapters.base import ToolDefinition
-from .client import McpToolClient
+from .client import McpToolClient, ToolCallBatch, ToolExecutionResult, run_captured
 from .tool_definitions import GRAPH_MEMORY_TOOLS
 
-
-@dataclass(slots=True)
-class ToolExecutionResult:
-    name: str
-    output: Any
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from .async_client import AsyncMcpClient
 
 
 class ToolRouter:
@@ -22,6 +19,9 @@ class ToolRouter:
     def __init__(self) -> None:
         self._tools: Dict[str, ToolDefinition] = {}
         self._executors: Dict[str, Callable[[Mapping[str, Any]], Any]] = {}
+        self._async_executors: Dict[str, Callable[[Mapping[str, Any]], Awaitable[Any]]] = {}
+        # Canonical name -> (client, bare tool name) for tools execute_many can batch
+        self._batch_routes: Dict[str, tuple[McpToolClient, str]] = {}
         self.register_many(GRAPH_MEMORY_TOOLS)
 
     def register(self, definition: ToolDefinition, executor: Callable[[Mapping[str, Any]], Any] | None = None) -> None:
@@ -39,6 +39,7 @@ class ToolRouter:
 
     def attach_executor(self, name: str, executor: Callable[[Mapping[str, Any]], Any]) -> None:
         self._executors[name] = executor
+        self._batch_routes.pop(name, None)
 
     def attach_mcp_client(self, client: McpToolClient) -> None:
         """Attach an MCP client so canonical tool names invoke the server."""
@@ -51,6 +52,22 @@ class ToolRouter:
                 definition.name,
                 _build_executor(client, tool_name),
             )
+            self._batch_routes[definition.name] = (client, tool_name)
+
+    def attach_async_executor(self, name: str, executor: Callable[[Mapping[str, Any]], Awaitable[Any]]) -> None:
+        self._async_executors[name] = executor
+
+    def attach_async_mcp_client(self, client: "AsyncMcpClient") -> None:
+        """Attach an asyncio MCP client; used by execute_async for its server's tools."""
+
+        for definition in self._tools.values():
+            server_name, tool_name = _split_canonical_name(definition.name)
+            if server_name != client.server_name:
+                continue
+            self.attach_async_executor(
+                definition.name,
+                _build_async_executor(client, tool_name),
+            )
 
     def list_tools(self) -> tuple[ToolDefinition, ...]:
         return tuple(self._tools.values())
@@ -62,6 +79,53 @@ class ToolRouter:
         output = executor(arguments)
         return ToolExecutionResult(name=name, output=output)
 
+    def execute_many(self, calls: ToolCallBatch) -> list[ToolExecutionResult]:
+        """Execute calls in order, returning one result per call.
+
+        Consecutive calls served by the same MCP client go to it as a single
+        batch (see McpToolClient.call_tools_batch). A failing call does not
+        stop the rest; its result carries ``error`` instead of output.
+        """
+
+        results: list[ToolExecutionResult] = []
+        index = 0
+        while index < len(calls):
+            name, arguments = calls[index]
+            route = self._batch_routes.get(name)
+            if route is None:
+                results.append(run_captured(lambda tool, args: self.execute(tool, args).output, name, arguments))
+                index += 1
+                continue
+            client = route[0]
+            end = index
+            while end < len(calls) and self._batch_routes.get(calls[end][0], (None,))[0] is client:
+                end += 1
+            run = calls[index:end]
+            outcomes = client.call_tools_batch([(self._batch_routes[name][1], args) for name, args in run])
+            results.extend(
+                ToolExecutionResult(name=name, output=outcome.output, error=outcome.error)
+                for (name, _), outcome in zip(run, outcomes)
+            )
+            index = end
+        return results
+
+    async def execute_async(self, name: str, arguments: Mapping[str, Any]) -> ToolExecutionResult:
+        """Like execute, awaiting an async executor when one is attached.
+
+        Tools with only a blocking executor run in a worker thread so they do
+        not stall the event loop.
+        """
+
+        async_executor = self._async_executors.get(name)
+        if async_executor is not None:
+            output = await async_executor(arguments)
+            return ToolExecutionResult(name=name, output=output)
+        executor = self._executors.get(name)
+        if executor is None:
+            raise RuntimeError(f"No executor registered for tool '{name}'")
+        output = await asyncio.to_thread(executor, arguments)
+        return ToolExecutionResult(name=name, output=output)
+
 
 __all__ = ["ToolRouter", "ToolExecutionResult"]
 
@@ -78,3 +142,10 @@ def _build_executor(client: McpToolClient, tool_name: str) -> Callable[[Mapping[
         return client.call_tool(tool_name, arguments)
 
     return _executor
+
+
+def _build_async_executor(client: "AsyncMcpClient", tool_name: str) -> Callable[[Mapping[str, Any]], Awaitable[Any]]:
+    async def _executor(arguments: Mapping[str, Any]) -> Any:
+        return await client.call_tool(tool_name, arguments)
+
+    return _executor
@@ -36,28 +36,62 @@ function parseArgs(argv) {
   return args;
 }
 
+async function readStdin() {
+  const chunks = [];
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+  }
+  return Buffer.concat(chunks).toString('utf8');
+}
+
+async function runBatch(registrar, calls) {
+  // Sequential: later calls may depend on earlier writes. A failed call is
+  // reported in place and does not stop the batch.
+  const results = [];
+  for (const call of calls) {
+    try {
+      const definition = registrar.get(call.tool);
+      if (!definition) {
+        throw new Error(`Unknown tool ${call.tool}`);
+      }
+      results.push({ ok: true, result: await definition.handler(call.input ?? {}) });
+    } catch (error) {
+      results.push({ ok: false, error: String(error) });
+    }
+  }
+  return results;
+}
+
 async function main() {
   try {
     const argv = process.argv.slice(2);
     const parsed = parseArgs(argv);
     const toolName = parsed.tool;
-    if (!toolName) {
-      throw new Error('Missing --tool argument');
+    const batchArg = parsed.batch;
+    if (!toolName && !batchArg) {
+      throw new Error('Missing --tool (or --batch) argument');
     }
     const inputArg = parsed.input;
-    if (!inputArg) {
+    if (toolName && !inputArg) {
       throw new Error('Missing --input argument');
     }
     const basePath = parsed['base-path'] || process.env.BASE_PATH;
     if (!basePath) {
       throw new Error('Provide --base-path or BASE_PATH env');
     }
-    const input = JSON.parse(inputArg);
     const storage = new FileStorageAdapter(basePath);
     const graph = await MemoryGraph.initialize({ basePath }, storage);
     const server = new GraphMemoryMcpServer(graph);
     const registrar = new CaptureRegistrar();
     server.registerTools(registrar);
+    if (batchArg) {
+      // --batch - reads [{"tool": ..., "input": {...}}, ...] from stdin
+      const calls = JSON.parse(batchArg === '-' ? await readStdin() : batchArg);
+      const results = await runBatch(registrar, calls);
+      process.stdout.write(JSON.stringify({ ok: true, results }) + '\n');
+      return;
+    }
+    const input = JSON.parse(inputArg);
     const definition = registrar.get(toolName);
     if (!definition) {
       throw new Error(`Unknown tool ${toolName}`);
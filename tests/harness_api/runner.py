@@ -33,6 +33,7 @@ class HarnessRunner:
         self.mcp_bridge = GraphMemoryBridge(
             data_dir=Path(".tmp/harness/mcp/data"),
             log_dir=Path(".tmp/harness/mcp/logs"),
+            transport=self.config.mcp_transport,
         )
         # Prefer gateway HTTP if configured
         if self.config.gateway_base_url:
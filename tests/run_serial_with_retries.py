@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 """
-Run each test case serially with exponential backoff retries.
+Run the test suite serially, resuming after crashes with exponential backoff.
 Each test runs 5 times to measure variance.
+
+Progress is checkpointed in the results database: every finished
+(test, run) result is saved as it completes. If the suite process dies or
+times out, it is restarted with --resume RUN_ID and only the unfinished
+pairs are re-run. The run ID is kept in test-results/resume_run_id so the
+script itself can also be re-launched after an interruption.
 All output goes to test-results/ directory.
 """
 
+import datetime
 import json
+import sqlite3
 import subprocess
 import sys
 import time
-import datetime
 from pathlib import Path
 
 def safe_print(*args, **kwargs):
@@ -23,201 +30,179 @@ def safe_print(*args, **kwargs):
     except Exception:
         pass  # Silently ignore other print errors
 
-# Load test cases
-test_cases_path = Path(__file__).parent / "test_cases_refactored.json"
-with open(test_cases_path) as f:
-    test_cases = json.load(f)
-
 # Configuration
 NUM_RUNS = 5
 MAX_RETRIES = 3
-INITIAL_BACKOFF = 30  # seconds (increased to handle rate limits better)
+INITIAL_BACKOFF = 30  # seconds between crash restarts (rate limits are paced by the suite itself)
+SUITE_TIMEOUT = 6 * 60 * 60  # 6 hour timeout per suite attempt
 OUTPUT_DIR = Path(__file__).parent.parent / "test-results"
 OUTPUT_DIR.mkdir(exist_ok=True)
+RESULTS_DB = OUTPUT_DIR / "results.db"
+RUN_ID_FILE = OUTPUT_DIR / "resume_run_id"
 
 BASE_CMD = [
-    "python", str(Path(__file__).parent / "test_conversational_layer.py"),
+    "python", str(Path(__file__).parent / "test_conversational_layer_new.py"),
     "--suite", "assistant",
     "--mode", "real",
-    "--test-cases", "refactored",
     "--clean-graph-between-tests",
-    "--interrogate-all"
+    "--interrogate-all",
+    "--runs", str(NUM_RUNS),
+    "--results-db", str(RESULTS_DB),
 ]
 
-# Delay between tests to avoid rate limits
-INTER_TEST_DELAY = 10  # seconds
 
-print(f"Running {len(test_cases)} tests × {NUM_RUNS} runs = {len(test_cases) * NUM_RUNS} total executions")
+def latest_run_id():
+    """Highest run_id in the results database (None if there are no runs)"""
+    if not RESULTS_DB.exists():
+        return None
+    with sqlite3.connect(str(RESULTS_DB)) as conn:
+        try:
+            row = conn.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        except sqlite3.OperationalError:
+            return None
+    return row[0] if row else None
+
+
+def run_progress(run_id):
+    """(saved results, planned results, passed) for a run
+
+    Only the latest result of each (test, run) pair counts, the same way the
+    suite totals a resumed run. runs.test_count is recomputed from saved
+    results, so the planned total comes from the planned_results the suite
+    stores with the run (falling back to test_count for older runs).
+    """
+    with sqlite3.connect(str(RESULTS_DB)) as conn:
+        saved, passed = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(passed), 0) FROM test_results
+            WHERE result_id IN (
+                SELECT MAX(result_id) FROM test_results
+                WHERE run_id = ?
+                GROUP BY test_name, run_number
+            )
+            """,
+            (run_id,)
+        ).fetchone()
+        row = conn.execute(
+            "SELECT test_count, config_json FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+    if row is None:
+        return saved, 0, passed
+    planned = json.loads(row[1] or "{}").get("planned_results", row[0])
+    return saved, planned, passed
+
+
+run_id = int(RUN_ID_FILE.read_text().strip()) if RUN_ID_FILE.exists() else None
+
+print(f"Running suite × {NUM_RUNS} runs")
 print(f"Output directory: {OUTPUT_DIR}")
-print(f"Max retries per test: {MAX_RETRIES} with exponential backoff")
-print(f"Delay between tests: {INTER_TEST_DELAY}s")
+print(f"Max restarts: {MAX_RETRIES} with exponential backoff")
+if run_id is not None:
+    print(f"Resuming run {run_id}")
 print()
 
-total_tests = 0
-total_passes = 0
-total_failures = 0
-total_retries = 0
-
-for test_idx, test_case in enumerate(test_cases, 1):
-    test_name = test_case["name"]
-    print(f"[{test_idx}/{len(test_cases)}] Running test: {test_name}")
-
-    for run in range(1, NUM_RUNS + 1):
-        output_file = OUTPUT_DIR / f"{test_name}_run{run}.json"
-        stdout_file = OUTPUT_DIR / f"{test_name}_run{run}.stdout"
-        stderr_file = OUTPUT_DIR / f"{test_name}_run{run}.stderr"
-        status_file = OUTPUT_DIR / f"{test_name}_run{run}.status"
-
-        # Skip if already completed
-        if output_file.exists():
-            safe_print(f"  Run {run}: ⏭ SKIP (already completed)")
-            total_tests += 1
-            total_passes += 1
-            continue
-
-        # Build command for this specific test
-        cmd = BASE_CMD + [
-            "--test-name", test_name,
-            "--interrogation-log", str(output_file)
-        ]
-
-        # Retry logic with exponential backoff
-        retry_count = 0
-        success = False
-
-        while retry_count <= MAX_RETRIES and not success:
-            start_time = datetime.datetime.now()
-            status_info = {
-                "test": test_name,
-                "run": run,
-                "retry": retry_count,
-                "start_time": start_time.isoformat(),
-                "command": " ".join(str(c) for c in cmd)
-            }
-
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600,  # 10 minute timeout per test
-                    cwd=Path(__file__).parent
-                )
-
-                end_time = datetime.datetime.now()
-                status_info["end_time"] = end_time.isoformat()
-                status_info["duration_seconds"] = (end_time - start_time).total_seconds()
-                status_info["exit_code"] = result.returncode
-
-                # Write stdout and stderr
-                stdout_file.write_text(result.stdout, encoding='utf-8')
-                stderr_file.write_text(result.stderr, encoding='utf-8')
-
-                if result.returncode == 0:
-                    status_info["status"] = "PASS"
-                    success = True
-                    total_passes += 1
-                    retry_msg = f" (after {retry_count} retries)" if retry_count > 0 else ""
-                    print(f"  Run {run}: ✓ PASS ({status_info['duration_seconds']:.1f}s){retry_msg}")
-                else:
-                    # Check if test completed with interrogation data (judge FAIL is valid completion)
-                    if output_file.exists() and output_file.stat().st_size > 100:
-                        status_info["status"] = "COMPLETED_WITH_JUDGE_FAIL"
-                        success = True
-                        total_passes += 1
-                        safe_print(f"  Run {run}: ✓ COMPLETED ({status_info['duration_seconds']:.1f}s) [Judge FAIL - behavioral issue, not crash]")
-                    # Check if test doesn't exist (permanent error, don't retry)
-                    elif "not found" in result.stderr.lower():
-                        status_info["status"] = "TEST_NOT_FOUND"
-                        success = True  # Mark as success to move on
-                        total_failures += 1
-                        safe_print(f"  Run {run}: ⊗ SKIP (test not found)")
-                    # Check if it's a crash/rate limit that should be retried
-                    elif retry_count < MAX_RETRIES:
-                        backoff_time = INITIAL_BACKOFF * (2 ** retry_count)
-                        total_retries += 1
-                        print(f"  Run {run}: ⚠ FAIL (exit {result.returncode}), retrying in {backoff_time}s...")
-                        if result.stderr:
-                            print(f"    stderr: {result.stderr[:200]}")
-
-                        status_info["status"] = "RETRY"
-                        status_file.write_text(json.dumps(status_info, indent=2), encoding='utf-8')
-
-                        time.sleep(backoff_time)
-                        retry_count += 1
-                        continue
-                    else:
-                        status_info["status"] = "FAIL"
-                        total_failures += 1
-                        print(f"  Run {run}: ✗ FAIL (exit {result.returncode}, exhausted retries)")
-                        if result.stderr:
-                            print(f"    stderr: {result.stderr[:200]}")
-
-            except subprocess.TimeoutExpired as timeout:
-                end_time = datetime.datetime.now()
-                status_info["end_time"] = end_time.isoformat()
-                status_info["duration_seconds"] = (end_time - start_time).total_seconds()
-                status_info["timeout_seconds"] = 600
-
-                # Save partial output from timeout
-                if timeout.stdout:
-                    stdout_file.write_text(timeout.stdout, encoding='utf-8')
-                if timeout.stderr:
-                    stderr_file.write_text(timeout.stderr, encoding='utf-8')
-
-                if retry_count < MAX_RETRIES:
-                    backoff_time = INITIAL_BACKOFF * (2 ** retry_count)
-                    total_retries += 1
-                    print(f"  Run {run}: ⏱ TIMEOUT, retrying in {backoff_time}s...")
-
-                    status_info["status"] = "RETRY_TIMEOUT"
-                    status_file.write_text(json.dumps(status_info, indent=2), encoding='utf-8')
-
-                    time.sleep(backoff_time)
-                    retry_count += 1
-                    continue
-                else:
-                    status_info["status"] = "TIMEOUT"
-                    total_failures += 1
-                    print(f"  Run {run}: ⏱ TIMEOUT (exhausted retries)")
-
-            except Exception as e:
-                import traceback
-                end_time = datetime.datetime.now()
-                status_info["end_time"] = end_time.isoformat()
-                status_info["duration_seconds"] = (end_time - start_time).total_seconds()
-                status_info["error"] = str(e)
-                status_info["traceback"] = traceback.format_exc()
-                status_info["status"] = "ERROR"
-                total_failures += 1
-
-                # Write error details
-                stderr_file.write_text(status_info["traceback"], encoding='utf-8')
-
-                print(f"  Run {run}: ⚠ ERROR: {e}")
-                print(f"    {traceback.format_exc()[:200]}")
-
-            finally:
-                # Always write final status file
-                status_file.write_text(json.dumps(status_info, indent=2), encoding='utf-8')
-
-        total_tests += 1
-
-        # Small delay between runs of the same test
-        if run < NUM_RUNS:
-            time.sleep(2)
-
-    # Delay between different tests to avoid rate limits
-    if test_idx < len(test_cases):
-        print(f"  Waiting {INTER_TEST_DELAY}s before next test...")
-        time.sleep(INTER_TEST_DELAY)
-
-    print()
+retry_count = 0
+completed = False
+
+while retry_count <= MAX_RETRIES and not completed:
+    attempt = retry_count + 1
+    stdout_file = OUTPUT_DIR / f"suite_attempt{attempt}.stdout"
+    stderr_file = OUTPUT_DIR / f"suite_attempt{attempt}.stderr"
+    status_file = OUTPUT_DIR / f"suite_attempt{attempt}.status"
+
+    cmd = list(BASE_CMD)
+    if run_id is not None:
+        cmd += ["--resume", str(run_id)]
+
+    previous_latest = latest_run_id()
+    start_time = datetime.datetime.now()
+    status_info = {
+        "attempt": attempt,
+        "run_id": run_id,
+        "start_time": start_time.isoformat(),
+        "command": " ".join(str(c) for c in cmd)
+    }
+    exit_code = None
 
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=SUITE_TIMEOUT,
+            cwd=Path(__file__).parent
+        )
+        exit_code = result.returncode
+        stdout_file.write_text(result.stdout, encoding='utf-8')
+        stderr_file.write_text(result.stderr, encoding='utf-8')
+        status_info["exit_code"] = exit_code
+
+    except subprocess.TimeoutExpired as timeout:
+        status_info["timeout_seconds"] = SUITE_TIMEOUT
+        if timeout.stdout:
+            stdout_file.write_text(str(timeout.stdout), encoding='utf-8')
+        if timeout.stderr:
+            stderr_file.write_text(str(timeout.stderr), encoding='utf-8')
+        safe_print(f"Attempt {attempt}: ⏱ TIMEOUT")
+
+    except Exception as e:
+        import traceback
+        status_info["error"] = str(e)
+        status_info["traceback"] = traceback.format_exc()
+        stderr_file.write_text(status_info["traceback"], encoding='utf-8')
+        safe_print(f"Attempt {attempt}: ⚠ ERROR: {e}")
+
+    end_time = datetime.datetime.now()
+    status_info["end_time"] = end_time.isoformat()
+    status_info["duration_seconds"] = (end_time - start_time).total_seconds()
+
+    # A fresh run creates its run record right away; remember it for resuming
+    if run_id is None:
+        newest = latest_run_id()
+        if newest is not None and newest != previous_latest:
+            run_id = newest
+            RUN_ID_FILE.write_text(str(run_id), encoding='utf-8')
+            status_info["run_id"] = run_id
+
+    if run_id is not None:
+        saved, planned, passed = run_progress(run_id)
+        status_info.update({"saved": saved, "planned": planned, "passed": passed})
+        # Judge FAILs still count as completion (behavioral issue, not crash)
+        completed = planned > 0 and saved >= planned
+        safe_print(f"Attempt {attempt}: run {run_id} has {saved}/{planned} results ({passed} passed)")
+
+    if completed:
+        status_info["status"] = "COMPLETED"
+    elif retry_count < MAX_RETRIES:
+        backoff_time = INITIAL_BACKOFF * (2 ** retry_count)
+        status_info["status"] = "RETRY"
+        safe_print(f"Attempt {attempt}: ✗ incomplete (exit {exit_code}), resuming in {backoff_time}s...")
+        status_file.write_text(json.dumps(status_info, indent=2), encoding='utf-8')
+        time.sleep(backoff_time)
+        retry_count += 1
+        continue
+    else:
+        status_info["status"] = "FAIL"
+        safe_print(f"Attempt {attempt}: ✗ incomplete (exit {exit_code}, exhausted retries)")
+        retry_count += 1
+
+    status_file.write_text(json.dumps(status_info, indent=2), encoding='utf-8')
+
+print()
 print("=" * 60)
-print(f"Done! Results saved to {OUTPUT_DIR}/")
-print(f"Total: {total_tests} test executions")
-print(f"  ✓ Pass: {total_passes}")
-print(f"  ✗ Fail: {total_failures}")
-print(f"  🔄 Retries: {total_retries}")
-print(f"Pass rate: {total_passes}/{total_tests} ({100*total_passes/total_tests if total_tests > 0 else 0:.1f}%)")
+if run_id is None:
+    print("No run was recorded; see the attempt .stderr files.")
+    sys.exit(1)
+
+saved, planned, passed = run_progress(run_id)
+print(f"Done! Results saved to {RESULTS_DB} (run {run_id})")
+print(f"Total: {saved}/{planned} test executions")
+print(f"  ✓ Pass: {passed}")
+print(f"  ✗ Fail: {saved - passed}")
+print(f"  🔄 Restarts: {retry_count if completed else retry_count - 1}")
+print(f"Pass rate: {passed}/{saved} ({100*passed/saved if saved > 0 else 0:.1f}%)")
+
+if completed:
+    # Finished runs start fresh next time
+    RUN_ID_FILE.unlink(missing_ok=True)
+sys.exit(0 if completed else 1)
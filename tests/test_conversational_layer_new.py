@@ -104,6 +104,10 @@ def main() -> int:
             logger.error(f"Query error: {e}", exc_info=True)
             return 1
 
+    # Merge shard databases into one run
+    if args.merge_results:
+        return merge_shard_results(args, test_config, logger)
+
     # List tests if requested
     if test_config.list_tests:
         cases = runner.load_test_cases(test_config)
@@ -153,5 +157,65 @@ def main() -> int:
         return 0
 
 
+def merge_shard_results(args, test_config: config.Config, logger: logging.Logger) -> int:
+    """Merge --shard runs into one run in --results-db (and report on it).
+
+    Args:
+        args: Parsed arguments (merge_results holds DB[:RUN_ID] entries)
+        test_config: Test configuration
+        logger: Logger
+
+    Returns:
+        Exit code
+    """
+    target = results_db.ResultsDB(test_config.results_db)
+    opened = {}
+    try:
+        sources = []
+        for spec in args.merge_results:
+            path, run_id = cli.parse_merge_source(spec)
+            if not path.exists():
+                print(f"ERROR: Shard database not found: {path}", file=sys.stderr)
+                return 1
+            if path.resolve() == test_config.results_db.resolve():
+                db = target
+            else:
+                if path.resolve() not in opened:
+                    opened[path.resolve()] = results_db.ResultsDB(path)
+                db = opened[path.resolve()]
+            if run_id is None:
+                recent = db.get_recent_runs(limit=1)
+                if not recent:
+                    print(f"ERROR: No runs in {path}", file=sys.stderr)
+                    return 1
+                run_id = recent[0]["run_id"]
+            sources.append((db, run_id))
+
+        merged_run_id = target.merge_shard_runs(sources)
+        summary = target.get_run_summary(merged_run_id)
+        print(f"Merged {len(sources)} shards into run {merged_run_id} in {test_config.results_db}")
+        print(f"  Passed: {summary['passed_count']}/{summary['test_count']}")
+
+        if test_config.markdown_report:
+            report_path = markdown_report.generate_markdown_report(
+                db=target,
+                run_id=merged_run_id,
+                output_path=test_config.markdown_report,
+                test_cases_path=test_config.test_cases_path
+            )
+            print(f"Markdown report saved to: {report_path}")
+        return 0
+
+    except ValueError as e:
+        print(f"ERROR: Merge failed: {e}", file=sys.stderr)
+        logger.error(f"Merge error: {e}")
+        return 1
+
+    finally:
+        for db in opened.values():
+            db.close()
+        target.close()
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.cassette import (
+    CassetteMissError,
+    CassetteStore,
+    normalize_request,
+    request_key,
+)
+
+
+def _write_mcp_config(path: Path, log_path: Path) -> Path:
+    path.write_text(json.dumps({
+        "mcpServers": {"gtd-graph-memory": {"env": {"MCP_CALL_LOG": str(log_path)}}}
+    }))
+    return path
+
+
+def test_worker_paths_normalize_to_same_key(tmp_path):
+    prompt_a = tmp_path / "a.md"
+    prompt_b = tmp_path / "b.md"
+    prompt_a.write_text("same prompt")
+    prompt_b.write_text("same prompt")
+
+    first = normalize_request(
+        ["/usr/bin/claude", "--mcp-config", "/x/worker-1/mcp.json", "--system-prompt", str(prompt_a), "hi"],
+        "/tmp/gtd-test-workspace-worker-1",
+    )
+    second = normalize_request(
+        ["claude", "--mcp-config", "/x/worker-2/mcp.json", "--system-prompt", str(prompt_b), "hi"],
+        "/tmp/gtd-test-workspace-worker-2",
+    )
+
+    assert request_key(first) == request_key(second)
+
+
+def test_record_then_replay_serves_takes_in_order(tmp_path):
+    log_path = tmp_path / "mcp-calls.log"
+    mcp_config = _write_mcp_config(tmp_path / "mcp.json", log_path)
+    args = ["claude", "--mcp-config", str(mcp_config), "--print", "hello"]
+
+    recorder = CassetteStore(tmp_path / "cassettes", "record")
+    recorder.record(args, None, subprocess.CompletedProcess(args, 0, "first", ""), "call 1\n", 1.0)
+    recorder.record(args, None, subprocess.CompletedProcess(args, 0, "second", ""), "", 1.0)
+
+    player = CassetteStore(tmp_path / "cassettes", "replay")
+    assert player.replay(args, None).stdout == "first"
+    assert log_path.read_text() == "call 1\n"
+    assert player.replay(args, None).stdout == "second"
+    assert player.replay(args, None).stdout == "second"
+
+
+def test_replay_miss_raises(tmp_path):
+    (tmp_path / "cassettes").mkdir()
+    player = CassetteStore(tmp_path / "cassettes", "replay")
+
+    with pytest.raises(CassetteMissError):
+        player.replay(["claude", "--print", "never recorded"], None)
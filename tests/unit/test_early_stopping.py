@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.early_stopping import EarlyStopper, wilson_interval
+
+
+@pytest.mark.parametrize(
+    "passes, total, expected",
+    [
+        (3, 3, (0.4385, 1.0)),
+        (0, 3, (0.0, 0.5615)),
+        (5, 10, (0.2366, 0.7634)),
+    ],
+)
+def test_wilson_interval_known_values(passes, total, expected):
+    low, high = wilson_interval(passes, total)
+    assert low == pytest.approx(expected[0], abs=1e-4)
+    assert high == pytest.approx(expected[1], abs=1e-4)
+
+
+def test_wilson_interval_without_runs_is_uninformative():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_stable_case_settles_after_min_runs():
+    stopper = EarlyStopper(max_width=0.6, min_runs=3)
+    for _ in range(2):
+        stopper.record("stable", True)
+    assert not stopper.is_settled("stable")
+    stopper.record("stable", True)
+    assert stopper.is_settled("stable")
+
+
+def test_flaky_case_keeps_running():
+    stopper = EarlyStopper(max_width=0.6, min_runs=3)
+    for passed in (True, False, True, False, True):
+        stopper.record("flaky", passed)
+    assert not stopper.is_settled("flaky")
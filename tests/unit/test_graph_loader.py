@@ -0,0 +1,156 @@
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.graph_loader import (
+    FixtureError,
+    McpSessionError,
+    load_fixture,
+    plan_fixture,
+    probe_mcp_server,
+)
+
+
+FAKE_SERVER = textwrap.dedent('''
+    import json, os, sys
+
+    ontology = os.environ.get("HAS_ONTOLOGY") == "1"
+    nodes = 0
+    log = open(os.environ["CALLS"], "a")
+
+    def reply(message_id, result):
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message_id, "result": result}) + "\\n")
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        if message["method"] == "initialize":
+            reply(message["id"], {"protocolVersion": "2025-06-18", "capabilities": {"tools": {}}})
+            continue
+        if message["method"] == "tools/list":
+            reply(message["id"], {"tools": [{"name": "create_node"}, {"name": "get_ontology"}]})
+            continue
+        if message["method"] != "tools/call":
+            continue
+        name, args = message["params"]["name"], message["params"]["arguments"]
+        log.write(json.dumps([name, args]) + "\\n")
+        log.flush()
+        if (name == "create_ontology") == ontology:
+            text = "Ontology already exists" if ontology else "Ontology not found"
+            reply(message["id"], {"content": [{"type": "text", "text": text}], "isError": True})
+            continue
+        ontology = True
+        result = {}
+        if name == "create_node":
+            nodes += 1
+            result = {"node_id": "mem_%d" % nodes}
+        reply(message["id"], {"content": [{"type": "text", "text": json.dumps(result)}], "structuredContent": result})
+''')
+
+
+@pytest.fixture
+def server(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    calls = tmp_path / "calls.log"
+
+    def make_config(has_ontology=False):
+        config = tmp_path / "mcp-config.json"
+        env = {"CALLS": str(calls), "HAS_ONTOLOGY": "1" if has_ontology else "0"}
+        config.write_text(json.dumps({
+            "mcpServers": {"gtd-graph-memory": {"command": sys.executable, "args": [str(script)], "env": env}}
+        }))
+        return config
+
+    def read_calls():
+        return [json.loads(line) for line in calls.read_text().splitlines()]
+
+    return make_config, read_calls
+
+
+FIXTURE = {
+    "contexts": [{"content": "atOffice", "isTrue": False}],
+    "tasks": [
+        {"content": "Website redesign", "isComplete": False, "id": "web"},
+        {"content": "Design new homepage", "depends_on": ["web", "atOffice"]},
+    ],
+}
+
+
+def test_plan_resolves_task_ids_and_content_references():
+    plan = plan_fixture(FIXTURE)
+
+    assert [(node.node_type, node.content) for node in plan.nodes] == [
+        ("Context", "atOffice"),
+        ("Task", "Website redesign"),
+        ("Task", "Design new homepage"),
+    ]
+    assert plan.edges == [(2, 1), (2, 0)]
+    assert plan.nodes[1].names == ["web", "Website redesign"]
+    assert plan.nodes[0].create_request()["properties"] == {"isTrue": False}
+
+
+def test_plan_rejects_unknown_and_duplicate_references():
+    with pytest.raises(FixtureError, match="unknown fixture node 'missing'"):
+        plan_fixture({"tasks": [{"content": "A", "depends_on": ["missing"]}]})
+    with pytest.raises(FixtureError, match="Duplicate"):
+        plan_fixture({"tasks": [{"content": "A", "id": "t"}, {"content": "B", "id": "t"}]})
+
+
+def test_load_writes_nodes_then_connections(server):
+    make_config, read_calls = server
+
+    node_ids = load_fixture(FIXTURE, make_config(has_ontology=True), timeout=10)
+
+    assert node_ids["web"] == node_ids["Website redesign"] == "mem_2"
+    calls = read_calls()
+    assert [name for name, _ in calls] == [
+        "create_ontology", "create_node", "create_node", "create_node",
+        "create_connection", "create_connection",
+    ]
+    assert calls[4][1] == {"type": "DependsOn", "from_node_id": "mem_3", "to_node_id": "mem_2"}
+    assert calls[5][1]["to_node_id"] == "mem_1"
+
+
+def test_load_reports_server_that_cannot_start(tmp_path):
+    config = tmp_path / "mcp-config.json"
+    config.write_text(json.dumps({
+        "mcpServers": {"gtd-graph-memory": {"command": str(tmp_path / "missing-node")}}
+    }))
+
+    with pytest.raises(McpSessionError, match="Could not start"):
+        load_fixture(FIXTURE, config, timeout=5)
+    assert load_fixture({"tasks": []}, config) == {}
+
+
+def test_probe_reports_handshake_tools_and_latency(server):
+    make_config, read_calls = server
+
+    health = probe_mcp_server(make_config(has_ontology=False), timeout=10)
+
+    assert health.healthy and health.error is None
+    assert health.tools == ["create_node", "get_ontology"]
+    assert health.ontology_loaded is False
+    assert set(health.latencies) == {"tools/list", "get_ontology"}
+    assert 0 < health.startup_time < 10
+    assert "2 tools" in health.summary()
+    assert probe_mcp_server(make_config(has_ontology=True), timeout=10).ontology_loaded is True
+
+
+def test_probe_reports_dead_server(tmp_path):
+    config = tmp_path / "mcp-config.json"
+    config.write_text(json.dumps({
+        "mcpServers": {"gtd-graph-memory": {"command": sys.executable, "args": ["-c", "import sys; sys.exit(3)"]}}
+    }))
+
+    health = probe_mcp_server(config, timeout=5)
+
+    assert not health.healthy
+    assert "exited" in health.error or "closed" in health.error
@@ -0,0 +1,130 @@
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer import input_hash, models, runner
+from tests.conversational_layer.config import Config
+from tests.conversational_layer.judge import Verdict
+from tests.conversational_layer.results_db import ResultsDB
+from tests.conversational_layer.user_proxy import ConversationalConfig
+
+
+CASE = {"name": "capture_simple_task", "category": "Capture", "prompt": "Add a task"}
+
+
+@pytest.fixture
+def config(tmp_path):
+    (tmp_path / "fixtures").mkdir()
+    (tmp_path / "fixtures" / "system-prompt-test-overlay.md").write_text("Test mode.")
+    (tmp_path / "prompt.md").write_text("You are a GTD assistant.")
+    (tmp_path / "cases.json").write_text("[]")
+    (tmp_path / "mcp.json").write_text("{}")
+    return Config(
+        system_prompt_path=tmp_path / "prompt.md",
+        test_cases_path=tmp_path / "cases.json",
+        mcp_config_path=tmp_path / "mcp.json",
+        stream_assistant=True,
+    )
+
+
+def case_hash(config, case=CASE):
+    return input_hash.compute_case_hash(case, input_hash.compute_suite_fingerprint(config, "assistant-model"))
+
+
+def result(name, run_number=1, judged=True):
+    verdict = Verdict(effective=True, safe=True, clear=True, reasoning="ok", passed=True) if judged else None
+    return models.TestResult(
+        test_name=name, category="Capture", run_number=run_number,
+        passed=judged, expected_pass=True, actual_pass=judged, reason="", verdict=verdict,
+    )
+
+
+def reuse(db, run_id, jobs, input_hashes):
+    recorded = []
+
+    def record(job, reused):
+        reused.input_hash = input_hashes[job.case["name"]]
+        db.save_test_result(run_id, reused)
+        recorded.append(reused)
+
+    remaining = runner._reuse_unchanged_results(jobs, db, run_id, input_hashes, record)
+    return remaining, recorded
+
+
+def change_prompt(monkeypatch, config):
+    config.system_prompt_path.write_text("You are a terse GTD assistant.")
+    return config, CASE
+
+
+def change_overlay(monkeypatch, config):
+    (config.test_cases_path.parent / "fixtures" / "system-prompt-test-overlay.md").write_text("Test mode, v2.")
+    return config, CASE
+
+
+def change_case(monkeypatch, config):
+    return config, {**CASE, "prompt": "Add a task for tomorrow"}
+
+
+def change_rubric(monkeypatch, config):
+    monkeypatch.setattr(input_hash, "JUDGE_TEMPLATE", input_hash.JUDGE_TEMPLATE + "\nBe strict.")
+    return config, CASE
+
+
+def change_stream_guards(monkeypatch, config):
+    return replace(config, max_tool_calls=config.max_tool_calls + 1), CASE
+
+
+def change_user_proxy_model(monkeypatch, config):
+    monkeypatch.setattr(
+        input_hash, "ConversationalConfig", lambda: ConversationalConfig(user_proxy_model="claude-haiku-4-5")
+    )
+    return config, CASE
+
+
+@pytest.mark.parametrize("change", [
+    change_prompt, change_overlay, change_case, change_rubric, change_stream_guards, change_user_proxy_model,
+])
+def test_changed_inputs_change_the_hash_and_block_reuse(monkeypatch, tmp_path, config, change):
+    before = case_hash(config)
+    db = ResultsDB(tmp_path / "results.db")
+    earlier = db.create_run(config, models.TestSuiteResults())
+    db.save_test_result(earlier, replace(result(CASE["name"]), input_hash=before))
+
+    changed_config, changed_case = change(monkeypatch, config)
+    after = case_hash(changed_config, changed_case)
+    assert after != before
+
+    current = db.create_run(config, models.TestSuiteResults())
+    jobs = [runner.TestJob(sequence=0, run_number=1, index=1, case=changed_case)]
+    remaining, recorded = reuse(db, current, jobs, {CASE["name"]: after})
+    assert remaining == jobs
+    assert recorded == []
+
+
+def test_unchanged_inputs_reuse_only_judged_results(tmp_path, config):
+    cases = [{**CASE, "name": name} for name in ("judged", "crashed")]
+    hashes = {case["name"]: case_hash(config, case) for case in cases}
+    # Hashing is deterministic: a later session computes the same values
+    assert hashes == {case["name"]: case_hash(config, case) for case in cases}
+
+    db = ResultsDB(tmp_path / "results.db")
+    earlier = db.create_run(config, models.TestSuiteResults())
+    judged_id = db.save_test_result(earlier, replace(result("judged"), input_hash=hashes["judged"]))
+    db.save_test_result(earlier, replace(result("crashed", judged=False), input_hash=hashes["crashed"]))
+    # Reuse keeps per-run variance: run 2 has nothing stored yet
+    jobs = [
+        runner.TestJob(sequence=index, run_number=run_number, index=index + 1, case=case)
+        for index, (run_number, case) in enumerate([(1, cases[0]), (1, cases[1]), (2, cases[0])])
+    ]
+
+    current = db.create_run(config, models.TestSuiteResults())
+    remaining, recorded = reuse(db, current, jobs, hashes)
+
+    assert [(job.case["name"], job.run_number) for job in remaining] == [("crashed", 1), ("judged", 2)]
+    assert [(r.test_name, r.source_result_id) for r in recorded] == [("judged", judged_id)]
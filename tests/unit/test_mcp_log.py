@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.mcp_log import McpLogCursor
+
+
+def append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_cursor_reads_only_new_lines(tmp_path):
+    log = tmp_path / "mcp-calls.log"
+    append(log, "old call\n")
+
+    cursor = McpLogCursor(log)
+    assert cursor.read() == ""
+
+    append(log, "turn 1 call\n")
+    assert cursor.advance() == "turn 1 call\n"
+
+    append(log, "turn 2 call\n")
+    assert cursor.read() == "turn 2 call\n"
+    assert cursor.read() == "turn 2 call\n"
+    assert log.read_text() == "old call\nturn 1 call\nturn 2 call\n"
+
+
+def test_missing_log_is_read_from_start_once_created(tmp_path):
+    log = tmp_path / "mcp-calls.log"
+    cursor = McpLogCursor(log)
+    assert cursor.read() == ""
+
+    append(log, "first call\n")
+    assert cursor.read() == "first call\n"
+    assert McpLogCursor(None).read() == ""
+
+
+def test_replaced_or_truncated_log_is_read_from_start(tmp_path):
+    log = tmp_path / "mcp-calls.log"
+    append(log, "a much longer line from an earlier test\n")
+    cursor = McpLogCursor(log)
+
+    log.unlink()
+    append(log, "new\n")
+    assert cursor.read() == "new\n"
+
+    cursor = McpLogCursor(log)
+    log.write_text("x\n")
+    # Same file, now shorter than the cursor: start over rather than skip data
+    assert cursor.read() == "x\n"
@@ -0,0 +1,168 @@
+import json
+import re
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.harness_api.mcp.manager import McpLifecycleManager, McpServerSpec, ServerOutputLog
+from tests.harness_api.mcp.pool import McpServerPool
+
+
+# Graph-memory stand-in: loads its registry at startup and keeps it in memory
+FAKE_SERVER = textwrap.dedent('''
+    import json, os, sys, time
+
+    time.sleep(float(os.environ.get("BOOT_DELAY", "0")))
+    registry = os.path.join(os.environ["BASE_PATH"], "_system", "registry.json")
+    nodes = json.load(open(registry)) if os.path.exists(registry) else []
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        if "id" not in message:
+            continue
+        result = {"capabilities": {}}
+        if message["method"] == "tools/call":
+            if message["params"]["name"] == "create_node":
+                nodes.append("mem_%d" % (len(nodes) + 1))
+                os.makedirs(os.path.dirname(registry), exist_ok=True)
+                # Atomic replace like the real server, so hardlinked snapshots stay intact
+                with open(registry + ".tmp", "w") as f:
+                    json.dump(nodes, f)
+                os.replace(registry + ".tmp", registry)
+            data = {"node_ids": nodes, "pid": os.getpid()}
+            result = {"content": [{"type": "text", "text": json.dumps(data)}], "structuredContent": data}
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\\n")
+        sys.stdout.flush()
+''')
+
+
+@pytest.fixture
+def spec_factory(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+
+    def factory(data_dir, log_path=None, boot_delay=0.0):
+        return McpServerSpec(
+            name="gtd-graph-memory",
+            command=[sys.executable, str(script)],
+            env={"BASE_PATH": str(data_dir), "BOOT_DELAY": str(boot_delay)},
+            log_path=log_path,
+        )
+
+    return factory
+
+
+def test_start_all_waits_for_handshake_not_a_fixed_sleep(spec_factory, tmp_path):
+    specs = [spec_factory(tmp_path / f"d{i}", boot_delay=0.3) for i in range(3)]
+    for i, spec in enumerate(specs):
+        spec.name = f"server-{i}"
+    manager = McpLifecycleManager(specs, ready_timeout=10)
+
+    started = time.monotonic()
+    manager.start_all()
+    elapsed = time.monotonic() - started
+
+    try:
+        # Servers boot in parallel: total is about one boot delay, not three
+        assert 0.3 <= elapsed < 0.9
+        assert manager.processes["server-1"].client.call_tool("query_nodes", {})["node_ids"] == []
+    finally:
+        manager.stop_all()
+
+
+def test_start_all_reports_server_that_never_gets_ready(tmp_path):
+    spec = McpServerSpec(name="broken", command=[sys.executable, "-c", "import sys; sys.exit(2)"])
+    manager = McpLifecycleManager([spec], ready_timeout=5)
+
+    with pytest.raises(RuntimeError, match="broken did not become ready"):
+        manager.start_all()
+    assert manager.processes == {}
+
+
+def test_pool_leases_isolated_servers_and_resets_to_snapshot(spec_factory, tmp_path):
+    snapshot = tmp_path / "snapshots" / "fixture"
+    (snapshot / "_system").mkdir(parents=True)
+    (snapshot / "_system" / "registry.json").write_text(json.dumps(["mem_1"]))
+
+    with McpServerPool(2, tmp_path / "pool", spec_factory=spec_factory, snapshot=snapshot, ready_timeout=10) as pool:
+        first, second = pool.lease(timeout=5), pool.lease(timeout=5)
+        assert first.data_dir != second.data_dir
+        created = first.client.call_tool("create_node", {})
+        assert created["node_ids"] == ["mem_1", "mem_2"]
+        with pytest.raises(RuntimeError, match="No MCP server became free"):
+            pool.lease(timeout=0.05)
+
+        pool.release(first)
+        pool.release(second, reset=False)
+        leases = [pool.lease(timeout=10), pool.lease(timeout=10)]
+        recycled = next(server for server in leases if server.index == first.index)
+
+        # Fresh process, graph back to the snapshot; the snapshot itself is untouched
+        state = recycled.client.call_tool("query_nodes", {})
+        assert state["node_ids"] == ["mem_1"]
+        assert state["pid"] != created["pid"]
+        assert json.loads((snapshot / "_system" / "registry.json").read_text()) == ["mem_1"]
+
+
+def test_server_output_is_drained_into_timestamped_log(tmp_path):
+    # Far more stderr than a pipe buffer holds: an unread PIPE would stall the handshake
+    script = tmp_path / "noisy.py"
+    script.write_text(textwrap.dedent('''
+        import json, sys
+        for i in range(5000):
+            sys.stderr.write("debug line %d %s\\n" % (i, "x" * 60))
+        print("booted")
+        for line in sys.stdin:
+            message = json.loads(line)
+            if "id" in message:
+                print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": {}}), flush=True)
+    '''))
+    spec = McpServerSpec(name="noisy", command=[sys.executable, str(script)], log_path=tmp_path / "logs" / "calls.log")
+    manager = McpLifecycleManager([spec], ready_timeout=10)
+
+    manager.start_all()
+    manager.stop_all()
+
+    lines = (tmp_path / "logs" / "calls.server.log").read_text().splitlines()
+    assert sum("[stderr] debug line" in line for line in lines) == 5000
+    assert any(line.endswith("[stdout] booted") for line in lines)
+    assert " mono=" in lines[0] and lines[0][:4].isdigit()
+
+
+def test_output_log_rotates_at_size_cap(tmp_path):
+    log = ServerOutputLog(tmp_path / "server.log", max_bytes=2000, backup_count=2)
+    for i in range(200):
+        log.write("stderr", f"line {i}")
+    log.close()
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files == ["server.log", "server.log.1", "server.log.2"]
+    assert all((tmp_path / name).stat().st_size <= 2000 for name in files)
+    assert (tmp_path / "server.log").read_text().splitlines()[-1].endswith("[stderr] line 199")
+
+
+def test_output_log_writes_from_several_threads_stay_whole(tmp_path):
+    log = ServerOutputLog(tmp_path / "server.log", max_bytes=4000, backup_count=50)
+
+    def writer(stream_name):
+        for i in range(300):
+            log.write(stream_name, f"{stream_name} line {i} " + "x" * 40)
+
+    threads = [threading.Thread(target=writer, args=(name,)) for name in ("stderr", "stdout", "extra")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+
+    lines = [line for path in tmp_path.iterdir() for line in path.read_text().splitlines()]
+    assert len(lines) == 900
+    assert all(re.fullmatch(r"\S+ mono=\S+ \[(\w+)\] \1 line \d+ x{40}", line) for line in lines)
@@ -0,0 +1,65 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer import runner
+from tests.conversational_layer.config import Config
+
+
+class FakeInstallation:
+    def __init__(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.snapshots = set()
+
+    def create_review_snapshot(self, label):
+        path = self.tmp_path / f"{label}.json"
+        path.write_text("{}")
+        self.snapshots.add(path)
+        return path
+
+    def remove_review_snapshot(self, path):
+        self.snapshots.discard(path)
+
+
+def test_judge_error_fails_only_its_test_and_drops_the_snapshot(monkeypatch, tmp_path):
+    (tmp_path / "mcp.json").write_text("{}")
+    config = Config(
+        system_prompt_path=ROOT / "src" / "conversational-layer" / "system-prompt.md",
+        test_cases_path=ROOT / "tests" / "test_cases_refactored.json",
+        mcp_config_path=tmp_path / "mcp.json",
+        workers=2,
+        pipeline=True,
+    )
+    installation = FakeInstallation(tmp_path)
+
+    @contextmanager
+    def lease():
+        yield SimpleNamespace(config=config, installation=installation)
+
+    def judge(case, assistant_result, review_config):
+        if case["name"] == "broken":
+            raise RuntimeError("judge CLI crashed")
+        return {"pass": True, "reason": "ok"}
+
+    monkeypatch.setattr(runner, "_get_worker_pool", lambda config: SimpleNamespace(lease=lease))
+    monkeypatch.setattr(
+        runner, "run_assistant_phase",
+        lambda case, config, prompts: {"pass": True, "assistant": "done", "session_id": "s"},
+    )
+    monkeypatch.setattr(runner, "run_judge_phase", judge)
+    monkeypatch.setattr(runner, "run_interrogation_phase", lambda *args: None)
+    jobs = [
+        runner.TestJob(sequence=index, run_number=1, index=index + 1, case={"name": name, "category": "Capture"})
+        for index, name in enumerate(["ok", "broken", "after"])
+    ]
+
+    results = {job.case["name"]: result for job, result in runner._run_jobs_pipelined(jobs, config, [])}
+
+    assert [results[name].passed for name in ("ok", "broken", "after")] == [True, False, True]
+    assert results["broken"].reason == "Judge error: judge CLI crashed"
+    assert installation.snapshots == set()
@@ -0,0 +1,87 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.rate_limit import RateLimiter
+from tests.conversational_layer.timing import PhaseTimer, activate_timer, timed_phase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_acquire_is_free_under_quota():
+    clock = FakeClock()
+    limiter = RateLimiter("m", requests_per_minute=60, max_concurrent=3, clock=clock)
+
+    assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.in_flight == 3
+
+
+def test_concurrency_cap_blocks_until_release():
+    clock = FakeClock()
+    limiter = RateLimiter("m", requests_per_minute=0, max_concurrent=1, clock=clock)
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() > 0
+    limiter.release()
+    assert limiter.try_acquire() == 0.0
+
+
+def test_bucket_refills_at_configured_rate():
+    clock = FakeClock()
+    limiter = RateLimiter("m", requests_per_minute=60, max_concurrent=0, clock=clock)
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == pytest.approx(1.0)
+    clock.now += 1.0
+    assert limiter.try_acquire() == 0.0
+
+
+def test_rate_limit_error_stretches_back_then_recovers():
+    clock = FakeClock()
+    limiter = RateLimiter("m", requests_per_minute=60, max_concurrent=0, clock=clock)
+
+    limiter.report_rate_limit()
+    assert limiter.current_rate == pytest.approx(30.0)
+    assert limiter.try_acquire() == pytest.approx(5.0)
+
+    clock.now += 5.0
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == pytest.approx(2.0)
+
+    for _ in range(10):
+        limiter.report_success()
+    assert limiter.current_rate == pytest.approx(60.0)
+
+
+def test_slot_wait_is_timed_apart_from_the_calling_phase(monkeypatch):
+    clock = FakeClock()
+    limiter = RateLimiter("m", requests_per_minute=60, max_concurrent=0, clock=clock)
+    timer = PhaseTimer(clock)
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    limiter.report_rate_limit()
+
+    with activate_timer(timer):
+        with timed_phase("assistant"):
+            clock.now += 1
+            asyncio.run(limiter.acquire_async())
+            clock.now += 2
+
+    # 4s of the 5s cooldown were left when the call queued
+    timings = [(t.phase, t.duration, t.clean) for t in timer.timings()]
+    assert timings == [("assistant", 3.0, True), ("rate_limit", 4.0, True)]
@@ -0,0 +1,62 @@
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.config import Config
+from tests.conversational_layer import models
+from tests.conversational_layer.results_db import ResultsDB
+
+
+def result(name, passed):
+    return models.TestResult(
+        test_name=name, category="Capture", run_number=1,
+        passed=passed, expected_pass=True, actual_pass=passed, reason="",
+    )
+
+
+def test_run_totals_count_only_the_latest_result_per_pair(tmp_path):
+    (tmp_path / "mcp.json").write_text("{}")
+    config = Config(
+        system_prompt_path=ROOT / "src" / "conversational-layer" / "system-prompt.md",
+        test_cases_path=ROOT / "tests" / "test_cases_refactored.json",
+        mcp_config_path=tmp_path / "mcp.json",
+    )
+    db = ResultsDB(tmp_path / "results.db")
+    run_id = db.create_run(config, models.TestSuiteResults())
+
+    # "a" failed, then passed when the resumed run executed it again
+    for saved in (result("a", False), result("b", True), result("a", True)):
+        db.save_test_result(run_id, saved)
+    db.update_run_totals(run_id, 12.0)
+
+    row = db.conn.execute("SELECT passed_count, failed_count FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    assert tuple(row) == (2, 0)
+    assert sorted((r.test_name, r.passed) for r in db.get_completed_results(run_id)) == [("a", True), ("b", True)]
+
+
+def test_run_totals_replace_the_planned_count_when_runs_stop_early(tmp_path):
+    (tmp_path / "mcp.json").write_text("{}")
+    config = Config(
+        system_prompt_path=ROOT / "src" / "conversational-layer" / "system-prompt.md",
+        test_cases_path=ROOT / "tests" / "test_cases_refactored.json",
+        mcp_config_path=tmp_path / "mcp.json",
+        runs=3,
+        adaptive_runs=True,
+    )
+    db = ResultsDB(tmp_path / "results.db")
+    # Two tests planned for three runs each
+    run_id = db.create_run(config, models.TestSuiteResults(total=6))
+
+    # "a" was stable after two runs, so its third run was skipped
+    for run_number, passed in ((1, True), (2, True)):
+        db.save_test_result(run_id, replace(result("a", passed), run_number=run_number))
+    for run_number, passed in ((1, True), (2, False), (3, False)):
+        db.save_test_result(run_id, replace(result("b", passed), run_number=run_number))
+    db.update_run_totals(run_id, 30.0)
+
+    summary = db.get_run_summary(run_id)
+    assert (summary["test_count"], summary["passed_count"], summary["failed_count"]) == (5, 3, 2)
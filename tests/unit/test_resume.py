@@ -0,0 +1,58 @@
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer import models, runner
+from tests.conversational_layer.config import Config
+from tests.conversational_layer.judge import Verdict
+from tests.conversational_layer.results_db import ResultsDB
+
+
+def result(name, verdict=None):
+    return models.TestResult(
+        test_name=name, category="Capture", run_number=1,
+        passed=verdict is not None, expected_pass=True, actual_pass=verdict is not None,
+        reason="", verdict=verdict,
+    )
+
+
+def judged(name):
+    return result(name, Verdict(effective=True, safe=True, clear=True, reasoning="ok", passed=True))
+
+
+def test_resume_skips_judged_results_and_reruns_infrastructure_failures(monkeypatch, tmp_path):
+    cases = [{"name": name, "category": "Capture", "prompt": "hi"} for name in ("judged", "crashed", "unsaved")]
+    (tmp_path / "cases.json").write_text(json.dumps(cases))
+    (tmp_path / "mcp.json").write_text("{}")
+    config = Config(
+        system_prompt_path=ROOT / "src" / "conversational-layer" / "system-prompt.md",
+        test_cases_path=tmp_path / "cases.json",
+        mcp_config_path=tmp_path / "mcp.json",
+        results_db=tmp_path / "results.db",
+    )
+
+    # The interrupted session judged one case; the assistant CLI died on another
+    db = ResultsDB(config.results_db)
+    run_id = db.create_run(config, models.TestSuiteResults(total=3))
+    db.save_test_result(run_id, judged("judged"))
+    db.save_test_result(run_id, result("crashed"))
+    db.close()
+
+    executed = []
+
+    def run_jobs(jobs, config, append_prompts, record):
+        for job in jobs:
+            executed.append(job.case["name"])
+            record(job, judged(job.case["name"]))
+
+    monkeypatch.setattr(runner, "_run_jobs", run_jobs)
+    suite = runner.run_test_suite(replace(config, resume_run_id=run_id))
+
+    assert executed == ["crashed", "unsaved"]
+    assert [r.test_name for r in suite.results] == ["judged", "crashed", "unsaved"]
+    assert (suite.total, suite.passed) == (3, 3)
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer import runner
+from tests.conversational_layer.config import Config
+from tests.conversational_layer.scheduling import assign_shards, build_case_stats, order_items
+
+CASES = [
+    {"name": "quick", "prompt": "a"},
+    {"name": "slow", "prompt": "b"},
+    {"name": "flaky", "prompt": "c"},
+    {"name": "new_conversation", "prompt": "d", "conversational": {"enabled": True}},
+]
+HISTORY = {
+    "quick": [(10.0, True)] * 4,
+    "slow": [(200.0, True)] * 4,
+    "flaky": [(20.0, True), (20.0, False), (20.0, True), (20.0, False)],
+}
+
+
+def names(cases):
+    return [case["name"] for case in cases]
+
+
+def test_longest_first_estimates_cases_without_history():
+    stats = build_case_stats(CASES, HISTORY)
+
+    assert stats["flaky"].instability == 0.25
+    assert stats["new_conversation"].samples == 0
+    assert names(order_items(CASES, lambda case: case, stats, "longest-first")) == [
+        "slow", "new_conversation", "flaky", "quick"
+    ]
+
+
+def test_flaky_first_then_longest():
+    stats = build_case_stats(CASES, HISTORY)
+
+    assert names(order_items(CASES, lambda case: case, stats, "flaky-first")) == [
+        "flaky", "slow", "new_conversation", "quick"
+    ]
+
+
+def test_file_order_is_unchanged():
+    assert names(order_items(CASES, lambda case: case, {}, "file")) == names(CASES)
+
+
+def test_shards_are_balanced_and_cover_every_job_once():
+    stats = build_case_stats(CASES, HISTORY)
+    jobs = [(case["name"], run) for run in (1, 2) for case in CASES]
+
+    shards = assign_shards(jobs, lambda job: job, stats, 3)
+
+    assert sorted(job for shard in shards for job in shard) == sorted(jobs)
+    assert shards == assign_shards(list(jobs), lambda job: job, stats, 3)
+    assert [("slow", 1)] == shards[0] and [("slow", 2)] == shards[1]
+
+
+def test_sequential_cleanup_and_delays_follow_execution_order(monkeypatch, tmp_path):
+    events = []
+    monkeypatch.setattr(runner, "run_single_test", lambda case, *args: events.append(case["name"]))
+    monkeypatch.setattr(runner, "clean_graph_state", lambda config: events.append("clean") or True)
+    monkeypatch.setattr(runner.time, "sleep", lambda seconds: events.append(f"sleep {seconds:g}"))
+    (tmp_path / "mcp.json").write_text("{}")
+    config = Config(
+        system_prompt_path=ROOT / "src" / "conversational-layer" / "system-prompt.md",
+        test_cases_path=ROOT / "tests" / "test_cases_refactored.json",
+        mcp_config_path=tmp_path / "mcp.json",
+        runs=2,
+        inter_test_delay=1,
+        inter_run_delay=5,
+        clean_between_tests=True,
+    )
+    # Reordered and filtered: the file-order last case ("c", index 3) runs first
+    jobs = [
+        runner.TestJob(sequence=2, run_number=1, index=3, case={"name": "c"}),
+        runner.TestJob(sequence=0, run_number=1, index=1, case={"name": "a"}),
+        runner.TestJob(sequence=5, run_number=2, index=3, case={"name": "c"}),
+    ]
+
+    for _ in runner._run_jobs_sequential(jobs, config, []):
+        pass
+
+    assert events == [
+        "clean",
+        "c", "sleep 1", "clean",
+        "a", "sleep 5", "clean",
+        "c",
+    ]
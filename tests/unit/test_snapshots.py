@@ -0,0 +1,122 @@
+import json
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer import snapshots
+from tests.conversational_layer.snapshots import FixtureSnapshotStore
+
+
+# Graph-memory stand-in that persists nodes under BASE_PATH like the real server
+FAKE_SERVER = textwrap.dedent('''
+    import json, os, sys
+
+    base = os.environ["BASE_PATH"]
+    os.makedirs(os.path.join(base, "_system"), exist_ok=True)
+    with open(os.environ["BUILDS"], "a") as f:
+        f.write("build\\n")
+    nodes = []
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        if "id" not in message:
+            continue
+        result = {"capabilities": {}}
+        if message["method"] == "tools/call":
+            params = message["params"]
+            data = {}
+            if params["name"] == "create_node":
+                node_id = "mem_%d" % (len(nodes) + 1)
+                nodes.append(node_id)
+                os.makedirs(os.path.join(base, "_content", "nodes"), exist_ok=True)
+                with open(os.path.join(base, "_content", "nodes", node_id + ".md"), "w") as f:
+                    f.write(params["arguments"]["content"])
+                with open(os.path.join(base, "_system", "registry.json"), "w") as f:
+                    json.dump(nodes, f)
+                data = {"node_id": node_id}
+            result = {"content": [{"type": "text", "text": json.dumps(data)}], "structuredContent": data}
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\\n")
+        sys.stdout.flush()
+''')
+
+FIXTURE = {"tasks": [{"content": "File quarterly taxes", "isComplete": False}]}
+
+
+@pytest.fixture
+def env(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    builds = tmp_path / "builds.log"
+    config = tmp_path / "mcp-config.json"
+    config.write_text(json.dumps({"mcpServers": {"gtd-graph-memory": {
+        "command": sys.executable,
+        "args": [str(script)],
+        "env": {"BASE_PATH": str(tmp_path / "unused"), "BUILDS": str(builds)},
+    }}}))
+    store = FixtureSnapshotStore(tmp_path / "snapshots", build_fingerprint="build-1")
+    return store, config, builds
+
+
+def test_key_depends_on_fixture_and_build(tmp_path):
+    store = FixtureSnapshotStore(tmp_path, build_fingerprint="build-1")
+    rebuilt = FixtureSnapshotStore(tmp_path, build_fingerprint="build-2")
+    reordered = {"tasks": [{"isComplete": False, "content": "File quarterly taxes"}]}
+
+    assert store.key(FIXTURE) == store.key(reordered)
+    assert store.key(FIXTURE) != store.key({"tasks": []})
+    assert store.key(FIXTURE) != rebuilt.key(FIXTURE)
+
+
+def test_snapshot_is_built_once_and_hardlinked(env, tmp_path):
+    store, config, builds = env
+    graph_a, graph_b = tmp_path / "worker-1", tmp_path / "worker-2"
+    (graph_a / "_system").mkdir(parents=True)
+    (graph_a / "_system" / "stale.json").write_text("{}")
+
+    snapshot = store.restore(FIXTURE, graph_a, config, timeout=10)
+    store.restore(FIXTURE, graph_b, config, timeout=10)
+
+    assert builds.read_text().count("build") == 1
+    assert not (graph_a / "_system" / "stale.json").exists()
+    node = graph_b / "_content" / "nodes" / "mem_1.md"
+    assert node.read_text() == "File quarterly taxes"
+    assert os.stat(node).st_ino == os.stat(snapshot / "_content" / "nodes" / "mem_1.md").st_ino
+    assert store.method == "hardlink"
+    assert not [path for path in store.directory.iterdir() if path.name.startswith(".build-")]
+
+
+def test_replacing_a_restored_file_leaves_snapshot_intact(env, tmp_path):
+    store, config, _ = env
+    graph = tmp_path / "worker-1"
+    snapshot = store.restore(FIXTURE, graph, config, timeout=10)
+
+    # The graph-memory server writes a temp file and renames it into place
+    registry = graph / "_system" / "registry.json"
+    temp = registry.with_name(".registry.json.tmp")
+    temp.write_text('["mem_1", "mem_2"]')
+    os.replace(temp, registry)
+
+    assert json.loads((snapshot / "_system" / "registry.json").read_text()) == ["mem_1"]
+    assert not os.stat(snapshot / "_system" / "registry.json").st_mode & 0o222
+
+
+def test_falls_back_to_copy_when_links_fail(env, tmp_path, monkeypatch):
+    store, config, _ = env
+
+    def refuse(source, target):
+        raise OSError("cross-device link")
+
+    monkeypatch.setitem(snapshots._CLONERS, "hardlink", refuse)
+    monkeypatch.setitem(snapshots._CLONERS, "reflink", refuse)
+    snapshot = store.restore(FIXTURE, tmp_path / "worker-1", config, timeout=10)
+
+    copied = tmp_path / "worker-1" / "_system" / "registry.json"
+    assert store.method == "copy"
+    assert os.stat(copied).st_ino != os.stat(snapshot / "_system" / "registry.json").st_ino
@@ -0,0 +1,273 @@
+import asyncio
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.harness_api.adapters.base import ToolDefinition
+from tests.harness_api.mcp.async_client import AsyncMcpClient
+from tests.harness_api.mcp.cli_bridge import McpCliBridge
+from tests.harness_api.mcp.manager import McpServerSpec
+from tests.harness_api.mcp.stdio_client import McpStdioClient, McpStdioError, McpToolError
+from tests.harness_api.mcp.tool_router import ToolRouter
+
+
+FAKE_SERVER = textwrap.dedent('''
+    import json, sys
+
+    initialized = False
+    nodes = 0
+    held = []
+    cancelled = []
+
+    def reply(message_id, result):
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message_id, "result": result}) + "\\n")
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        method = message["method"]
+        if method == "initialize":
+            reply(message["id"], {"protocolVersion": message["params"]["protocolVersion"], "capabilities": {"tools": {}}})
+        elif method == "notifications/initialized":
+            initialized = True
+            sys.stdout.write(json.dumps({"jsonrpc": "2.0", "method": "notifications/message", "params": {}}) + "\\n")
+        elif method == "notifications/cancelled":
+            cancelled.append(message["params"]["requestId"])
+        elif method == "tools/list":
+            reply(message["id"], {"tools": [{"name": "create_node"}]})
+        elif method == "tools/call" and not initialized:
+            sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32600, "message": "not initialized"}}) + "\\n")
+            sys.stdout.flush()
+        elif message["params"]["name"] == "create_node":
+            nodes += 1
+            result = {"node_id": "mem_%d" % nodes}
+            reply(message["id"], {"content": [{"type": "text", "text": json.dumps(result)}], "structuredContent": result})
+        elif message["params"]["name"] == "delete_node":
+            reply(message["id"], {"content": [{"type": "text", "text": "delete_node completed successfully"}]})
+        elif message["params"]["name"] == "hold":
+            held.append(message["id"])
+        elif message["params"]["name"] == "release":
+            for held_id in held:
+                reply(held_id, {"content": [{"type": "text", "text": "released"}]})
+            held = []
+            reply(message["id"], {"content": [{"type": "text", "text": json.dumps(cancelled)}], "structuredContent": {"cancelled": cancelled}})
+        elif message["params"]["name"] == "exit":
+            sys.exit(0)
+        else:
+            reply(message["id"], {"content": [{"type": "text", "text": "Unknown tool"}], "isError": True})
+''')
+
+
+@pytest.fixture
+def client(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    process = subprocess.Popen(
+        [sys.executable, str(script)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    client = McpStdioClient(process, timeout=10)
+    yield client
+    client.close()
+    process.wait(timeout=10)
+
+
+def test_handshake_then_tool_calls_share_one_process(client):
+    with pytest.raises(McpStdioError, match="not initialized"):
+        client.call_tool("create_node", {})
+
+    assert client.initialize()["capabilities"] == {"tools": {}}
+    assert client.list_tools() == [{"name": "create_node"}]
+    assert client.call_tool("create_node", {"content": "A"}) == {"node_id": "mem_1"}
+    assert client.call_tool("mcp__gtd-graph-memory__create_node", {}) == {"node_id": "mem_2"}
+    assert client.call_tool("delete_node", {"node_id": "mem_1"}) is None
+
+
+def test_tool_errors_and_server_exit_raise(client):
+    client.initialize()
+
+    with pytest.raises(McpToolError, match="Unknown tool"):
+        client.call_tool("missing", {})
+    with pytest.raises(McpStdioError, match="closed stdout"):
+        client.call_tool("exit", {})
+
+
+def test_requests_pipeline_and_resolve_out_of_order(client):
+    client.initialize()
+    held = client.send_request("tools/call", {"name": "hold", "arguments": {}})
+
+    # The held request stays pending while later calls on the same pipe complete
+    assert client.call_tool("create_node", {}) == {"node_id": "mem_1"}
+    assert not held.done()
+    client.call_tool("release", {})
+    assert held.result(timeout=10)["content"][0]["text"] == "released"
+    assert client.pending_count() == 0
+
+
+def test_timeout_and_cancel_abandon_requests(client):
+    client.initialize()
+
+    with pytest.raises(McpStdioError, match="timed out on tools/call"):
+        client.call_tool("hold", {}, timeout=0.05)
+    cancelled = client.send_request("tools/call", {"name": "hold", "arguments": {}})
+    assert cancelled.cancel()
+    assert client.pending_count() == 0
+
+    # Late responses for abandoned requests are dropped; the server was told to stop
+    assert client.call_tool("release", {}) == {"cancelled": [2, 3]}
+    assert client.pending_count() == 0
+
+
+def test_server_exit_fails_every_pending_request(client):
+    client.initialize()
+    held = client.send_request("tools/call", {"name": "hold", "arguments": {}})
+
+    with pytest.raises(McpStdioError, match="closed stdout"):
+        client.call_tool("exit", {})
+    with pytest.raises(McpStdioError, match="closed stdout"):
+        held.result(timeout=10)
+    with pytest.raises(McpStdioError, match="closed stdout"):
+        client.send_request("tools/list", {})
+
+
+def test_async_client_multiplexes_concurrent_calls(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    spec = McpServerSpec(name="gtd-graph-memory", command=[sys.executable, str(script)])
+
+    async def scenario():
+        client = await AsyncMcpClient.spawn(spec, timeout=10, max_in_flight=4)
+        try:
+            held = asyncio.create_task(client.request("tools/call", {"name": "hold", "arguments": {}}))
+            results = await asyncio.gather(*(client.call_tool("create_node", {}) for _ in range(20)))
+            assert sorted(int(r["node_id"][4:]) for r in results) == list(range(1, 21))
+            assert not held.done()
+
+            with pytest.raises(McpStdioError, match="timed out"):
+                await client.call_tool("hold", {}, timeout=0.05)
+            released = await client.call_tool("release", {})
+            assert (await held)["content"][0]["text"] == "released"
+            assert released == {"cancelled": [23]}
+            assert client.pending_count() == 0
+
+            with pytest.raises(McpStdioError, match="closed stdout"):
+                await client.call_tool("exit", {})
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_router_execute_async_prefers_async_client(tmp_path):
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    spec = McpServerSpec(name="gtd-graph-memory", command=[sys.executable, str(script)])
+    router = ToolRouter()
+    router.register(
+        ToolDefinition(name="mcp__mcp-logs__get_recent", description="Recent MCP calls", input_schema={}),
+        lambda args: ["create_node"],
+    )
+
+    async def scenario():
+        client = await AsyncMcpClient.spawn(spec, timeout=10)
+        try:
+            router.attach_async_mcp_client(client)
+            created = await router.execute_async("mcp__gtd-graph-memory__create_node", {"content": "A"})
+            logs = await router.execute_async("mcp__mcp-logs__get_recent", {})
+        finally:
+            await client.close()
+        return created, logs
+
+    created, logs = asyncio.run(scenario())
+
+    assert created.output == {"node_id": "mem_1"}
+    assert logs.output == ["create_node"]
+
+
+def test_cli_bridge_uses_tool_runner_flags(tmp_path):
+    runner = tmp_path / "tool_runner.mjs"
+    runner.write_text("")
+    bridge = McpCliBridge(cli_path=runner)
+
+    command = bridge._build_command("mcp__gtd-graph-memory__query_nodes", {"type": "Task"})
+
+    assert command[2:] == ["--tool", "query_nodes", "--input", json.dumps({"type": "Task"})]
+
+
+def test_batch_keeps_order_and_per_call_errors(client):
+    client.initialize()
+    writes = []
+    write = client._write
+    client._write = lambda text: (writes.append(text.count("\n")), write(text))
+
+    results = client.call_tools_batch([
+        ("mcp__gtd-graph-memory__query_nodes", {}),
+        ("get_node", {"node_id": "mem_9"}),
+        ("create_node", {"content": "A"}),
+        ("create_node", {"content": "B"}),
+    ])
+
+    assert [result.name for result in results] == [
+        "mcp__gtd-graph-memory__query_nodes", "get_node", "create_node", "create_node",
+    ]
+    assert "Unknown tool" in results[0].error and "Unknown tool" in results[1].error
+    assert [result.output for result in results[2:]] == [{"node_id": "mem_1"}, {"node_id": "mem_2"}]
+    # Read-only calls share one write; each write call waits for the previous one
+    assert writes == [2, 1, 1]
+
+
+def test_router_execute_many_batches_per_client(client):
+    client.initialize()
+    router = ToolRouter()
+    router.attach_mcp_client(client)
+    router.register(
+        ToolDefinition(name="mcp__mcp-logs__get_recent", description="Recent MCP calls", input_schema={}),
+        lambda args: 1 / 0,
+    )
+    batches = []
+    batch = client.call_tools_batch
+    client.call_tools_batch = lambda calls: (batches.append(len(calls)), batch(calls))[1]
+
+    results = router.execute_many([
+        ("mcp__gtd-graph-memory__create_node", {"content": "A"}),
+        ("mcp__gtd-graph-memory__delete_node", {"node_id": "mem_1"}),
+        ("mcp__mcp-logs__get_recent", {}),
+        ("mcp__gtd-graph-memory__create_node", {"content": "B"}),
+    ])
+
+    assert batches == [2, 1]
+    assert [(result.output, result.error) for result in results] == [
+        ({"node_id": "mem_1"}, None),
+        (None, None),
+        (None, "division by zero"),
+        ({"node_id": "mem_2"}, None),
+    ]
+
+
+def test_cli_bridge_runs_batch_in_one_process(tmp_path):
+    runner = tmp_path / "tool_runner.mjs"
+    runner.write_text(textwrap.dedent('''
+        const chunks = [];
+        for await (const chunk of process.stdin) chunks.push(chunk);
+        const calls = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+        const results = calls.map((call) =>
+          call.tool === 'boom' ? { ok: false, error: 'Error: boom' } : { ok: true, result: { tool: call.tool, argv: process.argv.slice(2) } }
+        );
+        process.stdout.write(JSON.stringify({ ok: true, results }) + '\\n');
+    '''))
+    bridge = McpCliBridge(cli_path=runner, timeout=30)
+
+    results = bridge.run_batch([("mcp__gtd-graph-memory__get_node", {"node_id": "mem_1"}), ("boom", {})])
+
+    assert results[0].output == {"tool": "get_node", "argv": ["--batch", "-"]}
+    assert results[1].output is None and "boom" in results[1].error
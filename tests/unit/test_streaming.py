@@ -0,0 +1,113 @@
+import asyncio
+import json
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.claude_exec import run_claude_stream, run_claude_stream_async
+from tests.conversational_layer.rate_limit import configure_rate_limits, get_rate_limiter
+from tests.conversational_layer.streaming import StreamLimits, StreamMonitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def tool_use(call_id, name="create_node", tool_input=None):
+    return json.dumps({"type": "assistant", "message": {"content": [
+        {"type": "tool_use", "id": call_id, "name": name, "input": tool_input or {"id": call_id}}
+    ]}})
+
+
+def tool_result(call_id, is_error=False):
+    return json.dumps({"type": "user", "message": {"content": [
+        {"type": "tool_result", "tool_use_id": call_id, "content": "", "is_error": is_error}
+    ]}})
+
+
+def test_clean_session_keeps_result_payload():
+    monitor = StreamMonitor(StreamLimits())
+
+    assert monitor.feed_line(json.dumps({"type": "system", "subtype": "init", "session_id": "s1"})) is None
+    assert monitor.feed_line(tool_use("a")) is None
+    assert monitor.feed_line(tool_result("a")) is None
+    assert monitor.feed_line(json.dumps({"type": "result", "result": "done", "session_id": "s1"})) is None
+
+    assert monitor.result_payload["result"] == "done"
+    progress = monitor.progress()
+    assert progress["session_id"] == "s1"
+    assert progress["tool_calls"] == 1
+    assert progress["finished"] is True
+
+
+def test_identical_calls_abort_as_loop():
+    monitor = StreamMonitor(StreamLimits(max_identical_calls=3))
+
+    assert monitor.feed_line(tool_use("a", tool_input={"q": 1})) is None
+    assert monitor.feed_line(tool_use("b", tool_input={"q": 1})) is None
+    assert "loop" in monitor.feed_line(tool_use("c", tool_input={"q": 1}))
+
+
+def test_consecutive_tool_errors_abort_but_success_resets():
+    monitor = StreamMonitor(StreamLimits(max_tool_errors=2))
+
+    assert monitor.feed_line(tool_result("a", is_error=True)) is None
+    assert monitor.feed_line(tool_result("b")) is None
+    assert monitor.feed_line(tool_result("c", is_error=True)) is None
+    assert "consecutive tool errors" in monitor.feed_line(tool_result("d", is_error=True))
+
+
+def test_tool_call_budget():
+    monitor = StreamMonitor(StreamLimits(max_tool_calls=2))
+
+    assert monitor.feed_line(tool_use("a")) is None
+    assert monitor.feed_line(tool_use("b")) is None
+    assert "budget" in monitor.feed_line(tool_use("c"))
+
+
+def test_idle_time_resets_on_every_line():
+    clock = FakeClock()
+    monitor = StreamMonitor(StreamLimits(), clock=clock)
+
+    clock.now = 30.0
+    assert monitor.idle_seconds() == 30.0
+    monitor.feed_line("not json")
+    assert monitor.idle_seconds() == 0.0
+
+
+def test_time_queued_for_a_slot_is_not_inactivity(tmp_path):
+    script = tmp_path / "cli.py"
+    script.write_text(textwrap.dedent('''
+        import json
+        print(json.dumps({"type": "result", "result": "done", "session_id": "s1"}), flush=True)
+    '''))
+    args = [sys.executable, str(script), "--model", "queued"]
+    configure_rate_limits(requests_per_minute=0, max_concurrent=1)
+    limiter = get_rate_limiter("queued")
+
+    def hold_slot():
+        # Another worker keeps the only slot for longer than both limits
+        limiter.acquire()
+        threading.Timer(0.6, limiter.release).start()
+
+    try:
+        hold_slot()
+        monitor = StreamMonitor(StreamLimits(inactivity_timeout=0.3))
+        result = run_claude_stream(args, monitor, timeout=0.5)
+        assert json.loads(result.stdout)["result"] == "done"
+
+        hold_slot()
+        monitor = StreamMonitor(StreamLimits(inactivity_timeout=0.3))
+        result = asyncio.run(run_claude_stream_async(args, monitor, timeout=0.5))
+        assert json.loads(result.stdout)["result"] == "done"
+    finally:
+        configure_rate_limits()
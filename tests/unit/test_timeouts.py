@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.timeouts import AdaptiveTimeouts, TimeoutPolicy, percentile
+
+
+def test_percentile_interpolates():
+    assert percentile([10.0], 0.99) == 10.0
+    assert percentile([0.0, 10.0], 0.5) == pytest.approx(5.0)
+    assert percentile([1.0, 2.0, 3.0, 4.0, 100.0], 1.0) == 100.0
+
+
+def test_learned_timeout_is_clamped_between_floor_and_static():
+    history = {
+        ("fast", "assistant"): [20.0] * 10,
+        ("tiny", "assistant"): [1.0] * 10,
+        ("slow", "assistant"): [500.0] * 10,
+    }
+    timeouts = AdaptiveTimeouts(history, TimeoutPolicy(factor=2.0, floor=30.0, min_samples=5))
+
+    assert timeouts.timeout_for("fast", "assistant", 600.0) == pytest.approx(40.0)
+    assert timeouts.timeout_for("tiny", "assistant", 600.0) == 30.0
+    assert timeouts.timeout_for("slow", "assistant", 600.0) == 600.0
+
+
+def test_static_timeout_without_enough_history():
+    timeouts = AdaptiveTimeouts({("new", "judge"): [5.0, 5.0]}, TimeoutPolicy(min_samples=5))
+
+    assert timeouts.timeout_for("new", "judge", 120.0) == 120.0
+    assert timeouts.timeout_for("unknown", "judge", 120.0) == 120.0
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.timing import (
+    PhaseTimer,
+    activate_timer,
+    format_breakdown_table,
+    phase_breakdown,
+    timed_phase,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_nested_phases_are_exclusive():
+    clock = FakeClock()
+    timer = PhaseTimer(clock)
+
+    with activate_timer(timer):
+        with timed_phase("assistant"):
+            clock.now += 10
+            with timed_phase("user_proxy"):
+                clock.now += 3
+            clock.now += 2
+            with timed_phase("user_proxy"):
+                clock.now += 1
+
+    timings = {t.phase: t for t in timer.timings()}
+    assert timings["assistant"].duration == pytest.approx(12.0)
+    assert timings["user_proxy"].duration == pytest.approx(4.0)
+    assert all(t.clean for t in timings.values())
+
+
+def test_backoff_marks_enclosing_phase_unclean():
+    clock = FakeClock()
+    timer = PhaseTimer(clock)
+
+    with activate_timer(timer):
+        with timed_phase("judge"):
+            clock.now += 5
+            with timed_phase("backoff"):
+                clock.now += 30
+            clock.now += 5
+        with timed_phase("interrogation"):
+            clock.now += 4
+        timer.mark_failed("interrogation")
+
+    timings = [(t.phase, t.duration, t.clean) for t in timer.timings()]
+    assert timings == [("judge", 10.0, False), ("interrogation", 4.0, False), ("backoff", 30.0, True)]
+
+
+def test_timed_phase_without_timer_is_noop():
+    with timed_phase("assistant"):
+        pass
+
+
+def test_breakdown_table():
+    rows = [("Capture", "assistant", float(d)) for d in range(1, 21)] + [("Query", "judge", 2.0)]
+    breakdown = phase_breakdown(rows)
+
+    assert breakdown["Capture"]["assistant"]["mean"] == pytest.approx(10.5)
+    assert breakdown["Capture"]["assistant"]["p95"] == 19.0
+    assert breakdown["Query"]["judge"]["count"] == 1
+
+    table = format_breakdown_table(breakdown)
+    assert table[0] == "| Category | assistant | judge |"
+    assert table[2] == "| Capture | 10.5 / 19.0 | - |"
+    assert format_breakdown_table({}) == []
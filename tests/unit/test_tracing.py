@@ -0,0 +1,88 @@
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer import tracing
+from tests.conversational_layer.tracing import configure_tracing, record_span, span, write_trace
+
+
+@pytest.fixture
+def tracer():
+    tracer = configure_tracing(True)
+    yield tracer
+    configure_tracing(False)
+
+
+def spans_by_name(tracer):
+    return {event["name"]: event for event in tracer.events() if event["ph"] == "X"}
+
+
+def test_disabled_tracing_returns_shared_noop():
+    configure_tracing(False)
+    with span("anything", "test", track="t") as traced:
+        traced.set(ignored=True)
+    assert span("other", "phase") is tracing._NULL_SPAN
+    assert write_trace(Path("unused.json")) is None
+
+
+def test_children_inherit_track_and_parent(tracer):
+    with span("case run 1", "test", track="case run 1") as root:
+        with span("assistant", "phase"):
+            with span("claude", "subprocess"):
+                pass
+            record_span("get_node", "mcp", tracer.clock(), tracer.clock())
+
+    spans = spans_by_name(tracer)
+    assert {spans[name]["tid"] for name in spans} == {root.track}
+    assert spans["claude"]["args"]["parent_id"] == spans["assistant"]["args"]["span_id"]
+    assert spans["get_node"]["args"]["parent_id"] == spans["assistant"]["args"]["span_id"]
+    assert spans["assistant"]["args"]["parent_id"] == root.span_id
+
+
+def test_explicit_parent_continues_track_from_another_thread(tracer):
+    with span("case run 1", "test", track="case run 1") as root:
+        pass
+
+    def review():
+        with span("judge stage", "test", parent=root):
+            pass
+
+    thread = threading.Thread(target=review)
+    thread.start()
+    thread.join()
+
+    spans = spans_by_name(tracer)
+    assert spans["judge stage"]["tid"] == root.track
+    assert spans["judge stage"]["args"]["parent_id"] == root.span_id
+
+
+def test_child_on_new_track_is_linked_by_flow(tracer):
+    with span("suite", "suite", track="suite") as root:
+        with span("case run 1", "test", track="case run 1") as child:
+            pass
+
+    flows = [event for event in tracer.events() if event["ph"] in ("s", "f")]
+    assert [(event["ph"], event["tid"]) for event in flows] == [("s", root.track), ("f", child.track)]
+    assert {event["id"] for event in flows} == {child.span_id}
+
+
+def test_errors_are_recorded_and_trace_written(tracer, tmp_path):
+    with pytest.raises(ValueError):
+        with span("claude", "subprocess", model="sonnet"):
+            raise ValueError("boom")
+
+    path = write_trace(tmp_path / "trace.json", {"run_id": 7})
+    payload = json.loads(path.read_text())
+
+    assert payload["metadata"] == {"run_id": 7}
+    spans = [event for event in payload["traceEvents"] if event["ph"] == "X"]
+    assert spans[0]["args"]["error"] == "ValueError"
+    assert spans[0]["args"]["model"] == "sonnet"
+    assert payload["traceEvents"][0]["ph"] == "M"
@@ -0,0 +1,64 @@
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tests.conversational_layer.config import Config
+from tests.conversational_layer.fixtures import clean_graph_state
+from tests.conversational_layer.trash import TrashReaper, wait_for_trash
+
+
+def make_graph(base):
+    (base / "_system").mkdir(parents=True)
+    (base / "_system" / "registry.json").write_text("{}")
+    (base / "_content" / "nodes").mkdir(parents=True)
+    (base / "_content" / "nodes" / "mem_1.md").write_text("Task")
+
+
+def test_move_to_trash_renames_then_reaps(tmp_path):
+    make_graph(tmp_path)
+    reaper = TrashReaper()
+
+    trash_bin = reaper.move_to_trash([tmp_path / "_system", tmp_path / "_content"], tmp_path / ".trash")
+
+    assert not (tmp_path / "_system").exists() and not (tmp_path / "_content").exists()
+    assert trash_bin.parent == tmp_path / ".trash"
+    assert reaper.wait(timeout=10)
+    assert not trash_bin.exists()
+    assert reaper.move_to_trash([tmp_path / "_system"], tmp_path / ".trash") is None
+
+
+def test_leftover_bins_are_swept(tmp_path):
+    leftover = tmp_path / ".trash" / "interrupted-run"
+    (leftover / "_system").mkdir(parents=True)
+    reaper = TrashReaper()
+
+    reaper.move_to_trash([], tmp_path / ".trash")
+
+    assert reaper.wait(timeout=10)
+    assert not leftover.exists()
+
+
+def test_clean_graph_state_resets_base_path_and_keeps_call_log(tmp_path):
+    base = tmp_path / "data"
+    make_graph(base)
+    (base / "mcp-calls.log").write_text("create_node\n")
+    mcp_config = tmp_path / "mcp-config.json"
+    mcp_config.write_text(json.dumps({"mcpServers": {"gtd-graph-memory": {
+        "command": "node", "args": ["dist/index.js"], "env": {"BASE_PATH": str(base)},
+    }}}))
+    config = Config(
+        system_prompt_path=ROOT / "src" / "conversational-layer" / "system-prompt.md",
+        test_cases_path=ROOT / "tests" / "test_cases_refactored.json",
+        mcp_config_path=mcp_config,
+    )
+
+    assert clean_graph_state(config)
+
+    assert not (base / "_system").exists() and not (base / "_content").exists()
+    assert (base / "mcp-calls.log").read_text() == "create_node\n"
+    assert wait_for_trash(timeout=10)
+    assert list((base / ".trash").iterdir()) == []